@@ -0,0 +1,98 @@
+"""add user_route_schedule_windows
+
+Revision ID: 7c2e9b41d5a3
+Revises: 55ac4b0569a1
+Create Date: 2026-10-16 10:12:41.482913
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9b41d5a3"
+down_revision: str | Sequence[str] | None = "55ac4b0569a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_route_schedule_windows",
+        sa.Column("route_id", sa.UUID(), nullable=False, comment="User's route ID"),
+        sa.Column("schedule_id", sa.UUID(), nullable=False, comment="Route schedule the window was expanded from"),
+        sa.Column(
+            "timezone",
+            sa.String(length=64),
+            nullable=False,
+            comment="Copy of UserRoute.timezone the window is expressed in",
+        ),
+        sa.Column(
+            "start_minute",
+            sa.Integer(),
+            nullable=False,
+            comment="Window start, minutes since Monday 00:00 local time (inclusive)",
+        ),
+        sa.Column(
+            "end_minute",
+            sa.Integer(),
+            nullable=False,
+            comment="Window end, minutes since Monday 00:00 local time (inclusive)",
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["route_id"], ["user_routes.id"], ondelete="RESTRICT"),
+        sa.ForeignKeyConstraint(["schedule_id"], ["user_route_schedules.id"], ondelete="RESTRICT"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_user_route_schedule_windows_timezone_start",
+        "user_route_schedule_windows",
+        ["timezone", "start_minute"],
+        unique=False,
+    )
+    op.create_index("ix_user_route_schedule_windows_route", "user_route_schedule_windows", ["route_id"], unique=False)
+
+    # Backfill windows for existing schedules (one row per scheduled day),
+    # mirroring app/helpers/schedule_windows.get_schedule_windows()
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO user_route_schedule_windows
+                (id, route_id, schedule_id, timezone, start_minute, end_minute, created_at, updated_at)
+            SELECT
+                gen_random_uuid(),
+                s.route_id,
+                s.id,
+                r.timezone,
+                d.day_index * 1440
+                    + CAST(EXTRACT(HOUR FROM s.start_time) AS INTEGER) * 60
+                    + CAST(EXTRACT(MINUTE FROM s.start_time) AS INTEGER),
+                d.day_index * 1440
+                    + CAST(EXTRACT(HOUR FROM s.end_time) AS INTEGER) * 60
+                    + CAST(EXTRACT(MINUTE FROM s.end_time) AS INTEGER),
+                now(),
+                now()
+            FROM user_route_schedules s
+            JOIN user_routes r ON r.id = s.route_id
+            JOIN (
+                VALUES ('MON', 0), ('TUE', 1), ('WED', 2), ('THU', 3), ('FRI', 4), ('SAT', 5), ('SUN', 6)
+            ) AS d(day_code, day_index)
+                ON d.day_code IN (SELECT json_array_elements_text(s.days_of_week))
+            WHERE s.deleted_at IS NULL
+              AND r.deleted_at IS NULL
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_route_schedule_windows_route", table_name="user_route_schedule_windows")
+    op.drop_index("ix_user_route_schedule_windows_timezone_start", table_name="user_route_schedule_windows")
+    op.drop_table("user_route_schedule_windows")
@@ -0,0 +1,75 @@
+"""add notification_log_daily_stats
+
+Revision ID: a4d8f3c61b27
+Revises: 7c2e9b41d5a3
+Create Date: 2026-10-16 14:03:27.519384
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d8f3c61b27"
+down_revision: str | Sequence[str] | None = "7c2e9b41d5a3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "notification_log_daily_stats",
+        sa.Column("day", sa.Date(), nullable=False, comment="UTC day the notifications were sent"),
+        sa.Column(
+            "method",
+            postgresql.ENUM("email", "sms", name="notification_method", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            postgresql.ENUM("sent", "failed", "pending", name="notification_status", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "count",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of notifications sent that day with this method and status",
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("day", "method", "status", name="uq_notification_log_daily_stats_day_method_status"),
+    )
+
+    # Backfill complete UTC days, mirroring NotificationStatsService.refresh_daily_stats()
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO notification_log_daily_stats
+                (id, day, method, status, count, created_at, updated_at)
+            SELECT
+                gen_random_uuid(),
+                CAST(timezone('UTC', sent_at) AS DATE),
+                method,
+                status,
+                COUNT(id),
+                now(),
+                now()
+            FROM notification_logs
+            WHERE sent_at < timezone('UTC', date_trunc('day', timezone('UTC', now())))
+            GROUP BY CAST(timezone('UTC', sent_at) AS DATE), method, status
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("notification_log_daily_stats")
@@ -0,0 +1,64 @@
+"""add user search trigram indexes
+
+Revision ID: b37c5e1f9a02
+Revises: e61b0d9a4c58
+Create Date: 2026-10-16 18:02:47.513924
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b37c5e1f9a02"
+down_revision: str | Sequence[str] | None = "e61b0d9a4c58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm is a trusted extension (PostgreSQL 13+), so the database owner can create it
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_users_id_trgm",
+        "users",
+        [sa.text("(id::text) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_users_external_id_trgm",
+        "users",
+        ["external_id"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"external_id": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_email_addresses_email_trgm",
+        "email_addresses",
+        ["email"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_phone_numbers_phone_trgm",
+        "phone_numbers",
+        ["phone"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"phone": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_phone_numbers_phone_trgm", table_name="phone_numbers", postgresql_using="gin")
+    op.drop_index("ix_email_addresses_email_trgm", table_name="email_addresses", postgresql_using="gin")
+    op.drop_index("ix_users_external_id_trgm", table_name="users", postgresql_using="gin")
+    op.drop_index("ix_users_id_trgm", table_name="users", postgresql_using="gin")
+    op.execute("DROP EXTENSION IF EXISTS pg_trgm")
@@ -0,0 +1,36 @@
+"""add keyset pagination indexes
+
+Revision ID: e61b0d9a4c58
+Revises: a4d8f3c61b27
+Create Date: 2026-10-16 16:41:09.208735
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e61b0d9a4c58"
+down_revision: str | Sequence[str] | None = "a4d8f3c61b27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (sent_at, id) replaces the single-column sent_at index
+    op.create_index("ix_notification_logs_sent_at_id", "notification_logs", ["sent_at", "id"], unique=False)
+    op.drop_index(op.f("ix_notification_logs_sent_at"), table_name="notification_logs")
+    op.create_index(
+        "ix_notification_logs_status_sent_at_id", "notification_logs", ["status", "sent_at", "id"], unique=False
+    )
+    op.create_index("ix_users_created_at_id", "users", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_created_at_id", table_name="users")
+    op.drop_index("ix_notification_logs_status_sent_at_id", table_name="notification_logs")
+    op.create_index(op.f("ix_notification_logs_sent_at"), "notification_logs", ["sent_at"], unique=False)
+    op.drop_index("ix_notification_logs_sent_at_id", table_name="notification_logs")
@@ -1,22 +1,20 @@
 """Admin API endpoints for system management."""
 
-from datetime import UTC, datetime
-from typing import Any, cast
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import structlog
-from celery.app.control import Inspect
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.celery.app import celery_app
 from app.celery.tasks import detect_and_rebuild_stale_routes
 from app.core.admin import require_admin
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.redis import get_redis_client
+from app.helpers.worker_status import WORKER_STATUS_KEY, get_live_heartbeats, parse_worker_heartbeats
 from app.models.admin import AdminUser
-from app.models.notification import NotificationLog, NotificationStatus
+from app.models.notification import NotificationStatus
 from app.schemas.admin import (
     AnonymiseUserResponse,
     EngagementMetrics,
@@ -194,9 +192,11 @@ async def get_worker_status(
     """
     Check Celery worker health and status.
 
-    This endpoint inspects the Celery worker(s) to determine if they are
-    running and processing tasks correctly. It tracks the worker's logical
-    clock to detect if the worker is frozen (responding but not processing).
+    Workers publish a heartbeat with their task counts to Redis every few seconds
+    (see app/celery/worker_status.py), and this endpoint reads the latest snapshot
+    with one Redis call instead of broadcasting inspect commands to the workers.
+    A worker whose heartbeat is older than CELERY_WORKER_HEARTBEAT_STALE_SECONDS
+    is treated as down or frozen, as a blocked worker stops publishing.
 
     **Requires admin privileges.**
 
@@ -209,94 +209,34 @@ async def get_worker_status(
     Raises:
         HTTPException: 403 if not admin
     """
-    # Use Celery inspection API to check worker status
-    inspector: Inspect = celery_app.control.inspect()
-
-    # Check active tasks
-    active_tasks = inspector.active()
-    active_count = sum(len(tasks) for tasks in active_tasks.values()) if active_tasks else 0
-
-    # Check scheduled tasks
-    scheduled_tasks = inspector.scheduled()
-    scheduled_count = sum(len(tasks) for tasks in scheduled_tasks.values()) if scheduled_tasks else 0
-
-    # Check if at least one worker is responding (not None and not empty dict)
-    worker_available = active_tasks not in (None, {})
-
-    # Verify worker is actively processing by checking logical clock
-    # The clock increments with each event loop iteration, so comparing it
-    # across admin checks proves the worker hasn't frozen.
-    # Store (clock, timestamp) tuple to detect worker restarts (clock resets).
     redis_client = await get_redis_client()
     try:
-        stats = inspector.stats()
-        last_heartbeat: datetime | None = None
-
-        if stats and len(stats) > 0:
-            # Get first worker's stats (in multi-worker setup, we check the first one)
-            # Cast to dict since Celery's _StatInfo is not typed in public API
-            worker_stats = cast(dict[str, Any], next(iter(stats.values())))
-            current_clock: int = worker_stats.get("clock", 0)
-            current_time = datetime.now(UTC)
-
-            # Compare with cached (clock, timestamp) from previous check
-            redis_key = "celery:worker:last_clock"
-            cached_data_str = await redis_client.get(redis_key)
-
-            if cached_data_str:
-                try:
-                    # Parse cached tuple: "clock,timestamp_iso"
-                    cached_clock_str, cached_timestamp_str = cached_data_str.split(",", 1)
-                    cached_clock = int(cached_clock_str)
-
-                    if current_clock < cached_clock:
-                        # Clock decreased - worker restarted, treat as healthy
-                        logger.info(
-                            "worker_restarted",
-                            previous_clock=cached_clock,
-                            new_clock=current_clock,
-                        )
-                        last_heartbeat = current_time
-                    elif current_clock > cached_clock:
-                        # Clock incremented - worker is actively processing
-                        last_heartbeat = current_time
-                    else:
-                        # Clock didn't increment - worker may be frozen
-                        logger.warning(
-                            "worker_clock_not_incrementing",
-                            clock=current_clock,
-                            last_check=cached_timestamp_str,
-                        )
-                        last_heartbeat = None
-                except (ValueError, IndexError):
-                    # Invalid cached data, treat as first check
-                    logger.warning("invalid_cached_clock_data", cached_data=cached_data_str)
-                    last_heartbeat = current_time
-            else:
-                # First check - no comparison data yet, assume healthy if stats returned
-                last_heartbeat = current_time
-
-            # Update cache for next check (5 minute TTL): "clock,timestamp_iso"
-            cache_value = f"{current_clock},{current_time.isoformat()}"
-            await redis_client.setex(redis_key, 300, cache_value)
-        else:
-            # No worker stats available
-            logger.warning("no_worker_stats_available")
+        heartbeats = parse_worker_heartbeats(await redis_client.hgetall(WORKER_STATUS_KEY))
     finally:
         await redis_client.aclose()
 
-    # Condition message on both worker availability and recent heartbeat
-    if not worker_available:
-        message = "No workers available or responding."
-    elif last_heartbeat is not None:
+    live_heartbeats = get_live_heartbeats(
+        heartbeats,
+        now=datetime.now(UTC),
+        stale_after=timedelta(seconds=settings.CELERY_WORKER_HEARTBEAT_STALE_SECONDS),
+    )
+    worker_available = bool(live_heartbeats)
+    last_heartbeat = heartbeats[0].sent_at if heartbeats else None
+
+    # Condition message on both worker availability and how recent the last heartbeat was
+    if worker_available:
         message = "Worker is healthy and processing tasks."
+    elif last_heartbeat is not None:
+        logger.warning("worker_heartbeat_stale", last_heartbeat=last_heartbeat.isoformat())
+        message = "No recent worker heartbeat: workers may be down or frozen."
     else:
-        message = "Worker is responding but may be frozen (clock not incrementing)."
+        logger.warning("no_worker_heartbeats")
+        message = "No workers available or responding."
 
     return WorkerStatusResponse(
         worker_available=worker_available,
-        active_tasks=active_count,
-        scheduled_tasks=scheduled_count,
+        active_tasks=sum(heartbeat.active_tasks for heartbeat in live_heartbeats),
+        scheduled_tasks=sum(heartbeat.scheduled_tasks for heartbeat in live_heartbeats),
         last_heartbeat=last_heartbeat,
         message=message,
     )
@@ -308,6 +248,10 @@ async def get_recent_notification_logs(
     db: AsyncSession = Depends(get_db),
     limit: int = Query(50, ge=1, le=1000, description="Number of logs to return"),
     offset: int = Query(0, ge=0, description="Starting offset for pagination"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor from a previous page's next_cursor (keyset pagination; use instead of offset)",
+    ),
     status: NotificationStatus | None = Query(None, description="Filter by notification status"),
 ) -> RecentLogsResponse:
     """
@@ -316,6 +260,9 @@ async def get_recent_notification_logs(
     This endpoint returns notification logs in reverse chronological order
     (most recent first) with optional status filtering.
 
+    Pages can be requested by offset or, for constant cost at any depth, by
+    passing the previous page's next_cursor (keyset pagination on (sent_at, id)).
+
     **Requires admin privileges.**
 
     Args:
@@ -323,37 +270,32 @@ async def get_recent_notification_logs(
         db: Database session
         limit: Number of logs per page (1-1000, default 50)
         offset: Starting offset for pagination (default 0)
+        cursor: Optional cursor from a previous page (cannot be combined with offset)
         status: Optional filter by notification status (sent/failed/pending)
 
     Returns:
-        Paginated list of notification logs with total count
+        Paginated list of notification logs with total count and next page cursor
 
     Raises:
-        HTTPException: 403 if not admin
+        HTTPException: 403 if not admin, 400 if the cursor is invalid or combined with offset
     """
-    # Build query with optional status filter
-    query = select(NotificationLog)
-    if status is not None:
-        query = query.where(NotificationLog.status == status)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    result = await db.execute(count_query)
-    total = result.scalar() or 0
-
-    # Get paginated logs ordered by sent_at descending (most recent first)
-    query = query.order_by(desc(NotificationLog.sent_at)).limit(limit).offset(offset)
-    result = await db.execute(query)
-    logs_sequence = result.scalars().all()
+    admin_service = AdminService(db)
+    logs, total, next_cursor = await admin_service.get_notification_logs_page(
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        status_filter=status,
+    )
 
     # Convert to response models
-    log_items: list[NotificationLogItem] = [NotificationLogItem.model_validate(log) for log in logs_sequence]
+    log_items: list[NotificationLogItem] = [NotificationLogItem.model_validate(log) for log in logs]
 
     return RecentLogsResponse(
         total=total,
         logs=log_items,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -366,6 +308,10 @@ async def list_users(
     db: AsyncSession = Depends(get_db),
     limit: int = Query(50, ge=1, le=1000, description="Number of users to return"),
     offset: int = Query(0, ge=0, description="Starting offset for pagination"),
+    cursor: str | None = Query(
+        None,
+        description="Cursor from a previous page's next_cursor (keyset pagination; use instead of offset)",
+    ),
     search: str | None = Query(None, description="Search term (email or external_id)"),
     include_deleted: bool = Query(False, description="Include soft-deleted users"),
 ) -> PaginatedUsersResponse:
@@ -375,6 +321,9 @@ async def list_users(
     This endpoint returns a paginated list of users, optionally filtered by
     search term (searches email and external_id) and deleted status.
 
+    Pages can be requested by offset or, for constant cost at any depth, by
+    passing the previous page's next_cursor (keyset pagination on (created_at, id)).
+
     **Requires admin privileges.**
 
     Args:
@@ -382,19 +331,21 @@ async def list_users(
         db: Database session
         limit: Number of users per page (1-1000, default 50)
         offset: Starting offset for pagination (default 0)
+        cursor: Optional cursor from a previous page (cannot be combined with offset)
         search: Optional search term for email or external_id
         include_deleted: Whether to include soft-deleted users (default False)
 
     Returns:
-        Paginated list of users with email/phone contacts
+        Paginated list of users with email/phone contacts and next page cursor
 
     Raises:
-        HTTPException: 403 if not admin
+        HTTPException: 403 if not admin, 400 if the cursor is invalid or combined with offset
     """
     admin_service = AdminService(db)
-    users, total = await admin_service.get_users_paginated(
+    users, total, next_cursor = await admin_service.get_users_paginated(
         limit=limit,
         offset=offset,
+        cursor=cursor,
         search=search,
         include_deleted=include_deleted,
     )
@@ -407,6 +358,7 @@ async def list_users(
         users=user_items,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -166,12 +166,15 @@ async def get_route_disruptions(
     if not alertable_disruptions:
         return []
 
-    # 7. Match disruptions to routes
+    # 7. Load index pairs for all routes in one query
+    index_snapshot = await matching_service.get_route_index_snapshot([route.id for route in routes])
+
+    # 8. Match disruptions to routes
     route_disruptions: list[RouteDisruptionResponse] = []
 
     for route in routes:
         # Get route index pairs
-        route_index_pairs = await matching_service.get_route_index_pairs(route.id)
+        route_index_pairs = index_snapshot.get_route_pairs(route.id)
 
         # Match disruptions to this route
         matched_disruptions = matching_service.match_disruptions_to_route(route_index_pairs, alertable_disruptions)
@@ -4,11 +4,12 @@ These endpoints expose TfL data to our frontend, fetching from Transport for Lon
 official API via the pydantic-tfl-api library and our internal TfL service layer.
 """
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user
 from app.core.database import get_db
+from app.helpers.network_graph_artifact import NETWORK_GRAPH_CACHE_CONTROL, decompress_network_graph, etag_matches
 from app.models.user import User
 from app.schemas.tfl import (
     AlertConfigResponse,
@@ -188,11 +189,17 @@ async def validate_route(
     )
 
 
-@router.get("/network-graph", response_model=dict[str, list[NetworkConnection]])
+@router.get(
+    "/network-graph",
+    response_model=dict[str, list[NetworkConnection]],
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Graph unchanged since the ETag in If-None-Match"}},
+)
 async def get_network_graph(
+    if_none_match: str | None = Header(default=None),
+    accept_encoding: str | None = Header(default=None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, list[NetworkConnection]]:
+) -> Response:
     """
     Get the station network graph as an adjacency list.
 
@@ -200,6 +207,11 @@ async def get_network_graph(
     which helps the frontend constrain user choices to valid next stations
     when building routes.
 
+    The graph is served from an artifact serialized when the graph is built.
+    Responses carry an ETag and `Cache-Control: private, no-cache`; a request
+    with a matching If-None-Match gets 304 Not Modified. The body is sent
+    gzip-compressed when the client accepts gzip.
+
     **Note**: Station connection graph must be built first using the admin
     endpoint POST /admin/tfl/build-graph.
 
@@ -222,6 +234,8 @@ async def get_network_graph(
         ```
 
     Args:
+        if_none_match: ETag of the client's cached copy
+        accept_encoding: Encodings the client accepts
         current_user: Authenticated user
         db: Database session
 
@@ -229,7 +243,21 @@ async def get_network_graph(
         HTTPException: 503 if graph hasn't been built yet, 500 if fetch fails
     """
     tfl_service = TfLService(db)
-    return await tfl_service.get_network_graph()
+    artifact = await tfl_service.get_network_graph_artifact()
+
+    headers = {
+        "ETag": artifact.etag,
+        "Cache-Control": NETWORK_GRAPH_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(if_none_match, artifact.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if accept_encoding and "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=artifact.gzip_body, media_type="application/json", headers=headers)
+
+    return Response(content=decompress_network_graph(artifact), media_type="application/json", headers=headers)
 
 
 @router.get("/station-disruptions", response_model=list[StationDisruptionResponse])
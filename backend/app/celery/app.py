@@ -20,6 +20,10 @@ require_config("CELERY_BROKER_URL", "CELERY_RESULT_BACKEND")
 # Create Celery application instance
 celery_app = Celery("isthetuberunning")
 
+# Queue for notification deliveries, consumed by dedicated delivery workers
+# (celery -A app.celery.app worker -Q notifications)
+NOTIFICATIONS_QUEUE = "notifications"
+
 # Configure Celery
 celery_app.conf.update(
     # Redis Configuration
@@ -41,6 +45,9 @@ celery_app.conf.update(
     # Logging
     # Don't hijack root logger - let structlog handle it
     worker_hijack_root_logger=False,
+    # Routing
+    # Deliveries get their own queue so slow SMTP/SMS never queues behind (or delays) alert checks
+    task_routes={"app.celery.tasks.deliver_notification": {"queue": NOTIFICATIONS_QUEUE}},
 )
 
 # OpenTelemetry Instrumentation
@@ -129,7 +136,9 @@ def trigger_startup_tasks(
 # Import schedules to configure Celery Beat
 # CRITICAL: This import must remain - it populates celery_app.conf.beat_schedule
 # Removing this import will break all periodic tasks (Issue #167)
+# Import worker_status to register the worker heartbeat consumer bootstep
 from app.celery import (  # noqa: E402
     schedules,  # noqa: F401
     tasks,  # noqa: F401
+    worker_status,  # noqa: F401
 )
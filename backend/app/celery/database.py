@@ -25,6 +25,8 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from app.core.config import settings
 from app.core.redis import RedisClientProtocol
+from app.core.smtp_pool import SmtpConnectionPool, close_smtp_pool, init_smtp_pool
+from app.core.tfl_client import TfLResources, close_tfl_resources, init_tfl_resources
 
 # Module-level globals for worker resources
 # These are created once per worker process and reused across all tasks
@@ -32,6 +34,8 @@ _worker_loop: asyncio.AbstractEventLoop | None = None
 _worker_engine: AsyncEngine | None = None
 _worker_session_factory: async_sessionmaker[AsyncSession] | None = None
 _worker_redis_client: "RedisClientProtocol | None" = None
+_worker_tfl_resources: TfLResources | None = None
+_worker_smtp_pool: SmtpConnectionPool | None = None
 
 # Track if worker SQLAlchemy has been instrumented for OTEL
 _worker_sqlalchemy_instrumented: bool = False
@@ -100,6 +104,7 @@ def cleanup_worker_resources(
     and Redis client, then closes the event loop.
     """
     global _worker_loop, _worker_engine, _worker_session_factory, _worker_redis_client, _worker_sqlalchemy_instrumented  # noqa: PLW0603
+    global _worker_tfl_resources, _worker_smtp_pool  # noqa: PLW0603
     logger.info("worker_process_shutdown_cleaning_up")
 
     if _worker_loop is not None:
@@ -108,12 +113,16 @@ def cleanup_worker_resources(
         loop = _worker_loop
         engine = _worker_engine
         redis_client = _worker_redis_client
+        tfl_resources = _worker_tfl_resources
+        smtp_pool = _worker_smtp_pool
 
         # Clear globals immediately
         _worker_loop = None
         _worker_engine = None
         _worker_session_factory = None
         _worker_redis_client = None
+        _worker_tfl_resources = None
+        _worker_smtp_pool = None
         _worker_sqlalchemy_instrumented = False
 
         try:
@@ -127,6 +136,16 @@ def cleanup_worker_resources(
                 logger.debug("closing_worker_redis_client")
                 loop.run_until_complete(redis_client.aclose())
 
+            # Close shared TfL HTTP and cache connection pools
+            if tfl_resources is not None:
+                logger.debug("closing_worker_tfl_resources")
+                loop.run_until_complete(close_tfl_resources())
+
+            # Close pooled SMTP connections
+            if smtp_pool is not None:
+                logger.debug("closing_worker_smtp_pool")
+                loop.run_until_complete(close_smtp_pool())
+
             # Shutdown OpenTelemetry TracerProvider
             if settings.OTEL_ENABLED:
                 from app.core.telemetry import shutdown_tracer_provider  # noqa: PLC0415  # Lazy import for fork-safety
@@ -255,6 +274,54 @@ def get_worker_redis_client() -> "RedisClientProtocol":
     return _worker_redis_client
 
 
+def get_worker_tfl_resources() -> TfLResources:
+    """Get the worker's shared TfL API clients and cache.
+
+    Creates the resources on first access and registers them as the process-wide
+    TfL resources, so every TfLService in this worker reuses the same keep-alive
+    HTTP connections and Redis cache pool.
+
+    Note: Do NOT call aclose() on these resources in task code. Their lifecycle
+    is managed by the worker shutdown signal handler.
+
+    Thread-safe via double-checked locking pattern.
+
+    Returns:
+        TfLResources: Shared TfL resources for this worker
+    """
+    global _worker_tfl_resources  # noqa: PLW0603
+    if _worker_tfl_resources is None:
+        with _init_lock:
+            # Double-check after acquiring lock
+            if _worker_tfl_resources is None:
+                _worker_tfl_resources = init_tfl_resources()
+    return _worker_tfl_resources
+
+
+def get_worker_smtp_pool() -> SmtpConnectionPool:
+    """Get the worker's pooled SMTP connections.
+
+    Creates the pool on first access and registers it as the process-wide SMTP
+    pool, so every EmailService in this worker sends over the same authenticated
+    connections.
+
+    Note: Do NOT call aclose() on this pool in task code. Its lifecycle is
+    managed by the worker shutdown signal handler.
+
+    Thread-safe via double-checked locking pattern.
+
+    Returns:
+        SmtpConnectionPool: Shared SMTP connection pool for this worker
+    """
+    global _worker_smtp_pool  # noqa: PLW0603
+    if _worker_smtp_pool is None:
+        with _init_lock:
+            # Double-check after acquiring lock
+            if _worker_smtp_pool is None:
+                _worker_smtp_pool = init_smtp_pool()
+    return _worker_smtp_pool
+
+
 def get_worker_loop() -> asyncio.AbstractEventLoop:
     """Get the worker's persistent event loop.
 
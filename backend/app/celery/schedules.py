@@ -7,6 +7,8 @@ Scheduled tasks:
 - check_disruptions_and_alert: Every 30 seconds - monitor TfL disruptions and send alerts
 - refresh_tfl_metadata: Daily - refresh severity codes, categories, stop types with change detection
 - rebuild_network_graph: Daily - rebuild station graph and trigger stale route detection
+- refresh_notification_stats: Hourly - roll up notification logs into daily counts for admin analytics
+- prune_rate_limit_logs: Daily - delete rate limit audit rows past their retention
 
 Note: Route index staleness detection is event-driven (triggered after TfL data updates)
 rather than scheduled. See POST /admin/tfl/build-graph endpoint.
@@ -19,6 +21,8 @@ from celery.schedules import schedule
 DISRUPTION_CHECK_INTERVAL = 30.0  # 30 seconds
 METADATA_REFRESH_INTERVAL = 86400.0  # 24 hours (daily)
 GRAPH_REBUILD_INTERVAL = 86400.0  # 24 hours (daily)
+NOTIFICATION_STATS_REFRESH_INTERVAL = 3600.0  # 1 hour
+RATE_LIMIT_LOG_PRUNE_INTERVAL = 86400.0  # 24 hours (daily)
 
 # Configure Celery Beat schedule
 celery_app.conf.beat_schedule = {
@@ -43,4 +47,18 @@ celery_app.conf.beat_schedule = {
             "expires": 3600,  # Task expires if not picked up within 1 hour
         },
     },
+    "refresh-notification-stats": {
+        "task": "app.celery.tasks.refresh_notification_stats",
+        "schedule": schedule(run_every=NOTIFICATION_STATS_REFRESH_INTERVAL),
+        "options": {
+            "expires": 1800,  # Task expires if not picked up within 30 minutes
+        },
+    },
+    "prune-rate-limit-logs": {
+        "task": "app.celery.tasks.prune_rate_limit_logs",
+        "schedule": schedule(run_every=RATE_LIMIT_LOG_PRUNE_INTERVAL),
+        "options": {
+            "expires": 3600,  # Task expires if not picked up within 1 hour
+        },
+    },
 }
@@ -13,12 +13,22 @@ from sqlalchemy import distinct, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.celery.app import celery_app
-from app.celery.database import get_worker_loop, get_worker_redis_client, get_worker_session
+from app.celery.database import (
+    get_worker_loop,
+    get_worker_redis_client,
+    get_worker_session,
+    get_worker_smtp_pool,
+    get_worker_tfl_resources,
+)
+from app.core.config import settings
 from app.models.tfl import Line
 from app.models.user_route_index import UserRouteStationIndex
 from app.services.alert_service import AlertService
+from app.services.notification_outbox import OutboundNotification, deliver_outbound_notification
+from app.services.notification_stats_service import NotificationStatsService
 from app.services.tfl_service import MetadataChangeDetectedError, TfLService
 from app.services.user_route_index_service import UserRouteIndexService
+from app.services.verification_service import VerificationService
 
 logger = structlog.get_logger(__name__)
 
@@ -90,6 +100,14 @@ class DisruptionCheckResult(TypedDict):
     errors: int
 
 
+class NotificationDeliveryResult(TypedDict):
+    """Result from deliver_notification task."""
+
+    status: str  # "sent", or "failed" once retries are exhausted
+    kind: str
+    retries: int
+
+
 class RebuildIndexesResult(TypedDict):
     """Result from rebuild_route_indexes task."""
 
@@ -121,6 +139,20 @@ class MetadataRefreshResult(TypedDict):
     after_counts: NotRequired[tuple[int, int, int] | None]
 
 
+class NotificationStatsRefreshResult(TypedDict):
+    """Result from refresh_notification_stats task."""
+
+    status: str
+    rows_upserted: int
+
+
+class RateLimitLogPruneResult(TypedDict):
+    """Result from prune_rate_limit_logs task."""
+
+    status: str
+    rows_deleted: int
+
+
 class GraphRebuildResult(TypedDict):
     """Result from rebuild_network_graph task."""
 
@@ -197,9 +229,19 @@ async def _check_disruptions_async() -> DisruptionCheckResult:
         # Get database session and shared Redis client
         session = get_worker_session()
         redis_client = get_worker_redis_client()
-
-        # Create AlertService instance and process all routes
-        alert_service = AlertService(db=session, redis_client=redis_client)
+        # Register the worker's SMTP pool so alert emails reuse authenticated connections
+        get_worker_smtp_pool()
+
+        # Create AlertService instance and process all routes.
+        # The session factory lets routes be processed concurrently, one session per worker.
+        # With the notification queue enabled, delivery workers send the alerts.
+        alert_service = AlertService(
+            db=session,
+            redis_client=redis_client,
+            session_factory=get_worker_session,
+            tfl_resources=get_worker_tfl_resources(),
+            notification_outbox=CeleryNotificationOutbox() if settings.NOTIFICATION_QUEUE_ENABLED else None,
+        )
         result = await alert_service.process_all_routes()
 
         return DisruptionCheckResult(
@@ -214,6 +256,95 @@ async def _check_disruptions_async() -> DisruptionCheckResult:
             await session.close()
 
 
+@celery_app.task(  # type: ignore[arg-type]
+    bind=True,
+    max_retries=settings.NOTIFICATION_DELIVERY_MAX_RETRIES,
+    # Acknowledge only after delivery, so a notification survives a worker crash mid-send
+    acks_late=True,
+    reject_on_worker_lost=True,
+    name="app.celery.tasks.deliver_notification",
+)
+def deliver_notification_task(self: BoundTask, outbound: OutboundNotification) -> NotificationDeliveryResult:
+    """
+    Deliver a notification queued by the alert cycle and log it in NotificationLog.
+
+    Routed to the "notifications" queue (see app.celery.app), which dedicated delivery
+    workers consume, so a slow mail server delays deliveries rather than alert evaluation.
+    Failed sends are retried with exponential backoff; after the final retry the
+    notification is logged as FAILED.
+
+    Args:
+        self: Celery task instance (bound via bind=True)
+        outbound: Rendered notification and recipient
+
+    Returns:
+        NotificationDeliveryResult: Delivery outcome
+
+    Raises:
+        Retry: If the send failed and retries remain
+    """
+    retries = self.request.retries
+    try:
+        sent = run_in_worker_loop(
+            _deliver_notification_async,
+            outbound,
+            final_attempt=retries >= settings.NOTIFICATION_DELIVERY_MAX_RETRIES,
+        )
+    except Exception as exc:
+        countdown = settings.NOTIFICATION_DELIVERY_RETRY_BACKOFF_SECONDS * 2**retries
+        logger.warning(
+            "deliver_notification_task_retrying",
+            kind=outbound["kind"],
+            route_id=outbound["route_id"],
+            error=str(exc),
+            error_type=type(exc).__name__,
+            retry_count=retries,
+            countdown=countdown,
+        )
+        raise self.retry(exc=exc, countdown=countdown) from exc
+
+    return NotificationDeliveryResult(status="sent" if sent else "failed", kind=outbound["kind"], retries=retries)
+
+
+async def _deliver_notification_async(outbound: OutboundNotification, *, final_attempt: bool) -> bool:
+    """
+    Async implementation of notification delivery.
+
+    Args:
+        outbound: Rendered notification and recipient
+        final_attempt: Whether this is the last retry (failures are logged, not raised)
+
+    Returns:
+        True if sent, False if the final attempt failed
+    """
+    session = None
+    try:
+        session = get_worker_session()
+        # Register the worker's SMTP pool so deliveries reuse authenticated connections
+        get_worker_smtp_pool()
+        return await deliver_outbound_notification(session, outbound, final_attempt=final_attempt)
+
+    finally:
+        if session is not None:
+            await session.close()
+
+
+class CeleryNotificationOutbox:
+    """NotificationOutbox that queues deliveries as deliver_notification tasks."""
+
+    def enqueue(self, outbound: OutboundNotification) -> None:
+        """
+        Queue a notification for a delivery worker.
+
+        Args:
+            outbound: Rendered notification and recipient
+
+        Raises:
+            kombu.exceptions.OperationalError: If the broker is unreachable
+        """
+        deliver_notification_task.delay(outbound)
+
+
 @celery_app.task(  # type: ignore[arg-type]
     bind=True,
     max_retries=3,
@@ -318,7 +449,7 @@ async def find_stale_route_ids(session: AsyncSession) -> list[UUID]:
 
     Algorithm:
         1. Join UserRouteStationIndex → Line (directly via line_tfl_id)
-        2. Filter: WHERE line_data_version < Line.last_updated
+        2. Filter: WHERE line_data_version < Line.last_updated (active entries only)
         3. Return distinct route_ids (a route may have multiple stale entries)
     """
     # Query for routes where index is stale
@@ -328,7 +459,11 @@ async def find_stale_route_ids(session: AsyncSession) -> list[UUID]:
     stmt = (
         select(distinct(UserRouteStationIndex.route_id))
         .join(Line, Line.tfl_id == UserRouteStationIndex.line_tfl_id)
-        .where(UserRouteStationIndex.line_data_version < Line.last_updated)
+        .where(
+            UserRouteStationIndex.line_data_version < Line.last_updated,
+            # Soft-deleted entries keep the version they were removed with
+            UserRouteStationIndex.deleted_at.is_(None),
+        )
     )
 
     result = await session.execute(stmt)
@@ -525,7 +660,7 @@ async def _refresh_metadata_async() -> MetadataRefreshResult:
         session = get_worker_session()
 
         # Create TfLService instance and refresh metadata with change detection
-        tfl_service = TfLService(db=session)
+        tfl_service = TfLService(db=session, resources=get_worker_tfl_resources())
         counts = await tfl_service.refresh_metadata_with_change_detection()
 
         # Commit the transaction
@@ -630,7 +765,7 @@ async def _rebuild_graph_async() -> GraphRebuildResult:
         session = get_worker_session()
 
         # Create TfLService instance and rebuild graph
-        tfl_service = TfLService(db=session)
+        tfl_service = TfLService(db=session, resources=get_worker_tfl_resources())
         result = await tfl_service.build_station_graph()
 
         # Commit the transaction
@@ -674,3 +809,126 @@ async def _rebuild_graph_async() -> GraphRebuildResult:
     finally:
         if session is not None:
             await session.close()
+
+
+@celery_app.task(  # type: ignore[arg-type]
+    bind=True,
+    max_retries=3,
+    name="app.celery.tasks.refresh_notification_stats",
+)
+def refresh_notification_stats_task(self: BoundTask) -> NotificationStatsRefreshResult:
+    """
+    Roll up notification logs into daily counts for admin analytics.
+
+    This task runs periodically via Celery Beat (hourly) and adds the complete UTC
+    days since the last run to notification_log_daily_stats. Each run only reads
+    notification logs sent since the latest rolled-up day, so it stays cheap as the
+    log grows.
+
+    Args:
+        self: Celery task instance (bound via bind=True)
+
+    Returns:
+        NotificationStatsRefreshResult: Task execution result with rows upserted
+
+    Raises:
+        Retry: If the task should be retried due to transient failure
+    """
+    try:
+        logger.info("refresh_notification_stats_task_started")
+        result = run_in_worker_loop(_refresh_notification_stats_async)
+        logger.info("refresh_notification_stats_task_completed", result=result)
+        return result
+
+    except Exception as exc:
+        logger.error(
+            "refresh_notification_stats_task_failed",
+            error=str(exc),
+            error_type=type(exc).__name__,
+            retry_count=self.request.retries,
+        )
+        # Retry with exponential backoff (60s countdown)
+        raise self.retry(exc=exc, countdown=60) from exc
+
+
+async def _refresh_notification_stats_async() -> NotificationStatsRefreshResult:
+    """
+    Async implementation of the notification stats rollup refresh.
+
+    Returns:
+        NotificationStatsRefreshResult: Number of daily rollup rows inserted or updated
+    """
+    session = None
+    try:
+        session = get_worker_session()
+        rows_upserted = await NotificationStatsService(session).refresh_daily_stats()
+
+        return NotificationStatsRefreshResult(
+            status="success",
+            rows_upserted=rows_upserted,
+        )
+
+    finally:
+        if session is not None:
+            await session.close()
+
+
+@celery_app.task(  # type: ignore[arg-type]
+    bind=True,
+    max_retries=3,
+    name="app.celery.tasks.prune_rate_limit_logs",
+)
+def prune_rate_limit_logs_task(self: BoundTask) -> RateLimitLogPruneResult:
+    """
+    Delete rate_limit_logs audit rows past their retention.
+
+    This task runs periodically via Celery Beat (daily). Rate limits are counted in
+    Redis, so rate_limit_logs is only the audit trail (and the fallback count while
+    Redis is down); pruning keeps it from growing with every request.
+
+    Args:
+        self: Celery task instance (bound via bind=True)
+
+    Returns:
+        RateLimitLogPruneResult: Task execution result with rows deleted
+
+    Raises:
+        Retry: If the task should be retried due to transient failure
+    """
+    try:
+        logger.info("prune_rate_limit_logs_task_started")
+        result = run_in_worker_loop(_prune_rate_limit_logs_async)
+        logger.info("prune_rate_limit_logs_task_completed", result=result)
+        return result
+
+    except Exception as exc:
+        logger.error(
+            "prune_rate_limit_logs_task_failed",
+            error=str(exc),
+            error_type=type(exc).__name__,
+            retry_count=self.request.retries,
+        )
+        # Retry with exponential backoff (60s countdown)
+        raise self.retry(exc=exc, countdown=60) from exc
+
+
+async def _prune_rate_limit_logs_async() -> RateLimitLogPruneResult:
+    """
+    Async implementation of the rate_limit_logs pruning.
+
+    Returns:
+        RateLimitLogPruneResult: Number of audit rows deleted
+    """
+    session = None
+    try:
+        session = get_worker_session()
+        rows_deleted = await VerificationService(session).prune_rate_limit_logs()
+
+        return RateLimitLogPruneResult(
+            status="success",
+            rows_deleted=rows_deleted,
+        )
+
+    finally:
+        if session is not None:
+            await session.close()
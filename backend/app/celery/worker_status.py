@@ -0,0 +1,207 @@
+"""Worker heartbeats for the admin worker-status endpoint.
+
+Each worker publishes a WorkerHeartbeat (app/helpers/worker_status.py) to Redis on a
+timer, so GET /admin/alerts/worker-status reads a snapshot instead of broadcasting
+inspect commands from the API's event loop.
+
+Publishing is a consumer bootstep driven by the consumer's own timer (the mechanism
+Celery uses for its event heartbeats). It restarts with the consumer, and a worker
+whose main loop is blocked stops publishing and shows up as stale rather than healthy.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol, Self, cast
+
+import celery.worker.state as worker_state
+import redis
+import structlog
+from celery.worker.request import Request
+
+from app.celery.app import celery_app
+from app.core.config import settings
+from app.helpers.worker_status import (
+    WORKER_STATUS_KEY,
+    WORKER_STATUS_TTL_SECONDS,
+    WorkerHeartbeat,
+    parse_worker_heartbeats,
+)
+from celery import bootsteps
+
+logger = structlog.get_logger(__name__)
+
+# Heartbeats from workers silent for this long are removed when a worker starts
+# (e.g., hostnames of containers replaced by a deploy)
+PRUNE_AFTER = timedelta(hours=1)
+
+
+class SyncRedisPipelineProtocol(Protocol):
+    """Subset of the synchronous redis.client.Pipeline used for heartbeats (redis-py leaves it untyped)."""
+
+    def hset(self, name: str, key: str, value: str) -> Self:
+        """Queue setting field key of the hash at key name."""
+        ...
+
+    def expire(self, name: str, time: int) -> Self:
+        """Queue setting a timeout of time seconds on key name."""
+        ...
+
+    def execute(self) -> list[object]:
+        """Send the queued commands and return their results, in order."""
+        ...
+
+
+class SyncRedisClientProtocol(Protocol):
+    """Subset of the synchronous redis.Redis client used for heartbeats (redis-py leaves it untyped)."""
+
+    def hgetall(self, name: str) -> dict[str, str]:
+        """Get all fields and values of the hash at key name."""
+        ...
+
+    def hdel(self, name: str, *keys: str) -> int:
+        """Delete fields from the hash at key name."""
+        ...
+
+    def pipeline(self, transaction: bool = True) -> SyncRedisPipelineProtocol:
+        """Create a pipeline for sending several commands in one round-trip."""
+        ...
+
+    def close(self) -> None:
+        """Close the client connection."""
+        ...
+
+
+def _count_eta_tasks(consumer: Any) -> int:  # noqa: ANN401 - Celery Consumer is not typed
+    """
+    Count tasks waiting on the consumer's timer for their ETA/countdown.
+
+    Mirrors celery.worker.control.scheduled(), which reads the same timer queue.
+    """
+    try:
+        return sum(
+            1
+            for waiting in consumer.timer.schedule.queue
+            if waiting.entry.args and isinstance(waiting.entry.args[0], Request)
+        )
+    except (AttributeError, TypeError):
+        return 0
+
+
+def build_heartbeat(consumer: Any) -> WorkerHeartbeat:  # noqa: ANN401 - Celery Consumer is not typed
+    """
+    Snapshot the worker's task counts.
+
+    Reads the same in-process state the inspect active()/reserved()/scheduled()
+    commands reply with, without a broker round-trip.
+
+    Args:
+        consumer: Worker consumer
+
+    Returns:
+        Heartbeat for this worker
+    """
+    active = len(worker_state.active_requests)
+    reserved = len(worker_state.reserved_requests) - active
+    return WorkerHeartbeat(
+        hostname=consumer.hostname,
+        sent_at=datetime.now(UTC),
+        active_tasks=active,
+        scheduled_tasks=reserved + _count_eta_tasks(consumer),
+    )
+
+
+def publish_heartbeat(client: SyncRedisClientProtocol, consumer: Any) -> None:  # noqa: ANN401 - Celery Consumer is not typed
+    """
+    Write this worker's heartbeat to the worker status hash.
+
+    Errors are logged and swallowed so a Redis outage never breaks the consumer's timer.
+
+    Args:
+        client: Synchronous Redis client
+        consumer: Worker consumer
+    """
+    try:
+        heartbeat = build_heartbeat(consumer)
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(WORKER_STATUS_KEY, heartbeat.hostname, heartbeat.to_json())
+        pipe.expire(WORKER_STATUS_KEY, WORKER_STATUS_TTL_SECONDS)
+        pipe.execute()
+    except Exception as exc:
+        logger.warning("worker_heartbeat_publish_failed", error=str(exc))
+
+
+def prune_stale_heartbeats(client: SyncRedisClientProtocol) -> int:
+    """
+    Remove heartbeats of workers that haven't reported within PRUNE_AFTER.
+
+    Args:
+        client: Synchronous Redis client
+
+    Returns:
+        Number of heartbeats removed
+    """
+    now = datetime.now(UTC)
+    raw = client.hgetall(WORKER_STATUS_KEY)
+    recent_hostnames = {
+        heartbeat.hostname for heartbeat in parse_worker_heartbeats(raw) if now - heartbeat.sent_at <= PRUNE_AFTER
+    }
+    stale_hostnames = [hostname for hostname in raw if hostname not in recent_hostnames]
+    if stale_hostnames:
+        client.hdel(WORKER_STATUS_KEY, *stale_hostnames)
+    return len(stale_hostnames)
+
+
+class WorkerHeartbeatStep(bootsteps.StartStopStep):
+    """
+    Consumer bootstep publishing this worker's heartbeat every CELERY_WORKER_HEARTBEAT_INTERVAL_SECONDS.
+
+    Runs in the worker's main process, where the consumer tracks received and active tasks.
+    """
+
+    def __init__(self, parent: Any, **kwargs: Any) -> None:  # noqa: ANN401 - Celery bootstep signature
+        """Initialize the step (the Redis client is created on start)."""
+        self.client: SyncRedisClientProtocol | None = None
+        self.timer_ref: Any = None
+        super().__init__(parent, **kwargs)
+
+    def start(self, parent: Any) -> None:  # noqa: ANN401 - Celery Consumer is not typed
+        """Publish a heartbeat now and schedule the rest on the consumer's timer."""
+        try:
+            if self.client is None:
+                self.client = cast(
+                    SyncRedisClientProtocol, redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+                )
+                pruned = prune_stale_heartbeats(self.client)
+                logger.info("worker_heartbeat_started", hostname=parent.hostname, pruned=pruned)
+            publish_heartbeat(self.client, parent)
+            self.timer_ref = parent.timer.call_repeatedly(
+                settings.CELERY_WORKER_HEARTBEAT_INTERVAL_SECONDS,
+                publish_heartbeat,
+                (self.client, parent),
+            )
+        except Exception:
+            logger.exception("worker_heartbeat_start_failed")
+            # Continue without heartbeats - the worker shows as unavailable in the admin status
+
+    def stop(self, parent: Any) -> None:  # noqa: ANN401 - Celery Consumer is not typed
+        """Stop publishing (e.g., while the consumer reconnects to the broker)."""
+        if self.timer_ref is not None:
+            self.timer_ref.cancel()
+            self.timer_ref = None
+
+    def shutdown(self, parent: Any) -> None:  # noqa: ANN401 - Celery Consumer is not typed
+        """Stop publishing and remove this worker's heartbeat so it stops showing as available."""
+        self.stop(parent)
+        client, self.client = self.client, None
+        if client is None:
+            return
+
+        try:
+            client.hdel(WORKER_STATUS_KEY, parent.hostname)
+            logger.info("worker_heartbeat_removed", hostname=parent.hostname)
+        except Exception as exc:
+            logger.warning("worker_heartbeat_remove_failed", error=str(exc))
+        finally:
+            client.close()
+
+
+celery_app.steps["consumer"].add(WorkerHeartbeatStep)
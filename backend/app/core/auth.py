@@ -1,17 +1,23 @@
 """Authentication and authorization utilities."""
 
-from datetime import UTC, datetime, timedelta
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, cast
 from urllib.parse import urlunparse
 
 import httpx
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.core.config import require_config, settings
 from app.core.database import get_db
+from app.core.jwks import get_jwks_cache
+from app.core.tiered_cache import LocalTTLCache
+from app.helpers.auth_tokens import get_token_cache_ttl, hash_token, index_jwks_keys
 from app.models.user import User
 
 # Validate required auth configuration on module load
@@ -43,60 +49,104 @@ def set_mock_jwks(jwks: dict[str, Any]) -> None:
 # HTTP Bearer security scheme for JWT tokens
 security = HTTPBearer()
 
-# JWKS cache (JSON Web Key Set from Auth0)
-_jwks_cache: dict[str, Any] | None = None
-_jwks_cache_time: datetime | None = None
-_jwks_cache_ttl = timedelta(hours=1)
+# JWKS keys by kid, rebuilt whenever verification sees a different JWKS
+_jwks_keys: dict[str, dict[str, Any]] = {}
+_jwks_keys_source: dict[str, Any] | None = None
+
+
+@dataclass(slots=True)
+class CachedToken:
+    """
+    Verified token held in the token cache.
+
+    Attributes:
+        claims: Verified JWT claims (read-only; shared between requests)
+        user_values: Column values of the token's user, once get_current_user has resolved it
+    """
+
+    claims: dict[str, Any]
+    user_values: dict[str, Any] | None = None
+
+
+# Verified tokens by token hash, so repeat requests skip signature verification
+# and the user lookup. Entries expire after AUTH_TOKEN_CACHE_TTL_SECONDS or at
+# the token's exp claim, whichever is sooner.
+_token_cache = LocalTTLCache(max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES)
+
+
+def _get_cached_token(token_key: str) -> CachedToken | None:
+    """
+    Get a verified token from the token cache.
+
+    Args:
+        token_key: Token hash from hash_token()
+
+    Returns:
+        Cached token, or None if the token isn't cached or has expired
+    """
+    return cast(CachedToken | None, _token_cache.get(token_key))
 
 
 def clear_jwks_cache() -> None:
     """
-    Clear the JWKS cache.
+    Clear the JWKS key index.
+
+    This is primarily used in tests to reset cache state between test runs. The key
+    set itself is held by the process-wide JwksCache (see close_jwks_cache()).
+    """
+    global _jwks_keys, _jwks_keys_source  # noqa: PLW0603
+    _jwks_keys = {}
+    _jwks_keys_source = None
+
 
-    This is primarily used in tests to reset cache state between test runs.
+def clear_token_cache() -> None:
     """
-    global _jwks_cache, _jwks_cache_time  # noqa: PLW0603
-    _jwks_cache = None
-    _jwks_cache_time = None
+    Clear the verified token cache.
 
+    Used in tests, and after changes that alter which user a token resolves to
+    (e.g., anonymising a user).
+    """
+    _token_cache.clear()
 
-async def get_jwks(domain: str) -> dict[str, Any]:
+
+def get_jwks_key(jwks: dict[str, Any], kid: str) -> dict[str, Any] | None:
     """
-    Fetch JWKS (JSON Web Key Set) from Auth0.
+    Find the JWKS key with a key ID.
 
-    This is used to verify JWT signatures. Results are cached for 1 hour.
+    The key index is kept until a different JWKS is passed in, so a lookup is a
+    dictionary access rather than a scan of the key set.
 
     Args:
-        domain: Auth0 domain (e.g., 'your-tenant.auth0.com')
+        jwks: JWKS dictionary (from get_jwks() or the DEBUG mock)
+        kid: Key ID from the token header
 
     Returns:
-        JWKS dictionary containing public keys
+        Matching JWK, or None if the JWKS has no key with that ID
+    """
+    global _jwks_keys, _jwks_keys_source  # noqa: PLW0603
+    if jwks is not _jwks_keys_source:
+        _jwks_keys = index_jwks_keys(jwks)
+        _jwks_keys_source = jwks
+    return _jwks_keys.get(kid)
 
-    Raises:
-        HTTPException: If JWKS cannot be fetched
+
+async def get_jwks() -> dict[str, Any]:
     """
-    global _jwks_cache, _jwks_cache_time  # noqa: PLW0603
+    Get the JWKS (JSON Web Key Set) from Auth0.
 
-    # Return cached JWKS if still valid and contains keys
-    now = datetime.now(UTC)
-    if (
-        _jwks_cache is not None
-        and "keys" in _jwks_cache
-        and _jwks_cache_time is not None
-        and now - _jwks_cache_time < _jwks_cache_ttl
-    ):
-        return _jwks_cache
+    This is used to verify JWT signatures. Keys come from the process-wide JwksCache
+    (see app/core/jwks.py), which refreshes them in the background, so this only
+    waits for Auth0 if no keys have been fetched yet.
 
-    # Fetch fresh JWKS from Auth0
+    Returns:
+        JWKS dictionary containing public keys
+
+    Raises:
+        HTTPException: If no keys are cached and they cannot be fetched
+    """
     try:
-        async with httpx.AsyncClient() as client:
-            jwks_url = urlunparse(("https", domain, "/.well-known/jwks.json", "", "", ""))
-            response = await client.get(jwks_url, timeout=10.0)
-            response.raise_for_status()
-            _jwks_cache = response.json()
-            _jwks_cache_time = now
-            return _jwks_cache
-    except (httpx.HTTPError, httpx.TimeoutException) as e:
+        return await get_jwks_cache().get()
+    except (httpx.HTTPError, ValueError) as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Unable to fetch JWKS from Auth0: {e!s}",
@@ -107,6 +157,9 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Depends(securit
     """
     Verify JWT token from Auth0 or mock JWT in debug mode.
 
+    Verified claims are cached by token hash (see _token_cache), so a token is only
+    verified once per process until the cache entry expires.
+
     Args:
         credentials: HTTP Bearer credentials containing JWT token
 
@@ -117,6 +170,9 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Depends(securit
         HTTPException: If token is invalid or verification fails
     """
     token = credentials.credentials
+    token_key = hash_token(token)
+    if (cached := _get_cached_token(token_key)) is not None:
+        return cached.claims
 
     try:
         # Decode JWT header to get key ID (kid)
@@ -139,10 +195,10 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Depends(securit
                 detail="Mock JWKS not configured for DEBUG mode",
             )
         else:
-            jwks = await get_jwks(settings.AUTH0_DOMAIN)
+            jwks = await get_jwks()
 
         # Find matching key
-        matching_key = next((key for key in jwks.get("keys", []) if key.get("kid") == kid), None)
+        matching_key = get_jwks_key(jwks, kid)
 
         if not matching_key:
             raise HTTPException(
@@ -170,7 +226,7 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Depends(securit
 
         # Verify and decode JWT
         issuer = urlunparse(("https", settings.AUTH0_DOMAIN, "/", "", "", ""))
-        return jwt.decode(
+        claims = jwt.decode(
             token,
             rsa_key,
             algorithms=settings.AUTH0_ALGORITHMS,
@@ -185,10 +241,15 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Depends(securit
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    ttl = get_token_cache_ttl(claims, time.time(), settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+    _token_cache.set(token_key, CachedToken(claims=claims), ttl=ttl)
+    return claims
+
 
 async def get_current_user(
     payload: dict[str, Any] = Depends(verify_jwt),
     db: AsyncSession = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> User:
     """
     Get current user from database, auto-create if doesn't exist.
@@ -197,9 +258,13 @@ async def get_current_user(
     looks up the user in the database, and creates a new user record
     if this is their first authenticated request.
 
+    The user's column values are kept with the cached token, so later requests
+    with the same token attach the user to the session without a query.
+
     Args:
         payload: JWT payload from verify_jwt dependency
         db: Database session
+        credentials: HTTP Bearer credentials (the same token verify_jwt verified)
 
     Returns:
         User model instance
@@ -218,5 +283,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    cached = _get_cached_token(hash_token(credentials.credentials))
+    if cached is not None and cached.user_values is not None:
+        # Attach without loading: the values are what the database returned for this token
+        user = User(**cached.user_values)
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
     auth_service = AuthService(db)
-    return await auth_service.get_or_create_user(external_id, auth_provider="auth0")
+    user = await auth_service.get_or_create_user(external_id, auth_provider="auth0")
+    if cached is not None:
+        cached.user_values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    return user
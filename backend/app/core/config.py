@@ -42,6 +42,11 @@ class Settings(BaseSettings):
     AUTH0_DOMAIN: str
     AUTH0_API_AUDIENCE: str
     AUTH0_ALGORITHMS: str
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 60  # Max age of verified token claims and users held in process (0 = disabled)
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 1024  # Max verified tokens held in process (LRU eviction)
+    JWKS_REFRESH_INTERVAL_SECONDS: float = 3600.0  # Age at which Auth0 signing keys are refreshed in the background
+    JWKS_REFRESH_RETRY_SECONDS: float = 30.0  # Delay before retrying a failed background JWKS refresh
+    JWKS_HTTP_TIMEOUT_SECONDS: float = 10.0  # Timeout for JWKS requests to Auth0
 
     @field_validator("AUTH0_ALGORITHMS", mode="after")
     @classmethod
@@ -51,6 +56,16 @@ class Settings(BaseSettings):
 
     # TfL API Settings (for Phase 5)
     TFL_API_KEY: str | None = Field(default=None, validation_alias="SECRET_TFL_API_KEY")
+    TFL_LOCAL_CACHE_TTL_SECONDS: int = 30  # Max age of decoded TfL cache values held in process (0 = disabled)
+    TFL_LOCAL_CACHE_MAX_ENTRIES: int = 256  # Max decoded TfL cache values held in process (LRU eviction)
+    TFL_LOCAL_CACHE_VERSION_CHECK_SECONDS: float = 1.0  # Min interval between Redis cache version checks
+    TFL_HTTP_MAX_CONNECTIONS: int = 10  # Keep-alive connections to the TfL API per process
+    TFL_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0  # Idle time before a TfL API connection is closed
+    TFL_REDIS_POOL_MAX_SIZE: int = 20  # Max Redis connections for the TfL cache per process
+    TFL_REDIS_POOL_TIMEOUT_SECONDS: float = 5.0  # Max wait for a free TfL cache connection when the pool is full
+    TFL_GRAPH_FETCH_CONCURRENCY: int = 8  # Max concurrent TfL API requests while building the station graph
+    TFL_RATE_LIMIT_MAX_RETRIES: int = 3  # Retries for TfL API calls rejected with 429 Too Many Requests
+    TFL_RATE_LIMIT_BACKOFF_SECONDS: float = 1.0  # Initial delay before retrying a 429 (doubles per retry)
 
     # Email Settings (for Phase 4)
     SMTP_HOST: str | None = None
@@ -60,6 +75,8 @@ class Settings(BaseSettings):
     SMTP_FROM_EMAIL: str | None = Field(default=None, validation_alias="SECRET_SMTP_FROM_EMAIL")
     SMTP_TIMEOUT: int = 10  # Connection timeout in seconds (prevents indefinite hangs)
     SMTP_REQUIRE_TLS: bool = False  # If True, require STARTTLS upgrade on ports 25/587
+    SMTP_POOL_MAX_CONNECTIONS: int = 3  # Authenticated SMTP connections kept open per process
+    SMTP_POOL_IDLE_TIMEOUT_SECONDS: float = 30.0  # Idle time before a pooled SMTP connection is closed
 
     # SMS Settings (for Phase 4)
     SMS_LOG_DIR: str | None = None  # Directory for SMS stub logging (optional)
@@ -67,12 +84,23 @@ class Settings(BaseSettings):
     # Celery Settings (for Phase 8)
     CELERY_BROKER_URL: str = Field(validation_alias="SECRET_CELERY_BROKER_URL")
     CELERY_RESULT_BACKEND: str = Field(validation_alias="SECRET_CELERY_RESULT_BACKEND")
+    CELERY_WORKER_HEARTBEAT_INTERVAL_SECONDS: float = 10.0  # How often workers publish status to Redis
+    CELERY_WORKER_HEARTBEAT_STALE_SECONDS: int = 30  # Workers silent for longer are reported unavailable
 
     # Notification Settings (for Phase 7)
     MAX_NOTIFICATION_PREFERENCES_PER_ROUTE: int = 5
 
     # Alert Settings (for Issue #309)
     ALERT_COOLDOWN_MINUTES: int = 5  # Per-line cooldown to prevent spam from TfL API flickering
+    ALERT_ROUTE_CONCURRENCY: int = 8  # Max routes processed in parallel per alert cycle (1 = sequential)
+    ALERT_LINE_FIRST_EVALUATION: bool = True  # Only load routes on disrupted/changed lines each alert cycle
+    ALERT_SCHEDULE_WINDOW_INDEX: bool = True  # Only load routes with a schedule window open now each alert cycle
+    NOTIFICATION_QUEUE_ENABLED: bool = True  # Queue alert notifications for delivery workers (False = send inline)
+    NOTIFICATION_DELIVERY_MAX_RETRIES: int = 5  # Delivery retries before a queued notification is logged as failed
+    NOTIFICATION_DELIVERY_RETRY_BACKOFF_SECONDS: int = 30  # First retry delay, doubled on each further retry
+
+    # Admin Settings
+    ADMIN_USER_COUNT_CACHE_TTL_SECONDS: int = 60  # Max age of cached user totals in admin user listings (0 = no cache)
 
     # PII Hashing Settings (for Issue #311)
     PII_HASH_SECRET: str = Field(
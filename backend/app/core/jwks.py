@@ -0,0 +1,213 @@
+"""
+Application-scoped cache of Auth0's JWKS (JSON Web Key Set) with background refresh.
+
+verify_jwt needs Auth0's signing keys for every request. get_jwks used to refetch
+them inline on the first request after its one-hour TTL, opening a new
+httpx.AsyncClient each time, and every request arriving at expiry fetched at once.
+JwksCache instead:
+
+- Keeps serving the cached key set once it is due for refresh (stale-while-revalidate)
+  and refreshes it in the background
+- Runs at most one fetch at a time; callers waiting on it reuse its result (single flight)
+- Fetches over one keep-alive httpx.AsyncClient
+
+The API process owns its instance through the FastAPI lifespan (init_jwks_cache /
+close_jwks_cache), which fetches the keys at startup and refreshes them every
+JWKS_REFRESH_INTERVAL_SECONDS, so requests never wait for Auth0. Without a lifespan
+(e.g., scripts), get_jwks_cache() creates an instance that fetches on first use.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any
+from urllib.parse import urlunparse
+
+import httpx
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class JwksCache:
+    """Auth0 signing keys, refreshed in the background once older than the refresh interval."""
+
+    def __init__(self, url: str, refresh_interval: float, retry_interval: float, timeout: float) -> None:
+        """
+        Initialize the cache (no keys are fetched until start() or get()).
+
+        Args:
+            url: JWKS URL (e.g., 'https://your-tenant.auth0.com/.well-known/jwks.json')
+            refresh_interval: Seconds after which the key set is refreshed
+            retry_interval: Seconds before the refresh loop retries a failed refresh
+            timeout: Request timeout in seconds
+        """
+        self.url = url
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.fetch_count = 0
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+        )
+        self._jwks: dict[str, Any] | None = None
+        self._fetched_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._revalidate_task: asyncio.Task[bool] | None = None
+        self._refresh_loop_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the key set is missing or due for refresh."""
+        return time.monotonic() - self._fetched_at >= self.refresh_interval
+
+    async def get(self) -> dict[str, Any]:
+        """
+        Get the JWKS, fetching it only if nothing has been cached yet.
+
+        A stale key set is returned as-is while a background refresh fetches a new one.
+
+        Returns:
+            JWKS dictionary containing public keys
+
+        Raises:
+            httpx.HTTPError: If no key set is cached and fetching one fails
+            ValueError: If no key set is cached and Auth0's response has no keys
+        """
+        if self._jwks is None:
+            await self.refresh()
+        elif self.is_stale:
+            self._revalidate()
+
+        assert self._jwks is not None  # Type narrowing - refresh() raises if it could not fetch
+        return self._jwks
+
+    async def refresh(self) -> None:
+        """
+        Fetch the JWKS, or wait for a fetch already in progress.
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response has no keys
+        """
+        fetched_at = self._fetched_at
+        async with self._lock:
+            if self._fetched_at != fetched_at:
+                # Another caller fetched the keys while we waited for the lock
+                return
+
+            self.fetch_count += 1
+            response = await self._client.get(self.url)
+            response.raise_for_status()
+            jwks = response.json()
+            if not isinstance(jwks, dict) or "keys" not in jwks:
+                msg = "JWKS response has no keys"
+                raise ValueError(msg)
+
+            self._jwks = jwks
+            self._fetched_at = time.monotonic()
+            logger.debug("jwks_refreshed", key_count=len(jwks["keys"]))
+
+    async def start(self) -> None:
+        """Fetch the keys and start refreshing them in the background (startup never fails on Auth0 errors)."""
+        await self._refresh_quietly()
+        if self._refresh_loop_task is None:
+            self._refresh_loop_task = asyncio.create_task(self._refresh_loop())
+
+    def clear(self) -> None:
+        """Drop the cached key set (primarily for testing)."""
+        self._jwks = None
+        self._fetched_at = float("-inf")
+
+    async def aclose(self) -> None:
+        """Stop background refreshes and close the HTTP client."""
+        for task in (self._refresh_loop_task, self._revalidate_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._refresh_loop_task = None
+        self._revalidate_task = None
+        await self._client.aclose()
+
+    def _revalidate(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._revalidate_task is None or self._revalidate_task.done():
+            self._revalidate_task = asyncio.create_task(self._refresh_quietly())
+
+    async def _refresh_quietly(self) -> bool:
+        """
+        Refresh the keys, logging failures instead of raising.
+
+        Returns:
+            True if the refresh succeeded (the previous key set is kept otherwise)
+        """
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("jwks_refresh_failed", url=self.url, error=str(e))
+            return False
+        return True
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the keys whenever they become stale, retrying failures after retry_interval."""
+        while True:
+            await asyncio.sleep(max(0.0, self._fetched_at + self.refresh_interval - time.monotonic()))
+            if self.is_stale and not await self._refresh_quietly():
+                await asyncio.sleep(self.retry_interval)
+
+
+def create_jwks_cache() -> JwksCache:
+    """
+    Create a JwksCache for the configured Auth0 domain.
+
+    Returns:
+        New JwksCache (caller owns it and must call aclose())
+    """
+    return JwksCache(
+        url=urlunparse(("https", settings.AUTH0_DOMAIN, "/.well-known/jwks.json", "", "", "")),
+        refresh_interval=settings.JWKS_REFRESH_INTERVAL_SECONDS,
+        retry_interval=settings.JWKS_REFRESH_RETRY_SECONDS,
+        timeout=settings.JWKS_HTTP_TIMEOUT_SECONDS,
+    )
+
+
+# Process-wide cache, owned by the FastAPI lifespan
+_jwks_cache: JwksCache | None = None
+
+
+async def init_jwks_cache() -> JwksCache:
+    """
+    Create and register the process-wide JWKS cache and start its background refresh (idempotent).
+
+    Returns:
+        The registered JwksCache
+    """
+    jwks_cache = get_jwks_cache()
+    await jwks_cache.start()
+    logger.info("jwks_cache_initialized")
+    return jwks_cache
+
+
+def get_jwks_cache() -> JwksCache:
+    """
+    Get the process-wide JWKS cache, creating one if the lifespan hasn't.
+
+    Returns:
+        The registered JwksCache
+    """
+    global _jwks_cache  # noqa: PLW0603
+    if _jwks_cache is None:
+        _jwks_cache = create_jwks_cache()
+    return _jwks_cache
+
+
+async def close_jwks_cache() -> None:
+    """Close and unregister the process-wide JWKS cache (no-op if not initialized)."""
+    global _jwks_cache  # noqa: PLW0603
+    jwks_cache = _jwks_cache
+    _jwks_cache = None
+    if jwks_cache is not None:
+        await jwks_cache.aclose()
@@ -0,0 +1,203 @@
+"""
+Sliding-window rate limits counted in Redis.
+
+Rate limits used to be checked with a COUNT over rate_limit_logs on every attempt, so
+each verification code request and contact addition queried the primary database.
+SlidingWindowRateLimiter keeps the events for each limit in a Redis sorted set
+scored by timestamp instead:
+
+- count() trims events older than the window and counts the rest (ZREMRANGEBYSCORE +
+  ZCARD in one MULTI/EXEC round-trip)
+- record() adds an event, trims the set and renews its expiry, so idle limits expire
+  with their window and sets never grow past the events in one window
+- acquire() does the trim, the check against the limit and the add in one Lua script,
+  so concurrent requests can't all pass the check before any of them is recorded
+- reset() deletes the set
+
+Redis is the record of truth for the limits. rate_limit_logs is still written as the
+audit trail (pruned after RATE_LIMIT_LOG_RETENTION_DAYS), and VerificationService falls
+back to counting it if Redis is unavailable.
+
+The API process owns its limiter through the FastAPI lifespan (init_rate_limiter /
+close_rate_limiter). Without one (e.g., scripts, tests), VerificationService counts
+rate_limit_logs as before.
+"""
+
+import math
+import time
+import uuid
+from datetime import timedelta
+from typing import cast
+
+import structlog
+
+from app.core.redis import RedisClientProtocol, create_redis_client
+
+logger = structlog.get_logger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "rate_limit"
+
+# KEYS[1]: rate limit key
+# ARGV: exclusive cutoff score ("(<now - window>"), now, member, expiry seconds, limit
+# Returns 1 if the event was recorded, 0 if the limit was already reached
+ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[5]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def rate_limit_key(action: str, subject: uuid.UUID | str) -> str:
+    """
+    Build the Redis key holding the events for one rate limit.
+
+    Args:
+        action: Rate-limited action (e.g., RateLimitAction.VERIFY_CODE.value)
+        subject: What the limit applies to (e.g., contact or user ID)
+
+    Returns:
+        Redis key (e.g., 'rate_limit:verify_code:<contact_id>')
+    """
+    return f"{RATE_LIMIT_KEY_PREFIX}:{action}:{subject}"
+
+
+class SlidingWindowRateLimiter:
+    """Counts recent events per key in Redis sorted sets."""
+
+    def __init__(self, redis_client: RedisClientProtocol) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            redis_client: Redis client to store events in (the limiter owns it and closes it in aclose())
+        """
+        self.redis_client = redis_client
+        self._acquire_script = redis_client.register_script(ACQUIRE_SCRIPT)
+
+    async def count(self, key: str, window: timedelta) -> int:
+        """
+        Count the events recorded within the window.
+
+        Args:
+            key: Rate limit key (see rate_limit_key())
+            window: How far back to count
+
+        Returns:
+            Number of events at or after now - window
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        cutoff = time.time() - window.total_seconds()
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            # "(" makes the bound exclusive, so events exactly at the cutoff are kept
+            pipe.zremrangebyscore(key, "-inf", f"({cutoff}")
+            pipe.zcard(key)
+            _removed, count = await pipe.execute()
+        return cast(int, count)
+
+    async def record(self, key: str, window: timedelta) -> None:
+        """
+        Record an event now.
+
+        Args:
+            key: Rate limit key (see rate_limit_key())
+            window: Window of the limit (events are kept for this long)
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        now = time.time()
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {uuid.uuid4().hex: now})
+            pipe.zremrangebyscore(key, "-inf", f"({now - window.total_seconds()}")
+            pipe.expire(key, math.ceil(window.total_seconds()))
+            await pipe.execute()
+
+    async def acquire(self, key: str, window: timedelta, limit: int) -> bool:
+        """
+        Record an event now if fewer than limit events are within the window.
+
+        Atomic (one Lua script), so concurrent callers can't exceed the limit.
+
+        Args:
+            key: Rate limit key (see rate_limit_key())
+            window: How far back to count (events are kept for this long)
+            limit: Maximum number of events within the window
+
+        Returns:
+            True if the event was recorded, False if the limit was reached
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        now = time.time()
+        recorded = await self._acquire_script(
+            keys=[key],
+            args=[
+                # "(" makes the bound exclusive, so events exactly at the cutoff are kept
+                f"({now - window.total_seconds()}",
+                now,
+                uuid.uuid4().hex,
+                math.ceil(window.total_seconds()),
+                limit,
+            ],
+        )
+        return bool(recorded)
+
+    async def reset(self, key: str) -> None:
+        """
+        Forget all events for a key.
+
+        Args:
+            key: Rate limit key (see rate_limit_key())
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        await self.redis_client.delete(key)
+
+    async def aclose(self) -> None:
+        """Close the Redis client."""
+        await self.redis_client.aclose()
+
+
+# Process-wide limiter, owned by the FastAPI lifespan
+_rate_limiter: SlidingWindowRateLimiter | None = None
+
+
+def init_rate_limiter() -> SlidingWindowRateLimiter:
+    """
+    Create and register the process-wide rate limiter (idempotent).
+
+    Returns:
+        The registered SlidingWindowRateLimiter
+    """
+    global _rate_limiter  # noqa: PLW0603
+    if _rate_limiter is None:
+        _rate_limiter = SlidingWindowRateLimiter(create_redis_client())
+        logger.info("rate_limiter_initialized")
+    return _rate_limiter
+
+
+def get_rate_limiter() -> SlidingWindowRateLimiter | None:
+    """
+    Get the process-wide rate limiter.
+
+    Returns:
+        Registered SlidingWindowRateLimiter, or None if the lifespan hasn't initialized it
+    """
+    return _rate_limiter
+
+
+async def close_rate_limiter() -> None:
+    """Close and unregister the process-wide rate limiter (no-op if not initialized)."""
+    global _rate_limiter  # noqa: PLW0603
+    rate_limiter = _rate_limiter
+    _rate_limiter = None
+    if rate_limiter is not None:
+        await rate_limiter.aclose()
@@ -6,13 +6,74 @@ for creating Redis clients throughout the application, ensuring consistent
 configuration and type safety.
 """
 
-from typing import Protocol, cast
+from collections.abc import Mapping, Sequence
+from types import TracebackType
+from typing import Protocol, Self, cast
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
 from app.core.config import settings
 
 
+class RedisPipelineProtocol(Protocol):
+    """
+    Protocol for a Redis async pipeline.
+
+    Commands are buffered (they return the pipeline, not a result) and sent to the
+    server in one round-trip by execute().
+    """
+
+    def set(self, name: str, value: str) -> Self:
+        """Queue setting the value at key name (no expiration)."""
+        ...
+
+    def setex(self, name: str, time: int, value: str) -> Self:
+        """Queue setting the value at key name with expiration time."""
+        ...
+
+    def delete(self, *names: str) -> Self:
+        """Queue deleting one or more keys."""
+        ...
+
+    def expire(self, name: str, time: int) -> Self:
+        """Queue setting a timeout of time seconds on key name."""
+        ...
+
+    def zadd(self, name: str, mapping: Mapping[str, float], gt: bool = False) -> Self:
+        """Queue adding members with scores to the sorted set at key name (gt: only ever raise scores)."""
+        ...
+
+    def zremrangebyscore(self, name: str, min: float | str, max: float | str) -> Self:
+        """Queue removing the members of the sorted set at key name with scores between min and max."""
+        ...
+
+    def zcard(self, name: str) -> Self:
+        """Queue counting the members of the sorted set at key name."""
+        ...
+
+    def zrangebyscore(self, name: str, min: float | str, max: float | str) -> Self:
+        """Queue getting the members of the sorted set at key name with scores between min and max."""
+        ...
+
+    async def execute(self) -> list[object]:
+        """Send the queued commands and return their results, in order."""
+        ...
+
+    async def __aenter__(self) -> Self:
+        """Enter the pipeline context."""
+        ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Reset the pipeline, discarding unexecuted commands."""
+        ...
+
+
 class RedisClientProtocol(Protocol):
     """
     Protocol for Redis async client used for dependency injection and testing.
@@ -25,6 +86,10 @@ class RedisClientProtocol(Protocol):
         """Get the value at key name."""
         ...
 
+    async def mget(self, keys: Sequence[str]) -> list[str | None]:
+        """Get the values at several keys in one round-trip (None for missing keys)."""
+        ...
+
     async def set(self, name: str, value: str) -> bool:
         """Set the value at key name (no expiration)."""
         ...
@@ -37,6 +102,18 @@ class RedisClientProtocol(Protocol):
         """Delete one or more keys."""
         ...
 
+    async def hgetall(self, name: str) -> dict[str, str]:
+        """Get all fields and values of the hash at key name."""
+        ...
+
+    def pipeline(self, transaction: bool = True) -> RedisPipelineProtocol:
+        """Create a pipeline for sending several commands in one round-trip."""
+        ...
+
+    def register_script(self, script: str) -> AsyncScript:
+        """Register a Lua script, called with EVALSHA (falling back to EVAL on the first call)."""
+        ...
+
     async def ping(self) -> bool:
         """Ping the Redis server to check connectivity."""
         ...
@@ -53,6 +130,18 @@ async def get_redis_client() -> RedisClientProtocol:
     This factory function provides a single point for Redis client creation,
     centralizing configuration and type ignore annotations.
 
+    Returns:
+        Redis client instance that satisfies RedisClientProtocol
+    """
+    return create_redis_client()
+
+
+def create_redis_client() -> RedisClientProtocol:
+    """
+    Create Redis client with standard configuration (synchronous variant of get_redis_client).
+
+    No connection is opened until the first command.
+
     Returns:
         Redis client instance that satisfies RedisClientProtocol
 
@@ -0,0 +1,287 @@
+"""
+Pooled, authenticated SMTP connections for outbound email.
+
+Sending an email over a fresh aiosmtplib.SMTP connection costs a TCP connect, a TLS
+handshake and an AUTH exchange before the message itself. During a major disruption
+the alert cycle sends hundreds of emails back to back, so SmtpConnectionPool keeps a
+few logged-in connections open instead:
+
+- At most SMTP_POOL_MAX_CONNECTIONS connections, which also bounds concurrent sends
+- Connections idle for longer than SMTP_POOL_IDLE_TIMEOUT_SECONDS are closed on next use
+  (servers drop idle clients; reconnecting beats sending into a half-closed socket)
+- A pooled connection the server has dropped is replaced once, transparently
+
+The API process owns its pool through the FastAPI lifespan (init_smtp_pool /
+close_smtp_pool); Celery workers own theirs through app.celery.database.
+"""
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from email.message import EmailMessage
+
+import aiosmtplib
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Standard SMTP port for implicit TLS (SMTPS)
+SMTPS_PORT = 465
+
+
+def get_tls_settings(port: int, require_tls: bool) -> tuple[bool, bool | None]:
+    """
+    Determine TLS settings based on port and require_tls flag.
+
+    Args:
+        port: SMTP port number
+        require_tls: Whether to require STARTTLS upgrade on non-465 ports
+
+    Returns:
+        Tuple of (use_tls, start_tls) for aiosmtplib.SMTP
+    """
+    """
+    from https://aiosmtplib.readthedocs.io/en/stable/encryption.html and the signature of aiosmtplib.SMTP:
+
+    | Port | Type         | REQUIRE_TLS | use_tls | start_tls | Behavior                             |
+    |------|--------------|-------------|---------|-----------|--------------------------------------|
+    | 25   | Plaintext    | False       | False   | None      | Auto-upgrade if available            |
+    | 25   | Plaintext    | True        | False   | True      | Force upgrade, fail if not supported |
+    | 465  | Implicit TLS | False       | True    | N/A       | Always TLS (port behavior)           |
+    | 465  | Implicit TLS | True        | True    | N/A       | Always TLS (port behavior)           |
+    | 587  | STARTTLS     | False       | False   | None      | Auto-upgrade if available            |
+    | 587  | STARTTLS     | True        | False   | True      | Force upgrade, fail if not supported |
+
+    So the logic:
+    - Port 465: use_tls=True (always, regardless of REQUIRE_TLS)
+    - Other ports: use_tls=False, start_tls=True if REQUIRE_TLS else None
+
+    This way REQUIRE_TLS controls whether we require the STARTTLS upgrade to succeed on ports 25/587.
+
+    """
+
+    if port == SMTPS_PORT:
+        return (True, None)  # Implicit TLS, start_tls N/A
+    return (False, True if require_tls else None)
+
+
+@dataclass(slots=True)
+class SmtpPoolStats:
+    """Counters for a SMTP connection pool."""
+
+    messages_sent: int = 0
+    connections_opened: int = 0
+    reconnects: int = 0
+
+
+class SmtpConnectionPool:
+    """
+    Pool of logged-in aiosmtplib.SMTP connections.
+
+    Idle connections are reused most-recently-used first, so a burst runs over warm
+    connections and the least-used ones age out via the idle timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        hostname: str,
+        port: int,
+        username: str,
+        password: str,
+        timeout: float,
+        use_tls: bool,
+        start_tls: bool | None,
+        max_connections: int,
+        idle_timeout: float,
+    ) -> None:
+        """
+        Initialize the pool (no connection is opened until the first send).
+
+        Args:
+            hostname: SMTP server hostname
+            port: SMTP server port
+            username: SMTP AUTH username
+            password: SMTP AUTH password
+            timeout: Timeout in seconds for each SMTP operation
+            use_tls: Connect with implicit TLS (see get_tls_settings())
+            start_tls: STARTTLS behaviour (see get_tls_settings())
+            max_connections: Max open connections, and so max concurrent sends
+            idle_timeout: Seconds an idle connection may be reused for
+        """
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.idle_timeout = idle_timeout
+        self.stats = SmtpPoolStats()
+        self._semaphore = asyncio.Semaphore(max_connections)
+        # (connection, time.monotonic() when it was last released), most recently used last
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+
+    async def send_message(self, message: EmailMessage) -> None:
+        """
+        Send one message over a pooled connection.
+
+        If a reused connection turns out to have been dropped by the server, the
+        message is retried once on a new connection.
+
+        Args:
+            message: Message to send (recipients taken from its headers)
+
+        Raises:
+            aiosmtplib.SMTPException: If the server rejects the message or login fails
+            asyncio.TimeoutError: If an SMTP operation times out
+            OSError: If the server cannot be reached
+        """
+        async with self._semaphore:
+            smtp = await self._take_idle()
+            if smtp is not None:
+                try:
+                    await self._send_on(smtp, message)
+                except (aiosmtplib.SMTPServerDisconnected, ConnectionError) as e:
+                    self.stats.reconnects += 1
+                    logger.info("smtp_pooled_connection_lost", error=str(e))
+                else:
+                    return
+
+            await self._send_on(await self._connect(), message)
+
+    async def aclose(self) -> None:
+        """Close all idle connections."""
+        idle, self._idle = self._idle, []
+        for smtp, _released_at in idle:
+            await self._discard(smtp)
+        logger.info(
+            "smtp_pool_closed",
+            messages_sent=self.stats.messages_sent,
+            connections_opened=self.stats.connections_opened,
+            reconnects=self.stats.reconnects,
+        )
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        """Open and log in a new connection."""
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            timeout=self.timeout,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+        )
+        await smtp.connect()
+        try:
+            await smtp.login(self.username, self.password)
+        except BaseException:
+            await self._discard(smtp)
+            raise
+        self.stats.connections_opened += 1
+        return smtp
+
+    async def _take_idle(self) -> aiosmtplib.SMTP | None:
+        """Close expired idle connections, then pop the most recently used one still connected."""
+        # The idle list is in release order, so expired connections are at the front
+        while self._idle and time.monotonic() - self._idle[0][1] > self.idle_timeout:
+            expired, _released_at = self._idle.pop(0)
+            await self._discard(expired)
+        while self._idle:
+            smtp, _released_at = self._idle.pop()
+            if smtp.is_connected:
+                return smtp
+            smtp.close()
+        return None
+
+    async def _send_on(self, smtp: aiosmtplib.SMTP, message: EmailMessage) -> None:
+        """Send a message on a connection, returning the connection to the pool if still usable."""
+        try:
+            await smtp.send_message(message)
+        except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused):
+            # The server rejected this message but the session is intact (aiosmtplib sends RSET)
+            self._release(smtp)
+            raise
+        except BaseException:
+            await self._discard(smtp)
+            raise
+        self.stats.messages_sent += 1
+        self._release(smtp)
+
+    def _release(self, smtp: aiosmtplib.SMTP) -> None:
+        """Return a connection to the idle list if it is still connected."""
+        if smtp.is_connected:
+            self._idle.append((smtp, time.monotonic()))
+
+    @staticmethod
+    async def _discard(smtp: aiosmtplib.SMTP) -> None:
+        """Close a connection, politely if the server is still there."""
+        if smtp.is_connected:
+            with contextlib.suppress(aiosmtplib.SMTPException, OSError, TimeoutError):
+                await smtp.quit()
+        smtp.close()
+
+
+def create_smtp_pool() -> SmtpConnectionPool:
+    """
+    Create a SMTP connection pool from the SMTP_* settings.
+
+    Returns:
+        New SmtpConnectionPool (caller owns it and must call aclose())
+    """
+    # Type narrowing: require_config() in app.services.email_service guarantees these are set
+    assert settings.SMTP_HOST is not None
+    assert settings.SMTP_USER is not None
+    assert settings.SMTP_PASSWORD is not None
+
+    use_tls, start_tls = get_tls_settings(settings.SMTP_PORT, settings.SMTP_REQUIRE_TLS)
+    return SmtpConnectionPool(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        username=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+        timeout=settings.SMTP_TIMEOUT,
+        use_tls=use_tls,
+        start_tls=start_tls,
+        max_connections=settings.SMTP_POOL_MAX_CONNECTIONS,
+        idle_timeout=settings.SMTP_POOL_IDLE_TIMEOUT_SECONDS,
+    )
+
+
+# Process-wide pool, owned by the FastAPI lifespan or the Celery worker
+_smtp_pool: SmtpConnectionPool | None = None
+
+
+def init_smtp_pool() -> SmtpConnectionPool:
+    """
+    Create and register the process-wide SMTP connection pool (idempotent).
+
+    Returns:
+        The registered SmtpConnectionPool
+    """
+    global _smtp_pool  # noqa: PLW0603
+    if _smtp_pool is None:
+        _smtp_pool = create_smtp_pool()
+        logger.info("smtp_pool_initialized")
+    return _smtp_pool
+
+
+def get_smtp_pool() -> SmtpConnectionPool | None:
+    """
+    Get the process-wide SMTP connection pool.
+
+    Returns:
+        Registered SmtpConnectionPool, or None if the owning lifespan/worker hasn't initialized it
+    """
+    return _smtp_pool
+
+
+async def close_smtp_pool() -> None:
+    """Close and unregister the process-wide SMTP connection pool (no-op if not initialized)."""
+    global _smtp_pool  # noqa: PLW0603
+    pool = _smtp_pool
+    _smtp_pool = None
+    if pool is not None:
+        await pool.aclose()
@@ -0,0 +1,246 @@
+"""
+Application-scoped TfL API clients and Redis cache.
+
+Constructing a TfLService used to build new pydantic-tfl-api clients (each loading
+every response model) and a new aiocache Redis connection pool, and the library's
+default HTTP backend opens a fresh httpx.AsyncClient - and so a new TCP/TLS
+connection - for every request. TfLResources holds one set of clients per process
+instead:
+
+- One keep-alive httpx.AsyncClient shared by the line and stop point clients
+- One aiocache Redis cache (wrapped in the process-local TieredCache) with a bounded,
+  blocking pool
+
+The API process owns its instance through the FastAPI lifespan (init_tfl_resources /
+close_tfl_resources); Celery workers own theirs through app.celery.database.
+Connection counters are exposed via TfLResources.stats() and logged on close.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+import redis.asyncio
+import structlog
+from aiocache import Cache
+from aiocache.serializers import PickleSerializer
+from pydantic_tfl_api import AsyncLineClient, AsyncStopPointClient
+from pydantic_tfl_api.core.http_backends.async_httpx_client import AsyncHttpxResponse
+from pydantic_tfl_api.core.http_client import AsyncHTTPClientBase, HTTPResponse
+
+from app.core.config import settings
+from app.core.tiered_cache import TieredCache, create_tiered_cache
+
+logger = structlog.get_logger(__name__)
+
+# Redis key namespace for the TfL cache
+TFL_CACHE_NAMESPACE = "tfl"
+
+# Default request timeout (seconds), matching pydantic-tfl-api's own default
+DEFAULT_TFL_HTTP_TIMEOUT = 30
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """Counters for connections opened by a pooled client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+
+class PooledAsyncHttpxClient(AsyncHTTPClientBase):
+    """
+    pydantic-tfl-api HTTP backend that reuses one keep-alive httpx.AsyncClient.
+
+    Counts requests, new TCP connections and TLS handshakes via httpcore trace
+    events, so connection reuse is measurable.
+    """
+
+    def __init__(self, max_connections: int, keepalive_expiry: float) -> None:
+        """
+        Initialize the pooled client.
+
+        Args:
+            max_connections: Max concurrent connections (all kept alive when idle)
+            keepalive_expiry: Seconds an idle connection is kept open
+        """
+        self.stats = ConnectionStats()
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: int | None = None,  # noqa: ASYNC109  # Signature defined by AsyncHTTPClientBase
+    ) -> HTTPResponse:
+        """
+        Send a GET request over the shared connection pool.
+
+        Args:
+            url: Request URL (including query string)
+            headers: Optional request headers
+            timeout: Request timeout in seconds (default 30)
+
+        Returns:
+            Response wrapped for pydantic-tfl-api
+        """
+        self.stats.requests += 1
+        response = await self._client.get(
+            url,
+            headers=headers,
+            timeout=timeout if timeout is not None else DEFAULT_TFL_HTTP_TIMEOUT,
+            extensions={"trace": self._trace},
+        )
+        return AsyncHttpxResponse(response)
+
+    async def _trace(self, event_name: str, info: Mapping[str, Any]) -> None:
+        """Count new connections from httpcore trace events."""
+        if event_name == "connection.connect_tcp.complete":
+            self.stats.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            self.stats.tls_handshakes += 1
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._client.aclose()
+
+
+class CountingConnectionPool(redis.asyncio.BlockingConnectionPool):
+    """
+    Redis connection pool that counts the connections it creates.
+
+    Blocking, so callers beyond max_connections wait (up to the pool timeout) for a
+    connection to be released instead of failing with "Too many connections".
+    """
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the pool (accepts redis.asyncio.BlockingConnectionPool kwargs)."""
+        super().__init__(**kwargs)
+        self.connections_created = 0
+
+    def make_connection(self) -> redis.asyncio.connection.AbstractConnection:
+        """Create a new connection and count it."""
+        self.connections_created += 1
+        connection: redis.asyncio.connection.AbstractConnection = super().make_connection()  # type: ignore[no-untyped-call]
+        return connection
+
+
+@dataclass
+class TfLResources:
+    """
+    Shared TfL API clients and Redis cache for one process.
+
+    Attributes:
+        http_client: Keep-alive HTTP backend shared by both API clients
+        line_client: pydantic-tfl-api Line client
+        stoppoint_client: pydantic-tfl-api StopPoint client
+        cache: TfL cache (process-local tier in front of Redis)
+    """
+
+    http_client: PooledAsyncHttpxClient
+    line_client: AsyncLineClient
+    stoppoint_client: AsyncStopPointClient
+    cache: TieredCache
+    _redis_pool: CountingConnectionPool | None = field(default=None, repr=False)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get connection counters for the shared clients.
+
+        Returns:
+            Dict of HTTP request/connection counts and Redis pool counts
+        """
+        redis_pool = self._redis_pool
+        return {
+            "http_requests": self.http_client.stats.requests,
+            "http_connections_opened": self.http_client.stats.connections_opened,
+            "http_tls_handshakes": self.http_client.stats.tls_handshakes,
+            "redis_connections_created": redis_pool.connections_created if redis_pool is not None else 0,
+        }
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool and Redis cache connections."""
+        stats = self.stats()
+        await self.http_client.aclose()
+        await self.cache.close()
+        logger.info("tfl_resources_closed", **stats)
+
+
+def create_tfl_resources() -> TfLResources:
+    """
+    Create TfL clients and a Redis cache with process-lifetime connection pools.
+
+    Nothing connects until first use, so this is safe to call before the event loop
+    that will use the resources starts handling requests.
+
+    Returns:
+        New TfLResources (caller owns it and must call aclose())
+    """
+    http_client = PooledAsyncHttpxClient(
+        max_connections=settings.TFL_HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=settings.TFL_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    parsed = urlparse(settings.REDIS_URL)
+    remote = Cache(
+        Cache.REDIS,
+        endpoint=parsed.hostname or "localhost",
+        port=parsed.port or 6379,
+        serializer=PickleSerializer(),
+        namespace=TFL_CACHE_NAMESPACE,
+        pool_max_size=settings.TFL_REDIS_POOL_MAX_SIZE,
+        connection_pool_class=CountingConnectionPool,
+        connection_pool_kwargs={"timeout": settings.TFL_REDIS_POOL_TIMEOUT_SECONDS},
+    )
+    return TfLResources(
+        http_client=http_client,
+        line_client=AsyncLineClient(api_token=settings.TFL_API_KEY, http_client=http_client),
+        stoppoint_client=AsyncStopPointClient(api_token=settings.TFL_API_KEY, http_client=http_client),
+        cache=create_tiered_cache(remote, TFL_CACHE_NAMESPACE),
+        _redis_pool=remote.client.connection_pool,
+    )
+
+
+# Process-wide resources, owned by the FastAPI lifespan or the Celery worker
+_tfl_resources: TfLResources | None = None
+
+
+def init_tfl_resources() -> TfLResources:
+    """
+    Create and register the process-wide TfL resources (idempotent).
+
+    Returns:
+        The registered TfLResources
+    """
+    global _tfl_resources  # noqa: PLW0603
+    if _tfl_resources is None:
+        _tfl_resources = create_tfl_resources()
+        logger.info("tfl_resources_initialized")
+    return _tfl_resources
+
+
+def get_tfl_resources() -> TfLResources | None:
+    """
+    Get the process-wide TfL resources.
+
+    Returns:
+        Registered TfLResources, or None if the owning lifespan/worker hasn't initialized them
+    """
+    return _tfl_resources
+
+
+async def close_tfl_resources() -> None:
+    """Close and unregister the process-wide TfL resources (no-op if not initialized)."""
+    global _tfl_resources  # noqa: PLW0603
+    resources = _tfl_resources
+    _tfl_resources = None
+    if resources is not None:
+        await resources.aclose()
@@ -0,0 +1,308 @@
+"""
+Two-tier cache: a process-local decoded LRU in front of the shared Redis cache.
+
+The TfL cache stores pickled objects in Redis via aiocache. Hot keys such as
+``line_disruptions:modes:...`` and ``stations:all`` are read many times per alert
+cycle and per API request, and every read pays a network round-trip plus an
+unpickle of the full list. TieredCache keeps recently read values in process
+memory (bounded by entry count and TTL) so repeated reads are dictionary lookups.
+
+Cross-process invalidation uses a version token stored in Redis under
+CACHE_VERSION_KEY (one per remote namespace). Deletes and overwrites of existing
+keys replace the token; readers compare it with the token they last saw (at most
+once per version check interval) and drop their local entries when it has changed.
+Writes of new keys (the common case: refilling a key after its TTL expired) leave
+the token alone, since no process can hold a local copy of a key missing from
+Redis: local entries read from Redis never outlive the key's remaining Redis TTL.
+A local entry is therefore never served more than the check interval after another
+process changes the shared cache.
+
+The local tier is only filled from values decoded out of Redis, never from the
+objects passed to set(): callers such as fetch_lines() cache ORM instances that
+stay attached to their session and may later be mutated or expired by a rollback.
+Values returned from the local tier are shared between callers and must be
+treated as read-only.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, cast
+from uuid import uuid4
+
+import structlog
+from aiocache.base import BaseCache
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Key (inside the remote cache namespace) holding the shared cache version token
+CACHE_VERSION_KEY = "cache_version"
+
+# PTTL reply for a key that exists without an expiry
+REDIS_PTTL_NO_EXPIRY = -1
+
+
+class LocalTTLCache:
+    """
+    Bounded in-process LRU cache with per-entry expiry.
+
+    Also tracks the remote version token the entries were read under, so that
+    all TieredCache instances sharing it invalidate together.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the local cache.
+
+        Args:
+            max_entries: Maximum number of entries kept (least recently used evicted first)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.version: str | None = None
+        self.version_checked_at = float("-inf")
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """
+        Get a live entry, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:  # noqa: ANN401
+        """
+        Store an entry, evicting the least recently used entries beyond max_entries.
+
+        Args:
+            key: Cache key
+            value: Decoded value to keep in memory
+            ttl: Seconds the entry stays live (<= 0 skips caching)
+        """
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries (including expired entries not yet evicted)."""
+        return len(self._entries)
+
+
+class TieredCache:
+    """
+    aiocache-compatible wrapper reading through a LocalTTLCache before the remote cache.
+
+    Exposes the get/set/delete/close subset of the aiocache API used by TfLService,
+    so it can be swapped in for the underlying Cache without changing call sites.
+    """
+
+    def __init__(
+        self,
+        remote: BaseCache,
+        local: LocalTTLCache,
+        local_ttl: float,
+        version_check_interval: float,
+    ) -> None:
+        """
+        Initialize the tiered cache.
+
+        Args:
+            remote: Shared aiocache instance (e.g., Redis with PickleSerializer)
+            local: Process-local cache (shared between TieredCache instances)
+            local_ttl: Max seconds a value stays in the local tier (<= 0 disables it)
+            version_check_interval: Min seconds between remote version token checks
+        """
+        self.remote = remote
+        self.local = local
+        self.local_ttl = local_ttl
+        self.version_check_interval = version_check_interval
+
+    async def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """
+        Get a value from the local tier, falling back to the remote cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss in both tiers
+        """
+        if self.local_ttl > 0:
+            await self._sync_version()
+            value = self.local.get(key)
+            if value is not None:
+                return value
+
+        value = await self.remote.get(key)
+        if value is not None and self.local_ttl > 0:
+            self.local.set(key, value, await self._local_ttl_for(key))
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:  # noqa: ANN401
+        """
+        Write a value to the remote cache and drop this process's local copy.
+
+        New keys are written with SET NX and leave other processes' local tiers alone.
+        Overwriting an existing key replaces the version token so other processes drop
+        their local entries. The caller's object isn't kept locally (it may still be
+        attached to a session); the next get() caches the copy decoded from Redis.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Remote TTL in seconds (None for no expiry)
+
+        Returns:
+            Result of the remote set
+        """
+        try:
+            result: bool = await self.remote.add(key, value, ttl=ttl)
+        except ValueError:
+            # Key already exists: overwrite it and invalidate other processes' copies
+            result = await self.remote.set(key, value, ttl=ttl)
+            await self._bump_version()
+        self.local.delete(key)
+        return result
+
+    async def delete(self, key: str) -> int:
+        """
+        Delete a value from both tiers, replacing the version token if the key existed.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Number of remote keys deleted
+        """
+        result: int = await self.remote.delete(key)
+        self.local.delete(key)
+        if result:
+            await self._bump_version()
+        return result
+
+    async def close(self) -> None:
+        """Close the remote cache connection."""
+        await self.remote.close()
+
+    async def _sync_version(self) -> None:
+        """Drop local entries if the remote version token changed since the last check."""
+        now = time.monotonic()
+        if now - self.local.version_checked_at < self.version_check_interval:
+            return
+
+        version = await self.remote.get(CACHE_VERSION_KEY)
+        if version != self.local.version:
+            if self.local:
+                logger.debug("local_cache_invalidated", entries=len(self.local))
+            self.local.clear()
+            self.local.version = version
+        self.local.version_checked_at = now
+
+    async def _local_ttl_for(self, key: str) -> float:
+        """
+        Get the local TTL for a value just read from the remote cache.
+
+        Capped at the key's remaining remote TTL, so the local copy expires no later
+        than the remote value (re-creating an expired key doesn't replace the token).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Seconds the local copy may be served (0 if the key has since expired)
+        """
+        remaining_ms = cast(int, await self.remote.raw("pttl", self.remote.build_key(key)))
+        if remaining_ms == REDIS_PTTL_NO_EXPIRY:
+            return self.local_ttl
+        return min(self.local_ttl, max(remaining_ms, 0) / 1000)
+
+    async def _bump_version(self) -> None:
+        """
+        Publish a new version token after a delete or overwrite.
+
+        The token isn't recorded as seen locally: another process may have bumped it
+        since our last check, and its change is only picked up if our next check
+        sees a token different from the one we last saw (clearing our tier as well).
+        """
+        await self.remote.set(CACHE_VERSION_KEY, uuid4().hex)
+
+
+# Process-wide local tiers, keyed by remote cache namespace
+_local_caches: dict[str, LocalTTLCache] = {}
+
+
+def get_local_cache(namespace: str) -> LocalTTLCache:
+    """
+    Get the process-wide local cache for a remote namespace.
+
+    Args:
+        namespace: Remote cache namespace (e.g., "tfl")
+
+    Returns:
+        LocalTTLCache shared by every TieredCache in this process using the namespace
+    """
+    local = _local_caches.get(namespace)
+    if local is None:
+        local = LocalTTLCache(max_entries=settings.TFL_LOCAL_CACHE_MAX_ENTRIES)
+        _local_caches[namespace] = local
+    return local
+
+
+def clear_local_caches() -> None:
+    """
+    Drop all process-local cache entries.
+
+    Primarily for testing.
+    """
+    _local_caches.clear()
+
+
+def create_tiered_cache(remote: BaseCache, namespace: str) -> TieredCache:
+    """
+    Wrap a remote cache with the process-wide local tier for its namespace.
+
+    Args:
+        remote: Shared aiocache instance
+        namespace: Remote cache namespace
+
+    Returns:
+        TieredCache configured from TFL_LOCAL_CACHE_* settings
+    """
+    return TieredCache(
+        remote=remote,
+        local=get_local_cache(namespace),
+        local_ttl=settings.TFL_LOCAL_CACHE_TTL_SECONDS,
+        version_check_interval=settings.TFL_LOCAL_CACHE_VERSION_CHECK_SECONDS,
+    )
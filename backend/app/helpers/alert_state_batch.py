@@ -0,0 +1,152 @@
+"""Per-cycle batching of Redis alert state reads and writes.
+
+AlertService keeps the alert state of each route/user/schedule in Redis (see
+get_alert_state_key()). Reading it one key at a time costs a round-trip per in-schedule
+route, and storing it costs another per alerted route. AlertStateBatch reads all of a
+cycle's keys with one MGET, serves reads from memory while routes are processed, and
+writes each route's changed keys back in one pipeline once the route is done.
+"""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from app.core.redis import RedisClientProtocol
+
+# Sorted set of lines that routes hold alert state for, scored by when that state
+# expires (Unix time). Line-first evaluation keeps these lines' routes as candidates,
+# so a line clearing is noticed even if the cycle it cleared in didn't process them.
+ALERTED_LINES_KEY = "alerted_lines"
+
+
+def get_alert_state_key(route_id: UUID, user_id: UUID, schedule_id: UUID) -> str:
+    """
+    Build the Redis key holding the alert state of a route's schedule.
+
+    Pure function for easy testing.
+
+    Args:
+        route_id: UserRoute ID
+        user_id: Route owner's user ID
+        schedule_id: UserRouteSchedule ID
+
+    Returns:
+        Redis key
+
+    Example:
+        >>> get_alert_state_key(route.id, route.user_id, schedule.id)
+        'alert:<route_id>:<user_id>:<schedule_id>'
+    """
+    return f"alert:{route_id}:{user_id}:{schedule_id}"
+
+
+class AlertStateBatch:
+    """
+    Alert state values for one alert cycle, read in bulk and written back in bulk.
+
+    Writes are held until flush(), so another process reading the same keys sees them
+    only once they are flushed. AlertService flushes after each route.
+    """
+
+    def __init__(self, redis_client: RedisClientProtocol) -> None:
+        """
+        Initialize an empty batch.
+
+        Args:
+            redis_client: Redis client the state is read from and flushed to
+        """
+        self.redis_client = redis_client
+        # Key -> current value (None if the key is missing or deleted)
+        self._values: dict[str, str | None] = {}
+        # Key -> (ttl_seconds, value) to write, or None to delete
+        self._pending: dict[str, tuple[int, str] | None] = {}
+        # Line ID -> latest expiry (Unix time) to record in ALERTED_LINES_KEY
+        self._pending_alerted_lines: dict[str, float] = {}
+
+    async def load(self, keys: Iterable[str]) -> None:
+        """
+        Read keys not already in the batch with one MGET.
+
+        Args:
+            keys: Redis keys to read
+        """
+        missing = [key for key in dict.fromkeys(keys) if key not in self._values]
+        if not missing:
+            return
+        values = await self.redis_client.mget(missing)
+        self._values.update(zip(missing, values, strict=True))
+
+    async def get(self, key: str) -> str | None:
+        """
+        Get a key's value, including writes not yet flushed.
+
+        Keys that weren't loaded up front are read individually.
+
+        Args:
+            key: Redis key
+
+        Returns:
+            Value, or None if the key is missing or deleted
+        """
+        if key not in self._values:
+            self._values[key] = await self.redis_client.get(key)
+        return self._values[key]
+
+    def setex(self, key: str, ttl_seconds: int, value: str) -> None:
+        """
+        Set a key's value with an expiry, written on the next flush().
+
+        Args:
+            key: Redis key
+            ttl_seconds: Expiry in seconds, from when the write is flushed
+            value: Value to store
+        """
+        self._values[key] = value
+        self._pending[key] = (ttl_seconds, value)
+
+    def record_alerted_lines(self, line_ids: Iterable[str], expires_at: float) -> None:
+        """
+        Record lines with alert state until expires_at, written on the next flush().
+
+        Args:
+            line_ids: TfL line IDs the stored alert state covers
+            expires_at: When the alert state expires (Unix time)
+        """
+        for line_id in line_ids:
+            self._pending_alerted_lines[line_id] = max(self._pending_alerted_lines.get(line_id, 0.0), expires_at)
+
+    def delete(self, key: str) -> None:
+        """
+        Delete a key, on the next flush().
+
+        Args:
+            key: Redis key
+        """
+        self._values[key] = None
+        self._pending[key] = None
+
+    async def flush(self) -> int:
+        """
+        Write pending changes in one pipeline.
+
+        Returns:
+            Number of keys written or deleted
+
+        Raises:
+            redis.RedisError: If the pipeline fails (the pending changes are dropped)
+        """
+        if not self._pending and not self._pending_alerted_lines:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        alerted_lines, self._pending_alerted_lines = self._pending_alerted_lines, {}
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for key, entry in pending.items():
+                if entry is None:
+                    pipe.delete(key)
+                else:
+                    ttl_seconds, value = entry
+                    pipe.setex(key, ttl_seconds, value)
+            if alerted_lines:
+                pipe.zadd(ALERTED_LINES_KEY, alerted_lines, gt=True)
+            await pipe.execute()
+        return len(pending)
@@ -0,0 +1,69 @@
+"""Helpers for caching verified access tokens (see app/core/auth.py)."""
+
+import hashlib
+from typing import Any
+
+
+def hash_token(token: str) -> str:
+    """
+    Hash an access token for use as a cache key.
+
+    Tokens are bearer credentials, so only their hash is kept in memory.
+
+    Pure function for easy testing.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        SHA-256 hex digest of the token
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_token_cache_ttl(claims: dict[str, Any], now: float, max_ttl: float) -> float:
+    """
+    Get how long verified claims may be cached.
+
+    Entries never outlive the token: the TTL is capped at the 'exp' claim.
+
+    Pure function for easy testing.
+
+    Args:
+        claims: Verified JWT claims
+        now: Current Unix timestamp
+        max_ttl: Configured maximum TTL in seconds
+
+    Returns:
+        TTL in seconds (0 if the token has no numeric 'exp' claim or has expired)
+
+    Example:
+        >>> get_token_cache_ttl({"exp": 1_000_030}, now=1_000_000, max_ttl=60)
+        30
+    """
+    exp = claims.get("exp")
+    if not isinstance(exp, int | float) or isinstance(exp, bool):
+        return 0
+    return max(0, min(max_ttl, exp - now))
+
+
+def index_jwks_keys(jwks: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """
+    Index the keys of a JWKS by key ID.
+
+    Keys without a 'kid' cannot be selected by a token header and are skipped.
+    If several keys share a 'kid', the first one wins (as with a linear scan).
+
+    Pure function for easy testing.
+
+    Args:
+        jwks: JSON Web Key Set (e.g., from Auth0's /.well-known/jwks.json)
+
+    Returns:
+        Dictionary mapping kid -> JWK
+    """
+    keys: dict[str, dict[str, Any]] = {}
+    for key in jwks.get("keys", []):
+        if (kid := key.get("kid")) and kid not in keys:
+            keys[kid] = key
+    return keys
@@ -0,0 +1,104 @@
+"""In-memory snapshot of notification preference targets for an alert cycle.
+
+Looking up each notification preference's email address or phone number when it is
+notified costs one SQL round-trip per preference. This module loads the targets of
+every preference being processed with one query per contact type, so that notifying
+many recipients adds no further queries.
+"""
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.query_filters import any_of
+from app.models.notification import NotificationPreference
+from app.models.user import EmailAddress, PhoneNumber
+
+
+@dataclass(slots=True)
+class ContactSnapshot:
+    """
+    Verified contact details by ID, held in process memory.
+
+    Attributes:
+        emails: EmailAddress ID -> address, or None if missing or unverified
+        phones: PhoneNumber ID -> number, or None if missing or unverified
+    """
+
+    emails: dict[UUID, str | None] = field(default_factory=dict)
+    phones: dict[UUID, str | None] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Number of contacts the snapshot was loaded for."""
+        return len(self.emails) + len(self.phones)
+
+
+def collect_preference_target_ids(
+    preferences: Iterable[NotificationPreference],
+) -> tuple[set[UUID], set[UUID]]:
+    """
+    Collect the email and phone IDs targeted by notification preferences.
+
+    Pure function for easy testing.
+
+    Args:
+        preferences: Notification preferences
+
+    Returns:
+        Tuple of (email_ids, phone_ids)
+    """
+    email_ids = {pref.target_email_id for pref in preferences if pref.target_email_id is not None}
+    phone_ids = {pref.target_phone_id for pref in preferences if pref.target_phone_id is not None}
+    return email_ids, phone_ids
+
+
+async def load_contact_snapshot(
+    db: AsyncSession,
+    email_ids: Collection[UUID],
+    phone_ids: Collection[UUID],
+) -> ContactSnapshot:
+    """
+    Load email addresses and phone numbers by ID, one query per contact type.
+
+    Only the ID, contact and verified columns are selected, so no ORM objects are kept.
+
+    Args:
+        db: Database session
+        email_ids: EmailAddress IDs to load
+        phone_ids: PhoneNumber IDs to load
+
+    Returns:
+        ContactSnapshot covering every requested ID
+
+    Example:
+        >>> snapshot = await load_contact_snapshot(db, {email_id}, set())
+        >>> snapshot.emails[email_id]
+        'user@example.com'
+    """
+    snapshot = ContactSnapshot(
+        emails=dict.fromkeys(email_ids),
+        phones=dict.fromkeys(phone_ids),
+    )
+
+    if email_ids:
+        email_result = await db.execute(
+            select(EmailAddress.id, EmailAddress.email).where(
+                any_of(EmailAddress.id, email_ids),
+                EmailAddress.verified == True,  # noqa: E712
+            )
+        )
+        snapshot.emails.update(email_result.tuples().all())
+
+    if phone_ids:
+        phone_result = await db.execute(
+            select(PhoneNumber.id, PhoneNumber.phone).where(
+                any_of(PhoneNumber.id, phone_ids),
+                PhoneNumber.verified == True,  # noqa: E712
+            )
+        )
+        snapshot.phones.update(phone_result.tuples().all())
+
+    return snapshot
@@ -7,6 +7,9 @@ and AlertService to follow the DRY principle.
 All functions are pure for easy testing and reusability.
 """
 
+import hashlib
+import json
+
 from app.models.user_route import UserRouteSegment
 from app.schemas.tfl import DisruptionResponse
 
@@ -156,3 +159,94 @@ def calculate_affected_stations(
 
     # Return sorted list for consistent ordering
     return sorted(affected_naptans)
+
+
+def create_line_aggregate_hash(disruptions: list[DisruptionResponse]) -> str:
+    """
+    Create aggregate hash for all statuses of a single line.
+
+    Sorts disruptions by (severity, description, reason) for deterministic ordering.
+    This ensures that multiple statuses for the same line (e.g., "Minor Delays" and
+    "Part Suspended") produce a consistent hash regardless of API response order.
+
+    Pure function for easy testing without database dependencies.
+
+    Args:
+        disruptions: List of disruptions for a single line (all must have same line_id)
+
+    Returns:
+        SHA256 hash string (64 characters)
+
+    Example:
+        >>> disruptions = [
+        ...     DisruptionResponse(line_id="northern", status_severity=10,
+        ...                        status_severity_description="Minor Delays", reason="Signal failure"),
+        ...     DisruptionResponse(line_id="northern", status_severity=20,
+        ...                        status_severity_description="Part Suspended", reason="Signal failure"),
+        ... ]
+        >>> hash1 = create_line_aggregate_hash(disruptions)
+        >>> # Same disruptions in different order produce same hash
+        >>> hash2 = create_line_aggregate_hash(list(reversed(disruptions)))
+        >>> hash1 == hash2
+        True
+    """
+    # Defensive: ensure all disruptions have the same line_id
+    if disruptions and len({d.line_id for d in disruptions}) > 1:
+        msg = "All disruptions must have the same line_id"
+        raise ValueError(msg)
+
+    # Sort disruptions by (severity, description, reason) for deterministic ordering
+    sorted_statuses = sorted(
+        disruptions,
+        key=lambda d: (d.status_severity, d.status_severity_description, d.reason or ""),
+    )
+
+    # Build hash input from sorted disruptions
+    # Normalize reasons: strip whitespace and treat empty/whitespace-only as empty string
+    hash_input = [
+        {
+            "severity": d.status_severity,
+            "status": d.status_severity_description,
+            "reason": (d.reason or "").strip() or "",
+        }
+        for d in sorted_statuses
+    ]
+
+    # Create JSON string and hash it
+    hash_string = json.dumps(hash_input, sort_keys=True)
+    return hashlib.sha256(hash_string.encode()).hexdigest()
+
+
+def create_disruption_set_hash(disruptions: list[DisruptionResponse]) -> str:
+    """
+    Create a hash identifying a set of disruptions across one or more lines.
+
+    Combines create_line_aggregate_hash() per line, in the order lines first appear,
+    with each line's name (shown to users, but not part of the per-line hash). Routes
+    affected by the same disruptions therefore share a hash, which keys rendered
+    notification content (see NotificationRenderCache).
+
+    Pure function for easy testing without database dependencies.
+
+    Args:
+        disruptions: List of disruptions, possibly for several lines
+
+    Returns:
+        SHA256 hash string (64 characters)
+
+    Example:
+        >>> northern = DisruptionResponse(line_id="northern", line_name="Northern", ...)
+        >>> victoria = DisruptionResponse(line_id="victoria", line_name="Victoria", ...)
+        >>> create_disruption_set_hash([northern, victoria]) == create_disruption_set_hash([northern, victoria])
+        True
+    """
+    disruptions_by_line: dict[str, list[DisruptionResponse]] = {}
+    for disruption in disruptions:
+        disruptions_by_line.setdefault(disruption.line_id, []).append(disruption)
+
+    hash_input = [
+        [line_id, line_disruptions[0].line_name, create_line_aggregate_hash(line_disruptions)]
+        for line_id, line_disruptions in disruptions_by_line.items()
+    ]
+    hash_string = json.dumps(hash_input)
+    return hashlib.sha256(hash_string.encode()).hexdigest()
@@ -0,0 +1,126 @@
+"""Precomputed network graph artifact for GET /tfl/network-graph.
+
+The station network graph only changes when TfLService.build_station_graph() runs
+(about once a day), but building it means joining every StationConnection with its
+stations and line. These helpers serialize the graph once into a compressed,
+content-addressed artifact that the API serves with ETag / If-None-Match support,
+so repeat loads cost a 304.
+"""
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from app.types.tfl_api import NetworkConnection
+
+# Cache key for the artifact in the TfL cache
+NETWORK_GRAPH_ARTIFACT_CACHE_KEY = "network_graph:artifact"
+
+# Clients may keep the graph but must revalidate it (cheap 304) before each use
+NETWORK_GRAPH_CACHE_CONTROL = "private, no-cache"
+
+_graph_adapter: TypeAdapter[dict[str, list[NetworkConnection]]] = TypeAdapter(dict[str, list[NetworkConnection]])
+
+
+def _connection_sort_key(connection: NetworkConnection) -> tuple[str, str, str, str]:
+    """Stable order for a station's connections (by line, then destination station)."""
+    return (connection.line_tfl_id, connection.station_tfl_id, connection.line_id, connection.station_id)
+
+
+@dataclass(frozen=True, slots=True)
+class NetworkGraphArtifact:
+    """
+    Serialized network graph.
+
+    Attributes:
+        etag: Strong ETag (quoted hash of the uncompressed JSON)
+        gzip_body: Gzip-compressed JSON adjacency list
+        stations_count: Number of stations with outgoing connections
+        built_at: When the artifact was serialized
+    """
+
+    etag: str
+    gzip_body: bytes
+    stations_count: int
+    built_at: datetime
+
+
+def build_network_graph_artifact(graph: dict[str, Any]) -> NetworkGraphArtifact:
+    """
+    Serialize a network graph adjacency list into an artifact.
+
+    Serialization is deterministic (sorted stations, each station's connections sorted
+    by line and destination, fixed gzip mtime), so an unchanged graph produces the same
+    ETag across rebuilds and processes whatever order the database returned rows in.
+
+    Args:
+        graph: Mapping of station_tfl_id to NetworkConnection models (or equivalent dicts)
+
+    Returns:
+        NetworkGraphArtifact for the graph
+
+    Example:
+        >>> artifact = build_network_graph_artifact({})
+        >>> artifact.stations_count
+        0
+        >>> artifact.etag.startswith('"') and artifact.etag.endswith('"')
+        True
+    """
+    validated = _graph_adapter.validate_python(graph)
+    ordered = {
+        station_tfl_id: sorted(connections, key=_connection_sort_key)
+        for station_tfl_id, connections in sorted(validated.items())
+    }
+    body = _graph_adapter.dump_json(ordered)
+    return NetworkGraphArtifact(
+        etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        gzip_body=gzip.compress(body, mtime=0),
+        stations_count=len(validated),
+        built_at=datetime.now(UTC),
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header value against an ETag.
+
+    Supports "*", comma-separated lists and weak validators (W/ prefix), which
+    match under the weak comparison If-None-Match uses.
+
+    Args:
+        if_none_match: If-None-Match header value (None if absent)
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's cached copy is current
+
+    Example:
+        >>> etag_matches('W/"abc", "def"', '"abc"')
+        True
+        >>> etag_matches(None, '"abc"')
+        False
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        value = candidate.strip()
+        if value == "*" or value.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def decompress_network_graph(artifact: NetworkGraphArtifact) -> bytes:
+    """
+    Get the uncompressed JSON body of an artifact.
+
+    Args:
+        artifact: Network graph artifact
+
+    Returns:
+        JSON adjacency list as bytes
+    """
+    return gzip.decompress(artifact.gzip_body)
@@ -0,0 +1,124 @@
+"""Helpers for combining rolled-up and live notification counts.
+
+Admin analytics read notification counts from the notification_log_daily_stats rollup
+for complete UTC days, and from notification_logs only for the days after the last
+rolled-up day (see app/services/notification_stats_service.py).
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time, timedelta
+
+from app.models.notification import NotificationMethod, NotificationStatus
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationCountRow:
+    """
+    Notification counts for one (method, status) pair.
+
+    Attributes:
+        method: Notification method
+        status: Notification status
+        total: Count over all time
+        recent: Count within the recent period (e.g., the last 30 days)
+    """
+
+    method: NotificationMethod
+    status: NotificationStatus
+    total: int
+    recent: int
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationCounts:
+    """
+    Notification counts for the admin dashboard.
+
+    Attributes:
+        total: All notifications, any status
+        successful: Notifications with status SENT
+        failed: Notifications with status FAILED
+        by_method_recent: Method value -> notifications in the recent period, any status
+    """
+
+    total: int = 0
+    successful: int = 0
+    failed: int = 0
+    by_method_recent: dict[str, int] = field(default_factory=dict)
+
+    def count_by_status(self, status: NotificationStatus | None) -> int:
+        """
+        Get the number of notifications with a status.
+
+        Args:
+            status: Notification status, or None for any status
+
+        Returns:
+            Notification count
+        """
+        if status is None:
+            return self.total
+        if status == NotificationStatus.SENT:
+            return self.successful
+        if status == NotificationStatus.FAILED:
+            return self.failed
+        return self.total - self.successful - self.failed
+
+
+def get_live_counts_start(last_rolled_up_day: date | None) -> datetime | None:
+    """
+    Get the time from which notifications must be counted from the live log.
+
+    The rollup holds complete UTC days up to and including last_rolled_up_day, so
+    anything sent from the following midnight (UTC) onwards is not yet rolled up.
+
+    Pure function for easy testing.
+
+    Args:
+        last_rolled_up_day: Latest day in the rollup, or None if the rollup is empty
+
+    Returns:
+        Start of the day after last_rolled_up_day (UTC), or None to count the whole log
+
+    Example:
+        >>> get_live_counts_start(date(2025, 1, 6))
+        datetime.datetime(2025, 1, 7, 0, 0, tzinfo=datetime.timezone.utc)
+    """
+    if last_rolled_up_day is None:
+        return None
+    return datetime.combine(last_rolled_up_day + timedelta(days=1), time.min, tzinfo=UTC)
+
+
+def summarize_notification_counts(rows: Iterable[NotificationCountRow]) -> NotificationCounts:
+    """
+    Sum per-(method, status) counts into dashboard totals.
+
+    Rows for the same pair (e.g., one from the rollup and one from the live log) are added.
+
+    Pure function for easy testing.
+
+    Args:
+        rows: Counts per (method, status)
+
+    Returns:
+        Totals by status and recent counts by method
+    """
+    total = successful = failed = 0
+    by_method_recent: dict[str, int] = {}
+    for row in rows:
+        total += row.total
+        if row.status == NotificationStatus.SENT:
+            successful += row.total
+        elif row.status == NotificationStatus.FAILED:
+            failed += row.total
+        if row.recent:
+            method = NotificationMethod(row.method).value
+            by_method_recent[method] = by_method_recent.get(method, 0) + row.recent
+
+    return NotificationCounts(
+        total=total,
+        successful=successful,
+        failed=failed,
+        by_method_recent=by_method_recent,
+    )
@@ -0,0 +1,66 @@
+"""Keyset (cursor) pagination helpers.
+
+Keyset pagination pages through rows ordered by (timestamp, id) descending by asking
+for rows strictly before the last row of the previous page, instead of skipping
+OFFSET rows. With an index on (timestamp, id) each page costs the same however deep it is.
+
+The cursor handed to clients is an opaque URL-safe string encoding that last row's
+(timestamp, id).
+"""
+
+import base64
+from datetime import datetime
+from uuid import UUID
+
+CURSOR_SEPARATOR = "|"
+
+
+def encode_keyset_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Pure function for easy testing.
+
+    Args:
+        timestamp: Sort timestamp of the row (e.g., sent_at, created_at)
+        row_id: Row ID (tie-breaker for rows with the same timestamp)
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{timestamp.isoformat()}{CURSOR_SEPARATOR}{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor created by encode_keyset_cursor().
+
+    Pure function for easy testing.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (timestamp, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    Example:
+        >>> decode_keyset_cursor(encode_keyset_cursor(log.sent_at, log.id)) == (log.sent_at, log.id)
+        True
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp_str, row_id_str = raw.split(CURSOR_SEPARATOR)
+        timestamp = datetime.fromisoformat(timestamp_str)
+        row_id = UUID(row_id_str)
+        if timestamp.tzinfo is None:
+            msg = "Cursor timestamp has no timezone"
+            raise ValueError(msg)
+    except ValueError as exc:  # Includes binascii.Error and UnicodeDecodeError
+        msg = f"Invalid pagination cursor: {cursor!r}"
+        raise ValueError(msg) from exc
+
+    return timestamp, row_id
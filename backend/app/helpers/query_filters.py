@@ -0,0 +1,39 @@
+"""
+Query filter helpers for matching a column against large value lists.
+
+column.in_(values) renders one bind parameter per value, and asyncpg rejects
+statements with more than 32767 parameters. Alert cycles filter by every candidate
+route (and the contacts they notify), which can exceed that at scale, so those
+filters bind the whole list as a single PostgreSQL array instead.
+
+Usage example:
+    query = select(UserRoute).where(any_of(UserRoute.id, route_ids))
+"""
+
+from collections.abc import Collection
+from typing import Any
+
+from sqlalchemy import ColumnElement, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def any_of(column: InstrumentedAttribute[Any], values: Collection[Any]) -> ColumnElement[bool]:
+    """
+    Match a column against a list of values bound as one array parameter.
+
+    Renders as "column = ANY(:param)", so the statement has one parameter however
+    many values there are.
+
+    Args:
+        column: Column to filter on (e.g., UserRoute.id)
+        values: Values to match
+
+    Returns:
+        Filter expression for .where()
+
+    Example:
+        >>> str(any_of(UserRoute.id, [route_id]))
+        'user_routes.id = ANY (:param_1)'
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(column.type)))
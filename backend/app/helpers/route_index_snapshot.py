@@ -0,0 +1,161 @@
+"""In-memory snapshot of the route station index for bulk disruption matching.
+
+Loading (line_tfl_id, station_naptan) pairs one route at a time costs one SQL round-trip
+per route. This module loads the active UserRouteStationIndex rows for many routes in a
+single streaming query and builds a compact inverted structure that can be shared by
+AlertService (once per alert cycle) and DisruptionMatchingService (once per request).
+"""
+
+import sys
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.query_filters import any_of
+from app.helpers.soft_delete_filters import add_active_filter
+from app.models.user_route_index import UserRouteStationIndex
+
+# Rows fetched per round-trip when streaming the index
+SNAPSHOT_STREAM_BATCH_SIZE = 5000
+
+
+@dataclass(slots=True)
+class RouteIndexSnapshot:
+    """
+    Inverted route station index held in process memory.
+
+    Attributes:
+        pairs_by_route: route_id -> set of (line_tfl_id, station_naptan) pairs
+        routes_by_pair: (line_tfl_id, station_naptan) -> set of route_ids
+        route_ids: Routes the snapshot was loaded for (None if loaded for all routes).
+            Routes in this set with no pairs are known to have no active index rows.
+    """
+
+    pairs_by_route: dict[UUID, set[tuple[str, str]]] = field(default_factory=dict)
+    routes_by_pair: dict[tuple[str, str], set[UUID]] = field(default_factory=dict)
+    route_ids: frozenset[UUID] | None = None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[UUID, str, str]],
+        route_ids: Collection[UUID] | None = None,
+    ) -> "RouteIndexSnapshot":
+        """
+        Build a snapshot from (route_id, line_tfl_id, station_naptan) rows.
+
+        Line and station identifiers are interned so that the many repeated values
+        across routes share a single string object.
+
+        Args:
+            rows: Index rows as (route_id, line_tfl_id, station_naptan) tuples
+            route_ids: Routes the rows were loaded for (None if unrestricted)
+
+        Returns:
+            Populated RouteIndexSnapshot
+
+        Example:
+            >>> from uuid import uuid4
+            >>> route_id = uuid4()
+            >>> snapshot = RouteIndexSnapshot.from_rows([(route_id, "victoria", "940GZZLUKSX")])
+            >>> snapshot.get_route_pairs(route_id)
+            {('victoria', '940GZZLUKSX')}
+            >>> snapshot.routes_for_pairs([("victoria", "940GZZLUKSX")]) == {route_id}
+            True
+        """
+        snapshot = cls(route_ids=frozenset(route_ids) if route_ids is not None else None)
+        for route_id, line_tfl_id, station_naptan in rows:
+            snapshot.add(route_id, line_tfl_id, station_naptan)
+        return snapshot
+
+    def add(self, route_id: UUID, line_tfl_id: str, station_naptan: str) -> None:
+        """
+        Add a single index entry to the snapshot.
+
+        Args:
+            route_id: Route UUID
+            line_tfl_id: TfL line ID
+            station_naptan: Station NaPTAN code
+        """
+        pair = (sys.intern(line_tfl_id), sys.intern(station_naptan))
+        self.pairs_by_route.setdefault(route_id, set()).add(pair)
+        self.routes_by_pair.setdefault(pair, set()).add(route_id)
+
+    def covers(self, route_id: UUID) -> bool:
+        """Return True if the snapshot was loaded for this route."""
+        return self.route_ids is None or route_id in self.route_ids
+
+    def get_route_pairs(self, route_id: UUID) -> set[tuple[str, str]]:
+        """
+        Get (line_tfl_id, station_naptan) pairs for a route.
+
+        Args:
+            route_id: Route UUID
+
+        Returns:
+            Copy of the route's pairs (empty set if the route has no active index rows)
+        """
+        return set(self.pairs_by_route.get(route_id, ()))
+
+    def routes_for_pairs(self, pairs: Iterable[tuple[str, str]]) -> set[UUID]:
+        """
+        Find routes passing through any of the given (line_tfl_id, station_naptan) pairs.
+
+        Args:
+            pairs: Pairs to look up (e.g., from extract_line_station_pairs)
+
+        Returns:
+            Set of matching route IDs
+        """
+        matched: set[UUID] = set()
+        for pair in pairs:
+            matched.update(self.routes_by_pair.get(pair, ()))
+        return matched
+
+    def __len__(self) -> int:
+        """Number of routes with at least one index entry."""
+        return len(self.pairs_by_route)
+
+
+async def load_route_index_snapshot(
+    db: AsyncSession,
+    route_ids: Collection[UUID] | None = None,
+) -> RouteIndexSnapshot:
+    """
+    Load active route index entries in one streaming query.
+
+    Rows are streamed in batches of SNAPSHOT_STREAM_BATCH_SIZE so the full result set
+    is never buffered as ORM objects; only the compact snapshot is kept.
+
+    Args:
+        db: Database session
+        route_ids: Optional routes to restrict the snapshot to. None loads the whole
+            active index.
+
+    Returns:
+        RouteIndexSnapshot for the requested routes
+
+    Example:
+        snapshot = await load_route_index_snapshot(db, [route.id for route in routes])
+        pairs = snapshot.get_route_pairs(route.id)
+    """
+    if route_ids is not None and not route_ids:
+        return RouteIndexSnapshot(route_ids=frozenset())
+
+    query = select(
+        UserRouteStationIndex.route_id,
+        UserRouteStationIndex.line_tfl_id,
+        UserRouteStationIndex.station_naptan,
+    ).execution_options(yield_per=SNAPSHOT_STREAM_BATCH_SIZE)
+    query = add_active_filter(query, UserRouteStationIndex)
+    if route_ids is not None:
+        query = query.where(any_of(UserRouteStationIndex.route_id, route_ids))
+
+    snapshot = RouteIndexSnapshot(route_ids=frozenset(route_ids) if route_ids is not None else None)
+    result = await db.stream(query)
+    async for route_id, line_tfl_id, station_naptan in result:
+        snapshot.add(route_id, line_tfl_id, station_naptan)
+    return snapshot
@@ -2,8 +2,8 @@
 Route validation helpers for directional validation.
 
 These pure functions enable testable, functional-style route validation logic
-without requiring database access. They are used by TfLService._check_connection()
-for validating station connections on TfL lines.
+without requiring database access. They define the connection semantics that
+app.helpers.route_variant_index compiles for TfLService._check_connection().
 
 Issue #57: Route direction validation
 """
@@ -0,0 +1,160 @@
+"""Compiled route variant index for constant-time connection validation.
+
+find_valid_connection_in_routes() scans every route variant with list.index for each
+station pair it checks. Route validation checks many pairs per line (one per segment,
+times every hub-equivalent combination), so this module compiles each line's route
+variants once into station -> {variant index: position} and keeps the result in process
+memory. Checking a pair is then a couple of dictionary lookups and integer comparisons.
+
+Compiled entries are keyed by line ID and tagged with Line.updated_at, so a line whose
+route variants were rebuilt (by this or another process) is recompiled on next use.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
+from app.helpers.route_validation import ConnectionResult, RouteVariant
+from app.models.tfl import Line
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRouteVariants:
+    """
+    Route variants of one line compiled for station lookups.
+
+    Attributes:
+        variants: (name, direction) of each route variant, in stored order
+        positions: station_tfl_id -> {variant index: position of the station in that variant}
+    """
+
+    variants: tuple[tuple[str | None, str | None], ...]
+    positions: dict[str, dict[int, int]]
+
+    @classmethod
+    def from_routes(cls, routes: list[RouteVariant]) -> Self:
+        """
+        Compile a list of route variants.
+
+        Only the first occurrence of a station in a variant is recorded, matching
+        list.index in find_valid_connection_in_routes().
+
+        Args:
+            routes: Route variant dicts from Line.route_variants["routes"]
+
+        Returns:
+            CompiledRouteVariants for the routes
+
+        Example:
+            >>> compiled = CompiledRouteVariants.from_routes(
+            ...     [{"name": "A → C", "direction": "inbound", "service_type": "Regular", "stations": ["A", "B", "C"]}]
+            ... )
+            >>> compiled.positions["B"]
+            {0: 1}
+        """
+        positions: dict[str, dict[int, int]] = {}
+        for variant_index, route in enumerate(routes):
+            for position, station_tfl_id in enumerate(route.get("stations", [])):
+                positions.setdefault(station_tfl_id, {}).setdefault(variant_index, position)
+        variants = tuple((route.get("name"), route.get("direction")) for route in routes)
+        return cls(variants=variants, positions=positions)
+
+    def find_connection(self, from_station_tfl_id: str, to_station_tfl_id: str) -> ConnectionResult | None:
+        """
+        Find the first route variant where from_station comes before to_station.
+
+        Same contract as find_valid_connection_in_routes(): a found result for the first
+        variant in stored order with a valid connection, otherwise the first backwards
+        result (both stations present, wrong order), otherwise None.
+
+        Args:
+            from_station_tfl_id: Starting station TfL ID
+            to_station_tfl_id: Destination station TfL ID
+
+        Returns:
+            ConnectionResult, or None if the stations share no route variant
+
+        Example:
+            >>> compiled = CompiledRouteVariants.from_routes(
+            ...     [{"name": "A → C", "direction": "inbound", "service_type": "Regular", "stations": ["A", "B", "C"]}]
+            ... )
+            >>> compiled.find_connection("A", "C")["found"]
+            True
+            >>> compiled.find_connection("C", "A")["found"]
+            False
+            >>> compiled.find_connection("A", "D") is None
+            True
+        """
+        from_positions = self.positions.get(from_station_tfl_id)
+        to_positions = self.positions.get(to_station_tfl_id)
+        if not from_positions or not to_positions:
+            return None
+
+        backwards_result = None
+        for variant_index, from_index in from_positions.items():
+            to_index = to_positions.get(variant_index)
+            if to_index is None:
+                continue
+
+            route_name, direction = self.variants[variant_index]
+            result = ConnectionResult(
+                found=from_index < to_index,
+                from_index=from_index,
+                to_index=to_index,
+                route_name=route_name,
+                direction=direction,
+            )
+            if result["found"]:
+                return result
+            if backwards_result is None:
+                backwards_result = result
+
+        return backwards_result
+
+
+# line_id -> (Line.updated_at the entry was compiled from, compiled variants)
+_compiled_route_variants: dict[UUID, tuple[datetime, CompiledRouteVariants]] = {}
+
+
+def get_compiled_route_variants(line: Line) -> CompiledRouteVariants | None:
+    """
+    Get the compiled route variants for a line, compiling them if missing or stale.
+
+    Args:
+        line: Line with route_variants loaded
+
+    Returns:
+        CompiledRouteVariants, or None if the line has no route variants
+    """
+    if not line.route_variants or "routes" not in line.route_variants:
+        return None
+
+    entry = _compiled_route_variants.get(line.id)
+    if entry is not None and entry[0] == line.updated_at:
+        return entry[1]
+
+    compiled = CompiledRouteVariants.from_routes(line.route_variants["routes"])
+    # Lines not yet flushed have no updated_at to detect later changes with, so don't keep them
+    if line.updated_at is not None:
+        _compiled_route_variants[line.id] = (line.updated_at, compiled)
+    return compiled
+
+
+def compile_route_variants(lines: Iterable[Line]) -> int:
+    """
+    Compile route variants for several lines up front (e.g. after a graph build).
+
+    Args:
+        lines: Lines with route_variants loaded
+
+    Returns:
+        Number of lines with compiled route variants
+    """
+    return sum(1 for line in lines if get_compiled_route_variants(line) is not None)
+
+
+def clear_compiled_route_variants() -> None:
+    """Drop all compiled route variants (primarily for testing)."""
+    _compiled_route_variants.clear()
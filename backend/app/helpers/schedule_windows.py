@@ -0,0 +1,101 @@
+"""Minute-of-week schedule windows for the route schedule index.
+
+A route schedule ("MON-FRI 08:00-09:30" in the route's timezone) becomes one window
+per day, each stored as a [start_minute, end_minute] range of minutes since Monday
+00:00 in the route's local time. Finding the routes with a schedule open now then only
+needs the current minute of week in each timezone in use, instead of converting the
+current time for every route and checking every schedule.
+
+Windows are kept in local time so they follow daylight saving changes without being
+rebuilt. They are minute-granular and inclusive of both ends, so they select a
+superset of the routes is_time_in_schedule_window() accepts for the same moment.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, time
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+MINUTES_PER_DAY = 24 * 60
+
+# Day codes in Python weekday order (0=Monday)
+DAY_CODES = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
+
+def get_minute_of_week(local_dt: datetime) -> int:
+    """
+    Get the number of whole minutes since Monday 00:00 for a local datetime.
+
+    Pure function for easy testing.
+
+    Args:
+        local_dt: Datetime in the timezone the minute of week is wanted for
+
+    Returns:
+        Minute of week (0 to 10079)
+
+    Example:
+        >>> get_minute_of_week(datetime(2025, 1, 7, 8, 30))  # Tuesday
+        1950
+    """
+    return local_dt.weekday() * MINUTES_PER_DAY + local_dt.hour * 60 + local_dt.minute
+
+
+def get_schedule_windows(
+    days_of_week: Iterable[str],
+    start_time: time,
+    end_time: time,
+) -> list[tuple[int, int]]:
+    """
+    Expand a schedule into one minute-of-week window per scheduled day.
+
+    Pure function for easy testing.
+
+    Args:
+        days_of_week: Day codes the schedule applies to (MON, TUE, ...)
+        start_time: Schedule start time (local)
+        end_time: Schedule end time (local, after start_time)
+
+    Returns:
+        List of inclusive (start_minute, end_minute) windows, in day order.
+        Unknown day codes are ignored.
+
+    Example:
+        >>> get_schedule_windows(["TUE", "MON"], time(8, 0), time(9, 30))
+        [(480, 570), (1920, 2010)]
+    """
+    days = set(days_of_week)
+    start_offset = start_time.hour * 60 + start_time.minute
+    end_offset = end_time.hour * 60 + end_time.minute
+    return [
+        (day_index * MINUTES_PER_DAY + start_offset, day_index * MINUTES_PER_DAY + end_offset)
+        for day_index, day_code in enumerate(DAY_CODES)
+        if day_code in days
+    ]
+
+
+def get_local_minutes_of_week(timezones: Iterable[str], now_utc: datetime) -> dict[str, int]:
+    """
+    Get the current minute of week in each timezone.
+
+    Pure function for easy testing.
+
+    Args:
+        timezones: IANA timezone names
+        now_utc: Current time (timezone-aware)
+
+    Returns:
+        Timezone name -> current local minute of week. Unknown timezones are left out,
+        since routes in them can't match a schedule either.
+
+    Example:
+        >>> get_local_minutes_of_week(["Europe/London"], datetime(2025, 1, 6, 8, 0, tzinfo=UTC))
+        {'Europe/London': 480}
+    """
+    minutes: dict[str, int] = {}
+    for timezone in timezones:
+        try:
+            zone = ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            continue
+        minutes[timezone] = get_minute_of_week(now_utc.astimezone(zone))
+    return minutes
@@ -31,6 +31,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql import Select
 
+from app.helpers.query_filters import any_of
 from app.models.base import BaseModel
 
 # TypeVar for maintaining type safety across query transformations
@@ -202,7 +203,7 @@ async def get_active_children_for_parents(  # noqa: UP047
         return {}
 
     # Query all active children for these parents
-    query = select(child_model).where(parent_id_column.in_(parent_ids))
+    query = select(child_model).where(any_of(parent_id_column, parent_ids))
     query = add_active_filter(query, child_model)
 
     result = await db.execute(query)
@@ -0,0 +1,67 @@
+"""Admin user search helpers.
+
+Admin user search matches a term anywhere in a user's ID, external_id, email
+addresses, or phone numbers. Each of those columns has a pg_trgm GIN index, which
+PostgreSQL can use for ILIKE '%term%' lookups, so the search is built as a union of
+per-table lookups rather than outer joins that fan out per contact.
+"""
+
+from sqlalchemy import ColumnElement, Text, cast, or_, select, union
+
+from app.models.user import EmailAddress, PhoneNumber, User
+
+LIKE_ESCAPE_CHAR = "\\"
+
+
+def build_contains_pattern(search: str) -> str:
+    """
+    Build an ILIKE pattern matching a search term anywhere in a value.
+
+    LIKE wildcards in the term are escaped so that, for example, the underscore in
+    "first_last@example.com" only matches an underscore.
+
+    Pure function for easy testing.
+
+    Args:
+        search: Search term entered by an admin
+
+    Returns:
+        Pattern for use with ilike(pattern, escape=LIKE_ESCAPE_CHAR)
+
+    Example:
+        >>> build_contains_pattern("alice@example.com")
+        '%alice@example.com%'
+    """
+    escaped = (
+        search.replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+        .replace("%", f"{LIKE_ESCAPE_CHAR}%")
+        .replace("_", f"{LIKE_ESCAPE_CHAR}_")
+    )
+    return f"%{escaped}%"
+
+
+def user_search_condition(search: str) -> ColumnElement[bool]:
+    """
+    Build a filter for users whose ID, external_id, email, or phone contains a term.
+
+    Each branch of the union is served by its own trigram index, and the union removes
+    duplicates, so users with several matching contacts are only returned once.
+
+    Args:
+        search: Search term entered by an admin
+
+    Returns:
+        Condition on User.id for use in a where() clause
+    """
+    pattern = build_contains_pattern(search)
+    matching_user_ids = union(
+        select(User.id).where(
+            or_(
+                cast(User.id, Text).ilike(pattern, escape=LIKE_ESCAPE_CHAR),
+                User.external_id.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
+            )
+        ),
+        select(EmailAddress.user_id).where(EmailAddress.email.ilike(pattern, escape=LIKE_ESCAPE_CHAR)),
+        select(PhoneNumber.user_id).where(PhoneNumber.phone.ilike(pattern, escape=LIKE_ESCAPE_CHAR)),
+    )
+    return User.id.in_(matching_user_ids)
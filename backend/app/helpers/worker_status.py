@@ -0,0 +1,112 @@
+"""Celery worker heartbeats published to Redis for the admin worker-status endpoint.
+
+Each worker periodically writes a small status record (see app/celery/worker_status.py)
+into one Redis hash, keyed by worker hostname. Reading worker health is then a single
+HGETALL instead of broadcasting inspect commands to every worker and waiting for replies.
+"""
+
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Self
+
+# Redis hash of worker hostname -> WorkerHeartbeat JSON
+WORKER_STATUS_KEY = "celery:worker:status"
+
+# The hash expires this long after the last heartbeat from any worker
+WORKER_STATUS_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerHeartbeat:
+    """
+    Status snapshot published by one Celery worker.
+
+    Attributes:
+        hostname: Worker node name (e.g., celery@host)
+        sent_at: When the snapshot was taken (UTC)
+        active_tasks: Tasks currently executing
+        scheduled_tasks: Tasks received but not started (waiting for a pool slot or an ETA)
+    """
+
+    hostname: str
+    sent_at: datetime
+    active_tasks: int
+    scheduled_tasks: int
+
+    def to_json(self) -> str:
+        """Serialize for storage in the worker status hash."""
+        return json.dumps(
+            {
+                "hostname": self.hostname,
+                "sent_at": self.sent_at.isoformat(),
+                "active_tasks": self.active_tasks,
+                "scheduled_tasks": self.scheduled_tasks,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> Self:
+        """
+        Deserialize a heartbeat written by to_json().
+
+        Raises:
+            ValueError: If the data is not a valid heartbeat
+        """
+        try:
+            payload = json.loads(data)
+            return cls(
+                hostname=str(payload["hostname"]),
+                sent_at=datetime.fromisoformat(payload["sent_at"]),
+                active_tasks=int(payload["active_tasks"]),
+                scheduled_tasks=int(payload["scheduled_tasks"]),
+            )
+        except (KeyError, TypeError, json.JSONDecodeError) as exc:
+            msg = f"Invalid worker heartbeat: {data!r}"
+            raise ValueError(msg) from exc
+
+
+def parse_worker_heartbeats(raw: Mapping[str, str]) -> list[WorkerHeartbeat]:
+    """
+    Parse the worker status hash, skipping malformed entries.
+
+    Pure function for easy testing.
+
+    Args:
+        raw: Worker hostname -> heartbeat JSON, as returned by HGETALL
+
+    Returns:
+        Valid heartbeats, most recent first
+    """
+    heartbeats = []
+    for data in raw.values():
+        try:
+            heartbeats.append(WorkerHeartbeat.from_json(data))
+        except ValueError:
+            continue
+    return sorted(heartbeats, key=lambda heartbeat: heartbeat.sent_at, reverse=True)
+
+
+def get_live_heartbeats(
+    heartbeats: Iterable[WorkerHeartbeat],
+    now: datetime,
+    stale_after: timedelta,
+) -> list[WorkerHeartbeat]:
+    """
+    Filter heartbeats to workers that reported recently enough to be considered alive.
+
+    A worker whose event loop is blocked or frozen stops publishing, so its heartbeat
+    goes stale just like one that has shut down.
+
+    Pure function for easy testing.
+
+    Args:
+        heartbeats: Published heartbeats
+        now: Current time (UTC)
+        stale_after: Maximum heartbeat age for a live worker
+
+    Returns:
+        Heartbeats no older than stale_after
+    """
+    return [heartbeat for heartbeat in heartbeats if now - heartbeat.sent_at <= stale_after]
@@ -19,14 +19,18 @@ from app import __version__
 from app.api import admin, auth, contacts, notification_preferences, routes, tfl
 from app.core.config import settings
 from app.core.database import get_engine, get_session_factory
+from app.core.jwks import close_jwks_cache, init_jwks_cache
 from app.core.logging import configure_logging
+from app.core.rate_limiter import close_rate_limiter, init_rate_limiter
 from app.core.redis import get_redis_client
+from app.core.smtp_pool import close_smtp_pool, init_smtp_pool
 from app.core.telemetry import (
     get_tracer_provider,
     set_logger_provider,
     shutdown_logger_provider,
     shutdown_tracer_provider,
 )
+from app.core.tfl_client import close_tfl_resources, init_tfl_resources
 from app.middleware import AccessLoggingMiddleware
 from app.services.alert_service import warm_up_line_state_cache
 from app.services.tfl_service import warm_up_metadata_cache
@@ -84,9 +88,36 @@ def _check_alembic_migrations(sync_conn: Connection) -> str | None:
     return current_rev
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Application lifespan - initialize OTEL providers and validate database on startup."""
+async def _warm_up_redis_caches() -> None:
+    """Rehydrate Redis caches from the database on startup (never raises for cache errors)."""
+    # Warm up Redis cache from database (eliminates cold-start TfL API dependency)
+    # warm_up_metadata_cache handles all exceptions internally
+    async with get_session_factory()() as session:
+        counts = await warm_up_metadata_cache(session, settings.REDIS_URL)
+        logger.info(
+            "redis_cache_warmup_complete",
+            severity_codes=counts["severity_codes_count"],
+            disruption_categories=counts["disruption_categories_count"],
+            stop_types=counts["stop_types_count"],
+        )
+
+    # Warm up line disruption state cache from database
+    # Rehydrates Redis with latest aggregate state hash per line
+    # warm_up_line_state_cache handles all exceptions internally
+    redis_client = await get_redis_client()
+    try:
+        async with get_session_factory()() as session:
+            lines_count = await warm_up_line_state_cache(session, redis_client)
+            logger.info(
+                "line_state_cache_warmup_complete",
+                lines_hydrated=lines_count,
+            )
+    finally:
+        await redis_client.aclose()
+
+
+def _init_process_resources() -> None:
+    """Set up this worker process's OTEL providers and shared clients."""
     # Initialize TracerProvider and LoggerProvider in lifespan (after fork) so each worker
     # gets its own providers with proper threading. Instrumentors were already called at module level.
     if settings.OTEL_ENABLED:
@@ -98,18 +129,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         set_logger_provider()
         logger.info("otel_logger_provider_initialized")
 
-    # Skip database validation in DEBUG mode (tests use mock databases/contexts)
-    if settings.DEBUG:
-        logger.info("debug_mode_startup", message="skipping database validation")
-        yield
-        # Shutdown OTEL if enabled
-        if settings.OTEL_ENABLED:
-            shutdown_logger_provider()
-            shutdown_tracer_provider()
-        logger.info("shutdown_complete")
-        return
+    # Shared TfL API clients and cache connection pool for all requests in this process
+    init_tfl_resources()
+    # Pooled SMTP connections for verification emails sent by this process
+    init_smtp_pool()
+    # Redis-backed rate limits for verification codes and contact additions
+    init_rate_limiter()
 
-    # Production mode: Validate database
+
+async def _close_process_resources() -> None:
+    """Close this worker process's shared clients (including the JWKS cache, if started) and OTEL providers."""
+    await close_tfl_resources()
+    await close_smtp_pool()
+    await close_rate_limiter()
+    await close_jwks_cache()
+    if settings.OTEL_ENABLED:
+        shutdown_logger_provider()
+        shutdown_tracer_provider()
+
+
+async def _validate_database() -> None:
+    """Check database connectivity and that migrations are up to date (raises on failure)."""
     logger.info("startup_initializing", message="validating database")
 
     try:
@@ -132,30 +172,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         logger.error("startup_failed", error=str(e))
         raise
 
-    # Warm up Redis cache from database (eliminates cold-start TfL API dependency)
-    # warm_up_metadata_cache handles all exceptions internally
-    async with get_session_factory()() as session:
-        counts = await warm_up_metadata_cache(session, settings.REDIS_URL)
-        logger.info(
-            "redis_cache_warmup_complete",
-            severity_codes=counts["severity_codes_count"],
-            disruption_categories=counts["disruption_categories_count"],
-            stop_types=counts["stop_types_count"],
-        )
 
-    # Warm up line disruption state cache from database
-    # Rehydrates Redis with latest aggregate state hash per line
-    # warm_up_line_state_cache handles all exceptions internally
-    redis_client = await get_redis_client()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    """Application lifespan - initialize OTEL providers and validate database on startup."""
+    _init_process_resources()
+
+    # Skip database validation in DEBUG mode (tests use mock databases/contexts)
+    if settings.DEBUG:
+        logger.info("debug_mode_startup", message="skipping database validation")
+        yield
+        await _close_process_resources()
+        logger.info("shutdown_complete")
+        return
+
+    # Production mode: Validate database
     try:
-        async with get_session_factory()() as session:
-            lines_count = await warm_up_line_state_cache(session, redis_client)
-            logger.info(
-                "line_state_cache_warmup_complete",
-                lines_hydrated=lines_count,
-            )
-    finally:
-        await redis_client.aclose()
+        await _validate_database()
+    except Exception:
+        # Don't leave this process's clients registered when startup fails
+        await _close_process_resources()
+        raise
+
+    await _warm_up_redis_caches()
+    # Fetch Auth0's signing keys now and keep them fresh in the background (DEBUG uses mock JWKS)
+    await init_jwks_cache()
 
     logger.info("startup_complete")
 
@@ -163,9 +204,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
 
     # Shutdown
     logger.info("shutdown_starting")
-    if settings.OTEL_ENABLED:
-        shutdown_logger_provider()
-        shutdown_tracer_provider()
+    await _close_process_resources()
     await get_engine().dispose()
     logger.info("shutdown_complete")
 
@@ -6,6 +6,7 @@ from app.models.admin import AdminRole, AdminUser
 from app.models.base import Base, BaseModel
 from app.models.notification import (
     NotificationLog,
+    NotificationLogDailyStat,
     NotificationMethod,
     NotificationPreference,
     NotificationStatus,
@@ -27,7 +28,7 @@ from app.models.user import (
     VerificationType,
 )
 from app.models.user_route import UserRoute, UserRouteSchedule, UserRouteSegment
-from app.models.user_route_index import UserRouteStationIndex
+from app.models.user_route_index import UserRouteScheduleWindow, UserRouteStationIndex
 
 __all__ = [
     # Base
@@ -54,9 +55,11 @@ __all__ = [
     "UserRouteSegment",
     "UserRouteSchedule",
     "UserRouteStationIndex",
+    "UserRouteScheduleWindow",
     # Notification models
     "NotificationPreference",
     "NotificationLog",
+    "NotificationLogDailyStat",
     "NotificationMethod",
     "NotificationStatus",
     # Admin models
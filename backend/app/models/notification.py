@@ -2,16 +2,19 @@
 
 import enum
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     CheckConstraint,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
     Index,
+    Integer,
     Text,
+    UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -114,7 +117,6 @@ class NotificationLog(BaseModel):
     sent_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,  # For time-based queries
     )
     method: Mapped[NotificationMethod] = mapped_column(
         Enum(
@@ -147,8 +149,69 @@ class NotificationLog(BaseModel):
     __table_args__ = (
         Index("ix_notification_logs_user_sent", "user_id", "sent_at"),
         Index("ix_notification_logs_route_sent", "route_id", "sent_at"),
+        # Time-based queries and keyset pagination of admin log listings (newest first)
+        Index("ix_notification_logs_sent_at_id", "sent_at", "id"),
+        Index("ix_notification_logs_status_sent_at_id", "status", "sent_at", "id"),
     )
 
     def __repr__(self) -> str:
         """String representation of the notification log."""
         return f"<NotificationLog(id={self.id}, method={self.method}, status={self.status})>"
+
+
+class NotificationLogDailyStat(BaseModel):
+    """
+    Daily rollup of NotificationLog counts per method and status.
+
+    Maintained by the refresh_notification_stats Celery task
+    (NotificationStatsService.refresh_daily_stats), so admin analytics read a few rows
+    per day instead of scanning notification_logs. Only complete UTC days are rolled up;
+    notifications sent after the latest rolled-up day are counted from notification_logs.
+    """
+
+    __tablename__ = "notification_log_daily_stats"
+
+    day: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="UTC day the notifications were sent",
+    )
+    method: Mapped[NotificationMethod] = mapped_column(
+        Enum(
+            NotificationMethod,
+            name="notification_method",
+            create_constraint=True,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
+    status: Mapped[NotificationStatus] = mapped_column(
+        Enum(
+            NotificationStatus,
+            name="notification_status",
+            create_constraint=True,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of notifications sent that day with this method and status",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "method",
+            "status",
+            name="uq_notification_log_daily_stats_day_method_status",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the notification log daily stat."""
+        return (
+            f"<NotificationLogDailyStat(day={self.day}, method={self.method}, "
+            f"status={self.status}, count={self.count})>"
+        )
@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, String
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,8 +42,20 @@ class User(BaseModel):
         cascade="all, delete-orphan",
     )
 
-    # Composite unique constraint on external_id + auth_provider
-    __table_args__ = (Index("ix_users_external_id_auth_provider", "external_id", "auth_provider", unique=True),)
+    __table_args__ = (
+        # Composite unique constraint on external_id + auth_provider
+        Index("ix_users_external_id_auth_provider", "external_id", "auth_provider", unique=True),
+        # Keyset pagination of admin user listings (newest first)
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Trigram indexes for admin user search (ILIKE '%term%', see app/helpers/user_search.py)
+        Index("ix_users_id_trgm", text("(id::text) gin_trgm_ops"), postgresql_using="gin"),
+        Index(
+            "ix_users_external_id_trgm",
+            "external_id",
+            postgresql_using="gin",
+            postgresql_ops={"external_id": "gin_trgm_ops"},
+        ),
+    )
 
     def __repr__(self) -> str:
         """String representation of the user."""
@@ -84,8 +96,17 @@ class EmailAddress(BaseModel):
     # Relationships
     user: Mapped[User] = relationship(back_populates="email_addresses")
 
-    # Ensure only one primary email per user
-    __table_args__ = (Index("ix_email_addresses_user_id_primary", "user_id", "is_primary"),)
+    __table_args__ = (
+        # Ensure only one primary email per user
+        Index("ix_email_addresses_user_id_primary", "user_id", "is_primary"),
+        # Trigram index for admin user search
+        Index(
+            "ix_email_addresses_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     def __init__(self, **kwargs: object) -> None:
         """Initialize email address with auto-computed hash."""
@@ -132,8 +153,17 @@ class PhoneNumber(BaseModel):
     # Relationships
     user: Mapped[User] = relationship(back_populates="phone_numbers")
 
-    # Ensure only one primary phone per user
-    __table_args__ = (Index("ix_phone_numbers_user_id_primary", "user_id", "is_primary"),)
+    __table_args__ = (
+        # Ensure only one primary phone per user
+        Index("ix_phone_numbers_user_id_primary", "user_id", "is_primary"),
+        # Trigram index for admin user search
+        Index(
+            "ix_phone_numbers_phone_trgm",
+            "phone",
+            postgresql_using="gin",
+            postgresql_ops={"phone": "gin_trgm_ops"},
+        ),
+    )
 
     def __init__(self, **kwargs: object) -> None:
         """Initialize phone number with auto-computed hash."""
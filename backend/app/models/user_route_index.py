@@ -1,9 +1,9 @@
-"""Route station index model for fast disruption matching."""
+"""Route index models for fast disruption matching and schedule lookup."""
 
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -32,8 +32,9 @@ class UserRouteStationIndex(BaseModel):
         - Line.route_variants data changes (detected via line_data_version staleness check)
 
     Soft Delete: This model uses soft delete (deleted_at column from BaseModel).
-    Soft deleted via user_route_index_service._delete_existing_index() when rebuilding
-    index or cascade from parent route. See Issue #233.
+    Rebuilding the index only soft deletes entries the route no longer needs (see
+    user_route_index_service.diff_route_station_index()); all entries are soft deleted
+    in cascade from the parent route. See Issue #233.
     """
 
     __tablename__ = "user_route_station_index"
@@ -77,3 +78,71 @@ class UserRouteStationIndex(BaseModel):
         return (
             f"<UserRouteStationIndex(route_id={self.route_id}, line={self.line_tfl_id}, station={self.station_naptan})>"
         )
+
+
+class UserRouteScheduleWindow(BaseModel):
+    """
+    Precomputed schedule windows answering "which routes are in a schedule window now?".
+
+    One row per day of each active route schedule, holding the window as a range of
+    minutes since Monday 00:00 in the route's timezone (see app/helpers/schedule_windows.py).
+    The alert cycle computes the current minute of week once per timezone in use and
+    only loads routes with a window containing it.
+
+    Example:
+        Route in Europe/London with schedule MON-TUE 08:00-09:30
+        - route_id=123, timezone="Europe/London", start_minute=480, end_minute=570  (MON)
+        - route_id=123, timezone="Europe/London", start_minute=1920, end_minute=2010  (TUE)
+
+    Updated when:
+        - User creates/updates/deletes schedules, or changes the route's timezone
+        - User deletes the route
+
+    Soft Delete: This model uses soft delete (deleted_at column from BaseModel).
+    Soft deleted via user_route_schedule_index_service when rebuilding a route's windows
+    or cascade from parent route. See Issue #233.
+    """
+
+    __tablename__ = "user_route_schedule_windows"
+
+    route_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("user_routes.id", ondelete="RESTRICT"),
+        nullable=False,
+        comment="User's route ID",
+    )
+    schedule_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("user_route_schedules.id", ondelete="RESTRICT"),
+        nullable=False,
+        comment="Route schedule the window was expanded from",
+    )
+    timezone: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        comment="Copy of UserRoute.timezone the window is expressed in",
+    )
+    start_minute: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Window start, minutes since Monday 00:00 local time (inclusive)",
+    )
+    end_minute: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Window end, minutes since Monday 00:00 local time (inclusive)",
+    )
+
+    __table_args__ = (
+        # Primary lookup: "Which routes in timezone X have a window open at minute M?"
+        Index("ix_user_route_schedule_windows_timezone_start", "timezone", "start_minute"),
+        # Cleanup lookup: "Delete all windows for route Z"
+        Index("ix_user_route_schedule_windows_route", "route_id"),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the route schedule window."""
+        return (
+            f"<UserRouteScheduleWindow(route_id={self.route_id}, timezone={self.timezone}, "
+            f"minutes={self.start_minute}-{self.end_minute})>"
+        )
@@ -49,7 +49,7 @@ class WorkerStatusResponse(BaseModel):
 
     worker_available: bool = Field(..., description="Whether a worker is available")
     active_tasks: int = Field(..., description="Number of currently executing tasks")
-    scheduled_tasks: int = Field(..., description="Number of scheduled tasks")
+    scheduled_tasks: int = Field(..., description="Number of tasks received but not started (queued or awaiting ETA)")
     last_heartbeat: datetime | None = Field(
         None,
         description="Timestamp of last worker heartbeat (if available)",
@@ -81,6 +81,7 @@ class RecentLogsResponse(BaseModel):
     logs: list[NotificationLogItem] = Field(..., description="List of notification logs")
     limit: int = Field(..., description="Number of logs per page")
     offset: int = Field(..., description="Starting offset for pagination")
+    next_cursor: str | None = Field(None, description="Cursor for the next page (null on the last page)")
 
 
 # ==================== User Management Schemas ====================
@@ -126,10 +127,11 @@ class UserListItem(BaseModel):
 class PaginatedUsersResponse(BaseModel):
     """Response from paginated user listing."""
 
-    total: int = Field(..., description="Total number of users matching filter")
+    total: int = Field(..., description="Total number of users matching filter (cached briefly)")
     users: list[UserListItem] = Field(..., description="List of users")
     limit: int = Field(..., description="Number of users per page")
     offset: int = Field(..., description="Starting offset for pagination")
+    next_cursor: str | None = Field(None, description="Cursor for the next page (null on the last page)")
 
 
 class RouteBasicInfo(BaseModel):
@@ -4,11 +4,16 @@ import uuid
 from datetime import UTC, datetime, timedelta
 
 from fastapi import HTTPException, status
-from sqlalchemy import String, and_, delete, func, or_, select, update
+from sqlalchemy import ColumnElement, and_, delete, func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.auth import clear_token_cache
+from app.core.config import settings
 from app.core.telemetry import service_span
+from app.core.tiered_cache import get_local_cache
+from app.helpers.pagination import decode_keyset_cursor, encode_keyset_cursor
+from app.helpers.user_search import user_search_condition
 from app.models.admin import AdminUser
 from app.models.notification import NotificationLog, NotificationPreference, NotificationStatus
 from app.models.user import EmailAddress, PhoneNumber, User, VerificationCode
@@ -21,6 +26,7 @@ from app.schemas.admin import (
     RouteStatMetrics,
     UserCountMetrics,
 )
+from app.services.notification_stats_service import NotificationStatsService
 
 # ==================== Pure Calculation Functions ====================
 
@@ -59,6 +65,40 @@ def calculate_avg_routes(total_routes: int, users_with_routes: int) -> float:
     return round(total_routes / users_with_routes, 2)
 
 
+# Process-local cache namespace for admin listing total counts
+USER_COUNT_CACHE_NAMESPACE = "admin_counts"
+
+
+def decode_page_cursor(cursor: str | None, offset: int) -> tuple[datetime, uuid.UUID] | None:
+    """
+    Decode the keyset cursor of a paginated listing request.
+
+    Args:
+        cursor: Optional next_cursor from the previous page
+        offset: Requested offset (must be 0 when a cursor is given)
+
+    Returns:
+        Tuple of (timestamp, id) to page from, or None to page by offset
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid or combined with offset
+    """
+    if cursor is None:
+        return None
+    if offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both.",
+        )
+    try:
+        return decode_keyset_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+        ) from exc
+
+
 class AdminService:
     """Service for admin operations and analytics."""
 
@@ -77,18 +117,29 @@ class AdminService:
         offset: int = 0,
         search: str | None = None,
         include_deleted: bool = False,
-    ) -> tuple[list[User], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[User], int, str | None]:
         """
         Get paginated list of users with optional search and filters.
 
+        Users are ordered newest first by (created_at, id). Pages are selected by offset,
+        or by keyset from a cursor so that deep pages cost the same as the first.
+        Searches use trigram indexes (see app/helpers/user_search.py) and get their total
+        in the same statement as the page. Totals without a search are cached for
+        ADMIN_USER_COUNT_CACHE_TTL_SECONDS.
+
         Args:
             limit: Maximum number of users to return (1-1000)
             offset: Number of users to skip
             search: Optional search term (searches UUID, email, phone, and external_id)
             include_deleted: Whether to include soft-deleted users
+            cursor: Optional next_cursor from the previous page (cannot be combined with offset)
 
         Returns:
-            Tuple of (list of users, total count)
+            Tuple of (list of users, total count, cursor for the next page or None)
+
+        Raises:
+            HTTPException: 400 if the cursor is invalid or combined with offset
         """
         with service_span(
             "admin.get_users_paginated",
@@ -97,72 +148,112 @@ class AdminService:
             span.set_attribute("admin.operation", "get_users_paginated")
             span.set_attribute("admin.limit", limit)
             span.set_attribute("admin.offset", offset)
+            span.set_attribute("admin.cursor_enabled", cursor is not None)
             span.set_attribute("admin.search_enabled", bool(search))
             span.set_attribute("admin.include_deleted", include_deleted)
-            # Build count query (separate from main query to avoid cartesian product)
-            count_query = select(func.count(func.distinct(User.id)))
-
-            # Filter deleted users unless explicitly included
-            if not include_deleted:
-                count_query = count_query.where(User.deleted_at.is_(None))
-
-            # Apply search if provided
-            if search:
-                # Search in UUID (cast to text for partial matching), external_id, email, or phone
-                search_term = f"%{search}%"
-                count_query = (
-                    count_query.outerjoin(User.email_addresses)
-                    .outerjoin(User.phone_numbers)
-                    .where(
-                        or_(
-                            func.cast(User.id, String).ilike(search_term),
-                            User.external_id.ilike(search_term),
-                            EmailAddress.email.ilike(search_term),
-                            PhoneNumber.phone.ilike(search_term),
-                        )
-                    )
+            keyset = decode_page_cursor(cursor, offset)
+
+            conditions = self._user_listing_conditions(search, include_deleted)
+            query = (
+                select(User)
+                .options(
+                    selectinload(User.email_addresses),
+                    selectinload(User.phone_numbers),
                 )
-
-            # Get total count
-            result = await self.db.execute(count_query)
-            total = result.scalar() or 0
-
-            # Build main query with relationships loaded
-            query = select(User).options(
-                selectinload(User.email_addresses),
-                selectinload(User.phone_numbers),
+                .order_by(User.created_at.desc(), User.id.desc())
             )
-
-            # Apply same filters as count query
-            if not include_deleted:
-                query = query.where(User.deleted_at.is_(None))
-
-            if search:
-                search_term = f"%{search}%"
-                query = (
-                    query.outerjoin(User.email_addresses)
-                    .outerjoin(User.phone_numbers)
-                    .where(
-                        or_(
-                            func.cast(User.id, String).ilike(search_term),
-                            User.external_id.ilike(search_term),
-                            EmailAddress.email.ilike(search_term),
-                            PhoneNumber.phone.ilike(search_term),
-                        )
-                    )
-                    .distinct()
+            if keyset is not None:
+                created_at, user_id = keyset
+                query = query.where(
+                    tuple_(User.created_at, User.id)
+                    < tuple_(literal(created_at, User.created_at.type), literal(user_id, User.id.type))
                 )
+            else:
+                query = query.offset(offset)
 
-            # Get paginated results
-            query = query.order_by(User.created_at.desc()).limit(limit).offset(offset)
-            result = await self.db.execute(query)
-            users_list: list[User] = list(result.unique().scalars().all())  # type: ignore[arg-type]
+            if search:
+                # Count and page matches in one statement: count(*) OVER () is computed
+                # over every match before the keyset, OFFSET and LIMIT are applied
+                matches = select(User.id, func.count().over().label("total")).where(*conditions).subquery()
+                query = query.add_columns(matches.c.total).join(matches, matches.c.id == User.id)
+                result = await self.db.execute(query.limit(limit + 1))
+                rows = result.all()
+                users_list = [row[0] for row in rows]
+                if rows:
+                    total = rows[0].total
+                elif keyset is None and offset == 0:
+                    total = 0
+                else:
+                    # Past the last match, so no row carries the count
+                    total = await self._count_users(conditions)
+            else:
+                total = await self._count_users_cached(include_deleted)
+                result = await self.db.execute(query.where(*conditions).limit(limit + 1))
+                users_list = list(result.scalars().all())
+
+            # One extra row was fetched to detect a next page
+            next_cursor = None
+            if len(users_list) > limit:
+                users_list = users_list[:limit]
+                next_cursor = encode_keyset_cursor(users_list[-1].created_at, users_list[-1].id)
 
             # Set result counts as span attributes
             span.set_attribute("admin.result_count", len(users_list))
             span.set_attribute("admin.total_count", total)
 
-            return users_list, total
+            return users_list, total, next_cursor
+
+    async def get_notification_logs_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: str | None = None,
+        status_filter: NotificationStatus | None = None,
+    ) -> tuple[list[NotificationLog], int, str | None]:
+        """
+        Get a page of notification logs, most recent first.
+
+        Logs are ordered by (sent_at, id). Pages are selected by offset, or by keyset
+        from a cursor so that deep pages cost the same as the first. The total comes
+        from the notification stats rollup instead of a COUNT over notification_logs.
+
+        Args:
+            limit: Maximum number of logs to return (1-1000)
+            offset: Number of logs to skip
+            cursor: Optional next_cursor from the previous page (cannot be combined with offset)
+            status_filter: Optional notification status to filter by
+
+        Returns:
+            Tuple of (list of logs, total count, cursor for the next page or None)
+
+        Raises:
+            HTTPException: 400 if the cursor is invalid or combined with offset
+        """
+        keyset = decode_page_cursor(cursor, offset)
+
+        query = select(NotificationLog).order_by(NotificationLog.sent_at.desc(), NotificationLog.id.desc())
+        if status_filter is not None:
+            query = query.where(NotificationLog.status == status_filter)
+        if keyset is not None:
+            sent_at, log_id = keyset
+            query = query.where(
+                tuple_(NotificationLog.sent_at, NotificationLog.id)
+                < tuple_(literal(sent_at, NotificationLog.sent_at.type), literal(log_id, NotificationLog.id.type))
+            )
+        else:
+            query = query.offset(offset)
+
+        # Fetch one extra row to detect a next page
+        result = await self.db.execute(query.limit(limit + 1))
+        logs = list(result.scalars().all())
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_keyset_cursor(logs[-1].sent_at, logs[-1].id)
+
+        notification_counts = await NotificationStatsService(self.db).get_notification_counts(datetime.now(UTC))
+        return logs, notification_counts.count_by_status(status_filter), next_cursor
 
     async def get_user_details(self, user_id: uuid.UUID) -> User:
         """
@@ -273,137 +364,132 @@ class AdminService:
                 await self.db.rollback()
                 raise
 
-    # ==================== Private Helper Methods for Metrics ====================
+            # Cached tokens may still resolve to this user (other processes drop
+            # theirs within AUTH_TOKEN_CACHE_TTL_SECONDS)
+            clear_token_cache()
 
-    async def _count_total_users(self) -> int:
-        """Count total non-deleted users."""
-        result = await self.db.execute(select(func.count(User.id)).where(User.deleted_at.is_(None)))
-        return result.scalar() or 0
+    # ==================== Private Helper Methods for Pagination ====================
 
-    async def _count_active_users(self) -> int:
-        """Count users with at least one active route."""
-        result = await self.db.execute(
-            select(func.count(func.distinct(UserRoute.user_id))).where(
-                and_(
-                    UserRoute.active.is_(True),
-                    UserRoute.deleted_at.is_(None),
-                )
-            )
-        )
-        return result.scalar() or 0
-
-    async def _count_users_with_verified_email(self) -> int:
-        """Count users with at least one verified email address."""
-        result = await self.db.execute(
-            select(func.count(func.distinct(EmailAddress.user_id))).where(EmailAddress.verified.is_(True))
-        )
-        return result.scalar() or 0
+    def _user_listing_conditions(self, search: str | None, include_deleted: bool) -> list[ColumnElement[bool]]:
+        """
+        Build the filter conditions of a user listing.
 
-    async def _count_users_with_verified_phone(self) -> int:
-        """Count users with at least one verified phone number."""
-        result = await self.db.execute(
-            select(func.count(func.distinct(PhoneNumber.user_id))).where(PhoneNumber.verified.is_(True))
-        )
-        return result.scalar() or 0
+        Args:
+            search: Optional search term (as for get_users_paginated)
+            include_deleted: Whether soft-deleted users are included
 
-    async def _count_admin_users(self) -> int:
-        """Count non-deleted admin users."""
-        result = await self.db.execute(select(func.count(AdminUser.id)).where(AdminUser.deleted_at.is_(None)))
-        return result.scalar() or 0
+        Returns:
+            Conditions for a where() clause on User
+        """
+        conditions: list[ColumnElement[bool]] = []
+        if not include_deleted:
+            conditions.append(User.deleted_at.is_(None))
+        if search:
+            conditions.append(user_search_condition(search))
+        return conditions
+
+    async def _count_users(self, conditions: list[ColumnElement[bool]]) -> int:
+        """
+        Count users matching listing conditions.
 
-    async def _count_total_routes(self) -> int:
-        """Count total non-deleted routes."""
-        result = await self.db.execute(select(func.count(UserRoute.id)).where(UserRoute.deleted_at.is_(None)))
-        return result.scalar() or 0
+        Args:
+            conditions: Conditions from _user_listing_conditions()
 
-    async def _count_active_routes(self) -> int:
-        """Count active non-deleted routes."""
-        result = await self.db.execute(
-            select(func.count(UserRoute.id)).where(
-                and_(
-                    UserRoute.active.is_(True),
-                    UserRoute.deleted_at.is_(None),
-                )
-            )
-        )
+        Returns:
+            Number of matching users
+        """
+        result = await self.db.execute(select(func.count(User.id)).where(*conditions))
         return result.scalar() or 0
 
-    async def _get_routes_user_count(self) -> tuple[int, int]:
+    async def _count_users_cached(self, include_deleted: bool) -> int:
         """
-        Get total routes and distinct user count for average calculation.
+        Count all users, reusing a recent count from this process.
+
+        Counting is the only part of an unfiltered user listing page that grows with the
+        table, so it is cached for ADMIN_USER_COUNT_CACHE_TTL_SECONDS.
+
+        Args:
+            include_deleted: Whether soft-deleted users are counted
 
         Returns:
-            Tuple of (total_routes, users_with_routes)
+            Number of users (possibly up to the cache TTL old)
         """
-        result = await self.db.execute(
-            select(
-                func.count(UserRoute.id).label("total_routes"),
-                func.count(func.distinct(UserRoute.user_id)).label("users_with_routes"),
-            ).where(UserRoute.deleted_at.is_(None))
-        )
-        row = result.one()
-        return row.total_routes, row.users_with_routes
+        cache = get_local_cache(USER_COUNT_CACHE_NAMESPACE)
+        cache_key = f"users:{include_deleted}"
+        if (cached_total := cache.get(cache_key)) is not None:
+            return int(cached_total)
 
-    async def _count_total_notifications(self) -> int:
-        """Count all notification log entries."""
-        result = await self.db.execute(select(func.count(NotificationLog.id)))
-        return result.scalar() or 0
+        total = await self._count_users(self._user_listing_conditions(None, include_deleted))
+        cache.set(cache_key, total, ttl=settings.ADMIN_USER_COUNT_CACHE_TTL_SECONDS)
+        return total
 
-    async def _count_successful_notifications(self) -> int:
-        """Count successfully sent notifications."""
-        result = await self.db.execute(
-            select(func.count(NotificationLog.id)).where(NotificationLog.status == NotificationStatus.SENT)
-        )
-        return result.scalar() or 0
+    # ==================== Private Helper Methods for Metrics ====================
 
-    async def _count_failed_notifications(self) -> int:
-        """Count failed notifications."""
+    async def _get_user_counts(self, seven_days_ago: datetime, thirty_days_ago: datetime) -> tuple[int, int, int]:
+        """
+        Count non-deleted users in total and created within the growth periods.
+
+        Args:
+            seven_days_ago: Start of the 7-day growth period
+            thirty_days_ago: Start of the 30-day growth period
+
+        Returns:
+            Tuple of (total_users, new_users_last_7_days, new_users_last_30_days)
+        """
         result = await self.db.execute(
-            select(func.count(NotificationLog.id)).where(NotificationLog.status == NotificationStatus.FAILED)
+            select(
+                func.count(User.id).label("total"),
+                func.count(User.id).filter(User.created_at >= seven_days_ago).label("last_7_days"),
+                func.count(User.id).filter(User.created_at >= thirty_days_ago).label("last_30_days"),
+            ).where(User.deleted_at.is_(None))
         )
-        return result.scalar() or 0
+        row = result.one()
+        return row.total, row.last_7_days, row.last_30_days
 
-    async def _get_notifications_by_method(self, since: datetime) -> dict[str, int]:
+    async def _get_contact_and_admin_counts(self) -> tuple[int, int, int]:
         """
-        Get notification counts grouped by method since a given datetime.
-
-        Args:
-            since: Only count notifications sent on or after this datetime
+        Count users with verified contacts and non-deleted admin users in one query.
 
         Returns:
-            Dictionary mapping method name to count
+            Tuple of (users_with_verified_email, users_with_verified_phone, admin_users)
         """
         result = await self.db.execute(
             select(
-                NotificationLog.method,
-                func.count(NotificationLog.id).label("count"),
+                select(func.count(func.distinct(EmailAddress.user_id)))
+                .where(EmailAddress.verified.is_(True))
+                .scalar_subquery()
+                .label("verified_email"),
+                select(func.count(func.distinct(PhoneNumber.user_id)))
+                .where(PhoneNumber.verified.is_(True))
+                .scalar_subquery()
+                .label("verified_phone"),
+                select(func.count(AdminUser.id))
+                .where(AdminUser.deleted_at.is_(None))
+                .scalar_subquery()
+                .label("admins"),
             )
-            .where(NotificationLog.sent_at >= since)
-            .group_by(NotificationLog.method)
         )
-        # SQLAlchemy row attributes are dynamic - mypy can't infer the type
-        by_method: dict[str, int] = {row.method.value: row.count for row in result}  # type: ignore[misc]
-        return by_method
+        row = result.one()
+        return row.verified_email, row.verified_phone, row.admins
 
-    async def _count_new_users_since(self, since: datetime) -> int:
+    async def _get_route_counts(self) -> tuple[int, int, int, int]:
         """
-        Count new users created since a given datetime.
-
-        Args:
-            since: Only count users created on or after this datetime
+        Count non-deleted routes and their owners, in total and for active routes.
 
         Returns:
-            Count of new non-deleted users
+            Tuple of (total_routes, active_routes, users_with_active_routes, users_with_routes)
         """
+        is_active = UserRoute.active.is_(True)
         result = await self.db.execute(
-            select(func.count(User.id)).where(
-                and_(
-                    User.created_at >= since,
-                    User.deleted_at.is_(None),
-                )
-            )
+            select(
+                func.count(UserRoute.id).label("total_routes"),
+                func.count(UserRoute.id).filter(is_active).label("active_routes"),
+                func.count(func.distinct(UserRoute.user_id)).filter(is_active).label("active_users"),
+                func.count(func.distinct(UserRoute.user_id)).label("users_with_routes"),
+            ).where(UserRoute.deleted_at.is_(None))
         )
-        return result.scalar() or 0
+        row = result.one()
+        return row.total_routes, row.active_routes, row.active_users, row.users_with_routes
 
     async def _get_daily_signups_since(self, since: datetime) -> list[DailySignup]:
         """
@@ -453,44 +539,42 @@ class AdminService:
             seven_days_ago = now - timedelta(days=7)
             thirty_days_ago = now - timedelta(days=30)
 
-            # Gather user count metrics
-            user_counts = UserCountMetrics(
-                total_users=await self._count_total_users(),
-                active_users=await self._count_active_users(),
-                users_with_verified_email=await self._count_users_with_verified_email(),
-                users_with_verified_phone=await self._count_users_with_verified_phone(),
-                admin_users=await self._count_admin_users(),
+            # One aggregated query per table (FILTER clauses) rather than one COUNT per metric
+            total_users, new_users_7_days, new_users_30_days = await self._get_user_counts(
+                seven_days_ago, thirty_days_ago
             )
+            verified_email_users, verified_phone_users, admin_users = await self._get_contact_and_admin_counts()
+            total_routes, active_routes, active_users, users_with_routes = await self._get_route_counts()
 
-            # Gather route statistics
-            total_routes = await self._count_total_routes()
-            active_routes = await self._count_active_routes()
-            route_count, user_count = await self._get_routes_user_count()
+            user_counts = UserCountMetrics(
+                total_users=total_users,
+                active_users=active_users,
+                users_with_verified_email=verified_email_users,
+                users_with_verified_phone=verified_phone_users,
+                admin_users=admin_users,
+            )
 
             route_stats = RouteStatMetrics(
                 total_routes=total_routes,
                 active_routes=active_routes,
-                avg_routes_per_user=calculate_avg_routes(route_count, user_count),
+                avg_routes_per_user=calculate_avg_routes(total_routes, users_with_routes),
             )
 
-            # Gather notification statistics
-            total_sent = await self._count_total_notifications()
-            successful = await self._count_successful_notifications()
-            failed = await self._count_failed_notifications()
-            by_method = await self._get_notifications_by_method(thirty_days_ago)
+            # Notification counts come from the daily rollup plus the days not yet rolled up
+            notification_counts = await NotificationStatsService(self.db).get_notification_counts(thirty_days_ago)
 
             notification_stats = NotificationStatMetrics(
-                total_sent=total_sent,
-                successful=successful,
-                failed=failed,
-                success_rate=calculate_success_rate(successful, total_sent),
-                by_method_last_30_days=by_method,
+                total_sent=notification_counts.total,
+                successful=notification_counts.successful,
+                failed=notification_counts.failed,
+                success_rate=calculate_success_rate(notification_counts.successful, notification_counts.total),
+                by_method_last_30_days=notification_counts.by_method_recent,
             )
 
             # Gather growth metrics
             growth_metrics = GrowthMetrics(
-                new_users_last_7_days=await self._count_new_users_since(seven_days_ago),
-                new_users_last_30_days=await self._count_new_users_since(thirty_days_ago),
+                new_users_last_7_days=new_users_7_days,
+                new_users_last_30_days=new_users_30_days,
                 daily_signups_last_7_days=await self._get_daily_signups_since(seven_days_ago),
             )
 
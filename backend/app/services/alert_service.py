@@ -1,11 +1,13 @@
 """Alert processing service for checking disruptions and sending notifications."""
 
+import asyncio
 import contextlib
 import hashlib
 import json
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, time, timedelta
 from itertools import groupby
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
@@ -13,7 +15,7 @@ import structlog
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span
-from sqlalchemy import and_, func, inspect, or_, select
+from sqlalchemy import and_, func, inspect, or_, select, union
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -21,7 +23,16 @@ from sqlalchemy.orm import selectinload
 from app.core.config import settings
 from app.core.redis import RedisClientProtocol
 from app.core.telemetry import service_span
-from app.helpers.disruption_helpers import disruption_affects_route, extract_line_station_pairs
+from app.core.tfl_client import TfLResources
+from app.helpers.alert_state_batch import ALERTED_LINES_KEY, AlertStateBatch, get_alert_state_key
+from app.helpers.contact_snapshot import ContactSnapshot, collect_preference_target_ids, load_contact_snapshot
+from app.helpers.disruption_helpers import (
+    create_line_aggregate_hash,
+    disruption_affects_route,
+    extract_line_station_pairs,
+)
+from app.helpers.query_filters import any_of
+from app.helpers.route_index_snapshot import RouteIndexSnapshot, load_route_index_snapshot
 from app.helpers.soft_delete_filters import add_active_filter, get_active_children_for_parents
 from app.models.notification import (
     NotificationLog,
@@ -31,11 +42,13 @@ from app.models.notification import (
 )
 from app.models.tfl import AlertDisabledSeverity, Line, LineDisruptionStateLog
 from app.models.user import EmailAddress, PhoneNumber, User
-from app.models.user_route import UserRoute, UserRouteSchedule
+from app.models.user_route import UserRoute, UserRouteSchedule, UserRouteSegment
 from app.models.user_route_index import UserRouteStationIndex
 from app.schemas.tfl import ClearedLineInfo, DisruptionResponse
-from app.services.notification_service import NotificationService
+from app.services.notification_outbox import NotificationOutbox, OutboundNotification
+from app.services.notification_service import NotificationRenderCache, NotificationService, RenderedNotification
 from app.services.tfl_service import TfLService
+from app.services.user_route_schedule_index_service import UserRouteScheduleIndexService
 from app.utils.pii import hash_pii
 
 logger = structlog.get_logger(__name__)
@@ -272,82 +285,92 @@ def detect_cleared_lines(
     return cleared_lines
 
 
-def init_alert_processing_stats() -> dict[str, int]:
+def get_candidate_line_ids(
+    disruptions: list[DisruptionResponse],
+    disabled_severity_pairs: set[tuple[str, int]],
+    changed_line_ids: set[str],
+    alerted_line_ids: set[str],
+) -> set[str]:
     """
-    Initialize alert processing statistics dictionary.
+    Compute the lines whose routes need evaluating in this alert cycle.
 
-    Pure function for easy testing.
+    A route can only produce a notification if one of its lines has an alertable
+    disruption (new alert or cooldown re-check), changed state since the previous
+    cycle, or is still in a route's stored alert state (it may have cleared, triggering
+    a status update, in a cycle that didn't process that route). Routes on every other
+    line can be skipped without being loaded.
+
+    Pure function for easy testing without database or Redis dependencies.
+
+    Args:
+        disruptions: All current line statuses from TfL (including Good Service)
+        disabled_severity_pairs: Set of (mode_id, severity_level) pairs that don't trigger alerts
+        changed_line_ids: Lines whose aggregate state changed since the previous cycle
+        alerted_line_ids: Lines that routes still hold unexpired alert state for
 
     Returns:
-        Dictionary with routes_checked, alerts_sent, and errors all set to 0
+        Set of TfL line IDs whose routes should be evaluated
 
     Example:
-        >>> stats = init_alert_processing_stats()
-        >>> stats
-        {'routes_checked': 0, 'alerts_sent': 0, 'errors': 0}
+        >>> from app.schemas.tfl import DisruptionResponse
+        >>> disruptions = [
+        ...     DisruptionResponse(line_id="victoria", mode="tube", status_severity=10,
+        ...                        status_severity_description="Good Service"),
+        ...     DisruptionResponse(line_id="northern", mode="tube", status_severity=5,
+        ...                        status_severity_description="Severe Delays"),
+        ... ]
+        >>> sorted(get_candidate_line_ids(disruptions, {("tube", 10)}, set(), set()))
+        ['northern']
+        >>> sorted(get_candidate_line_ids(disruptions, {("tube", 10)}, {"victoria"}, set()))
+        ['northern', 'victoria']
     """
-    return {
-        "routes_checked": 0,
-        "alerts_sent": 0,
-        "errors": 0,
-    }
+    alertable_line_ids = {d.line_id for d in filter_alertable_disruptions(disruptions, disabled_severity_pairs)}
+    return alertable_line_ids | changed_line_ids | alerted_line_ids
 
 
-# Pure helper functions for testability
-def create_line_aggregate_hash(disruptions: list[DisruptionResponse]) -> str:
+def intersect_route_id_filters(*route_id_filters: set[UUID] | None) -> set[UUID] | None:
     """
-    Create aggregate hash for all statuses of a single line.
+    Combine route ID restrictions, where None means "no restriction".
 
-    Sorts disruptions by (severity, description, reason) for deterministic ordering.
-    This ensures that multiple statuses for the same line (e.g., "Minor Delays" and
-    "Part Suspended") produce a consistent hash regardless of API response order.
-
-    Pure function for easy testing without database dependencies.
+    Pure function for easy testing.
 
     Args:
-        disruptions: List of disruptions for a single line (all must have same line_id)
+        route_id_filters: Sets of allowed route IDs, or None to allow every route
 
     Returns:
-        SHA256 hash string (64 characters)
+        Route IDs allowed by every filter, or None if no filter restricts the routes
 
     Example:
-        >>> disruptions = [
-        ...     DisruptionResponse(line_id="northern", status_severity=10,
-        ...                        status_severity_description="Minor Delays", reason="Signal failure"),
-        ...     DisruptionResponse(line_id="northern", status_severity=20,
-        ...                        status_severity_description="Part Suspended", reason="Signal failure"),
-        ... ]
-        >>> hash1 = create_line_aggregate_hash(disruptions)
-        >>> # Same disruptions in different order produce same hash
-        >>> hash2 = create_line_aggregate_hash(list(reversed(disruptions)))
-        >>> hash1 == hash2
+        >>> intersect_route_id_filters(None, None) is None
         True
+        >>> intersect_route_id_filters({1, 2}, None, {2, 3})
+        {2}
     """
-    # Defensive: ensure all disruptions have the same line_id
-    if disruptions and len({d.line_id for d in disruptions}) > 1:
-        msg = "All disruptions must have the same line_id"
-        raise ValueError(msg)
-
-    # Sort disruptions by (severity, description, reason) for deterministic ordering
-    sorted_statuses = sorted(
-        disruptions,
-        key=lambda d: (d.status_severity, d.status_severity_description, d.reason or ""),
-    )
-
-    # Build hash input from sorted disruptions
-    # Normalize reasons: strip whitespace and treat empty/whitespace-only as empty string
-    hash_input = [
-        {
-            "severity": d.status_severity,
-            "status": d.status_severity_description,
-            "reason": (d.reason or "").strip() or "",
-        }
-        for d in sorted_statuses
-    ]
+    restrictions = [route_ids for route_ids in route_id_filters if route_ids is not None]
+    if not restrictions:
+        return None
+    return set.intersection(*restrictions)
 
-    # Create JSON string and hash it
-    hash_string = json.dumps(hash_input, sort_keys=True)
-    return hashlib.sha256(hash_string.encode()).hexdigest()
+
+def init_alert_processing_stats() -> dict[str, int]:
+    """
+    Initialize alert processing statistics dictionary.
+
+    Pure function for easy testing.
+
+    Returns:
+        Dictionary with routes_checked, alerts_sent, and errors all set to 0
+
+    Example:
+        >>> stats = init_alert_processing_stats()
+        >>> stats
+        {'routes_checked': 0, 'alerts_sent': 0, 'errors': 0}
+    """
+    return {
+        "routes_checked": 0,
+        "alerts_sent": 0,
+        "errors": 0,
+    }
 
 
 async def warm_up_line_state_cache(db: AsyncSession, redis_client: RedisClientProtocol) -> int:
@@ -415,18 +438,20 @@ async def warm_up_line_state_cache(db: AsyncSession, redis_client: RedisClientPr
             logs_sorted = sorted(logs, key=lambda log: log.line_id)
             lines_hydrated = 0
 
-            for line_id, group in groupby(logs_sorted, key=lambda log: log.line_id):
-                statuses = list(group)
+            # Store in Redis in one pipeline (no TTL - persists until state changes)
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for line_id, group in groupby(logs_sorted, key=lambda log: log.line_id):
+                    statuses = list(group)
+
+                    # All statuses for this line have the same state_hash (aggregate hash)
+                    # Just pick the first one - they're all identical for records at same detected_at
+                    aggregate_hash = statuses[0].state_hash
 
-                # All statuses for this line have the same state_hash (aggregate hash)
-                # Just pick the first one - they're all identical for records at same detected_at
-                aggregate_hash = statuses[0].state_hash
+                    pipe.set(f"line_state:{line_id}", aggregate_hash)
 
-                # Store in Redis (no TTL - persists until state changes)
-                redis_key = f"line_state:{line_id}"
-                await redis_client.set(redis_key, aggregate_hash)
+                    lines_hydrated += 1
 
-                lines_hydrated += 1
+                await pipe.execute()
 
             span.set_attribute("cache.lines_hydrated", lines_hydrated)
             span.set_attribute("cache.total_log_entries", len(logs))
@@ -458,16 +483,57 @@ async def warm_up_line_state_cache(db: AsyncSession, redis_client: RedisClientPr
 class AlertService:
     """Service for processing route alerts and sending notifications."""
 
-    def __init__(self, db: AsyncSession, redis_client: RedisClientProtocol) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        redis_client: RedisClientProtocol,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        concurrency: int | None = None,
+        tfl_resources: TfLResources | None = None,
+        *,
+        notification_outbox: NotificationOutbox | None = None,
+    ) -> None:
         """
         Initialize the alert service.
 
         Args:
             db: Database session
             redis_client: Redis client for deduplication
+            session_factory: Optional factory for per-worker database sessions. Required for
+                concurrent route processing, since a single AsyncSession cannot be shared
+                across concurrently running tasks.
+            concurrency: Max routes processed in parallel (defaults to ALERT_ROUTE_CONCURRENCY).
+                Ignored (sequential processing) when no session_factory is provided.
+            tfl_resources: Shared TfL clients and cache for TfLService (defaults to the
+                process-wide resources, if registered).
+            notification_outbox: Queue for rendered notifications, delivered (and logged in
+                NotificationLog) by separate workers. Without one, notifications are sent inline.
         """
         self.db = db
         self.redis_client = redis_client
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency if concurrency is not None else settings.ALERT_ROUTE_CONCURRENCY)
+        self.tfl_resources = tfl_resources
+        self.notification_outbox = notification_outbox
+
+        # Email content blocks shared between routes alerted about the same disruptions,
+        # replaced at the start of each cycle by process_all_routes
+        self.render_cache = NotificationRenderCache()
+
+        # Per-cycle state for line-first evaluation, populated by _fetch_global_disruption_data
+        # and _log_line_disruption_state_changes. None means disruption data was unavailable.
+        self._cycle_disruptions: list[DisruptionResponse] | None = None
+        self._changed_line_ids: set[str] = set()
+
+        # In-memory route index for the routes being processed this cycle (None = query per route)
+        self._route_index_snapshot: RouteIndexSnapshot | None = None
+
+        # Verified contacts targeted by this cycle's notification preferences (None = query per preference)
+        self._contact_snapshot: ContactSnapshot | None = None
+
+        # Alert state for the routes being processed this cycle, flushed to Redis after
+        # each route (None = read and write Redis per route)
+        self._alert_state: AlertStateBatch | None = None
 
     async def _log_line_disruption_state_changes(
         self,
@@ -478,7 +544,8 @@ class AlertService:
 
         Groups disruptions by line and compares aggregate state hash against Redis cache.
         Only logs when the aggregate state for a line changes (e.g., new status added,
-        status removed, or status details changed).
+        status removed, or status details changed). The last hashes of all lines are read
+        with one MGET and the changed ones written back in one pipeline.
 
         Multiple statuses for the same line (e.g., "Minor Delays" + "Part Suspended")
         are stored as separate database records but share the same detected_at timestamp.
@@ -507,6 +574,8 @@ class AlertService:
             span.set_attribute("alert.operation", "log_line_state_changes")
             span.set_attribute("alert.disruption_count", len(disruptions))
 
+            self._changed_line_ids = set()
+
             try:
                 logged_count = 0
 
@@ -524,17 +593,22 @@ class AlertService:
                     line_id: list(group) for line_id, group in groupby(disruptions_sorted, key=lambda d: d.line_id)
                 }
 
+                # Read the last known aggregate hash of every line in one round-trip
+                line_ids = list(disruptions_by_line)
+                last_hashes = await self.redis_client.mget([f"line_state:{line_id}" for line_id in line_ids])
+                last_hash_by_line = dict(zip(line_ids, last_hashes, strict=True))
+                changed_hashes: dict[str, str] = {}
+
                 # Process each line's aggregate state
                 for line_id, line_disruptions in disruptions_by_line.items():
                     # Compute aggregate hash for this line's current state
                     current_hash = create_line_aggregate_hash(line_disruptions)
-
-                    # Check Redis for last known aggregate hash for this line
-                    redis_key = f"line_state:{line_id}"
-                    last_hash = await self.redis_client.get(redis_key)
+                    last_hash = last_hash_by_line[line_id]
 
                     # Only log if aggregate state changed
                     if current_hash != last_hash:
+                        self._changed_line_ids.add(line_id)
+
                         # Log each status as a separate database record
                         for disruption in line_disruptions:
                             new_log = LineDisruptionStateLog(
@@ -547,12 +621,7 @@ class AlertService:
                             self.db.add(new_log)
                             logged_count += 1
 
-                        # Update Redis with new aggregate hash (no TTL - persists until state changes)
-                        # Note: Redis is updated before commit intentionally. If commit fails,
-                        # Redis will be ahead of DB, but the next poll will re-detect the state
-                        # change (since DB won't have the new hash). This prioritizes preventing
-                        # duplicate logs over strict consistency.
-                        await self.redis_client.set(redis_key, current_hash)
+                        changed_hashes[line_id] = current_hash
 
                         logger.info(
                             "line_aggregate_state_changed",
@@ -569,6 +638,17 @@ class AlertService:
                             state_hash=current_hash,
                         )
 
+                # Update Redis with the new aggregate hashes (no TTL - persists until state changes)
+                # Note: Redis is updated before commit intentionally. If commit fails,
+                # Redis will be ahead of DB, but the next poll will re-detect the state
+                # change (since DB won't have the new hash). This prioritizes preventing
+                # duplicate logs over strict consistency.
+                if changed_hashes:
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        for line_id, current_hash in changed_hashes.items():
+                            pipe.set(f"line_state:{line_id}", current_hash)
+                        await pipe.execute()
+
                 # Commit all new log entries
                 if logged_count > 0:
                     await self.db.commit()
@@ -585,6 +665,8 @@ class AlertService:
                 )
                 span.record_exception(e)
                 await self.db.rollback()
+                # Change detection is incomplete - conservatively treat every line as changed
+                self._changed_line_ids = {d.line_id for d in disruptions}
                 span.set_attribute("alert.logged_count", 0)
                 # Don't raise - logging failures shouldn't block alert processing
                 return 0
@@ -606,10 +688,12 @@ class AlertService:
         Main entry point for processing all active routes.
 
         Orchestrates the alert processing workflow:
-        1. Fetch all active routes
-        2. Fetch global disruption data (cached, reused for all routes)
-        3. Process each route individually
-        4. Return statistics
+        1. Fetch global disruption data (cached, reused for all routes)
+        2. Select routes with a schedule window open now (schedule window index)
+        3. Narrow to candidate routes on disrupted/changed lines (line-first evaluation)
+        4. Fetch the candidate active routes (all active routes if neither selection is available)
+        5. Process each route individually (bounded-parallel when a session factory is configured)
+        6. Return statistics
 
         Returns:
             Statistics dictionary with routes_checked, alerts_sent, and errors
@@ -618,10 +702,28 @@ class AlertService:
             logger.info("alert_processing_started")
             stats = init_alert_processing_stats()
 
+            self._route_index_snapshot = None
+            self._contact_snapshot = None
+            self.render_cache = NotificationRenderCache()
+
             try:
-                # Fetch all active routes with relationships
-                routes = await self._get_active_routes()
-                logger.info("active_routes_fetched", count=len(routes))
+                # Fetch global disruption data once for all routes
+                # Errors are non-fatal - returns empty data on failure
+                disabled_severity_pairs, cleared_states = await self._fetch_global_disruption_data()
+
+                # Only routes with a schedule window open now can produce alerts
+                candidate_route_ids = await self._get_in_window_route_ids()
+
+                # Line-first evaluation: only routes on disrupted/changed lines can produce alerts
+                # (skipped when no route is in a schedule window)
+                if candidate_route_ids is None or candidate_route_ids:
+                    candidate_route_ids = intersect_route_id_filters(
+                        candidate_route_ids, await self._get_candidate_route_ids(disabled_severity_pairs)
+                    )
+
+                # Fetch active routes with relationships (only candidates when line-first applies)
+                routes = await self._get_active_routes(route_ids=candidate_route_ids)
+                logger.info("active_routes_fetched", count=len(routes), line_first=candidate_route_ids is not None)
 
                 # Batch load active schedules for all routes (filtered for soft-delete)
                 route_ids = [route.id for route in routes]
@@ -630,28 +732,40 @@ class AlertService:
                 )
                 logger.debug("active_schedules_loaded", route_count=len(routes))
 
-                # Fetch global disruption data once for all routes
-                # Errors are non-fatal - returns empty data on failure
-                disabled_severity_pairs, cleared_states = await self._fetch_global_disruption_data()
+                # Bulk load the route index once for all routes (replaces one query per route)
+                self._route_index_snapshot = await self._load_route_index_snapshot(route_ids)
 
-                # Process each route individually
-                for route in routes:
-                    stats["routes_checked"] += 1
+                # Load every notification target's verified contact at once (replaces one query per preference)
+                self._contact_snapshot = await self._load_contact_snapshot(routes)
 
-                    # Get active schedules for this route
-                    route_schedules = schedules_by_route.get(route.id, [])
+                # Read all routes' alert state in one MGET (writes are flushed after each route)
+                self._alert_state = await self._load_alert_state(routes, schedules_by_route)
 
-                    # Process this route and collect results
-                    alerts_sent, error_occurred = await self._process_single_route(
-                        route=route,
-                        schedules=route_schedules,
+                # Process each route (concurrently when a session factory is available)
+                if self.session_factory is not None and self.concurrency > 1 and len(routes) > 1:
+                    await self._process_routes_concurrently(
+                        routes=routes,
+                        schedules_by_route=schedules_by_route,
                         disabled_severity_pairs=disabled_severity_pairs,
                         cleared_states=cleared_states,
+                        stats=stats,
                     )
+                else:
+                    for route in routes:
+                        stats["routes_checked"] += 1
 
-                    stats["alerts_sent"] += alerts_sent
-                    if error_occurred:
-                        stats["errors"] += 1
+                        # Process this route and collect results
+                        alerts_sent, error_occurred = await self._process_single_route(
+                            route=route,
+                            schedules=schedules_by_route.get(route.id, []),
+                            disabled_severity_pairs=disabled_severity_pairs,
+                            cleared_states=cleared_states,
+                        )
+                        await self._write_alert_state()
+
+                        stats["alerts_sent"] += alerts_sent
+                        if error_occurred:
+                            stats["errors"] += 1
 
                 logger.info("alert_processing_completed", **stats)
 
@@ -660,26 +774,414 @@ class AlertService:
                 stats["errors"] += 1
 
             finally:
+                # Store any alert state left unwritten if processing failed part-way,
+                # so alerts that went out aren't sent again next cycle
+                await self._flush_alert_state()
+
                 # Always set span attributes, even on error
                 self._set_span_stats_attributes(span, stats)
+                self._record_render_cache_stats(span)
 
             return stats
 
-    async def _get_active_routes(self) -> list[UserRoute]:
+    async def _load_alert_state(
+        self,
+        routes: list[UserRoute],
+        schedules_by_route: dict[UUID, list[UserRouteSchedule]],
+    ) -> AlertStateBatch | None:
         """
-        Get all active routes with their relationships.
+        Read the alert state of every route schedule in one MGET.
+
+        All of a route's schedules are read, since which one is active is only
+        determined when the route is processed.
+
+        Args:
+            routes: Routes being processed this cycle
+            schedules_by_route: Active (non-deleted) schedules per route
 
         Returns:
-            List of active UserRoute objects with segments, schedules, preferences, and user loaded
+            Loaded AlertStateBatch, or None to fall back to per-route Redis access if loading failed
         """
+        alert_state = AlertStateBatch(self.redis_client)
         try:
-            result = await self.db.execute(
-                select(UserRoute)
+            await alert_state.load(
+                get_alert_state_key(route.id, route.user_id, schedule.id)
+                for route in routes
+                for schedule in schedules_by_route.get(route.id, [])
+            )
+        except Exception as e:
+            logger.warning("alert_state_load_failed", error=str(e), exc_info=e)
+            return None
+        return alert_state
+
+    async def _write_alert_state(self) -> None:
+        """
+        Write the batch's pending alert state changes to Redis in one pipeline.
+
+        Called after each route rather than once per cycle, so an overlapping cycle
+        sees a route's state as soon as its alerts are sent (and TTLs count from then).
+        """
+        if self._alert_state is None:
+            return
+
+        try:
+            written = await self._alert_state.flush()
+        except Exception as e:
+            logger.error("alert_state_flush_failed", error=str(e), exc_info=e)
+            return
+
+        if written:
+            logger.debug("alert_state_flushed", keys_written=written)
+
+    async def _flush_alert_state(self) -> None:
+        """Write any remaining alert state changes and end this cycle's batch."""
+        await self._write_alert_state()
+        self._alert_state = None
+
+    async def _get_alert_state(self, redis_key: str) -> str | None:
+        """
+        Read a route schedule's alert state, from this cycle's batch if there is one.
+
+        Args:
+            redis_key: Key from get_alert_state_key()
+
+        Returns:
+            Stored state JSON, or None if there is none
+        """
+        if self._alert_state is not None:
+            return await self._alert_state.get(redis_key)
+        return await self.redis_client.get(redis_key)
+
+    async def _set_alert_state(self, redis_key: str, ttl_seconds: int, state_json: str) -> None:
+        """
+        Write a route schedule's alert state, via this cycle's batch if there is one.
+
+        Args:
+            redis_key: Key from get_alert_state_key()
+            ttl_seconds: Seconds until the state expires
+            state_json: State to store
+        """
+        if self._alert_state is not None:
+            self._alert_state.setex(redis_key, ttl_seconds, state_json)
+            return
+        await self.redis_client.setex(redis_key, ttl_seconds, state_json)
+
+    async def _record_alerted_lines(self, line_ids: Iterable[str], ttl_seconds: int) -> None:
+        """
+        Record that a route holds alert state for these lines, via this cycle's batch if there is one.
+
+        Args:
+            line_ids: TfL line IDs in the stored alert state
+            ttl_seconds: Seconds until the alert state expires
+        """
+        expires_at = datetime.now(UTC).timestamp() + ttl_seconds
+        if self._alert_state is not None:
+            self._alert_state.record_alerted_lines(line_ids, expires_at)
+            return
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.zadd(ALERTED_LINES_KEY, dict.fromkeys(line_ids, expires_at), gt=True)
+            await pipe.execute()
+
+    async def _delete_alert_state(self, redis_key: str) -> None:
+        """
+        Delete a route schedule's alert state, via this cycle's batch if there is one.
+
+        Args:
+            redis_key: Key from get_alert_state_key()
+        """
+        if self._alert_state is not None:
+            self._alert_state.delete(redis_key)
+            return
+        await self.redis_client.delete(redis_key)
+
+    def _record_render_cache_stats(self, span: "Span") -> None:
+        """
+        Log and set span attributes for this cycle's notification render cache.
+
+        Args:
+            span: OpenTelemetry span to set attributes on
+        """
+        render_stats = self.render_cache.stats
+        span.set_attribute("alert.render_cache_hits", render_stats.hits)
+        span.set_attribute("alert.render_cache_misses", render_stats.misses)
+        if render_stats.hits or render_stats.misses:
+            logger.info(
+                "notification_render_cache_stats",
+                hits=render_stats.hits,
+                misses=render_stats.misses,
+                blocks=len(self.render_cache),
+            )
+
+    async def _process_routes_concurrently(
+        self,
+        routes: list[UserRoute],
+        schedules_by_route: dict[UUID, list[UserRouteSchedule]],
+        disabled_severity_pairs: set[tuple[str, int]],
+        cleared_states: set[tuple[str, int]],
+        stats: dict[str, int],
+    ) -> None:
+        """
+        Process routes over a bounded pool of asyncio workers.
+
+        Each worker owns its own database session (from session_factory) and AlertService
+        instance, and pulls routes from a shared queue until it is drained. The Redis client
+        is shared, as redis-py's async client is safe for concurrent use via its connection pool.
+
+        Errors are isolated per route: a failing route increments the error count, its
+        session is rolled back, and the worker moves on to the next route.
+
+        Args:
+            routes: Active routes to process (relationships already loaded)
+            schedules_by_route: Active schedules keyed by route ID
+            disabled_severity_pairs: Set of (mode_id, severity_level) pairs to filter out
+            cleared_states: Set of (mode_id, severity_level) pairs that represent cleared/normal states
+            stats: Statistics dictionary updated in place
+        """
+        if self.session_factory is None:
+            msg = "session_factory is required for concurrent route processing"
+            raise RuntimeError(msg)
+
+        session_factory = self.session_factory
+        queue: asyncio.Queue[UserRoute] = asyncio.Queue()
+        for route in routes:
+            queue.put_nowait(route)
+
+        worker_count = min(self.concurrency, len(routes))
+        logger.info("concurrent_route_processing_started", route_count=len(routes), worker_count=worker_count)
+
+        async def _worker() -> None:
+            async with session_factory() as session:
+                worker_service = type(self)(
+                    db=session,
+                    redis_client=self.redis_client,
+                    concurrency=1,
+                    notification_outbox=self.notification_outbox,
+                )
+                worker_service._route_index_snapshot = self._route_index_snapshot
+                worker_service.render_cache = self.render_cache
+                worker_service._alert_state = self._alert_state
+                worker_service._contact_snapshot = self._contact_snapshot
+                while True:
+                    try:
+                        route = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    stats["routes_checked"] += 1
+                    try:
+                        alerts_sent, error_occurred = await worker_service._process_single_route(
+                            route=route,
+                            schedules=schedules_by_route.get(route.id, []),
+                            disabled_severity_pairs=disabled_severity_pairs,
+                            cleared_states=cleared_states,
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "route_processing_failed",
+                            route_id=str(route.id),
+                            error=str(e),
+                            exc_info=e,
+                        )
+                        await session.rollback()
+                        alerts_sent, error_occurred = 0, True
+                    await worker_service._write_alert_state()
+
+                    stats["alerts_sent"] += alerts_sent
+                    if error_occurred:
+                        stats["errors"] += 1
+
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(worker_count):
+                task_group.create_task(_worker())
+
+    async def _get_candidate_route_ids(
+        self,
+        disabled_severity_pairs: set[tuple[str, int]],
+    ) -> set[UUID] | None:
+        """
+        Select the routes that need evaluating this cycle (line-first evaluation).
+
+        Computes the set of lines with alertable disruptions, a state change this cycle, or
+        unexpired alert state (see get_candidate_line_ids), then uses the inverted index
+        (ix_user_route_station_index_line_station, leading column line_tfl_id) to find
+        routes passing through them. Routes whose index has not been built yet are matched
+        via their segments' lines instead, mirroring the fallback in _get_route_disruptions.
+
+        Args:
+            disabled_severity_pairs: Set of (mode_id, severity_level) pairs that don't trigger alerts
+
+        Returns:
+            Set of candidate route IDs, or None if every active route should be evaluated
+            (line-first disabled, disruption data unavailable, or a lookup failed)
+        """
+        if not settings.ALERT_LINE_FIRST_EVALUATION or self._cycle_disruptions is None:
+            return None
+
+        alerted_line_ids = await self._get_alerted_line_ids()
+        if alerted_line_ids is None:
+            return None
+
+        line_ids = get_candidate_line_ids(
+            self._cycle_disruptions, disabled_severity_pairs, self._changed_line_ids, alerted_line_ids
+        )
+        if not line_ids:
+            logger.info("line_first_no_candidate_lines", total_lines=len(self._cycle_disruptions))
+            return set()
+
+        try:
+            indexed_query = select(UserRouteStationIndex.route_id).where(
+                UserRouteStationIndex.line_tfl_id.in_(line_ids),
+                UserRouteStationIndex.deleted_at.is_(None),
+            )
+
+            # Routes without an active index (e.g., newly created) fall back to segment lines
+            has_active_index = (
+                select(UserRouteStationIndex.id)
+                .where(
+                    UserRouteStationIndex.route_id == UserRouteSegment.route_id,
+                    UserRouteStationIndex.deleted_at.is_(None),
+                )
+                .exists()
+            )
+            unindexed_query = (
+                select(UserRouteSegment.route_id)
+                .join(Line, Line.id == UserRouteSegment.line_id)
                 .where(
-                    UserRoute.active == True,  # noqa: E712
-                    UserRoute.deleted_at.is_(None),
+                    Line.tfl_id.in_(line_ids),
+                    UserRouteSegment.deleted_at.is_(None),
+                    ~has_active_index,
                 )
-                .options(
+            )
+
+            result = await self.db.execute(union(indexed_query, unindexed_query))
+            route_ids = {row[0] for row in result.all()}
+
+        except SQLAlchemyError as e:
+            logger.error("line_first_candidate_lookup_failed", error=str(e), exc_info=e)
+            return None
+
+        logger.info(
+            "line_first_candidates_selected",
+            candidate_line_count=len(line_ids),
+            candidate_route_count=len(route_ids),
+        )
+        return route_ids
+
+    async def _get_alerted_line_ids(self) -> set[str] | None:
+        """
+        Get the lines that routes still hold unexpired alert state for, pruning expired ones.
+
+        Returns:
+            Set of TfL line IDs, or None if Redis couldn't be read
+        """
+        now = datetime.now(UTC).timestamp()
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(ALERTED_LINES_KEY, "-inf", now)
+                pipe.zrangebyscore(ALERTED_LINES_KEY, now, "+inf")
+                _removed, alerted_line_ids = await pipe.execute()
+        except Exception as e:
+            logger.error("alerted_lines_lookup_failed", error=str(e), exc_info=e)
+            return None
+        return set(cast(list[str], alerted_line_ids))
+
+    async def _get_in_window_route_ids(self) -> set[UUID] | None:
+        """
+        Select the routes with a schedule window open now, from the schedule window index.
+
+        Returns:
+            Set of route IDs that may be in a schedule window, or None if every active route
+            should be checked (index disabled or the lookup failed)
+        """
+        if not settings.ALERT_SCHEDULE_WINDOW_INDEX:
+            return None
+
+        try:
+            schedule_index_service = UserRouteScheduleIndexService(self.db)
+            route_ids = await schedule_index_service.get_in_window_route_ids(datetime.now(UTC))
+        except Exception as e:
+            logger.error("schedule_window_lookup_failed", error=str(e), exc_info=e)
+            return None
+
+        logger.info("schedule_window_routes_selected", in_window_route_count=len(route_ids))
+        return route_ids
+
+    async def _load_route_index_snapshot(self, route_ids: list[UUID]) -> RouteIndexSnapshot | None:
+        """
+        Load the route station index for this cycle's routes in one streaming query.
+
+        Args:
+            route_ids: Routes being processed this cycle
+
+        Returns:
+            RouteIndexSnapshot, or None on failure (per-route index queries are used instead)
+        """
+        if not route_ids:
+            return None
+
+        try:
+            snapshot = await load_route_index_snapshot(self.db, route_ids)
+        except SQLAlchemyError as e:
+            logger.error("route_index_snapshot_load_failed", error=str(e), exc_info=e)
+            return None
+
+        logger.debug(
+            "route_index_snapshot_loaded",
+            route_count=len(route_ids),
+            indexed_route_count=len(snapshot),
+            pair_count=len(snapshot.routes_by_pair),
+        )
+        return snapshot
+
+    async def _load_contact_snapshot(self, routes: list[UserRoute]) -> ContactSnapshot | None:
+        """
+        Load the verified contacts targeted by this cycle's notification preferences.
+
+        Args:
+            routes: Routes being processed this cycle (with notification preferences loaded)
+
+        Returns:
+            ContactSnapshot, or None on failure (contacts are queried per preference instead)
+        """
+        if not routes:
+            return None
+
+        try:
+            email_ids, phone_ids = collect_preference_target_ids(
+                pref for route in routes for pref in route.notification_preferences
+            )
+            snapshot = await load_contact_snapshot(self.db, email_ids, phone_ids)
+        except Exception as e:
+            logger.error("contact_snapshot_load_failed", error=str(e), exc_info=e)
+            return None
+
+        logger.debug("contact_snapshot_loaded", route_count=len(routes), contact_count=len(snapshot))
+        return snapshot
+
+    async def _get_active_routes(self, route_ids: set[UUID] | None = None) -> list[UserRoute]:
+        """
+        Get active routes with their relationships.
+
+        Args:
+            route_ids: Optional set of route IDs to restrict the query to (line-first candidates).
+                None loads every active route.
+
+        Returns:
+            List of active UserRoute objects with segments, schedules, preferences, and user loaded
+        """
+        if route_ids is not None and not route_ids:
+            return []
+
+        try:
+            query = select(UserRoute).where(
+                UserRoute.active == True,  # noqa: E712
+                UserRoute.deleted_at.is_(None),
+            )
+            if route_ids is not None:
+                query = query.where(any_of(UserRoute.id, route_ids))
+
+            result = await self.db.execute(
+                query.options(
                     selectinload(UserRoute.segments),
                     # NOTE: Schedules are loaded separately with soft-delete filter
                     # to avoid including soft-deleted schedules (Issue #233, PR #360)
@@ -713,6 +1215,7 @@ class AlertService:
         """
         disabled_severity_pairs: set[tuple[str, int]] = set()
         cleared_states: set[tuple[str, int]] = set()
+        self._cycle_disruptions = None
 
         # Step 1: ALWAYS fetch disabled severity pairs and cleared states first (critical for filtering)
         # This query must succeed regardless of TfL API status
@@ -735,12 +1238,14 @@ class AlertService:
         # Step 2: Try to fetch disruptions for state logging (optional, for analytics)
         # Failure here should not prevent alert processing
         try:
-            tfl_service = TfLService(db=self.db)
+            tfl_service = TfLService(db=self.db, resources=self.tfl_resources)
             all_disruptions = await tfl_service.fetch_line_disruptions(use_cache=True)
             logger.info("all_disruptions_fetched", count=len(all_disruptions))
 
             # Log line disruption state changes (for troubleshooting and analytics)
+            # This also records which lines changed state, used for line-first evaluation
             await self._log_line_disruption_state_changes(all_disruptions)
+            self._cycle_disruptions = all_disruptions
 
         except Exception as e:
             logger.error(
@@ -827,6 +1332,10 @@ class AlertService:
         """
         Query inverted index for routes passing through (line, station) combinations.
 
+        During an alert cycle the lookup is served from the cycle's in-memory snapshot
+        (routes outside the cycle aren't processed, so only the cycle's routes are
+        returned). Otherwise the index is queried from the database.
+
         Args:
             line_station_pairs: List of (line_tfl_id, station_naptan) tuples
 
@@ -836,6 +1345,9 @@ class AlertService:
         if not line_station_pairs:
             return set()
 
+        if self._route_index_snapshot is not None:
+            return self._route_index_snapshot.routes_for_pairs(line_station_pairs)
+
         # Build a single query with OR conditions for all (line, station) pairs
         conditions = [
             and_(
@@ -862,12 +1374,18 @@ class AlertService:
         """
         Get (line_tfl_id, station_naptan) pairs for a specific route from the index.
 
+        Served from the per-cycle in-memory snapshot when it covers the route,
+        otherwise queried from the database.
+
         Args:
             route_id: UserRoute ID to get index pairs for
 
         Returns:
             Set of (line_tfl_id, station_naptan) tuples for this route
         """
+        if self._route_index_snapshot is not None and self._route_index_snapshot.covers(route_id):
+            return self._route_index_snapshot.get_route_pairs(route_id)
+
         query = select(
             UserRouteStationIndex.line_tfl_id,
             UserRouteStationIndex.station_naptan,
@@ -999,7 +1517,7 @@ class AlertService:
                     route_line_ids = {row[0] for row in result.all()}
 
             # Create TfL service instance
-            tfl_service = TfLService(db=self.db)
+            tfl_service = TfLService(db=self.db, resources=self.tfl_resources)
 
             # Fetch all line disruptions (uses cache automatically)
             all_disruptions = await tfl_service.fetch_line_disruptions(use_cache=True)
@@ -1103,10 +1621,10 @@ class AlertService:
 
             try:
                 # Build Redis key for this route/user/schedule combination
-                redis_key = f"alert:{route.id}:{user_id}:{schedule.id}"
+                redis_key = get_alert_state_key(route.id, user_id, schedule.id)
 
-                # Check if key exists in Redis
-                stored_state = await self.redis_client.get(redis_key)
+                # Check if key exists in Redis (or this cycle's alert state batch)
+                stored_state = await self._get_alert_state(redis_key)
                 stored_lines: dict[str, dict[str, object]] = {}
 
                 if stored_state:
@@ -1197,6 +1715,9 @@ class AlertService:
         """
         Get verified contact information for a notification preference.
 
+        Served from this cycle's contact snapshot when it covers the preference's
+        target, otherwise queried.
+
         Args:
             pref: Notification preference
             route_id: UserRoute ID for logging
@@ -1213,10 +1734,16 @@ class AlertService:
                 )
                 return None
 
-            email_result = await self.db.execute(select(EmailAddress).where(EmailAddress.id == pref.target_email_id))
-            email_address = email_result.scalar_one_or_none()
+            if self._contact_snapshot is not None and pref.target_email_id in self._contact_snapshot.emails:
+                email = self._contact_snapshot.emails[pref.target_email_id]
+            else:
+                email_result = await self.db.execute(
+                    select(EmailAddress).where(EmailAddress.id == pref.target_email_id)
+                )
+                email_address = email_result.scalar_one_or_none()
+                email = email_address.email if email_address and email_address.verified else None
 
-            if not email_address or not email_address.verified:
+            if email is None:
                 logger.warning(
                     "email_not_verified",
                     pref_id=str(pref.id),
@@ -1225,7 +1752,7 @@ class AlertService:
                 )
                 return None
 
-            return email_address.email
+            return email
 
         if pref.method == NotificationMethod.SMS:
             if not pref.target_phone_id:
@@ -1236,10 +1763,14 @@ class AlertService:
                 )
                 return None
 
-            phone_result = await self.db.execute(select(PhoneNumber).where(PhoneNumber.id == pref.target_phone_id))
-            phone_number = phone_result.scalar_one_or_none()
+            if self._contact_snapshot is not None and pref.target_phone_id in self._contact_snapshot.phones:
+                phone = self._contact_snapshot.phones[pref.target_phone_id]
+            else:
+                phone_result = await self.db.execute(select(PhoneNumber).where(PhoneNumber.id == pref.target_phone_id))
+                phone_number = phone_result.scalar_one_or_none()
+                phone = phone_number.phone if phone_number and phone_number.verified else None
 
-            if not phone_number or not phone_number.verified:
+            if phone is None:
                 logger.warning(
                     "phone_not_verified",
                     pref_id=str(pref.id),
@@ -1248,7 +1779,7 @@ class AlertService:
                 )
                 return None
 
-            return phone_number.phone
+            return phone
 
         # Edge case: Unknown notification method
         # This code path is unreachable in practice because NotificationMethod is an enum
@@ -1309,6 +1840,207 @@ class AlertService:
         )
         self.db.add(notification_log)
 
+    def _log_notification_result(
+        self,
+        route: UserRoute,
+        pref: NotificationPreference,
+        success: bool,
+        error_message: str | None,
+    ) -> int:
+        """
+        Create the notification log entry for one preference's send attempt.
+
+        Args:
+            route: UserRoute the notification was for
+            pref: Notification preference the notification was sent to
+            success: Whether the notification was sent
+            error_message: Error message if the send failed
+
+        Returns:
+            1 if the notification was sent, otherwise 0 (for counting alerts sent)
+        """
+        if success:
+            self._create_notification_log(
+                user_id=route.user_id,
+                route_id=route.id,
+                method=pref.method,
+                status=NotificationStatus.SENT,
+            )
+            return 1
+        self._create_notification_log(
+            user_id=route.user_id,
+            route_id=route.id,
+            method=pref.method,
+            status=NotificationStatus.FAILED,
+            error_message=error_message,
+        )
+        return 0
+
+    def _enqueue_notifications(
+        self,
+        *,
+        targets: list[tuple[NotificationPreference, str]],
+        route: UserRoute,
+        kind: str,
+        render: Callable[[NotificationMethod], RenderedNotification],
+    ) -> int:
+        """
+        Queue a route's notification for delivery workers, rendered once per method.
+
+        Delivery workers write the NotificationLog entries once the notifications are
+        sent (or finally fail). A notification that can't be queued gets a FAILED entry here.
+
+        Args:
+            targets: (notification preference, verified contact) pairs
+            route: UserRoute the notifications are for
+            kind: "disruption_alert" or "status_update"
+            render: Renders the notification for a method
+
+        Returns:
+            Number of notifications queued
+        """
+        if not targets:
+            return 0
+        # Type narrowing: targets are only collected when an outbox is configured
+        assert self.notification_outbox is not None
+
+        rendered: dict[NotificationMethod, RenderedNotification] = {}
+        queued = 0
+        for pref, contact_info in targets:
+            if pref.method not in rendered:
+                rendered[pref.method] = render(pref.method)
+            try:
+                self.notification_outbox.enqueue(
+                    OutboundNotification(
+                        user_id=str(route.user_id),
+                        route_id=str(route.id),
+                        kind=kind,
+                        recipient=contact_info,
+                        notification=rendered[pref.method],
+                    )
+                )
+            except Exception as enqueue_error:
+                logger.error(
+                    "notification_enqueue_failed",
+                    pref_id=str(pref.id),
+                    route_id=str(route.id),
+                    method=pref.method.value,
+                    kind=kind,
+                    error=str(enqueue_error),
+                    exc_info=enqueue_error,
+                )
+                self._log_notification_result(route, pref, False, str(enqueue_error))
+                continue
+
+            logger.info(
+                "notification_enqueued",
+                method=pref.method.value,
+                target_hash=hash_pii(contact_info),
+                route_id=str(route.id),
+                kind=kind,
+            )
+            queued += 1
+        return queued
+
+    async def _send_batched_notifications(
+        self,
+        targets: list[tuple[NotificationPreference, str]],
+        route: UserRoute,
+        disruptions: list[DisruptionResponse],
+    ) -> int:
+        """
+        Send a route's disruption alert to several preferences together.
+
+        With a notification outbox the alerts are queued for delivery workers; otherwise
+        the (email) targets are sent as one batch over pooled SMTP connections and logged.
+
+        Args:
+            targets: (notification preference, verified contact) pairs
+            route: UserRoute being alerted
+            disruptions: List of disruptions
+
+        Returns:
+            Number of alerts queued or successfully sent
+        """
+        if self.notification_outbox is not None:
+            notification_service = NotificationService(render_cache=self.render_cache)
+            return self._enqueue_notifications(
+                targets=targets,
+                route=route,
+                kind="disruption_alert",
+                render=lambda method: notification_service.render_disruption_notification(
+                    method=method,
+                    route_name=route.name,
+                    disruptions=disruptions,
+                    user_name=self._get_user_display_name(route),
+                ),
+            )
+
+        results = await self._send_email_notifications(email_targets=targets, route=route, disruptions=disruptions)
+        return sum(
+            self._log_notification_result(route, pref, success, error_message)
+            for (pref, _contact_info), (success, error_message) in zip(targets, results, strict=True)
+        )
+
+    async def _send_email_notifications(
+        self,
+        email_targets: list[tuple[NotificationPreference, str]],
+        route: UserRoute,
+        disruptions: list[DisruptionResponse],
+    ) -> list[tuple[bool, str | None]]:
+        """
+        Send a route's disruption alert to all of its verified email contacts as one batch.
+
+        Args:
+            email_targets: (notification preference, verified email address) pairs
+            route: UserRoute being alerted
+            disruptions: List of disruptions
+
+        Returns:
+            One (success, error_message) tuple per target, in order
+        """
+        try:
+            notification_service = NotificationService(render_cache=self.render_cache)
+            errors = await notification_service.send_disruption_emails(
+                emails=[contact_info for _pref, contact_info in email_targets],
+                route_name=route.name,
+                disruptions=disruptions,
+                user_name=self._get_user_display_name(route),
+            )
+        except Exception as send_error:
+            logger.error(
+                "notification_send_failed",
+                route_id=str(route.id),
+                method=NotificationMethod.EMAIL.value,
+                recipient_count=len(email_targets),
+                error=str(send_error),
+                exc_info=send_error,
+            )
+            return [(False, str(send_error))] * len(email_targets)
+
+        results: list[tuple[bool, str | None]] = []
+        for (pref, contact_info), error in zip(email_targets, errors, strict=True):
+            if error is None:
+                logger.info(
+                    "alert_sent_successfully",
+                    method=pref.method.value,
+                    target_hash=hash_pii(contact_info),
+                    route_id=str(route.id),
+                    route_name=route.name,
+                    disruption_count=len(disruptions),
+                )
+                results.append((True, None))
+            else:
+                logger.error(
+                    "notification_send_failed",
+                    pref_id=str(pref.id),
+                    route_id=str(route.id),
+                    method=pref.method.value,
+                    error=str(error),
+                )
+                results.append((False, str(error)))
+        return results
+
     async def _send_single_notification(
         self,
         pref: NotificationPreference,
@@ -1331,7 +2063,7 @@ class AlertService:
             - error_message: Error message if failed, None if successful
         """
         try:
-            notification_service = NotificationService()
+            notification_service = NotificationService(render_cache=self.render_cache)
 
             if pref.method == NotificationMethod.EMAIL:
                 user_name = self._get_user_display_name(route)
@@ -1393,7 +2125,7 @@ class AlertService:
             - error_message: Error message if failed, None if successful
         """
         try:
-            notification_service = NotificationService()
+            notification_service = NotificationService(render_cache=self.render_cache)
 
             if pref.method == NotificationMethod.EMAIL:
                 user_name = self._get_user_display_name(route)
@@ -1487,6 +2219,9 @@ class AlertService:
                     span.set_attribute("alert.updates_sent", 0)
                     return 0
 
+                # Queued for delivery workers after the loop, if there is an outbox
+                queued_targets: list[tuple[NotificationPreference, str]] = []
+
                 # Process each notification preference
                 for pref in prefs:
                     try:
@@ -1495,6 +2230,10 @@ class AlertService:
                         if not contact_info:
                             continue
 
+                        if self.notification_outbox is not None:
+                            queued_targets.append((pref, contact_info))
+                            continue
+
                         # Send status update notification
                         success, error_message = await self._send_single_status_update(
                             pref=pref,
@@ -1532,6 +2271,21 @@ class AlertService:
                             exc_info=e,
                         )
 
+                updates_sent += self._enqueue_notifications(
+                    targets=queued_targets,
+                    route=route,
+                    kind="status_update",
+                    render=lambda method: NotificationService(
+                        render_cache=self.render_cache
+                    ).render_status_update_notification(
+                        method=method,
+                        route_name=route.name,
+                        cleared_lines=cleared_lines,
+                        still_disrupted=still_disrupted,
+                        user_name=self._get_user_display_name(route),
+                    ),
+                )
+
                 # Commit all notification logs
                 await self.db.commit()
 
@@ -1601,10 +2355,10 @@ class AlertService:
 
             try:
                 # Build Redis key
-                redis_key = f"alert:{route.id}:{user_id}:{schedule.id}"
+                redis_key = get_alert_state_key(route.id, user_id, schedule.id)
 
                 # Get existing state
-                existing_state = await self.redis_client.get(redis_key)
+                existing_state = await self._get_alert_state(redis_key)
                 if not existing_state:
                     logger.debug(
                         "no_existing_state_to_update",
@@ -1646,11 +2400,7 @@ class AlertService:
                     # Store updated state back to Redis
                     if ttl_seconds > 0 and lines_state:
                         # Only store if we have TTL and remaining lines
-                        await self.redis_client.setex(
-                            redis_key,
-                            ttl_seconds,
-                            json.dumps(state_data),
-                        )
+                        await self._set_alert_state(redis_key, ttl_seconds, json.dumps(state_data))
                         logger.info(
                             "cleared_lines_removed_from_state",
                             route_id=str(route.id),
@@ -1660,7 +2410,7 @@ class AlertService:
                         )
                     else:
                         # No lines left or TTL expired - delete the key
-                        await self.redis_client.delete(redis_key)
+                        await self._delete_alert_state(redis_key)
                         logger.info(
                             "alert_state_deleted_no_remaining_lines",
                             route_id=str(route.id),
@@ -1868,6 +2618,10 @@ class AlertService:
                     span.set_attribute("alert.alerts_sent", 0)
                     return 0
 
+                # Sent together after the loop: queued for delivery workers if there is an
+                # outbox, otherwise email preferences go over pooled SMTP connections
+                batched_targets: list[tuple[NotificationPreference, str]] = []
+
                 # Process each notification preference
                 for pref in prefs:
                     try:
@@ -1876,6 +2630,10 @@ class AlertService:
                         if not contact_info:
                             continue
 
+                        if self.notification_outbox is not None or pref.method == NotificationMethod.EMAIL:
+                            batched_targets.append((pref, contact_info))
+                            continue
+
                         # Send notification
                         success, error_message = await self._send_single_notification(
                             pref=pref,
@@ -1883,24 +2641,7 @@ class AlertService:
                             route=route,
                             disruptions=disruptions,
                         )
-
-                        # Create notification log
-                        if success:
-                            self._create_notification_log(
-                                user_id=route.user_id,
-                                route_id=route.id,
-                                method=pref.method,
-                                status=NotificationStatus.SENT,
-                            )
-                            alerts_sent += 1
-                        else:
-                            self._create_notification_log(
-                                user_id=route.user_id,
-                                route_id=route.id,
-                                method=pref.method,
-                                status=NotificationStatus.FAILED,
-                                error_message=error_message,
-                            )
+                        alerts_sent += self._log_notification_result(route, pref, success, error_message)
 
                     except Exception as e:
                         # Catch any other unexpected errors in preference processing
@@ -1912,6 +2653,13 @@ class AlertService:
                             exc_info=e,
                         )
 
+                if batched_targets:
+                    alerts_sent += await self._send_batched_notifications(
+                        targets=batched_targets,
+                        route=route,
+                        disruptions=disruptions,
+                    )
+
                 # Commit all notification logs
                 await self.db.commit()
 
@@ -2019,13 +2767,13 @@ class AlertService:
                     }
 
                 # Build Redis key
-                redis_key = f"alert:{route.id}:{user_id}:{schedule.id}"
+                redis_key = get_alert_state_key(route.id, user_id, schedule.id)
 
                 # Merge with existing state (preserve lines we didn't alert about).
                 # Note: No freshness validation needed because:
                 # 1. TTL expires at schedule end time, so stale data doesn't persist across windows
                 # 2. Re-appearing disruptions will have different full_hash/status_hash, bypassing cooldown
-                existing_state = await self.redis_client.get(redis_key)
+                existing_state = await self._get_alert_state(redis_key)
                 if existing_state:
                     with contextlib.suppress(json.JSONDecodeError, AttributeError):
                         data = json.loads(existing_state)
@@ -2044,11 +2792,8 @@ class AlertService:
 
                 # Store in Redis with TTL
                 if ttl_seconds > 0:
-                    await self.redis_client.setex(
-                        redis_key,
-                        ttl_seconds,
-                        json.dumps(state_data),
-                    )
+                    await self._set_alert_state(redis_key, ttl_seconds, json.dumps(state_data))
+                    await self._record_alerted_lines(lines_state, ttl_seconds)
                     logger.info(
                         "alert_state_stored",
                         route_id=str(route.id),
@@ -1,5 +1,6 @@
 """Service for matching TfL disruptions to user routes."""
 
+from collections.abc import Collection
 from uuid import UUID
 
 from sqlalchemy import select
@@ -10,6 +11,7 @@ from app.helpers.disruption_helpers import (
     disruption_affects_route,
     extract_line_station_pairs,
 )
+from app.helpers.route_index_snapshot import RouteIndexSnapshot, load_route_index_snapshot
 from app.helpers.soft_delete_filters import add_active_filter
 from app.models.tfl import AlertDisabledSeverity
 from app.models.user_route_index import UserRouteStationIndex
@@ -48,6 +50,24 @@ class DisruptionMatchingService:
         result = await self.db.execute(query)
         return {(row[0], row[1]) for row in result.all()}
 
+    async def get_route_index_snapshot(self, route_ids: Collection[UUID]) -> RouteIndexSnapshot:
+        """
+        Load index pairs for several routes in a single query.
+
+        Use instead of calling get_route_index_pairs() once per route.
+
+        Args:
+            route_ids: Route UUIDs to load
+
+        Returns:
+            RouteIndexSnapshot covering the requested routes
+        """
+        with service_span("disruption.load_route_index_snapshot", "disruption-matching-service") as span:
+            span.set_attribute("disruption.route_count", len(route_ids))
+            snapshot = await load_route_index_snapshot(self.db, route_ids)
+            span.set_attribute("disruption.indexed_route_count", len(snapshot))
+            return snapshot
+
     async def filter_alertable_disruptions(
         self,
         disruptions: list[DisruptionResponse],
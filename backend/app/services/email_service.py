@@ -1,5 +1,8 @@
 """Email service for sending verification and notification emails."""
 
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
 from email.message import EmailMessage
 from pathlib import Path
 
@@ -9,6 +12,7 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 from opentelemetry.trace import SpanKind
 
 from app.core.config import require_config, settings
+from app.core.smtp_pool import SmtpConnectionPool, create_smtp_pool, get_smtp_pool, get_tls_settings
 from app.core.telemetry import service_span
 from app.utils.pii import hash_pii
 
@@ -17,46 +21,6 @@ require_config("SMTP_HOST", "SMTP_PORT", "SMTP_USER", "SMTP_PASSWORD", "SMTP_FRO
 
 logger = structlog.get_logger(__name__)
 
-# Standard SMTP port for implicit TLS (SMTPS)
-SMTPS_PORT = 465
-
-
-def get_tls_settings(port: int, require_tls: bool) -> tuple[bool, bool | None]:
-    """
-    Determine TLS settings based on port and require_tls flag.
-
-    Args:
-        port: SMTP port number
-        require_tls: Whether to require STARTTLS upgrade on non-465 ports
-
-    Returns:
-        Tuple of (use_tls, start_tls) for aiosmtplib.SMTP
-    """
-    """
-    from https://aiosmtplib.readthedocs.io/en/stable/encryption.html and the signature of aiosmtplib.SMTP:
-
-    | Port | Type         | REQUIRE_TLS | use_tls | start_tls | Behavior                             |
-    |------|--------------|-------------|---------|-----------|--------------------------------------|
-    | 25   | Plaintext    | False       | False   | None      | Auto-upgrade if available            |
-    | 25   | Plaintext    | True        | False   | True      | Force upgrade, fail if not supported |
-    | 465  | Implicit TLS | False       | True    | N/A       | Always TLS (port behavior)           |
-    | 465  | Implicit TLS | True        | True    | N/A       | Always TLS (port behavior)           |
-    | 587  | STARTTLS     | False       | False   | None      | Auto-upgrade if available            |
-    | 587  | STARTTLS     | True        | False   | True      | Force upgrade, fail if not supported |
-
-    So the logic:
-    - Port 465: use_tls=True (always, regardless of REQUIRE_TLS)
-    - Other ports: use_tls=False, start_tls=True if REQUIRE_TLS else None
-
-    This way REQUIRE_TLS controls whether we require the STARTTLS upgrade to succeed on ports 25/587.
-
-    """
-
-    if port == SMTPS_PORT:
-        return (True, None)  # Implicit TLS, start_tls N/A
-    return (False, True if require_tls else None)
-
-
 # Initialize Jinja2 environment for email templates
 # Security: Using autoescape with select_autoescape for HTML/XML provides XSS protection
 # by automatically escaping all variables in templates. This is equivalent to Flask's
@@ -69,14 +33,28 @@ jinja_env = Environment(
 )
 
 
+@dataclass(frozen=True, slots=True)
+class OutgoingEmail:
+    """An email ready to send with EmailService.send_emails()."""
+
+    to: str
+    subject: str
+    html_content: str
+    text_content: str
+
+
 class EmailService:
     """Service for sending emails via SMTP."""
 
-    def __init__(self) -> None:
+    def __init__(self, smtp_pool: SmtpConnectionPool | None = None) -> None:
         """Initialize the email service.
 
         Note: All required fields are validated by require_config() at module import time.
         The assert statements narrow types for mypy after validation.
+
+        Args:
+            smtp_pool: Pooled SMTP connections to send over. Defaults to the process-wide
+                pool; without one, each email opens its own connection.
         """
         # Type narrowing: require_config() guarantees these are not None
         assert settings.SMTP_HOST is not None
@@ -91,6 +69,7 @@ class EmailService:
         self.from_email: str = settings.SMTP_FROM_EMAIL
         self.smtp_timeout = settings.SMTP_TIMEOUT
         self.require_tls = settings.SMTP_REQUIRE_TLS
+        self.smtp_pool = smtp_pool if smtp_pool is not None else get_smtp_pool()
 
     async def send_email(
         self,
@@ -115,6 +94,56 @@ class EmailService:
         """
         await self._send_email_async(to, subject, html_content, text_content)
 
+    async def send_emails(self, emails: Sequence[OutgoingEmail]) -> list[Exception | None]:
+        """
+        Send several emails over pooled SMTP connections.
+
+        Without a process-wide pool, a temporary pool is used for the batch so the
+        emails still share connections. One failed email does not stop the others.
+
+        Args:
+            emails: Emails to send
+
+        Returns:
+            One entry per email, in order: None if sent, otherwise the exception raised
+        """
+        if not emails:
+            return []
+        if self.smtp_pool is not None:
+            return await self._send_batch(self.smtp_pool, emails)
+
+        pool = create_smtp_pool()
+        try:
+            return await self._send_batch(pool, emails)
+        finally:
+            await pool.aclose()
+
+    async def _send_batch(
+        self,
+        smtp_pool: SmtpConnectionPool,
+        emails: Sequence[OutgoingEmail],
+    ) -> list[Exception | None]:
+        """Send emails concurrently over a pool, collecting per-email failures."""
+        results = await asyncio.gather(
+            *(
+                self._send_email_async(
+                    email.to,
+                    email.subject,
+                    email.html_content,
+                    email.text_content,
+                    smtp_pool=smtp_pool,
+                )
+                for email in emails
+            ),
+            return_exceptions=True,
+        )
+        errors: list[Exception | None] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result  # Cancellation and the like are not per-email failures
+            errors.append(result)
+        return errors
+
     async def send_verification_email(self, email: str, code: str) -> None:
         """
         Send a verification email with the provided code.
@@ -165,17 +194,22 @@ This is an automated message from IsTheTubeRunning.
         subject: str,
         html_content: str,
         text_content: str,
+        *,
+        smtp_pool: SmtpConnectionPool | None = None,
     ) -> None:
         """
         Asynchronously send an email using aiosmtplib.
 
         This method performs truly async SMTP operations without blocking the event loop.
+        Emails go over pooled connections when a pool is available (smtp_pool, else
+        self.smtp_pool), otherwise over a new connection for this email.
 
         Args:
             to: Recipient email address
             subject: Email subject line
             html_content: HTML content of the email
             text_content: Plain text fallback content
+            smtp_pool: Pool to send over instead of self.smtp_pool
 
         Raises:
             aiosmtplib.SMTPException: If email sending fails
@@ -206,6 +240,14 @@ This is an automated message from IsTheTubeRunning.
                 message.set_content(text_content)
                 message.add_alternative(html_content, subtype="html")
 
+                pool = smtp_pool if smtp_pool is not None else self.smtp_pool
+                span.set_attribute("smtp.pooled", pool is not None)
+                if pool is not None:
+                    # Reuse an authenticated connection (no connect/TLS/AUTH per email)
+                    await pool.send_message(message)
+                    logger.info("email_sent", recipient_hash=recipient_hash, subject=subject)
+                    return
+
                 # Send the email via SMTP (async network I/O)
                 # timeout parameter prevents indefinite hangs on unreachable hosts
                 use_tls, start_tls = get_tls_settings(self.smtp_port, self.require_tls)
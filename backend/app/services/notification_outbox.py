@@ -0,0 +1,114 @@
+"""
+Outbound notification queue between alert evaluation and delivery.
+
+Sending email/SMS inline made the alert cycle wait on the mail server: one slow SMTP
+exchange delayed evaluation of every route behind it. Instead, the alert cycle renders
+each notification and hands it to a NotificationOutbox, and delivery workers send it
+with retries (see deliver_notification in app.celery.tasks). The NotificationLog entry
+is written when delivery completes, successfully or after the final retry.
+
+OutboundNotification holds plain strings only, so it can be queued as JSON.
+"""
+
+from datetime import UTC, datetime
+from typing import Protocol, TypedDict
+from uuid import UUID
+
+import structlog
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.notification import NotificationLog, NotificationMethod, NotificationStatus
+from app.services.notification_service import NotificationService, RenderedNotification
+from app.utils.pii import hash_pii
+
+logger = structlog.get_logger(__name__)
+
+
+class OutboundNotification(TypedDict):
+    """A rendered notification for one recipient, queued for delivery."""
+
+    user_id: str
+    route_id: str
+    kind: str  # "disruption_alert" or "status_update", for logging
+    recipient: str  # Verified email address or phone number
+    notification: RenderedNotification
+
+
+class NotificationOutbox(Protocol):
+    """Queue that accepts notifications for asynchronous delivery."""
+
+    def enqueue(self, outbound: OutboundNotification) -> None:
+        """
+        Queue a notification for delivery.
+
+        Raises:
+            Exception: If the notification could not be queued
+        """
+        ...
+
+
+async def deliver_outbound_notification(
+    db: AsyncSession,
+    outbound: OutboundNotification,
+    *,
+    final_attempt: bool,
+) -> bool:
+    """
+    Send a queued notification and record the outcome in NotificationLog.
+
+    Failures before the final attempt are re-raised without a log entry, so the caller
+    can retry; the final failure is logged as FAILED and not re-raised. A database error
+    writing the log entry is logged but not raised, since retrying would resend.
+
+    Args:
+        db: Database session for the NotificationLog entry
+        outbound: Notification to deliver
+        final_attempt: Whether the caller will not retry a failure
+
+    Returns:
+        True if the notification was sent, False if the final attempt failed
+
+    Raises:
+        Exception: If sending fails and this is not the final attempt
+    """
+    method = NotificationMethod(outbound["notification"]["method"])
+    log_context = {
+        "kind": outbound["kind"],
+        "method": method.value,
+        "route_id": outbound["route_id"],
+        "target_hash": hash_pii(outbound["recipient"]),
+    }
+
+    try:
+        await NotificationService().send_rendered_notification(outbound["recipient"], outbound["notification"])
+    except Exception as send_error:
+        if not final_attempt:
+            logger.warning("outbound_notification_send_failed_will_retry", error=str(send_error), **log_context)
+            raise
+        logger.error("outbound_notification_failed", error=str(send_error), exc_info=send_error, **log_context)
+        status = NotificationStatus.FAILED
+        error_message: str | None = str(send_error)
+    else:
+        logger.info("outbound_notification_delivered", **log_context)
+        status = NotificationStatus.SENT
+        error_message = None
+
+    try:
+        db.add(
+            NotificationLog(
+                user_id=UUID(outbound["user_id"]),
+                route_id=UUID(outbound["route_id"]),
+                sent_at=datetime.now(UTC),
+                method=method,
+                status=status,
+                error_message=error_message,
+            )
+        )
+        await db.commit()
+    except SQLAlchemyError as log_error:
+        # Don't raise: the delivery outcome is final and a retry would send the notification again
+        logger.error("outbound_notification_log_failed", error=str(log_error), exc_info=log_error, **log_context)
+        await db.rollback()
+
+    return status == NotificationStatus.SENT
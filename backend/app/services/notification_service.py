@@ -1,14 +1,21 @@
 """Notification service for sending disruption alerts via email and SMS."""
 
+import hashlib
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
 
 import structlog
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup
 
 from app.core.telemetry import service_span
+from app.helpers.disruption_helpers import create_disruption_set_hash
+from app.models.notification import NotificationMethod
 from app.schemas.tfl import ClearedLineInfo, DisruptionResponse
-from app.services.email_service import EmailService
+from app.services.email_service import EmailService, OutgoingEmail
 from app.services.sms_service import SmsService
 from app.utils.pii import hash_pii
 
@@ -18,6 +25,93 @@ logger = structlog.get_logger(__name__)
 SMS_MAX_LENGTH = 160
 
 
+class RenderedNotification(TypedDict):
+    """
+    A notification rendered for sending, independent of the recipient.
+
+    Plain strings only, so it can be queued as JSON (see app.services.notification_outbox).
+    """
+
+    method: str  # NotificationMethod value
+    subject: str | None  # Email only
+    html_content: str | None  # Email only
+    text_content: str  # Email plain text part, or the SMS message
+
+
+@dataclass(slots=True)
+class NotificationRenderStats:
+    """Counters for a NotificationRenderCache."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class NotificationRenderCache:
+    """
+    Rendered email content blocks shared between recipients.
+
+    During a line-wide disruption many routes are alerted about the same disruptions,
+    and their emails differ only in the route name and greeting. The disruption (or
+    status update) block is the expensive part to render, so it is rendered once per
+    distinct disruption set and reused; only the personalised wrapper is rendered per
+    recipient. Keys come from create_disruption_set_hash(), so the cache is meant to
+    live for one alert cycle (AlertService creates one per cycle).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.stats = NotificationRenderStats()
+        # (block name, content hash) -> (html, plain text)
+        self._entries: dict[tuple[str, str], tuple[str, str]] = {}
+
+    def get_or_render(self, block: str, key: str, render: Callable[[], tuple[str, str]]) -> tuple[str, str]:
+        """
+        Get a rendered block, rendering and storing it on a miss.
+
+        Args:
+            block: Name of the content block (e.g. "disruption_list")
+            key: Hash of the content the block is rendered from
+            render: Renders the block as (html, plain text)
+
+        Returns:
+            Tuple of (html, plain text)
+        """
+        entry = self._entries.get((block, key))
+        if entry is not None:
+            self.stats.hits += 1
+            return entry
+
+        self.stats.misses += 1
+        entry = render()
+        self._entries[(block, key)] = entry
+        return entry
+
+    def __len__(self) -> int:
+        """Number of rendered blocks stored."""
+        return len(self._entries)
+
+
+def _create_status_update_hash(cleared_lines: list[ClearedLineInfo], still_disrupted: list[DisruptionResponse]) -> str:
+    """
+    Create a hash identifying the content of a status update, for NotificationRenderCache.
+
+    Args:
+        cleared_lines: Lines that have returned to normal service
+        still_disrupted: Lines that remain disrupted
+
+    Returns:
+        SHA256 hash string (64 characters)
+    """
+    hash_input = [
+        [
+            [c.line_id, c.line_name, c.previous_severity, c.previous_status, c.current_severity, c.current_status]
+            for c in cleared_lines
+        ],
+        create_disruption_set_hash(still_disrupted),
+    ]
+    return hashlib.sha256(json.dumps(hash_input).encode()).hexdigest()
+
+
 def _build_disruption_subject(route_name: str, disruptions: list[DisruptionResponse]) -> str:
     """
     Build concise subject line for disruption alerts.
@@ -83,6 +177,156 @@ def _build_status_update_subject(
     return f"✅ {route_name}: {cleared_names} restored | {disrupted_names} still disrupted"
 
 
+def _build_disruption_sms(route_name: str, disruptions: list[DisruptionResponse]) -> str:
+    """
+    Build a concise disruption alert SMS (under 160 characters when possible).
+
+    Format: TfL Alert: {route_name} affected. {line_name}: {status}. More: {url}
+
+    Args:
+        route_name: Name of the route affected
+        disruptions: List of disruptions affecting the route
+
+    Returns:
+        SMS message text
+    """
+    # Start with base message
+    base_msg = f"TfL Alert: {route_name} affected. "
+
+    # Add first 2-3 disruptions (prioritize fitting in 160 chars)
+    disruption_parts = []
+    for disruption in disruptions[:3]:  # Limit to first 3 disruptions
+        part = f"{disruption.line_name}: {disruption.status_severity_description}"
+        disruption_parts.append(part)
+
+    disruption_text = ". ".join(disruption_parts[:2])  # Start with first 2
+
+    # Add URL
+    url = "More: tfl.gov.uk/tube-dlr-overground/status/"
+
+    # Build final message
+    message = f"{base_msg}{disruption_text}. {url}"
+
+    # If too long and we have multiple disruptions, try with just one
+    if len(message) > SMS_MAX_LENGTH and len(disruptions) > 1:
+        disruption_text = disruption_parts[0]
+        message = f"{base_msg}{disruption_text}. {url}"
+
+    return message
+
+
+def _build_status_update_sms(
+    route_name: str,
+    cleared_lines: list[ClearedLineInfo],
+    still_disrupted: list[DisruptionResponse],
+) -> str:
+    """
+    Build a status update SMS, truncated in stages to fit SMS_MAX_LENGTH.
+
+    Format: TfL Update: {route_name}. Service restored: {lines}. Still disrupted: {lines}. More: {url}
+
+    Args:
+        route_name: Name of the route
+        cleared_lines: Lines that have returned to normal service
+        still_disrupted: Lines that remain disrupted
+
+    Returns:
+        SMS message text
+    """
+    # Build cleared lines text (comma-separated names)
+    cleared_names = ", ".join([cl.line_name for cl in cleared_lines[:3]])  # Limit to 3
+
+    base_msg = f"TfL Update: {route_name}. Service restored: {cleared_names}."
+
+    # Add still disrupted if any and space permits
+    if still_disrupted:
+        disrupted_names = ", ".join([d.line_name for d in still_disrupted[:2]])
+        disrupted_msg = f" Still disrupted: {disrupted_names}."
+    else:
+        disrupted_msg = ""
+
+    # Add URL
+    url = " More: tfl.gov.uk/tube-dlr-overground/status/"
+
+    # Build final message
+    message = f"{base_msg}{disrupted_msg}{url}"
+
+    # Multi-stage truncation if message exceeds SMS_MAX_LENGTH
+    if len(message) > SMS_MAX_LENGTH:
+        # Stage 1: Drop the "still disrupted" part
+        message = f"{base_msg}{url}"
+
+        # Stage 2: If still too long, reduce cleared lines from 3 to 2
+        min_cleared_lines_stage_2 = 2
+        if len(message) > SMS_MAX_LENGTH and len(cleared_lines) > min_cleared_lines_stage_2:
+            cleared_names = ", ".join([cl.line_name for cl in cleared_lines[:2]])
+            base_msg = f"TfL Update: {route_name}. Service restored: {cleared_names}."
+            message = f"{base_msg}{url}"
+
+        # Stage 3: If still too long, reduce cleared lines from 2 to 1
+        if len(message) > SMS_MAX_LENGTH and len(cleared_lines) > 1:
+            cleared_names = cleared_lines[0].line_name
+            base_msg = f"TfL Update: {route_name}. Service restored: {cleared_names}."
+            message = f"{base_msg}{url}"
+
+        # Stage 4: If still too long, truncate route_name and cleared_names with ellipsis
+        if len(message) > SMS_MAX_LENGTH:
+            max_route_len = 30
+            max_cleared_len = 20
+            truncated_route = (route_name[:max_route_len] + "…") if len(route_name) > max_route_len else route_name
+            truncated_cleared = (
+                (cleared_names[:max_cleared_len] + "…") if len(cleared_names) > max_cleared_len else cleared_names
+            )
+            base_msg = f"TfL Update: {truncated_route}. Service restored: {truncated_cleared}."
+            message = f"{base_msg}{url}"
+
+        # Stage 5: Final fallback - force truncate to SMS_MAX_LENGTH
+        if len(message) > SMS_MAX_LENGTH:
+            message = message[:SMS_MAX_LENGTH]
+
+    return message
+
+
+def _build_disruption_text(disruptions: list[DisruptionResponse]) -> str:
+    """
+    Build the plain text list of disruptions for a disruption alert email.
+
+    Args:
+        disruptions: List of disruptions affecting the route
+
+    Returns:
+        One line per disruption, plus its reason if there is one
+    """
+    text = ""
+    for disruption in disruptions:
+        text += f"- {disruption.line_name}: {disruption.status_severity_description}\n"
+        if disruption.reason:
+            text += f"  Reason: {disruption.reason}\n"
+    return text
+
+
+def _build_status_update_text(cleared_lines: list[ClearedLineInfo], still_disrupted: list[DisruptionResponse]) -> str:
+    """
+    Build the plain text list of cleared and still disrupted lines for a status update email.
+
+    Args:
+        cleared_lines: Lines that have returned to normal service
+        still_disrupted: Lines that remain disrupted
+
+    Returns:
+        One line per cleared line, then a section for lines still disrupted (if any)
+    """
+    text = ""
+    for cleared in cleared_lines:
+        text += f"- {cleared.line_name}: {cleared.current_status} (was: {cleared.previous_status})\n"
+
+    if still_disrupted:
+        text += "\nStill disrupted:\n"
+        for disruption in still_disrupted:
+            text += f"- {disruption.line_name}: {disruption.status_severity_description}\n"
+    return text
+
+
 # Initialize Jinja2 environment for email templates
 TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 # nosemgrep: python.flask.security.xss.audit.direct-use-of-jinja2
@@ -97,10 +341,17 @@ jinja_env = Environment(
 class NotificationService:
     """Service for sending disruption notifications via email and SMS."""
 
-    def __init__(self) -> None:
-        """Initialize the notification service with email and SMS services."""
+    def __init__(self, render_cache: NotificationRenderCache | None = None) -> None:
+        """
+        Initialize the notification service with email and SMS services.
+
+        Args:
+            render_cache: Cache for email content blocks shared between recipients.
+                Without one, every email is rendered in full.
+        """
         self.email_service = EmailService()
         self.sms_service = SmsService()
+        self.render_cache = render_cache
 
     async def send_disruption_email(
         self,
@@ -136,33 +387,7 @@ class NotificationService:
             span.set_attribute("notification.disruption_count", len(disruptions))
 
             try:
-                # Build email subject
-                subject = _build_disruption_subject(route_name, disruptions)
-
-                # Render the HTML template
-                html_content = self._render_email_template(
-                    "email/disruption_alert.html",
-                    {
-                        "route_name": route_name,
-                        "user_name": user_name,
-                        "disruptions": disruptions,
-                        "tfl_status_url": "https://tfl.gov.uk/tube-dlr-overground/status/",
-                    },
-                )
-
-                # Create plain text fallback
-                text_content = f"""
-Disruption Alert: {route_name}
-
-The following disruptions are affecting your route:
-
-"""
-                for disruption in disruptions:
-                    text_content += f"- {disruption.line_name}: {disruption.status_severity_description}\n"
-                    if disruption.reason:
-                        text_content += f"  Reason: {disruption.reason}\n"
-
-                text_content += "\nTfL Status: https://tfl.gov.uk/tube-dlr-overground/status/"
+                subject, html_content, text_content = self._build_disruption_email(route_name, disruptions, user_name)
 
                 # Send email via EmailService
                 await self.email_service.send_email(email, subject, html_content, text_content)
@@ -184,6 +409,222 @@ The following disruptions are affecting your route:
                 )
                 raise
 
+    async def send_disruption_emails(
+        self,
+        emails: Sequence[str],
+        route_name: str,
+        disruptions: list[DisruptionResponse],
+        user_name: str | None = None,
+    ) -> list[Exception | None]:
+        """
+        Send the same disruption alert to several email addresses as one batch.
+
+        The email is rendered once and the batch is sent over pooled SMTP
+        connections (see EmailService.send_emails()).
+
+        Args:
+            emails: Recipient email addresses
+            route_name: Name of the route affected
+            disruptions: List of disruptions affecting the route
+            user_name: User's name for personalized greeting (defaults to "there")
+
+        Returns:
+            One entry per recipient, in order: None if sent, otherwise the exception raised
+        """
+        with service_span(
+            "notification.send_disruption_emails",
+            "notification-service",
+        ) as span:
+            span.set_attribute("notification.type", "email")
+            span.set_attribute("notification.recipient_count", len(emails))
+            span.set_attribute("notification.route_name", route_name)
+            span.set_attribute("notification.disruption_count", len(disruptions))
+
+            subject, html_content, text_content = self._build_disruption_email(route_name, disruptions, user_name)
+            errors = await self.email_service.send_emails(
+                [
+                    OutgoingEmail(to=email, subject=subject, html_content=html_content, text_content=text_content)
+                    for email in emails
+                ]
+            )
+
+            for email, error in zip(emails, errors, strict=True):
+                if error is None:
+                    logger.info(
+                        "disruption_email_sent",
+                        recipient_hash=hash_pii(email),
+                        route_name=route_name,
+                        disruption_count=len(disruptions),
+                    )
+                else:
+                    logger.error(
+                        "disruption_email_failed",
+                        recipient_hash=hash_pii(email),
+                        route_name=route_name,
+                        error=str(error),
+                        exc_info=error,
+                    )
+
+            span.set_attribute("notification.failed_count", sum(1 for error in errors if error is not None))
+            return errors
+
+    def render_disruption_notification(
+        self,
+        method: NotificationMethod,
+        route_name: str,
+        disruptions: list[DisruptionResponse],
+        user_name: str | None = None,
+    ) -> RenderedNotification:
+        """
+        Render a disruption alert for sending later with send_rendered_notification().
+
+        Args:
+            method: Notification method to render for
+            route_name: Name of the route affected
+            disruptions: List of disruptions affecting the route
+            user_name: User's name for personalized email greeting
+
+        Returns:
+            RenderedNotification for the method
+        """
+        if method == NotificationMethod.SMS:
+            return RenderedNotification(
+                method=method.value,
+                subject=None,
+                html_content=None,
+                text_content=_build_disruption_sms(route_name, disruptions),
+            )
+        subject, html_content, text_content = self._build_disruption_email(route_name, disruptions, user_name)
+        return RenderedNotification(
+            method=method.value,
+            subject=subject,
+            html_content=html_content,
+            text_content=text_content,
+        )
+
+    def render_status_update_notification(
+        self,
+        method: NotificationMethod,
+        route_name: str,
+        cleared_lines: list[ClearedLineInfo],
+        still_disrupted: list[DisruptionResponse],
+        user_name: str | None = None,
+    ) -> RenderedNotification:
+        """
+        Render a status update for sending later with send_rendered_notification().
+
+        Args:
+            method: Notification method to render for
+            route_name: Name of the route
+            cleared_lines: Lines that have returned to normal service
+            still_disrupted: Lines that remain disrupted
+            user_name: User's name for personalized email greeting
+
+        Returns:
+            RenderedNotification for the method
+        """
+        if method == NotificationMethod.SMS:
+            return RenderedNotification(
+                method=method.value,
+                subject=None,
+                html_content=None,
+                text_content=_build_status_update_sms(route_name, cleared_lines, still_disrupted),
+            )
+        subject, html_content, text_content = self._build_status_update_email(
+            route_name, cleared_lines, still_disrupted, user_name
+        )
+        return RenderedNotification(
+            method=method.value,
+            subject=subject,
+            html_content=html_content,
+            text_content=text_content,
+        )
+
+    async def send_rendered_notification(self, recipient: str, notification: RenderedNotification) -> None:
+        """
+        Send a previously rendered notification.
+
+        Args:
+            recipient: Email address or phone number, matching the notification's method
+            notification: Notification from render_*_notification()
+
+        Raises:
+            Exception: If sending fails
+        """
+        method = NotificationMethod(notification["method"])
+
+        with service_span(
+            "notification.send_rendered",
+            "notification-service",
+        ) as span:
+            span.set_attribute("notification.type", method.value)
+            span.set_attribute("notification.recipient_hash", hash_pii(recipient))
+
+            if method == NotificationMethod.SMS:
+                await self.sms_service.send_sms(recipient, notification["text_content"])
+                return
+
+            # Type narrowing: render_*_notification() always sets these for email
+            assert notification["subject"] is not None
+            assert notification["html_content"] is not None
+            await self.email_service.send_email(
+                recipient,
+                notification["subject"],
+                notification["html_content"],
+                notification["text_content"],
+            )
+
+    def _build_disruption_email(
+        self,
+        route_name: str,
+        disruptions: list[DisruptionResponse],
+        user_name: str | None,
+    ) -> tuple[str, str, str]:
+        """
+        Render the subject, HTML and plain text of a disruption alert email.
+
+        Args:
+            route_name: Name of the route affected
+            disruptions: List of disruptions affecting the route
+            user_name: User's name for personalized greeting
+
+        Returns:
+            Tuple of (subject, html_content, text_content)
+        """
+        # Build email subject
+        subject = _build_disruption_subject(route_name, disruptions)
+
+        # Render the disruption block (shared between recipients) and then the personalised wrapper
+        disruption_list, disruption_text = self._render_content_block(
+            "disruption_list",
+            create_disruption_set_hash(disruptions),
+            lambda: (
+                self._render_email_template("email/_disruption_list.html", {"disruptions": disruptions}),
+                _build_disruption_text(disruptions),
+            ),
+        )
+        html_content = self._render_email_template(
+            "email/disruption_alert.html",
+            {
+                "route_name": route_name,
+                "user_name": user_name,
+                "disruption_list": Markup(disruption_list),  # Rendered with autoescape
+                "tfl_status_url": "https://tfl.gov.uk/tube-dlr-overground/status/",
+            },
+        )
+
+        # Create plain text fallback
+        text_content = f"""
+Disruption Alert: {route_name}
+
+The following disruptions are affecting your route:
+
+"""
+        text_content += disruption_text
+        text_content += "\nTfL Status: https://tfl.gov.uk/tube-dlr-overground/status/"
+
+        return subject, html_content, text_content
+
     async def send_disruption_sms(
         self,
         phone: str,
@@ -214,30 +655,7 @@ The following disruptions are affecting your route:
             span.set_attribute("notification.disruption_count", len(disruptions))
 
             try:
-                # Create concise SMS text (SMS has character limits)
-                # Format: "TfL Alert: {route_name} affected. {line_name}: {status}."
-
-                # Start with base message
-                base_msg = f"TfL Alert: {route_name} affected. "
-
-                # Add first 2-3 disruptions (prioritize fitting in 160 chars)
-                disruption_parts = []
-                for disruption in disruptions[:3]:  # Limit to first 3 disruptions
-                    part = f"{disruption.line_name}: {disruption.status_severity_description}"
-                    disruption_parts.append(part)
-
-                disruption_text = ". ".join(disruption_parts[:2])  # Start with first 2
-
-                # Add URL
-                url = "More: tfl.gov.uk/tube-dlr-overground/status/"
-
-                # Build final message
-                message = f"{base_msg}{disruption_text}. {url}"
-
-                # If too long and we have multiple disruptions, try with just one
-                if len(message) > SMS_MAX_LENGTH and len(disruptions) > 1:
-                    disruption_text = disruption_parts[0]
-                    message = f"{base_msg}{disruption_text}. {url}"
+                message = _build_disruption_sms(route_name, disruptions)
 
                 # Set message length as span attribute
                 span.set_attribute("notification.message_length", len(message))
@@ -297,40 +715,10 @@ The following disruptions are affecting your route:
             span.set_attribute("notification.still_disrupted_count", len(still_disrupted))
 
             try:
-                # Build email subject
-                subject = _build_status_update_subject(route_name, cleared_lines, still_disrupted)
-
-                # Render the HTML template
-                html_content = self._render_email_template(
-                    "email/status_update.html",
-                    {
-                        "route_name": route_name,
-                        "user_name": user_name,
-                        "cleared_lines": cleared_lines,
-                        "still_disrupted": still_disrupted,
-                        "tfl_status_url": "https://tfl.gov.uk/tube-dlr-overground/status/",
-                    },
+                subject, html_content, text_content = self._build_status_update_email(
+                    route_name, cleared_lines, still_disrupted, user_name
                 )
 
-                # Create plain text fallback
-                text_content = f"""
-Service Restored: {route_name}
-
-Service has been restored on the following lines:
-
-"""
-                for cleared in cleared_lines:
-                    text_content += (
-                        f"- {cleared.line_name}: {cleared.current_status} (was: {cleared.previous_status})\n"
-                    )
-
-                if still_disrupted:
-                    text_content += "\nStill disrupted:\n"
-                    for disruption in still_disrupted:
-                        text_content += f"- {disruption.line_name}: {disruption.status_severity_description}\n"
-
-                text_content += "\nTfL Status: https://tfl.gov.uk/tube-dlr-overground/status/"
-
                 # Send email via EmailService
                 await self.email_service.send_email(email, subject, html_content, text_content)
 
@@ -384,63 +772,7 @@ Service has been restored on the following lines:
             span.set_attribute("notification.still_disrupted_count", len(still_disrupted))
 
             try:
-                # Create concise SMS text
-                # Format: "TfL Update: {route_name}. Service restored: {lines}."
-
-                # Build cleared lines text (comma-separated names)
-                cleared_names = ", ".join([cl.line_name for cl in cleared_lines[:3]])  # Limit to 3
-
-                base_msg = f"TfL Update: {route_name}. Service restored: {cleared_names}."
-
-                # Add still disrupted if any and space permits
-                if still_disrupted:
-                    disrupted_names = ", ".join([d.line_name for d in still_disrupted[:2]])
-                    disrupted_msg = f" Still disrupted: {disrupted_names}."
-                else:
-                    disrupted_msg = ""
-
-                # Add URL
-                url = " More: tfl.gov.uk/tube-dlr-overground/status/"
-
-                # Build final message
-                message = f"{base_msg}{disrupted_msg}{url}"
-
-                # Multi-stage truncation if message exceeds SMS_MAX_LENGTH
-                if len(message) > SMS_MAX_LENGTH:
-                    # Stage 1: Drop the "still disrupted" part
-                    message = f"{base_msg}{url}"
-
-                    # Stage 2: If still too long, reduce cleared lines from 3 to 2
-                    min_cleared_lines_stage_2 = 2
-                    if len(message) > SMS_MAX_LENGTH and len(cleared_lines) > min_cleared_lines_stage_2:
-                        cleared_names = ", ".join([cl.line_name for cl in cleared_lines[:2]])
-                        base_msg = f"TfL Update: {route_name}. Service restored: {cleared_names}."
-                        message = f"{base_msg}{url}"
-
-                    # Stage 3: If still too long, reduce cleared lines from 2 to 1
-                    if len(message) > SMS_MAX_LENGTH and len(cleared_lines) > 1:
-                        cleared_names = cleared_lines[0].line_name
-                        base_msg = f"TfL Update: {route_name}. Service restored: {cleared_names}."
-                        message = f"{base_msg}{url}"
-
-                    # Stage 4: If still too long, truncate route_name and cleared_names with ellipsis
-                    if len(message) > SMS_MAX_LENGTH:
-                        max_route_len = 30
-                        max_cleared_len = 20
-                        truncated_route = (
-                            (route_name[:max_route_len] + "…") if len(route_name) > max_route_len else route_name
-                        )
-                        truncated_cleared = (
-                            (cleared_names[:max_cleared_len] + "…")
-                            if len(cleared_names) > max_cleared_len
-                            else cleared_names
-                        )
-                        base_msg = f"TfL Update: {truncated_route}. Service restored: {truncated_cleared}."
-                        message = f"{base_msg}{url}"
-
-                    # Stage 5: Final fallback - force truncate to SMS_MAX_LENGTH
-                    if len(message) > SMS_MAX_LENGTH:
-                        message = message[:SMS_MAX_LENGTH]
+                message = _build_status_update_sms(route_name, cleared_lines, still_disrupted)
 
                 # Set message length as span attribute
                 span.set_attribute("notification.message_length", len(message))
@@ -467,6 +799,83 @@ Service has been restored on the following lines:
                 )
                 raise
 
+    def _build_status_update_email(
+        self,
+        route_name: str,
+        cleared_lines: list[ClearedLineInfo],
+        still_disrupted: list[DisruptionResponse],
+        user_name: str | None,
+    ) -> tuple[str, str, str]:
+        """
+        Render the subject, HTML and plain text of a status update email.
+
+        Args:
+            route_name: Name of the route
+            cleared_lines: Lines that have returned to normal service
+            still_disrupted: Lines that remain disrupted
+            user_name: User's name for personalized greeting
+
+        Returns:
+            Tuple of (subject, html_content, text_content)
+        """
+        # Build email subject
+        subject = _build_status_update_subject(route_name, cleared_lines, still_disrupted)
+
+        # Render the line block (shared between recipients) and then the personalised wrapper
+        status_update_lines, status_update_text = self._render_content_block(
+            "status_update_lines",
+            _create_status_update_hash(cleared_lines, still_disrupted),
+            lambda: (
+                self._render_email_template(
+                    "email/_status_update_lines.html",
+                    {"cleared_lines": cleared_lines, "still_disrupted": still_disrupted},
+                ),
+                _build_status_update_text(cleared_lines, still_disrupted),
+            ),
+        )
+        html_content = self._render_email_template(
+            "email/status_update.html",
+            {
+                "route_name": route_name,
+                "user_name": user_name,
+                "status_update_lines": Markup(status_update_lines),  # Rendered with autoescape
+                "tfl_status_url": "https://tfl.gov.uk/tube-dlr-overground/status/",
+            },
+        )
+
+        # Create plain text fallback
+        text_content = f"""
+Service Restored: {route_name}
+
+Service has been restored on the following lines:
+
+"""
+        text_content += status_update_text
+        text_content += "\nTfL Status: https://tfl.gov.uk/tube-dlr-overground/status/"
+
+        return subject, html_content, text_content
+
+    def _render_content_block(
+        self,
+        block: str,
+        key: str,
+        render: Callable[[], tuple[str, str]],
+    ) -> tuple[str, str]:
+        """
+        Render an email content block, via the render cache if there is one.
+
+        Args:
+            block: Name of the content block
+            key: Hash of the content the block is rendered from
+            render: Renders the block as (html, plain text)
+
+        Returns:
+            Tuple of (html, plain text)
+        """
+        if self.render_cache is None:
+            return render()
+        return self.render_cache.get_or_render(block, key, render)
+
     def _render_email_template(self, template_name: str, context: dict[str, Any]) -> str:
         """
         Render an email template with the given context.
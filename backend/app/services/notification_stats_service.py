@@ -0,0 +1,148 @@
+"""Service for maintaining and reading the notification log daily rollup."""
+
+from datetime import UTC, date, datetime, time
+
+import structlog
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.notification_stats import (
+    NotificationCountRow,
+    NotificationCounts,
+    get_live_counts_start,
+    summarize_notification_counts,
+)
+from app.models.notification import NotificationLog, NotificationLogDailyStat
+
+logger = structlog.get_logger(__name__)
+
+
+class NotificationStatsService:
+    """
+    Service for notification counts backed by the notification_log_daily_stats rollup.
+
+    Notification logs are append-only, so complete days never change once rolled up.
+    Reading counts scans the rollup (a few rows per day) plus notification_logs only
+    for the days not rolled up yet, so the cost doesn't grow with the size of the log.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize service with database session.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def refresh_daily_stats(self, now: datetime | None = None) -> int:
+        """
+        Roll up complete UTC days not yet in the rollup.
+
+        The latest rolled-up day is recounted as well, picking up notifications committed
+        just after it was rolled up. On an empty rollup every complete day is counted.
+
+        Args:
+            now: Current time (defaults to now); the current UTC day is not rolled up
+
+        Returns:
+            Number of (day, method, status) rows inserted or updated
+        """
+        now = now or datetime.now(UTC)
+        today_start = datetime.combine(now.astimezone(UTC).date(), time.min, tzinfo=UTC)
+
+        last_day: date | None = await self.db.scalar(select(func.max(NotificationLogDailyStat.day)))
+
+        day_column = cast(func.timezone("UTC", NotificationLog.sent_at), Date)
+        counts_query = (
+            select(
+                func.gen_random_uuid(),
+                day_column,
+                NotificationLog.method,
+                NotificationLog.status,
+                func.count(NotificationLog.id),
+                func.now(),
+                func.now(),
+            )
+            .where(NotificationLog.sent_at < today_start)
+            .group_by(day_column, NotificationLog.method, NotificationLog.status)
+        )
+        if last_day is not None:
+            last_day_start = datetime.combine(last_day, time.min, tzinfo=UTC)
+            counts_query = counts_query.where(NotificationLog.sent_at >= last_day_start)
+
+        stmt = insert(NotificationLogDailyStat).from_select(
+            ["id", "day", "method", "status", "count", "created_at", "updated_at"],
+            counts_query,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_notification_log_daily_stats_day_method_status",
+            set_={
+                "count": stmt.excluded.count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+
+        # rowcount is set for INSERT ... SELECT, but isn't part of the generic Result type
+        rows_upserted: int = result.rowcount  # type: ignore[attr-defined]
+        logger.info(
+            "notification_stats_refreshed",
+            since=last_day.isoformat() if last_day else None,
+            until=today_start.isoformat(),
+            rows_upserted=rows_upserted,
+        )
+        return rows_upserted
+
+    async def get_notification_counts(self, recent_since: datetime) -> NotificationCounts:
+        """
+        Get notification totals by status and recent counts by method.
+
+        Uses two aggregated queries: one over the rollup and one over the notifications
+        sent after the latest rolled-up day.
+
+        Args:
+            recent_since: Start of the recent period for counts by method. Rolled-up days
+                are counted whole, so the period starts at midnight (UTC) on that day.
+
+        Returns:
+            NotificationCounts combining the rollup and the live log
+        """
+        recent_since_day = recent_since.astimezone(UTC).date()
+        rollup_result = await self.db.execute(
+            select(
+                NotificationLogDailyStat.method,
+                NotificationLogDailyStat.status,
+                func.sum(NotificationLogDailyStat.count).label("total"),
+                func.coalesce(
+                    func.sum(NotificationLogDailyStat.count).filter(NotificationLogDailyStat.day >= recent_since_day),
+                    0,
+                ).label("recent"),
+                func.max(NotificationLogDailyStat.day).label("last_day"),
+            ).group_by(NotificationLogDailyStat.method, NotificationLogDailyStat.status)
+        )
+        rollup_rows = rollup_result.all()
+
+        live_query = select(
+            NotificationLog.method,
+            NotificationLog.status,
+            func.count(NotificationLog.id).label("total"),
+            func.count(NotificationLog.id).filter(NotificationLog.sent_at >= recent_since).label("recent"),
+        ).group_by(NotificationLog.method, NotificationLog.status)
+        live_start = get_live_counts_start(max((row.last_day for row in rollup_rows), default=None))
+        if live_start is not None:
+            live_query = live_query.where(NotificationLog.sent_at >= live_start)
+        live_rows = (await self.db.execute(live_query)).all()
+
+        # The two queries return differently typed rows, so convert each separately
+        rollup_counts = [
+            NotificationCountRow(method=row.method, status=row.status, total=row.total, recent=row.recent)
+            for row in rollup_rows
+        ]
+        live_counts = [
+            NotificationCountRow(method=row.method, status=row.status, total=row.total, recent=row.recent)
+            for row in live_rows
+        ]
+        return summarize_notification_counts([*rollup_counts, *live_counts])
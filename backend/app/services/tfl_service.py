@@ -10,11 +10,13 @@ Terminology:
 - "pydantic-tfl-api" = The 3rd party client library we use (authoritative for API schemas)
 """
 
+import asyncio
 import contextlib
 import hashlib
 import json
 import uuid
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, cast
 from urllib.parse import urlparse
@@ -48,7 +50,14 @@ from sqlalchemy.orm import aliased
 
 from app.core.config import settings
 from app.core.telemetry import get_current_trace_id
-from app.helpers.route_validation import find_valid_connection_in_routes
+from app.core.tfl_client import TFL_CACHE_NAMESPACE, TfLResources, get_tfl_resources
+from app.core.tiered_cache import TieredCache, create_tiered_cache
+from app.helpers.network_graph_artifact import (
+    NETWORK_GRAPH_ARTIFACT_CACHE_KEY,
+    NetworkGraphArtifact,
+    build_network_graph_artifact,
+)
+from app.helpers.route_variant_index import compile_route_variants, get_compiled_route_variants
 from app.helpers.soft_delete_filters import add_active_filter, soft_delete
 from app.helpers.station_fetching import (
     DatabaseNotInitializedError,
@@ -143,6 +152,24 @@ class MetadataChangeDetectedError(Exception):
         self.after_counts = after_counts
 
 
+@dataclass(slots=True)
+class LineNetworkData:
+    """
+    TfL API data for one line, fetched before the graph build touches the database.
+
+    Attributes:
+        line: Line the data belongs to
+        stop_points: Stop points on the line (already filtered to DEFAULT_MODES)
+        inbound: Inbound route sequence (None if it could not be fetched)
+        outbound: Outbound route sequence (None if it could not be fetched)
+    """
+
+    line: Line
+    stop_points: list[StopPoint]
+    inbound: RouteSequence | None
+    outbound: RouteSequence | None
+
+
 def _compute_metadata_hash(
     items: list[SeverityCode] | list[DisruptionCategory] | list[StopType],
 ) -> str:
@@ -266,6 +293,9 @@ MIN_ROUTE_SEGMENTS = 2  # Minimum number of segments required for route validati
 MAX_ROUTE_SEGMENTS = 20  # Maximum number of segments allowed for route validation
 DEFAULT_MODES = ["tube", "overground", "dlr", "elizabeth-line"]  # Default transport modes to fetch
 
+# Rows per INSERT ... ON CONFLICT statement when upserting stations (11 bind params per row)
+STATION_UPSERT_BATCH_SIZE = 1000
+
 
 # Pure helper functions for station disruption processing
 
@@ -371,7 +401,7 @@ def _extract_station_atco_code(disrupted_point: DisruptedPoint) -> str | None:
 
 
 async def _cache_metadata_items(
-    cache: Cache,
+    cache: TieredCache,
     cache_key: str,
     items: list[Any],
     ttl: int,
@@ -444,12 +474,15 @@ async def warm_up_metadata_cache(db: AsyncSession, redis_url: str) -> dict[str,
         redis_host = parsed.hostname or "localhost"
         redis_port = parsed.port or 6379
 
-        cache = Cache(
-            Cache.REDIS,
-            endpoint=redis_host,
-            port=redis_port,
-            serializer=PickleSerializer(),
-            namespace="tfl",
+        cache = create_tiered_cache(
+            Cache(
+                Cache.REDIS,
+                endpoint=redis_host,
+                port=redis_port,
+                serializer=PickleSerializer(),
+                namespace=TFL_CACHE_NAMESPACE,
+            ),
+            TFL_CACHE_NAMESPACE,
         )
 
         try:
@@ -615,25 +648,41 @@ class TfLService:
     then caches responses in Redis and stores reference data in PostgreSQL.
     """
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, resources: TfLResources | None = None) -> None:
         """
         Initialize the TfL service.
 
         Args:
             db: Database session
+            resources: Shared TfL clients and cache. Defaults to the process-wide resources
+                registered by the FastAPI lifespan or Celery worker; if none are registered,
+                the service creates its own clients and cache connection.
         """
         self.db = db
+        # Bounds concurrent TfL API requests made through _call_tfl_api()
+        self._api_semaphore = asyncio.Semaphore(settings.TFL_GRAPH_FETCH_CONCURRENCY)
+
+        resources = resources or get_tfl_resources()
+        if resources is not None:
+            self.line_client = resources.line_client
+            self.stoppoint_client = resources.stoppoint_client
+            self.cache = resources.cache
+            return
+
         # pydantic-tfl-api v3 provides native async clients
         self.line_client = AsyncLineClient(api_token=settings.TFL_API_KEY)
         self.stoppoint_client = AsyncStopPointClient(api_token=settings.TFL_API_KEY)
 
-        # Initialize Redis cache for aiocache
-        self.cache = Cache(
-            Cache.REDIS,
-            endpoint=self._parse_redis_host(),
-            port=self._parse_redis_port(),
-            serializer=PickleSerializer(),
-            namespace="tfl",
+        # Initialize Redis cache for aiocache, fronted by the process-local decoded cache
+        self.cache = create_tiered_cache(
+            Cache(
+                Cache.REDIS,
+                endpoint=self._parse_redis_host(),
+                port=self._parse_redis_port(),
+                serializer=PickleSerializer(),
+                namespace=TFL_CACHE_NAMESPACE,
+            ),
+            TFL_CACHE_NAMESPACE,
         )
 
     def _parse_redis_host(self) -> str:
@@ -666,6 +715,33 @@ class TfLService:
                 detail=error_msg,
             )
 
+    async def _call_tfl_api[R](self, call: Callable[[], Awaitable[R]]) -> R:
+        """
+        Make a TfL API call under the service's concurrency limit, backing off on 429.
+
+        TfL answers bursts of requests with 429 Too Many Requests. Rate-limited calls
+        are retried up to TFL_RATE_LIMIT_MAX_RETRIES times with exponential backoff;
+        the semaphore is released while waiting so other requests can proceed.
+
+        Args:
+            call: Zero-argument function that makes the API call
+
+        Returns:
+            The API response (an ApiError if retries are exhausted or the error isn't a 429)
+        """
+        max_retries = settings.TFL_RATE_LIMIT_MAX_RETRIES
+        for attempt in range(max_retries + 1):
+            async with self._api_semaphore:
+                response = await call()
+            if not isinstance(response, ApiError) or response.http_status_code != status.HTTP_429_TOO_MANY_REQUESTS:
+                return response
+            if attempt == max_retries:
+                break
+            delay = settings.TFL_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+            logger.warning("tfl_api_rate_limited", attempt=attempt + 1, retry_in_seconds=delay)
+            await asyncio.sleep(delay)
+        return response
+
     def _extract_cache_ttl(self, response: ResponseModel[Any]) -> int:
         """
         Extract cache TTL from TfL API response.
@@ -799,8 +875,9 @@ class TfLService:
         logger.info("fetching_lines_from_tfl_api", modes=modes)
 
         try:
-            # Fetch lines for each mode and upsert (no delete!)
-            all_tfl_ids: list[str] = []  # Track all TfL IDs to fetch in batch at end
+            # Fetch lines for each mode from TfL API before touching the database
+            # tfl_id -> (line data, mode); a line listed under several modes keeps the last mode
+            fetched_lines: dict[str, tuple[TflLine, str]] = {}
             ttl = DEFAULT_LINES_CACHE_TTL
 
             for mode in modes:
@@ -824,69 +901,59 @@ class TfLService:
                 mode_ttl = self._extract_cache_ttl(response) or DEFAULT_LINES_CACHE_TTL
                 ttl = min(ttl, mode_ttl)
 
-                # Process lines for this mode
                 # response.content is a LineArray (RootModel), access via .root
                 line_data_list = response.content.root
+                for line_data in line_data_list:
+                    # Skip lines with no ID
+                    if line_data.id is not None:
+                        fetched_lines[line_data.id] = (line_data, mode)
 
-                # Batch fetch existing lines for this mode (optimize N+1 queries)
-                line_tfl_ids = [line_data.id for line_data in line_data_list if line_data.id is not None]
+                logger.debug("mode_lines_fetched", mode=mode, count=len(line_data_list))
+
+            all_tfl_ids = list(fetched_lines)
+            all_lines: list[Line] = []
+            if fetched_lines:
+                # Batch fetch existing lines once for change detection
                 existing_result = await self.db.execute(
-                    select(Line).where(Line.tfl_id.in_(line_tfl_ids)).execution_options(populate_existing=True)
+                    select(Line).where(Line.tfl_id.in_(all_tfl_ids)).execution_options(populate_existing=True)
                 )
                 existing_lines = {line.tfl_id: line for line in existing_result.scalars().all()}
 
                 now = datetime.now(UTC)
-                for line_data in line_data_list:
-                    # Skip lines with no ID
-                    if line_data.id is None:
-                        continue
-
-                    # Check for existing line to detect changes
-                    existing_line = existing_lines.get(line_data.id)
-
-                    # Detect changes and log (extracted to helper for complexity)
+                rows = []
+                for tfl_id, (line_data, mode) in fetched_lines.items():
+                    # Detect changes against the prefetched row and log (extracted to helper for complexity)
                     _log_line_change_if_needed(
                         db=self.db,
-                        tfl_id=line_data.id,
+                        tfl_id=tfl_id,
                         new_name=line_data.name,
                         new_mode=mode,
-                        existing_line=existing_line,
+                        existing_line=existing_lines.get(tfl_id),
                         detected_at=now,
                     )
+                    rows.append({"tfl_id": tfl_id, "name": line_data.name, "mode": mode, "last_updated": now})
 
-                    # Upsert the line (PostgreSQL INSERT ... ON CONFLICT DO UPDATE)
-                    stmt = insert(Line).values(
-                        tfl_id=line_data.id,
-                        name=line_data.name,
-                        mode=mode,
-                        last_updated=now,
-                    )
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["tfl_id"],
-                        set_={
-                            "name": stmt.excluded.name,
-                            "mode": stmt.excluded.mode,
-                            "last_updated": stmt.excluded.last_updated,
-                        },
-                    )
-                    await self.db.execute(stmt)
-
-                    # Track TfL ID for batch fetch after commit
-                    all_tfl_ids.append(line_data.id)
-
-                logger.debug("mode_lines_processed", mode=mode, count=len(line_data_list))
+                # Upsert all lines in one statement (PostgreSQL INSERT ... ON CONFLICT DO UPDATE)
+                stmt = insert(Line).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["tfl_id"],
+                    set_={
+                        "name": stmt.excluded.name,
+                        "mode": stmt.excluded.mode,
+                        "last_updated": stmt.excluded.last_updated,
+                    },
+                )
+                # RETURNING with populate_existing refreshes Line objects already in the session
+                upsert_result = await self.db.execute(
+                    stmt.returning(Line),
+                    execution_options={"populate_existing": True},
+                )
+                # Preserve order by building dict and reconstructing list in original order
+                lines_by_tfl_id = {line.tfl_id: line for line in upsert_result.scalars().all()}
+                all_lines = _verify_all_lines_fetched(all_tfl_ids, lines_by_tfl_id)
 
             await self.db.commit()
 
-            # Batch fetch all lines after commit (optimize N queries into 1)
-            # Use populate_existing to force reload from database
-            final_result = await self.db.execute(
-                select(Line).where(Line.tfl_id.in_(all_tfl_ids)).execution_options(populate_existing=True)
-            )
-            # Preserve order by building dict and reconstructing list in original order
-            lines_by_tfl_id = {line.tfl_id: line for line in final_result.scalars().all()}
-            all_lines = _verify_all_lines_fetched(all_tfl_ids, lines_by_tfl_id)
-
             # Cache the results
             await self.cache.set(cache_key, all_lines, ttl=ttl)
 
@@ -950,7 +1017,8 @@ class TfLService:
             # response.content is a StatusSeveritiesArray (RootModel), access via .root
             severity_data_list = response.content.root
 
-            now = datetime.now(UTC)
+            # (mode_id, severity_level) -> description; duplicates keep the last entry
+            fetched_codes: dict[tuple[str, int], str] = {}
             for severity_data in severity_data_list:
                 # Skip entries with missing required fields
                 if severity_data.modeName is None or severity_data.severityLevel is None:
@@ -960,14 +1028,38 @@ class TfLService:
                         severity_level=severity_data.severityLevel,
                     )
                     continue
+                fetched_codes[severity_data.modeName, severity_data.severityLevel] = severity_data.description or ""
 
-                # Use PostgreSQL INSERT ... ON CONFLICT to atomically upsert
-                # Now keyed on (mode_id, severity_level)
+            if fetched_codes:
+                # Batch fetch existing codes once to report what changed
+                existing_result = await self.db.execute(
+                    select(SeverityCode.mode_id, SeverityCode.severity_level, SeverityCode.description)
+                )
+                existing_descriptions = {
+                    (mode_id, severity_level): description
+                    for mode_id, severity_level, description in existing_result.tuples().all()
+                }
+                created = sum(1 for key in fetched_codes if key not in existing_descriptions)
+                changed = sum(
+                    1
+                    for key, description in fetched_codes.items()
+                    if key in existing_descriptions and existing_descriptions[key] != description
+                )
+                if created or changed:
+                    logger.info("severity_codes_changed", created=created, changed=changed)
+
+                # Upsert all codes in one statement, keyed on (mode_id, severity_level)
+                now = datetime.now(UTC)
                 stmt = insert(SeverityCode).values(
-                    mode_id=severity_data.modeName,
-                    severity_level=severity_data.severityLevel,
-                    description=severity_data.description or "",
-                    last_updated=now,
+                    [
+                        {
+                            "mode_id": mode_id,
+                            "severity_level": severity_level,
+                            "description": description,
+                            "last_updated": now,
+                        }
+                        for (mode_id, severity_level), description in fetched_codes.items()
+                    ]
                 )
                 stmt = stmt.on_conflict_do_update(
                     constraint="uq_severity_code_mode_level",
@@ -983,8 +1075,8 @@ class TfLService:
             await self.db.commit()
             logger.info("severity_codes_committed_to_database", severity_count=len(severity_data_list))
 
-            # Fetch all codes from database to return
-            result = await self.db.execute(select(SeverityCode))
+            # Fetch all codes from database to return (refreshing any already in the session)
+            result = await self.db.execute(select(SeverityCode).execution_options(populate_existing=True))
             codes = list(result.scalars().all())
             logger.debug("severity_codes_queried_from_database_after_commit", query_result_count=len(codes))
 
@@ -1346,116 +1438,114 @@ class TfLService:
                 detail="Failed to refresh TfL metadata.",
             ) from e
 
-    async def _extract_hub_fields(self, stop_point: StopPoint) -> tuple[str | None, str | None]:
+    async def _fetch_hub_name(self, hub_code: str) -> str | None:
         """
-        Extract hub NaPTAN code and fetch hub common name from TfL API.
-
-        Hub information is used to identify cross-mode interchange stations.
-        If a hub NaPTAN code exists, makes an API call to fetch the hub details
-        and extracts the common name (e.g., "Seven Sisters" for hub "HUBSVS").
-
-        The API call is executed in a thread pool to avoid blocking the event loop.
-        The pydantic-tfl-api client is thread-safe as it uses httpx for HTTP requests.
+        Fetch the common name of a hub from TfL API (e.g., "Seven Sisters" for "HUBSVS").
 
         Args:
-            stop_point: Stop point object from TfL API
+            hub_code: Hub NaPTAN code
 
         Returns:
-            Tuple of (hub_naptan_code, hub_common_name)
+            Hub common name, or None if it could not be fetched
         """
-        hub_code = getattr(stop_point, "hubNaptanCode", None)
-        hub_name = None
-
-        # Fetch hub details from API if hub code exists
-        if hub_code:
-            try:
-                with tfl_api_span(
-                    "GetByPathIdsQueryIncludeCrowdingData",
-                    "stoppoint_client",
-                    **{"tfl.api.hub_code": hub_code},
-                ) as span:
-                    response = await self.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData(
+        try:
+            with tfl_api_span(
+                "GetByPathIdsQueryIncludeCrowdingData",
+                "stoppoint_client",
+                **{"tfl.api.hub_code": hub_code},
+            ) as span:
+                response = await self._call_tfl_api(
+                    lambda: self.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData(
                         hub_code,
                         False,  # includeCrowdingData
                     )
-                    if hasattr(response, "http_status_code"):
-                        span.set_attribute("http.status_code", response.http_status_code)
-                if not isinstance(response, ApiError) and response.content and response.content.root:
-                    hub_data = response.content.root[0]
-                    hub_name = getattr(hub_data, "commonName", None)
-            except Exception as e:
-                # Log error but don't fail - hub name is optional
-                logger.warning(
-                    "failed_to_fetch_hub_details",
-                    hub_code=hub_code,
-                    error=str(e),
                 )
+                if hasattr(response, "http_status_code"):
+                    span.set_attribute("http.status_code", response.http_status_code)
+            if not isinstance(response, ApiError) and response.content and response.content.root:
+                hub_data = response.content.root[0]
+                return getattr(hub_data, "commonName", None)
+        except Exception as e:
+            # Log error but don't fail - hub name is optional
+            logger.warning(
+                "failed_to_fetch_hub_details",
+                hub_code=hub_code,
+                error=str(e),
+            )
+        return None
 
-        return hub_code, hub_name
-
-    def _update_existing_station(
-        self,
-        station: Station,
-        line_tfl_id: str,
-        hub_code: str | None,
-        hub_name: str | None,
-    ) -> None:
+    async def _fetch_hub_names(self, hub_codes: Iterable[str]) -> dict[str, str | None]:
         """
-        Update existing station with line and hub information.
+        Fetch common names for several hubs concurrently, one request per distinct hub.
 
         Args:
-            station: Existing station object to update
-            line_tfl_id: TfL line ID to add to station's lines
-            hub_code: Hub NaPTAN code (or None)
-            hub_name: Hub common name (or None)
+            hub_codes: Hub NaPTAN codes (duplicates are fetched once)
+
+        Returns:
+            Mapping of hub code to common name (None if it could not be fetched)
         """
-        if line_tfl_id not in station.lines:
-            station.lines = [*station.lines, line_tfl_id]
-        station.last_updated = datetime.now(UTC)
-        station.hub_naptan_code = hub_code
-        station.hub_common_name = hub_name
+        unique_codes = sorted(set(hub_codes))
+        names = await asyncio.gather(*(self._fetch_hub_name(hub_code) for hub_code in unique_codes))
+        return dict(zip(unique_codes, names, strict=True))
 
-    def _create_new_station(
+    def _build_station_row(
         self,
         stop_point: StopPoint,
         line_tfl_id: str,
         hub_code: str | None,
         hub_name: str | None,
-    ) -> Station:
+        *,
+        existing_lines: list[str] | None,
+        now: datetime,
+    ) -> dict[str, Any]:
         """
-        Create new station from stop point data.
+        Build the values for upserting a station from stop point data.
+
+        New stations get all fields from the stop point. For existing stations the upsert
+        only updates lines, last_updated and the hub fields, so the line is appended to
+        the station's current lines (without duplicating it).
 
         Args:
             stop_point: Stop point object from TfL API
-            line_tfl_id: TfL line ID for the station
+            line_tfl_id: TfL line ID the stop point was fetched for
             hub_code: Hub NaPTAN code (or None)
             hub_name: Hub common name (or None)
+            existing_lines: Current lines of the existing station (None for new stations)
+            now: Timestamp for last_updated/updated_at
 
         Returns:
-            New Station object (not yet added to session)
-        """
-        return Station(
-            tfl_id=stop_point.id,
-            name=stop_point.commonName,
-            latitude=stop_point.lat,
-            longitude=stop_point.lon,
-            lines=[line_tfl_id],
-            last_updated=datetime.now(UTC),
-            hub_naptan_code=hub_code,
-            hub_common_name=hub_name,
-        )
+            Column values for INSERT ... ON CONFLICT on stations
+        """
+        if existing_lines is None:
+            lines = [line_tfl_id]
+        elif line_tfl_id in existing_lines:
+            lines = existing_lines
+        else:
+            lines = [*existing_lines, line_tfl_id]
 
-    async def _fetch_stations_from_api(self, line_tfl_id: str) -> tuple[list[Station], int]:
+        return {
+            "tfl_id": stop_point.id,
+            "name": stop_point.commonName,
+            "latitude": stop_point.lat,
+            "longitude": stop_point.lon,
+            "lines": lines,
+            "last_updated": now,
+            "updated_at": now,
+            "hub_naptan_code": hub_code,
+            "hub_common_name": hub_name,
+        }
+
+    async def _fetch_stop_points(self, line_tfl_id: str) -> tuple[list[StopPoint], int]:
         """
-        Fetch stations for a line from TfL API and update database.
+        Fetch the stop points on a line from TfL API, keeping only DEFAULT_MODES stations.
 
         This fetches ALL stations on a line, including non-TfL-operated National Rail stations.
 
         Args:
-            line_tfl_id: TfL line ID to fetch stations for
+            line_tfl_id: TfL line ID to fetch stop points for
 
         Returns:
-            Tuple of (list of Station objects, cache TTL in seconds)
+            Tuple of (list of StopPoint objects, cache TTL in seconds)
         """
         # Fetch stations for the line using LineClient with tflOperatedNationalRailStationsOnly=False
         # This ensures we get ALL stations, not just TfL-operated ones
@@ -1464,9 +1554,11 @@ class TfLService:
             "line_client",
             **{"tfl.api.line_id": line_tfl_id},
         ) as span:
-            response = await self.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly(
-                line_tfl_id,
-                False,  # tflOperatedNationalRailStationsOnly=False to get ALL stations
+            response = await self._call_tfl_api(
+                lambda: self.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly(
+                    line_tfl_id,
+                    False,  # tflOperatedNationalRailStationsOnly=False to get ALL stations
+                )
             )
             if hasattr(response, "http_status_code"):
                 span.set_attribute("http.status_code", response.http_status_code)
@@ -1476,17 +1568,10 @@ class TfLService:
         assert not isinstance(response, ApiError)  # Type narrowing for mypy
 
         ttl = self._extract_cache_ttl(response) or DEFAULT_STATIONS_CACHE_TTL
+
+        stop_points = []
         # response.content is a StopPointArray (RootModel), access via .root
-        stop_points = response.content.root
-
-        stations = []
-        # Note: This implementation queries the database inside the loop (N+1 pattern).
-        # For this hobby project, this is acceptable because:
-        # - TfL lines typically have 20-60 stations (small N)
-        # - This operation is infrequent (cached station data, runs ~daily)
-        # - Database queries are fast (local DB, indexed tfl_id)
-        # Bulk fetching could be considered if performance monitoring indicates a problem.
-        for stop_point in stop_points:
+        for stop_point in response.content.root:
             # Filter stations by mode - only keep stations with at least one mode in DEFAULT_MODES
             modes = getattr(stop_point, "modes", []) or []  # Handle None case
             if not any(mode in DEFAULT_MODES for mode in modes):
@@ -1498,13 +1583,47 @@ class TfLService:
                     reason="no_overlap_with_default_modes",
                 )
                 continue
+            stop_points.append(stop_point)
 
-            # Check if station exists in DB
-            result = await self.db.execute(select(Station).where(Station.tfl_id == stop_point.id))
-            station = result.scalar_one_or_none()
+        return stop_points, ttl
 
-            # Extract hub fields once
-            hub_code, hub_name = await self._extract_hub_fields(stop_point)
+    async def _apply_stop_points(
+        self,
+        line_tfl_id: str,
+        stop_points: list[StopPoint],
+        hub_names: dict[str, str | None],
+    ) -> list[Station]:
+        """
+        Create or update stations for a line's stop points (does not commit).
+
+        Loads the current lines of all existing stations in one query, then upserts every
+        station with batched INSERT ... ON CONFLICT (tfl_id) DO UPDATE ... RETURNING, so
+        the returned Station objects are current without per-station queries or refreshes.
+
+        Args:
+            line_tfl_id: TfL line ID the stop points belong to
+            stop_points: Stop points from _fetch_stop_points()
+            hub_names: Hub common names by hub code, from _fetch_hub_names()
+
+        Returns:
+            List of Station objects in stop point order (one per distinct station)
+        """
+        if not stop_points:
+            return []
+
+        # Duplicate stop points would make ON CONFLICT touch the same row twice in one statement
+        unique_stop_points = {stop_point.id: stop_point for stop_point in stop_points if stop_point.id}
+
+        existing_result = await self.db.execute(
+            select(Station.tfl_id, Station.lines).where(Station.tfl_id.in_(unique_stop_points))
+        )
+        existing_lines: dict[str, list[str]] = dict(existing_result.tuples().all())
+
+        now = datetime.now(UTC)
+        rows = []
+        for tfl_id, stop_point in unique_stop_points.items():
+            hub_code = getattr(stop_point, "hubNaptanCode", None)
+            hub_name = hub_names.get(hub_code) if hub_code else None
 
             # Log hub detection
             if hub_code:
@@ -1516,21 +1635,64 @@ class TfLService:
                     hub_name=hub_name,
                 )
 
-            if station:
-                # Update existing station
-                self._update_existing_station(station, line_tfl_id, hub_code, hub_name)
-            else:
-                # Create new station
-                station = self._create_new_station(stop_point, line_tfl_id, hub_code, hub_name)
-                self.db.add(station)
+            rows.append(
+                self._build_station_row(
+                    stop_point,
+                    line_tfl_id,
+                    hub_code,
+                    hub_name,
+                    existing_lines=existing_lines.get(tfl_id),
+                    now=now,
+                )
+            )
+
+        stations_by_tfl_id: dict[str, Station] = {}
+        for batch_start in range(0, len(rows), STATION_UPSERT_BATCH_SIZE):
+            stmt = insert(Station).values(rows[batch_start : batch_start + STATION_UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["tfl_id"],
+                set_={
+                    "lines": stmt.excluded.lines,
+                    "last_updated": stmt.excluded.last_updated,
+                    "updated_at": stmt.excluded.updated_at,
+                    "hub_naptan_code": stmt.excluded.hub_naptan_code,
+                    "hub_common_name": stmt.excluded.hub_common_name,
+                },
+            )
+            # populate_existing refreshes Station objects already in the session
+            result = await self.db.scalars(
+                stmt.returning(Station),
+                execution_options={"populate_existing": True},
+            )
+            stations_by_tfl_id.update((station.tfl_id, station) for station in result)
 
-            stations.append(station)
+        logger.debug(
+            "stations_upserted",
+            line_tfl_id=line_tfl_id,
+            created=len(rows) - len(existing_lines),
+            updated=len(existing_lines),
+        )
+        return [stations_by_tfl_id[tfl_id] for tfl_id in unique_stop_points]
 
-        await self.db.commit()
+    async def _fetch_stations_from_api(self, line_tfl_id: str) -> tuple[list[Station], int]:
+        """
+        Fetch stations for a line from TfL API and update database.
+
+        This fetches ALL stations on a line, including non-TfL-operated National Rail stations.
+
+        Args:
+            line_tfl_id: TfL line ID to fetch stations for
+
+        Returns:
+            Tuple of (list of Station objects, cache TTL in seconds)
+        """
+        stop_points, ttl = await self._fetch_stop_points(line_tfl_id)
+        hub_names = await self._fetch_hub_names(
+            hub_code for stop_point in stop_points if (hub_code := getattr(stop_point, "hubNaptanCode", None))
+        )
+        stations = await self._apply_stop_points(line_tfl_id, stop_points, hub_names)
 
-        # Refresh to get database IDs
-        for station in stations:
-            await self.db.refresh(station)
+        await self.db.commit()
 
         return stations, ttl
 
@@ -2466,18 +2628,18 @@ class TfLService:
         )
         return None
 
-    async def _get_station_by_tfl_id(self, tfl_id: str) -> Station | None:
+    async def _load_stations_by_tfl_id(self) -> dict[str, Station]:
         """
-        Look up station in database by TfL ID.
+        Load every station in one query, keyed by TfL ID.
 
-        Args:
-            tfl_id: TfL station identifier
+        Used by build_station_graph() to resolve route sequence stops in memory
+        instead of querying once per stop.
 
         Returns:
-            Station object or None if not found
+            Mapping of station TfL ID to Station
         """
-        result = await self.db.execute(select(Station).where(Station.tfl_id == tfl_id))
-        return result.scalar_one_or_none()
+        result = await self.db.execute(select(Station))
+        return {station.tfl_id: station for station in result.scalars().all()}
 
     async def _connection_exists(
         self,
@@ -2506,49 +2668,53 @@ class TfLService:
         )
         return result.scalar_one_or_none() is not None
 
-    def _create_connection(
+    async def _insert_connections(
         self,
-        from_station_id: uuid.UUID,
-        to_station_id: uuid.UUID,
-        line_id: uuid.UUID,
-    ) -> StationConnection:
+        connections: Iterable[tuple[uuid.UUID, uuid.UUID, uuid.UUID]],
+    ) -> None:
         """
-        Create a station connection object.
+        Insert station connections with a single bulk INSERT.
 
-        Args:
-            from_station_id: Source station database ID
-            to_station_id: Destination station database ID
-            line_id: Line database ID
+        SQLAlchemy's insertmanyvalues batching turns the parameter list into
+        multi-row VALUES statements, so the round trips do not grow with the
+        number of connections.
 
-        Returns:
-            StationConnection object (not yet added to session)
+        Args:
+            connections: (from_station_id, to_station_id, line_id) tuples to insert
         """
-        return StationConnection(
-            from_station_id=from_station_id,
-            to_station_id=to_station_id,
-            line_id=line_id,
-        )
+        rows = [
+            {"from_station_id": from_station_id, "to_station_id": to_station_id, "line_id": line_id}
+            for from_station_id, to_station_id, line_id in connections
+        ]
+        if rows:
+            await self.db.execute(insert(StationConnection), rows)
 
-    async def _process_station_pair(
+    def _process_station_pair(
         self,
         current_stop: MatchedStop,
         next_stop: MatchedStop,
         line: Line,
+        *,
+        stations_by_tfl_id: dict[str, Station],
         stations_set: set[str],
         pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]],
     ) -> int:
         """
-        Process a pair of consecutive stations and create bidirectional connections.
+        Process a pair of consecutive stations and record bidirectional connections.
+
+        Connections are only recorded in pending_connections; build_station_graph()
+        inserts them all at once with _insert_connections().
 
         Args:
             current_stop: Current stop point data
             next_stop: Next stop point data
             line: Line object
+            stations_by_tfl_id: Preloaded stations from _load_stations_by_tfl_id()
             stations_set: Set to track unique station IDs
             pending_connections: Set to track pending connections (from_id, to_id, line_id)
 
         Returns:
-            Number of new connections created (0, 1, or 2)
+            Number of new connections recorded (0, 1, or 2)
         """
         # Extract stop IDs
         current_stop_id = self._get_stop_ids(current_stop)
@@ -2558,8 +2724,8 @@ class TfLService:
             return 0
 
         # Look up stations
-        from_station = await self._get_station_by_tfl_id(current_stop_id)
-        to_station = await self._get_station_by_tfl_id(next_stop_id)
+        from_station = stations_by_tfl_id.get(current_stop_id)
+        to_station = stations_by_tfl_id.get(next_stop_id)
 
         if not from_station or not to_station:
             logger.debug(
@@ -2576,21 +2742,11 @@ class TfLService:
 
         connections_created = 0
 
-        # Create forward connection if needed (check pending set to avoid duplicates in same transaction)
-        forward_key = (from_station.id, to_station.id, line.id)
-        if forward_key not in pending_connections:
-            connection = self._create_connection(from_station.id, to_station.id, line.id)
-            self.db.add(connection)
-            pending_connections.add(forward_key)
-            connections_created += 1
-
-        # Create reverse connection if needed (check pending set to avoid duplicates in same transaction)
-        reverse_key = (to_station.id, from_station.id, line.id)
-        if reverse_key not in pending_connections:
-            connection = self._create_connection(to_station.id, from_station.id, line.id)
-            self.db.add(connection)
-            pending_connections.add(reverse_key)
-            connections_created += 1
+        # Record forward and reverse connections unless already pending (avoids duplicates in same transaction)
+        for key in ((from_station.id, to_station.id, line.id), (to_station.id, from_station.id, line.id)):
+            if key not in pending_connections:
+                pending_connections.add(key)
+                connections_created += 1
 
         return connections_created
 
@@ -2617,11 +2773,13 @@ class TfLService:
             "line_client",
             **{"tfl.api.line_id": line_tfl_id, "tfl.api.direction": direction},
         ) as span:
-            response = await self.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding(
-                line_tfl_id,
-                direction,
-                "",  # serviceTypes (empty for all)
-                True,  # excludeCrowding
+            response = await self._call_tfl_api(
+                lambda: self.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding(
+                    line_tfl_id,
+                    direction,
+                    "",  # serviceTypes (empty for all)
+                    True,  # excludeCrowding
+                )
             )
             if hasattr(response, "http_status_code"):
                 span.set_attribute("http.status_code", response.http_status_code)
@@ -2633,61 +2791,108 @@ class TfLService:
         # Return full route sequence data (contains both stopPointSequences and orderedLineRoutes)
         return response.content
 
-    async def _process_route_sequence(
+    async def _fetch_route_sequence_or_none(self, line_tfl_id: str, direction: str) -> RouteSequence | None:
+        """
+        Fetch a route sequence, logging and returning None on failure.
+
+        A line missing one direction still gets connections from the other, so a failed
+        direction does not fail the graph build.
+
+        Args:
+            line_tfl_id: TfL line identifier
+            direction: "inbound" or "outbound"
+
+        Returns:
+            RouteSequence, or None if the fetch failed
+        """
+        try:
+            return await self._fetch_route_sequence(line_tfl_id, direction)
+        except Exception as e:
+            logger.warning(
+                "failed_to_process_direction",
+                line_tfl_id=line_tfl_id,
+                direction=direction,
+                error=str(e),
+            )
+            return None
+
+    async def _fetch_line_network_data(self, line: Line) -> LineNetworkData:
+        """
+        Fetch stop points and both route sequences for a line concurrently.
+
+        Args:
+            line: Line to fetch data for
+
+        Returns:
+            LineNetworkData for the line
+
+        Raises:
+            HTTPException: 503 if the line's stop points cannot be fetched
+        """
+        logger.info("fetching_line_network_data", line_tfl_id=line.tfl_id, line_name=line.name)
+        try:
+            (stop_points, _ttl), inbound, outbound = await asyncio.gather(
+                self._fetch_stop_points(line.tfl_id),
+                self._fetch_route_sequence_or_none(line.tfl_id, "inbound"),
+                self._fetch_route_sequence_or_none(line.tfl_id, "outbound"),
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error("fetch_stations_failed", line_tfl_id=line.tfl_id, error=str(e), exc_info=e)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Failed to fetch stations from TfL API.",
+            ) from e
+        return LineNetworkData(line=line, stop_points=stop_points, inbound=inbound, outbound=outbound)
+
+    def _process_route_sequence(
         self,
         line: Line,
-        direction: str,
+        route_data: RouteSequence | None,
+        *,
+        stations_by_tfl_id: dict[str, Station],
         stations_set: set[str],
         pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]],
-    ) -> tuple[int, RouteSequence | None]:
+    ) -> int:
         """
-        Process route sequence for a line and direction.
+        Record connections for the consecutive stations in a fetched route sequence.
 
         Args:
             line: Line object
-            direction: "inbound" or "outbound"
+            route_data: RouteSequence from _fetch_route_sequence() (None if the fetch failed)
+            stations_by_tfl_id: Preloaded stations from _load_stations_by_tfl_id()
             stations_set: Set to track unique station IDs
             pending_connections: Set to track pending connections (from_id, to_id, line_id)
 
         Returns:
-            Tuple of (connections_count, route_data)
-                - connections_count: Number of connections created
-                - route_data: Full RouteSequence object (contains orderedLineRoutes)
+            Number of connections recorded
         """
-        try:
-            route_data = await self._fetch_route_sequence(line.tfl_id, direction)
-            connections_count = 0
-
-            # Extract stopPointSequences for connection building
-            if hasattr(route_data, "stopPointSequences") and route_data.stopPointSequences:
-                sequences = list(route_data.stopPointSequences)
-
-                for sequence in sequences:
-                    if not hasattr(sequence, "stopPoint") or not sequence.stopPoint:
-                        continue
+        connections_count = 0
 
-                    stop_points = sequence.stopPoint
+        # Extract stopPointSequences for connection building
+        sequences = getattr(route_data, "stopPointSequences", None) if route_data is not None else None
+        if not sequences:
+            return connections_count
 
-                    # Process consecutive station pairs
-                    for i in range(len(stop_points) - 1):
-                        connections_count += await self._process_station_pair(
-                            stop_points[i],
-                            stop_points[i + 1],
-                            line,
-                            stations_set,
-                            pending_connections,
-                        )
+        for sequence in sequences:
+            if not hasattr(sequence, "stopPoint") or not sequence.stopPoint:
+                continue
 
-            return connections_count, route_data
+            stop_points = sequence.stopPoint
+
+            # Process consecutive station pairs
+            for i in range(len(stop_points) - 1):
+                connections_count += self._process_station_pair(
+                    stop_points[i],
+                    stop_points[i + 1],
+                    line,
+                    stations_by_tfl_id=stations_by_tfl_id,
+                    stations_set=stations_set,
+                    pending_connections=pending_connections,
+                )
 
-        except Exception as e:
-            logger.warning(
-                "failed_to_process_direction",
-                line_tfl_id=line.tfl_id,
-                direction=direction,
-                error=str(e),
-            )
-            return 0, None
+        return connections_count
 
     def _store_line_routes(
         self,
@@ -2834,6 +3039,10 @@ class TfLService:
         from the TfL API and populates the StationConnection table with bidirectional
         connections based on the actual order of stations on each route.
 
+        All TfL API requests are made concurrently up front (see _call_tfl_api() for the
+        concurrency limit and 429 backoff); stations, connections and route variants are
+        then written in a single transaction.
+
         Returns:
             Dictionary with build statistics (lines_count, stations_count, connections_count, hubs_count)
 
@@ -2848,16 +3057,27 @@ class TfLService:
             lines = await self.fetch_lines(use_cache=False)
             logger.info("lines_fetched", lines_count=len(lines))
 
-            # Fetch stations for all lines BEFORE building connections
-            # This ensures stations exist in the database for connection creation
-            # Use skip_database_validation=True to allow TfL API calls during initial graph building
-            for line in lines:
-                logger.info("fetching_stations_for_line", line_tfl_id=line.tfl_id, line_name=line.name)
-                await self.fetch_stations(line_tfl_id=line.tfl_id, use_cache=False, skip_database_validation=True)
+            # Network phase: fetch stop points and route sequences for all lines concurrently
+            # (bounded by TFL_GRAPH_FETCH_CONCURRENCY), then hub names once per distinct hub.
+            # Nothing is written to the database until every fetch has finished.
+            network_data = await asyncio.gather(*(self._fetch_line_network_data(line) for line in lines))
+            hub_names = await self._fetch_hub_names(
+                hub_code
+                for data in network_data
+                for stop_point in data.stop_points
+                if (hub_code := getattr(stop_point, "hubNaptanCode", None))
+            )
+            logger.info("network_data_fetched", lines_count=len(network_data), hubs_count=len(hub_names))
+
+            # Database phase: everything below is applied in one transaction
+            for data in network_data:
+                await self._apply_stop_points(data.line.tfl_id, data.stop_points, hub_names)
+
+            # Preload all stations once so route sequence stops resolve in memory
+            stations_by_tfl_id = await self._load_stations_by_tfl_id()
 
             # Validate that stations were populated
-            station_count_result = await self.db.execute(select(func.count()).select_from(Station))
-            station_count = station_count_result.scalar_one()
+            station_count = len(stations_by_tfl_id)
 
             if station_count == 0:
                 logger.error("no_stations_found_after_fetch")
@@ -2883,37 +3103,32 @@ class TfLService:
             connections_count = 0
 
             # Process each line
-            for line in lines:
+            for data in network_data:
+                line = data.line
                 logger.info("processing_line_for_graph", line_name=line.name, line_tfl_id=line.tfl_id)
 
-                # Process both directions and collect route data
                 # Note: Duplicate connections are prevented by pending_connections set
                 # Even if inbound and outbound routes overlap, we won't create duplicates
-                inbound_route_data = None
-                outbound_route_data = None
-
-                for direction in ["inbound", "outbound"]:
-                    conn_count, route_data = await self._process_route_sequence(
+                for route_data in (data.inbound, data.outbound):
+                    connections_count += self._process_route_sequence(
                         line,
-                        direction,
-                        stations_set,
-                        pending_connections,
+                        route_data,
+                        stations_by_tfl_id=stations_by_tfl_id,
+                        stations_set=stations_set,
+                        pending_connections=pending_connections,
                     )
-                    connections_count += conn_count
-
-                    # Store route data for later processing
-                    if direction == "inbound":
-                        inbound_route_data = route_data
-                    else:
-                        outbound_route_data = route_data
 
                 # Extract and store route sequences for this line
-                self._store_line_routes(line, inbound_route_data, outbound_route_data)
+                self._store_line_routes(line, data.inbound, data.outbound)
+
+            # Insert every new connection in one bulk statement
+            await self._insert_connections(pending_connections)
+            logger.info("station_connections_inserted", connections_count=len(pending_connections))
 
             # Compute canonical route variants (hub codes instead of NaPTAN IDs)
             await self._compute_canonical_route_variants(lines)
 
-            # Commit all changes (delete + new connections + route variants) atomically
+            # Commit all changes (stations + delete + new connections + route variants) atomically
             # If we reach here, everything succeeded
             await self.db.commit()
 
@@ -2927,6 +3142,9 @@ class TfLService:
             await self.cache.delete(self._build_modes_cache_key("lines", DEFAULT_MODES))
             logger.info("invalidated_all_tfl_caches", lines_invalidated=len(lines))
 
+            # Compile route variants now so validate_route in this process starts warm
+            compile_route_variants(lines)
+
             # Count stations with hub NaPTAN codes (interchange stations)
             hubs_count_result = await self.db.execute(
                 select(func.count()).select_from(Station).where(Station.hub_naptan_code.isnot(None))
@@ -2940,9 +3158,6 @@ class TfLService:
                 "hubs_count": hubs_count,
             }
 
-            logger.info("building_station_graph_complete", **build_result)
-            return build_result
-
         except HTTPException:
             # Re-raise HTTP exceptions (validation failures)
             await self.db.rollback()
@@ -2955,6 +3170,31 @@ class TfLService:
                 detail="Failed to build station graph.",
             ) from e
 
+        # Serialize the rebuilt graph once so GET /tfl/network-graph serves a blob, not a join.
+        # The graph is already committed, so this can't fail the build.
+        await self._refresh_network_graph_artifact_after_build()
+
+        logger.info("building_station_graph_complete", **build_result)
+        return build_result
+
+    async def _refresh_network_graph_artifact_after_build(self) -> None:
+        """
+        Refresh the network graph artifact after the graph has been rebuilt and committed.
+
+        Errors are logged, not raised. The stale artifact (stored without a TTL) is
+        deleted instead, so get_network_graph_artifact() rebuilds it on the next request.
+        """
+        try:
+            await self.refresh_network_graph_artifact()
+        except Exception as e:
+            logger.error("network_graph_artifact_refresh_failed", error=str(e), exc_info=e)
+            try:
+                await self.cache.delete(NETWORK_GRAPH_ARTIFACT_CACHE_KEY)
+            except Exception as delete_error:
+                logger.error(
+                    "network_graph_artifact_invalidation_failed", error=str(delete_error), exc_info=delete_error
+                )
+
     async def get_network_graph(self) -> dict[str, list[NetworkConnection]]:
         """
         Get the station network graph as an adjacency list for GUI route building.
@@ -3005,7 +3245,9 @@ class TfLService:
                 .join(to_station_alias, to_station_alias.id == StationConnection.to_station_id)
                 .join(Line, Line.id == StationConnection.line_id)
             )
-            filtered_query = add_active_filter(base_query, StationConnection)
+            filtered_query = add_active_filter(base_query, StationConnection).order_by(
+                from_station_alias.tfl_id, Line.tfl_id, to_station_alias.tfl_id
+            )
             result = await self.db.execute(filtered_query)
             connections = result.all()
 
@@ -3046,6 +3288,50 @@ class TfLService:
                 detail="Failed to fetch network graph.",
             ) from e
 
+    async def get_network_graph_artifact(self) -> NetworkGraphArtifact:
+        """
+        Get the precomputed network graph artifact.
+
+        The artifact is written by build_station_graph(). If it is missing from the
+        cache (e.g., first request after deploy or Redis eviction), it is rebuilt from
+        the database and stored.
+
+        Returns:
+            NetworkGraphArtifact with the serialized graph and its ETag
+
+        Raises:
+            HTTPException: 503 if graph hasn't been built yet, 500 if fetch fails
+        """
+        cached_artifact: NetworkGraphArtifact | None = await self.cache.get(NETWORK_GRAPH_ARTIFACT_CACHE_KEY)
+        if cached_artifact is not None:
+            logger.debug("network_graph_artifact_cache_hit", etag=cached_artifact.etag)
+            return cached_artifact
+
+        logger.info("network_graph_artifact_cache_miss")
+        return await self.refresh_network_graph_artifact()
+
+    async def refresh_network_graph_artifact(self) -> NetworkGraphArtifact:
+        """
+        Serialize the current network graph and store it in the cache.
+
+        Returns:
+            The new NetworkGraphArtifact
+
+        Raises:
+            HTTPException: 503 if graph hasn't been built yet, 500 if fetch fails
+        """
+        graph = await self.get_network_graph()
+        artifact = build_network_graph_artifact(graph)
+        # No TTL: the artifact only changes when the graph is rebuilt
+        await self.cache.set(NETWORK_GRAPH_ARTIFACT_CACHE_KEY, artifact)
+        logger.info(
+            "network_graph_artifact_stored",
+            etag=artifact.etag,
+            stations_count=artifact.stations_count,
+            size_bytes=len(artifact.gzip_body),
+        )
+        return artifact
+
     async def get_station_by_tfl_id(self, tfl_id: str) -> Station:
         """
         Get station from database by TfL ID.
@@ -3427,7 +3713,7 @@ class TfLService:
         # Stations are on different lines or connection doesn't exist
         return f"No connection found between '{from_station.name}' and '{to_station.name}' on {line.name} line."
 
-    async def _validate_segment_connections(
+    def _validate_segment_connections(
         self,
         segments: list[RouteSegmentRequest],
         stations_map: dict[str, Station],
@@ -3460,7 +3746,7 @@ class TfLService:
 
             # Check if connection exists (with hub interchange support)
             # Hub stations are equivalent - try all combinations of hub-equivalent stations
-            is_connected, _connected_from, _connected_to = await self._check_any_hub_connection(
+            is_connected, _connected_from, _connected_to = self._check_any_hub_connection(
                 from_station=from_station,
                 to_station=to_station,
                 line=line,
@@ -3525,7 +3811,7 @@ class TfLService:
             stations_map, lines_map, hub_map = await self._fetch_route_validation_data(segments)
 
             # Validate segment connections
-            is_valid, message, invalid_idx = await self._validate_segment_connections(
+            is_valid, message, invalid_idx = self._validate_segment_connections(
                 segments, stations_map, lines_map, hub_map
             )
 
@@ -3578,7 +3864,7 @@ class TfLService:
         # - We want to return [] if hub code exists but has no stations in map
         return list(hub_stations) if hub_stations else [station]
 
-    async def _check_any_hub_connection(
+    def _check_any_hub_connection(
         self,
         from_station: Station,
         to_station: Station,
@@ -3618,10 +3904,10 @@ class TfLService:
         # Try all combinations of hub-equivalent stations
         for from_st in from_stations:
             for to_st in to_stations:
-                is_connected = await self._check_connection(
-                    from_station_id=from_st.id,
-                    to_station_id=to_st.id,
-                    line_id=line.id,
+                is_connected = self._check_connection(
+                    from_station=from_st,
+                    to_station=to_st,
+                    line=line,
                 )
 
                 if is_connected:
@@ -3647,11 +3933,11 @@ class TfLService:
         # No combination connects
         return False, None, None
 
-    async def _check_connection(
+    def _check_connection(
         self,
-        from_station_id: uuid.UUID,
-        to_station_id: uuid.UUID,
-        line_id: uuid.UUID,
+        from_station: Station,
+        to_station: Station,
+        line: Line,
     ) -> bool:
         """
         Check if two stations are reachable on the same route sequence in the correct direction.
@@ -3664,31 +3950,20 @@ class TfLService:
         and backwards travel (e.g., Piccadilly Circus → Arsenal on Piccadilly line when the
         route sequence goes Arsenal → Piccadilly Circus).
 
+        Uses the line's compiled route variants (see app.helpers.route_variant_index), so
+        each check is a few dictionary lookups with no database access.
+
         Args:
-            from_station_id: Starting station UUID
-            to_station_id: Destination station UUID
-            line_id: Line UUID
+            from_station: Starting station
+            to_station: Destination station
+            line: Line being traveled on (with route_variants loaded)
 
         Returns:
             True if both stations exist in the same route sequence in the correct order,
             False otherwise
         """
-        # Get station and line objects
-        from_station = await self.db.get(Station, from_station_id)
-        to_station = await self.db.get(Station, to_station_id)
-        line = await self.db.get(Line, line_id)
-
-        if not from_station or not to_station or not line:
-            logger.warning(
-                "check_connection_missing_entity",
-                from_station_id=from_station_id,
-                to_station_id=to_station_id,
-                line_id=line_id,
-            )
-            return False
-
-        # Check if route sequences exist for this line
-        if not line.route_variants or "routes" not in line.route_variants:
+        compiled = get_compiled_route_variants(line)
+        if compiled is None:
             logger.warning(
                 "check_connection_no_routes",
                 line_tfl_id=line.tfl_id,
@@ -3696,15 +3971,7 @@ class TfLService:
             )
             return False
 
-        # Use pure helper function to find valid connection
-        # Performance: O(r * n) where r = route variants (2-6), n = stations (20-60)
-        # With infrequent validation (only during route creation/editing), performance is negligible.
-        routes = line.route_variants["routes"]
-        result = find_valid_connection_in_routes(
-            from_station.tfl_id,
-            to_station.tfl_id,
-            routes,
-        )
+        result = compiled.find_connection(from_station.tfl_id, to_station.tfl_id)
 
         if result and result["found"]:
             logger.debug(
@@ -1,10 +1,13 @@
 """Service for building and maintaining route station indexes."""
 
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import TypedDict
 from uuid import UUID
 
 import structlog
-from sqlalchemy import cast, select
+from sqlalchemy import cast, insert, select, update
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -52,16 +55,23 @@ class UserRouteIndexService:
         Build inverted index for a route by expanding segments to all intermediate stations.
 
         Algorithm:
-        1. Delete existing index entries for this route (in transaction)
-        2. Load route with segments (ordered by sequence)
-        3. For each segment pair (current → next):
+        1. Load route with segments (ordered by sequence)
+        2. For each segment pair (current → next):
            - Get Line.route_variants JSON for current.line_id
            - Find ALL route variants containing BOTH stations
            - For EACH matching variant:
              - Extract all stations between current and next (inclusive)
-             - Create index entry for each (line_tfl_id, station_naptan)
+             - Add (line_tfl_id, station_naptan) to the target entries
+        3. Diff the target entries against the route's active index entries and apply
+           only the changes (in transaction):
+           - Insert added entries in one bulk INSERT
+           - Soft delete removed (and duplicate) entries in one bulk UPDATE
+           - Refresh line_data_version on kept entries whose line data changed
         4. Optionally commit transaction (if auto_commit=True)
 
+        Rebuilding an unchanged route therefore writes nothing, and edits and line data
+        updates only touch the entries they affect.
+
         Note: If multiple route variants exist (e.g., Northern Line Bank/Charing Cross branches),
         we store ALL stations from ALL variants. This means alerts trigger if ANY branch is disrupted.
 
@@ -71,7 +81,9 @@ class UserRouteIndexService:
 
         Returns:
             Dictionary with statistics:
-                - entries_created: Number of index entries created
+                - entries_created: Number of index entries inserted
+                - entries_removed: Number of index entries soft deleted
+                - entries_refreshed: Number of index entries whose line_data_version was updated
                 - segments_processed: Number of segment pairs processed
 
         Raises:
@@ -87,11 +99,12 @@ class UserRouteIndexService:
                 logger.error("route_not_found", route_id=str(route_id))
                 raise ValueError(msg)
 
-            # Delete existing index entries for this route
-            await self._delete_existing_index(route_id)
+            # Expand segments to the entries the index should contain
+            target_entries, pairs_processed = await self._process_segments(route)
 
-            # Process segments and build index
-            entries_created, pairs_processed = await self._process_segments(route)
+            # Write only the differences from the current index
+            diff = diff_route_station_index(await self._load_existing_index(route_id), target_entries)
+            await self._apply_index_diff(route_id, diff)
 
             # Commit transaction if requested
             if auto_commit:
@@ -100,14 +113,18 @@ class UserRouteIndexService:
             logger.info(
                 "build_route_station_index_completed",
                 route_id=str(route_id),
-                entries_created=entries_created,
+                entries_created=len(diff.to_add),
+                entries_removed=len(diff.to_remove),
+                entries_refreshed=diff.refreshed_count,
                 pairs_processed=pairs_processed,
                 segments_count=len(route.segments),
                 auto_commit=auto_commit,
             )
 
             return {
-                "entries_created": entries_created,
+                "entries_created": len(diff.to_add),
+                "entries_removed": len(diff.to_remove),
+                "entries_refreshed": diff.refreshed_count,
                 "segments_processed": pairs_processed,
             }
 
@@ -231,20 +248,75 @@ class UserRouteIndexService:
         )
         return result.scalar_one_or_none()
 
-    async def _delete_existing_index(self, route_id: UUID) -> None:
+    async def _load_existing_index(self, route_id: UUID) -> list[tuple[UUID, str, str, datetime]]:
         """
-        Soft delete all existing index entries for a route.
+        Load the active index entries for a route.
 
         Args:
             route_id: UUID of route
+
+        Returns:
+            List of (id, line_tfl_id, station_naptan, line_data_version), oldest first
+        """
+        result = await self.db.execute(
+            select(
+                UserRouteStationIndex.id,
+                UserRouteStationIndex.line_tfl_id,
+                UserRouteStationIndex.station_naptan,
+                UserRouteStationIndex.line_data_version,
+            )
+            .where(
+                UserRouteStationIndex.route_id == route_id,
+                UserRouteStationIndex.deleted_at.is_(None),
+            )
+            .order_by(UserRouteStationIndex.created_at, UserRouteStationIndex.id)
+        )
+        return [(row.id, row.line_tfl_id, row.station_naptan, row.line_data_version) for row in result.all()]
+
+    async def _apply_index_diff(self, route_id: UUID, diff: "RouteIndexDiff") -> None:
         """
-        # Soft delete existing index entries (Issue #233)
-        await soft_delete(
-            self.db,
-            UserRouteStationIndex,
-            UserRouteStationIndex.route_id == route_id,
+        Apply an index diff with one bulk statement per kind of change.
+
+        Args:
+            route_id: UUID of route
+            diff: Changes computed by diff_route_station_index()
+        """
+        if diff.to_remove:
+            # Soft delete removed entries (Issue #233)
+            await soft_delete(
+                self.db,
+                UserRouteStationIndex,
+                UserRouteStationIndex.id.in_(diff.to_remove),
+            )
+
+        for line_data_version, entry_ids in diff.to_refresh.items():
+            await self.db.execute(
+                update(UserRouteStationIndex)
+                .where(UserRouteStationIndex.id.in_(entry_ids))
+                .values(line_data_version=line_data_version)
+            )
+
+        if diff.to_add:
+            await self.db.execute(
+                insert(UserRouteStationIndex),
+                [
+                    {
+                        "route_id": route_id,
+                        "line_tfl_id": line_tfl_id,
+                        "station_naptan": station_naptan,
+                        "line_data_version": line_data_version,
+                    }
+                    for (line_tfl_id, station_naptan), line_data_version in diff.to_add.items()
+                ],
+            )
+
+        logger.debug(
+            "applied_index_diff",
+            route_id=str(route_id),
+            added=len(diff.to_add),
+            removed=len(diff.to_remove),
+            refreshed=diff.refreshed_count,
         )
-        logger.debug("soft_deleted_existing_index", route_id=str(route_id))
 
     async def _resolve_station_for_line(
         self,
@@ -313,21 +385,23 @@ class UserRouteIndexService:
         )
         raise ValueError(msg)
 
-    async def _process_segments(self, route: UserRoute) -> tuple[int, int]:
+    async def _process_segments(self, route: UserRoute) -> tuple[dict[tuple[str, str], datetime], int]:
         """
-        Process route segments and create index entries.
+        Process route segments into the index entries the route should have.
 
-        Iterates through segment pairs, expands to intermediate stations,
-        and creates index entries for each station.
+        Iterates through segment pairs and expands them to intermediate stations.
+        Nothing is written to the database.
 
         Args:
             route: UserRoute instance with segments loaded
 
         Returns:
-            Tuple of (entries_created, pairs_processed) where:
-                - entries_created: Number of index entries created
+            Tuple of (target_entries, pairs_processed) where:
+                - target_entries: Mapping of (line_tfl_id, station_naptan) → line_data_version
+                  (a station shared by consecutive segments on a line is only indexed once)
                 - pairs_processed: Number of segment pairs actually processed
         """
+        target_entries: dict[tuple[str, str], datetime] = {}
         segments = route.segments
         if len(segments) < 2:  # noqa: PLR2004
             logger.warning(
@@ -335,9 +409,8 @@ class UserRouteIndexService:
                 route_id=str(route.id),
                 segment_count=len(segments),
             )
-            return 0, 0
+            return target_entries, 0
 
-        entries_created = 0
         pairs_processed = 0
 
         # Process each consecutive segment pair
@@ -389,17 +462,9 @@ class UserRouteIndexService:
                     current_segment.line,
                 )
 
-                # Create index entries for all intermediate stations
+                # Target index entries for all intermediate stations
                 for station_naptan in station_naptans:
-                    self.db.add(
-                        UserRouteStationIndex(
-                            route_id=route.id,
-                            line_tfl_id=current_segment.line.tfl_id,
-                            station_naptan=station_naptan,
-                            line_data_version=current_segment.line.last_updated,
-                        )
-                    )
-                    entries_created += 1
+                    target_entries[current_segment.line.tfl_id, station_naptan] = current_segment.line.last_updated
 
                 logger.debug(
                     "expanded_segment",
@@ -422,7 +487,7 @@ class UserRouteIndexService:
                 # Continue processing other segments rather than failing entire index build
                 continue
 
-        return entries_created, pairs_processed
+        return target_entries, pairs_processed
 
     async def _expand_segment_to_stations(
         self,
@@ -515,6 +580,59 @@ class UserRouteIndexService:
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class RouteIndexDiff:
+    """Changes that bring a route's active index entries to its target entries."""
+
+    to_add: dict[tuple[str, str], datetime] = field(default_factory=dict)
+    to_remove: list[UUID] = field(default_factory=list)
+    # Kept entry IDs to update, grouped by their new line_data_version
+    to_refresh: dict[datetime, list[UUID]] = field(default_factory=dict)
+
+    @property
+    def refreshed_count(self) -> int:
+        """Number of kept entries whose line_data_version changes."""
+        return sum(len(entry_ids) for entry_ids in self.to_refresh.values())
+
+
+def diff_route_station_index(
+    existing: Sequence[tuple[UUID, str, str, datetime]],
+    target: Mapping[tuple[str, str], datetime],
+) -> RouteIndexDiff:
+    """
+    Diff a route's active index entries against the entries it should have.
+
+    Entries are matched on (line_tfl_id, station_naptan). Matching entries are kept,
+    with their line_data_version refreshed if the line data has changed. If several
+    active entries share a key (indexes built before diffing could hold duplicates),
+    the first is kept and the rest are removed.
+
+    Pure function with no side effects.
+
+    Args:
+        existing: Active entries as (id, line_tfl_id, station_naptan, line_data_version)
+        target: Mapping of (line_tfl_id, station_naptan) → line_data_version
+
+    Returns:
+        RouteIndexDiff with entries to add, entry IDs to remove, and entry IDs to refresh
+    """
+    to_remove: list[UUID] = []
+    to_refresh: dict[datetime, list[UUID]] = {}
+    kept: set[tuple[str, str]] = set()
+
+    for entry_id, line_tfl_id, station_naptan, line_data_version in existing:
+        key = (line_tfl_id, station_naptan)
+        if key not in target or key in kept:
+            to_remove.append(entry_id)
+            continue
+        kept.add(key)
+        if line_data_version != target[key]:
+            to_refresh.setdefault(target[key], []).append(entry_id)
+
+    to_add = {key: line_data_version for key, line_data_version in target.items() if key not in kept}
+    return RouteIndexDiff(to_add=to_add, to_remove=to_remove, to_refresh=to_refresh)
+
+
 def find_stations_between(
     stations: list[str],
     from_station: str,
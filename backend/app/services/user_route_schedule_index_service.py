@@ -0,0 +1,277 @@
+"""Service for building and querying route schedule window indexes."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+import structlog
+from sqlalchemy import and_, insert, or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.helpers.schedule_windows import get_local_minutes_of_week, get_schedule_windows
+from app.helpers.soft_delete_filters import soft_delete
+from app.models.user_route import UserRoute, UserRouteSchedule
+from app.models.user_route_index import UserRouteScheduleWindow
+
+logger = structlog.get_logger(__name__)
+
+# A window's identity: (schedule_id, timezone, start_minute, end_minute)
+ScheduleWindowKey = tuple[UUID, str, int, int]
+
+
+class UserRouteScheduleIndexService:
+    """
+    Service for the precomputed schedule index answering "which routes are in-window now?".
+
+    Each active schedule is expanded into minute-of-week windows in the route's timezone
+    (UserRouteScheduleWindow), so the alert cycle can select in-window routes with one
+    indexed query instead of checking every schedule of every route.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize service with database session.
+
+        Args:
+            db: Async database session
+        """
+        self.db = db
+
+    async def build_route_schedule_index(
+        self,
+        route_id: UUID,
+        *,
+        auto_commit: bool = True,
+    ) -> int:
+        """
+        Rebuild a route's schedule windows from its active schedules and timezone.
+
+        The target windows are diffed against the active ones, so only windows that
+        changed are soft deleted or inserted (one bulk statement each). Call after any
+        change to the route's schedules or timezone.
+
+        Args:
+            route_id: UUID of route to index
+            auto_commit: If True, commits the transaction. If False, caller must commit.
+
+        Returns:
+            Number of windows created
+
+        Raises:
+            ValueError: If route not found
+        """
+        try:
+            result = await self.db.execute(
+                select(UserRoute.timezone).where(
+                    UserRoute.id == route_id,
+                    UserRoute.deleted_at.is_(None),
+                )
+            )
+            timezone = result.scalar_one_or_none()
+            if timezone is None:
+                msg = f"UserRoute {route_id} not found"
+                logger.error("route_not_found", route_id=str(route_id))
+                raise ValueError(msg)
+
+            schedules_result = await self.db.execute(
+                select(UserRouteSchedule).where(
+                    UserRouteSchedule.route_id == route_id,
+                    UserRouteSchedule.deleted_at.is_(None),
+                )
+            )
+            target_windows = [
+                (schedule.id, timezone, start_minute, end_minute)
+                for schedule in schedules_result.scalars().all()
+                for start_minute, end_minute in get_schedule_windows(
+                    schedule.days_of_week, schedule.start_time, schedule.end_time
+                )
+            ]
+
+            # Write only the differences from the current windows
+            diff = diff_route_schedule_windows(await self._load_existing_windows(route_id), target_windows)
+            await self._apply_windows_diff(route_id, diff)
+
+            if auto_commit:
+                await self.db.commit()
+
+        except Exception as exc:
+            if auto_commit:
+                await self.db.rollback()
+            logger.error("build_route_schedule_index_failed", route_id=str(route_id), error=str(exc))
+            raise
+
+        logger.info(
+            "build_route_schedule_index_completed",
+            route_id=str(route_id),
+            windows_created=len(diff.to_add),
+            windows_removed=len(diff.to_remove),
+            auto_commit=auto_commit,
+        )
+        return len(diff.to_add)
+
+    async def _load_existing_windows(self, route_id: UUID) -> list[tuple[UUID, ScheduleWindowKey]]:
+        """
+        Load the active schedule windows for a route.
+
+        Args:
+            route_id: UUID of route
+
+        Returns:
+            List of (id, (schedule_id, timezone, start_minute, end_minute)), oldest first
+        """
+        result = await self.db.execute(
+            select(
+                UserRouteScheduleWindow.id,
+                UserRouteScheduleWindow.schedule_id,
+                UserRouteScheduleWindow.timezone,
+                UserRouteScheduleWindow.start_minute,
+                UserRouteScheduleWindow.end_minute,
+            )
+            .where(
+                UserRouteScheduleWindow.route_id == route_id,
+                UserRouteScheduleWindow.deleted_at.is_(None),
+            )
+            .order_by(UserRouteScheduleWindow.created_at, UserRouteScheduleWindow.id)
+        )
+        return [(row.id, (row.schedule_id, row.timezone, row.start_minute, row.end_minute)) for row in result.all()]
+
+    async def _apply_windows_diff(self, route_id: UUID, diff: "ScheduleWindowDiff") -> None:
+        """
+        Apply a windows diff with one bulk statement per kind of change.
+
+        Args:
+            route_id: UUID of route
+            diff: Changes computed by diff_route_schedule_windows()
+        """
+        if diff.to_remove:
+            # Soft delete removed windows (Issue #233)
+            await soft_delete(
+                self.db,
+                UserRouteScheduleWindow,
+                UserRouteScheduleWindow.id.in_(diff.to_remove),
+            )
+
+        if diff.to_add:
+            await self.db.execute(
+                insert(UserRouteScheduleWindow),
+                [
+                    {
+                        "route_id": route_id,
+                        "schedule_id": schedule_id,
+                        "timezone": timezone,
+                        "start_minute": start_minute,
+                        "end_minute": end_minute,
+                    }
+                    for schedule_id, timezone, start_minute, end_minute in diff.to_add
+                ],
+            )
+
+    async def get_in_window_route_ids(self, now_utc: datetime) -> set[UUID]:
+        """
+        Get the routes with a schedule window open at the given time.
+
+        The current minute of week is computed once per timezone in use, then matched
+        against the index (ix_user_route_schedule_windows_timezone_start). Routes with
+        active schedules but no windows yet (e.g., created before the index existed) are
+        always included, so they are still checked schedule by schedule.
+
+        The windows are minute-granular, so the result may include routes whose schedule
+        ends within the current minute. Callers still check the exact schedule.
+
+        Args:
+            now_utc: Current time (timezone-aware)
+
+        Returns:
+            Set of route IDs that may be in a schedule window
+        """
+        timezones_result = await self.db.execute(
+            select(UserRouteScheduleWindow.timezone).where(UserRouteScheduleWindow.deleted_at.is_(None)).distinct()
+        )
+        minutes_by_timezone = get_local_minutes_of_week(timezones_result.scalars().all(), now_utc)
+
+        # Routes with active schedules but no active windows fall back to per-schedule checks
+        has_active_window = (
+            select(UserRouteScheduleWindow.id)
+            .where(
+                UserRouteScheduleWindow.route_id == UserRouteSchedule.route_id,
+                UserRouteScheduleWindow.deleted_at.is_(None),
+            )
+            .exists()
+        )
+        unindexed_query = select(UserRouteSchedule.route_id).where(
+            UserRouteSchedule.deleted_at.is_(None),
+            ~has_active_window,
+        )
+
+        if minutes_by_timezone:
+            in_window_query = select(UserRouteScheduleWindow.route_id).where(
+                UserRouteScheduleWindow.deleted_at.is_(None),
+                or_(
+                    *(
+                        and_(
+                            UserRouteScheduleWindow.timezone == timezone,
+                            UserRouteScheduleWindow.start_minute <= minute,
+                            UserRouteScheduleWindow.end_minute >= minute,
+                        )
+                        for timezone, minute in minutes_by_timezone.items()
+                    )
+                ),
+            )
+            result = await self.db.execute(union(in_window_query, unindexed_query))
+        else:
+            result = await self.db.execute(unindexed_query.distinct())
+
+        route_ids = {row[0] for row in result.all()}
+        logger.debug(
+            "in_window_routes_selected",
+            timezone_count=len(minutes_by_timezone),
+            route_count=len(route_ids),
+        )
+        return route_ids
+
+
+# =============================================================================
+# Pure Function Helpers
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ScheduleWindowDiff:
+    """Changes that bring a route's active schedule windows to its target windows."""
+
+    to_add: list[ScheduleWindowKey] = field(default_factory=list)
+    to_remove: list[UUID] = field(default_factory=list)
+
+
+def diff_route_schedule_windows(
+    existing: Sequence[tuple[UUID, ScheduleWindowKey]],
+    target: Iterable[ScheduleWindowKey],
+) -> ScheduleWindowDiff:
+    """
+    Diff a route's active schedule windows against the windows it should have.
+
+    Windows are matched on (schedule_id, timezone, start_minute, end_minute), so
+    unchanged windows are kept. If several active windows share a key, the first is
+    kept and the rest are removed.
+
+    Pure function with no side effects.
+
+    Args:
+        existing: Active windows as (id, (schedule_id, timezone, start_minute, end_minute))
+        target: Windows the route should have, as (schedule_id, timezone, start_minute, end_minute)
+
+    Returns:
+        ScheduleWindowDiff with windows to add and window IDs to remove
+    """
+    wanted = dict.fromkeys(target)
+    to_remove: list[UUID] = []
+    kept: set[ScheduleWindowKey] = set()
+
+    for window_id, key in existing:
+        if key not in wanted or key in kept:
+            to_remove.append(window_id)
+            continue
+        kept.add(key)
+
+    return ScheduleWindowDiff(to_add=[key for key in wanted if key not in kept], to_remove=to_remove)
@@ -11,7 +11,7 @@ from app.helpers.soft_delete_filters import soft_delete
 from app.models.notification import NotificationPreference
 from app.models.tfl import Line, Station
 from app.models.user_route import UserRoute, UserRouteSchedule, UserRouteSegment
-from app.models.user_route_index import UserRouteStationIndex
+from app.models.user_route_index import UserRouteScheduleWindow, UserRouteStationIndex
 from app.schemas.routes import (
     CreateUserRouteRequest,
     CreateUserRouteScheduleRequest,
@@ -23,6 +23,7 @@ from app.schemas.routes import (
 from app.schemas.tfl import RouteSegmentRequest
 from app.services.tfl_service import TfLService
 from app.services.user_route_index_service import UserRouteIndexService
+from app.services.user_route_schedule_index_service import UserRouteScheduleIndexService
 
 # Constants
 MIN_ROUTE_SEGMENTS = 2
@@ -182,9 +183,16 @@ class UserRouteService:
             route.description = request.description
         if request.active is not None:
             route.active = request.active
+        timezone_changed = request.timezone is not None and request.timezone != route.timezone
         if request.timezone is not None:
             route.timezone = request.timezone
 
+        if timezone_changed:
+            # Schedule windows are stored in the route's local time (part of same transaction)
+            await self.db.flush()
+            schedule_index_service = UserRouteScheduleIndexService(self.db)
+            await schedule_index_service.build_route_schedule_index(route_id, auto_commit=False)
+
         await self.db.commit()
         await self.db.refresh(route)
 
@@ -217,6 +225,9 @@ class UserRouteService:
         # Soft delete station indexes
         await soft_delete(self.db, UserRouteStationIndex, UserRouteStationIndex.route_id == route_id)
 
+        # Soft delete schedule windows
+        await soft_delete(self.db, UserRouteScheduleWindow, UserRouteScheduleWindow.route_id == route_id)
+
         # Soft delete notification preferences
         await soft_delete(self.db, NotificationPreference, NotificationPreference.route_id == route_id)
 
@@ -465,6 +476,12 @@ class UserRouteService:
         )
 
         self.db.add(schedule)
+        await self.db.flush()  # Flush to make schedule available for index building
+
+        # Rebuild route schedule index (part of same transaction)
+        schedule_index_service = UserRouteScheduleIndexService(self.db)
+        await schedule_index_service.build_route_schedule_index(route_id, auto_commit=False)
+
         await self.db.commit()
         await self.db.refresh(schedule)
 
@@ -530,6 +547,10 @@ class UserRouteService:
                 detail="end_time must be after start_time",
             )
 
+        # Rebuild route schedule index (part of same transaction)
+        schedule_index_service = UserRouteScheduleIndexService(self.db)
+        await schedule_index_service.build_route_schedule_index(route_id, auto_commit=False)
+
         await self.db.commit()
         await self.db.refresh(schedule)
 
@@ -573,6 +594,11 @@ class UserRouteService:
 
         # Soft delete the schedule (Issue #233)
         await soft_delete(self.db, UserRouteSchedule, UserRouteSchedule.id == schedule_id)
+
+        # Rebuild route schedule index (part of same transaction)
+        schedule_index_service = UserRouteScheduleIndexService(self.db)
+        await schedule_index_service.build_route_schedule_index(route_id, auto_commit=False)
+
         await self.db.commit()
 
     async def upsert_schedules(
@@ -618,6 +644,12 @@ class UserRouteService:
             ]
 
             self.db.add_all(new_schedules)
+            await self.db.flush()  # Flush to make schedules available for index building
+
+            # Rebuild route schedule index (part of same transaction)
+            schedule_index_service = UserRouteScheduleIndexService(self.db)
+            await schedule_index_service.build_route_schedule_index(route_id, auto_commit=False)
+
             await self.db.commit()
 
             # Reload for response (schedules don't have relationships to load)
@@ -3,12 +3,15 @@
 import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import NoReturn
 
 import structlog
 from fastapi import HTTPException
-from sqlalchemy import delete, func, select
+from redis.exceptions import RedisError
+from sqlalchemy import Select, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.rate_limiter import SlidingWindowRateLimiter, get_rate_limiter, rate_limit_key
 from app.core.telemetry import service_span
 from app.models.rate_limit import RateLimitAction, RateLimitLog
 from app.models.user import VerificationCode, VerificationType
@@ -25,21 +28,25 @@ ADD_CONTACT_FAILURE_RATE_LIMIT = 5  # Max failed additions per user per 24 hours
 VERIFICATION_CODE_EXPIRY_MINUTES = 15
 VERIFICATION_CODE_RATE_WINDOW_HOURS = 1
 ADD_CONTACT_RATE_WINDOW_HOURS = 24
+RATE_LIMIT_LOG_RETENTION_DAYS = 30  # Audit rows kept (longer than any window, for abuse investigation)
 
 
 class VerificationService:
     """Service for managing contact verification and rate limiting."""
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, rate_limiter: SlidingWindowRateLimiter | None = None) -> None:
         """
         Initialize the verification service.
 
         Args:
             db: Database session
+            rate_limiter: Redis rate limiter to count attempts with. Defaults to the process-wide
+                limiter; without one, attempts are counted in rate_limit_logs.
         """
         self.db = db
         self.email_service = EmailService()
         self.sms_service = SmsService()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
 
     def generate_code(self) -> str:
         """
@@ -61,33 +68,61 @@ class VerificationService:
         Raises:
             HTTPException: 429 if rate limit exceeded
         """
-        cutoff_time = datetime.now(UTC) - timedelta(hours=VERIFICATION_CODE_RATE_WINDOW_HOURS)
+        window = timedelta(hours=VERIFICATION_CODE_RATE_WINDOW_HOURS)
 
         # Count verification code requests in the last hour for this contact
-        result = await self.db.execute(
-            select(func.count())
-            .select_from(RateLimitLog)
-            .where(
-                RateLimitLog.action_type == RateLimitAction.VERIFY_CODE,
-                RateLimitLog.resource_id == str(contact_id),
-                RateLimitLog.timestamp >= cutoff_time,
-            )
+        count = await self._count_recent_attempts(
+            rate_limit_key(RateLimitAction.VERIFY_CODE.value, contact_id),
+            window,
+            self._verification_log_count(contact_id, window),
         )
-        count = result.scalar_one()
 
         if count >= VERIFICATION_CODE_RATE_LIMIT:
-            logger.warning(
-                "verification_rate_limit_exceeded",
-                contact_id=str(contact_id),
-                count=count,
-            )
-            raise HTTPException(
-                status_code=429,
-                detail=(
-                    f"Too many verification code requests. Please try again in "
-                    f"{VERIFICATION_CODE_RATE_WINDOW_HOURS} hour(s)."
-                ),
+            self._raise_verification_rate_limited(contact_id, count)
+
+    async def reserve_verification_code_request(self, contact_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        """
+        Check the verification rate limit and count a new code request against it.
+
+        With Redis, the check and the record happen in one atomic step, so concurrent
+        requests can't exceed the limit. The audit row is added to the session for the
+        caller to commit with the verification code, so the request costs no extra
+        database round-trip. Without Redis (or if it fails), rate_limit_logs is counted
+        and the audit row is what later checks count.
+
+        Args:
+            contact_id: UUID of the contact
+            user_id: UUID of the user
+
+        Raises:
+            HTTPException: 429 if rate limit exceeded
+        """
+        window = timedelta(hours=VERIFICATION_CODE_RATE_WINDOW_HOURS)
+        reserved = False
+        if self.rate_limiter is not None:
+            key = rate_limit_key(RateLimitAction.VERIFY_CODE.value, contact_id)
+            try:
+                reserved = await self.rate_limiter.acquire(key, window, VERIFICATION_CODE_RATE_LIMIT)
+            except RedisError as e:
+                logger.warning("rate_limit_redis_error", key=key, operation="acquire", error=str(e))
+            else:
+                if not reserved:
+                    self._raise_verification_rate_limited(contact_id, VERIFICATION_CODE_RATE_LIMIT)
+
+        if not reserved:
+            result = await self.db.execute(self._verification_log_count(contact_id, window))
+            count = result.scalar_one()
+            if count >= VERIFICATION_CODE_RATE_LIMIT:
+                self._raise_verification_rate_limited(contact_id, count)
+
+        self.db.add(
+            RateLimitLog(
+                user_id=user_id,
+                action_type=RateLimitAction.VERIFY_CODE,
+                resource_id=str(contact_id),
+                timestamp=datetime.now(UTC),
             )
+        )
 
     async def check_add_contact_rate_limit(self, user_id: uuid.UUID) -> None:
         """
@@ -101,19 +136,21 @@ class VerificationService:
         Raises:
             HTTPException: 429 if rate limit exceeded
         """
-        cutoff_time = datetime.now(UTC) - timedelta(hours=ADD_CONTACT_RATE_WINDOW_HOURS)
+        window = timedelta(hours=ADD_CONTACT_RATE_WINDOW_HOURS)
+        cutoff_time = datetime.now(UTC) - window
 
         # Count failed contact additions in the last 24 hours for this user
-        result = await self.db.execute(
+        count = await self._count_recent_attempts(
+            rate_limit_key(RateLimitAction.ADD_CONTACT_FAILURE.value, user_id),
+            window,
             select(func.count())
             .select_from(RateLimitLog)
             .where(
                 RateLimitLog.user_id == user_id,
                 RateLimitLog.action_type == RateLimitAction.ADD_CONTACT_FAILURE,
                 RateLimitLog.timestamp >= cutoff_time,
-            )
+            ),
         )
-        count = result.scalar_one()
 
         if count >= ADD_CONTACT_FAILURE_RATE_LIMIT:
             logger.warning(
@@ -130,10 +167,16 @@ class VerificationService:
         """
         Record a verification code request for rate limiting.
 
+        Recorded in Redis first (the record of truth), then in the rate_limit_logs audit trail.
+
         Args:
             contact_id: UUID of the contact
             user_id: UUID of the user
         """
+        await self._record_attempt(
+            rate_limit_key(RateLimitAction.VERIFY_CODE.value, contact_id),
+            timedelta(hours=VERIFICATION_CODE_RATE_WINDOW_HOURS),
+        )
         log_entry = RateLimitLog(
             user_id=user_id,
             action_type=RateLimitAction.VERIFY_CODE,
@@ -147,10 +190,16 @@ class VerificationService:
         """
         Record a failed contact addition attempt for rate limiting.
 
+        Recorded in Redis first (the record of truth), then in the rate_limit_logs audit trail.
+
         Args:
             user_id: UUID of the user
             contact_value: Email or phone that failed to add
         """
+        await self._record_attempt(
+            rate_limit_key(RateLimitAction.ADD_CONTACT_FAILURE.value, user_id),
+            timedelta(hours=ADD_CONTACT_RATE_WINDOW_HOURS),
+        )
         log_entry = RateLimitLog(
             user_id=user_id,
             action_type=RateLimitAction.ADD_CONTACT_FAILURE,
@@ -174,8 +223,120 @@ class VerificationService:
             )
         )
         await self.db.commit()
+        if self.rate_limiter is not None:
+            key = rate_limit_key(RateLimitAction.VERIFY_CODE.value, contact_id)
+            try:
+                await self.rate_limiter.reset(key)
+            except RedisError as e:
+                # The attempts still expire with the window, so the contact is only limited for longer
+                logger.warning("rate_limit_redis_error", key=key, operation="reset", error=str(e))
         logger.info("verification_rate_limit_reset", contact_id=str(contact_id))
 
+    async def prune_rate_limit_logs(self, now: datetime | None = None) -> int:
+        """
+        Delete rate_limit_logs audit rows older than RATE_LIMIT_LOG_RETENTION_DAYS.
+
+        The retention is longer than every rate limit window, so fallback counts are unaffected.
+
+        Args:
+            now: Current time (defaults to now, UTC)
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = (now or datetime.now(UTC)) - timedelta(days=RATE_LIMIT_LOG_RETENTION_DAYS)
+        result = await self.db.execute(delete(RateLimitLog).where(RateLimitLog.timestamp < cutoff))
+        await self.db.commit()
+        # rowcount is set for DELETE, but isn't part of the generic Result type
+        deleted: int = result.rowcount  # type: ignore[attr-defined]
+        logger.info("rate_limit_logs_pruned", deleted=deleted, cutoff=cutoff.isoformat())
+        return deleted
+
+    def _verification_log_count(self, contact_id: uuid.UUID, window: timedelta) -> Select[tuple[int]]:
+        """
+        Build the COUNT of a contact's verification code requests in rate_limit_logs.
+
+        Args:
+            contact_id: UUID of the contact
+            window: How far back to count
+
+        Returns:
+            COUNT query over rate_limit_logs
+        """
+        return (
+            select(func.count())
+            .select_from(RateLimitLog)
+            .where(
+                RateLimitLog.action_type == RateLimitAction.VERIFY_CODE,
+                RateLimitLog.resource_id == str(contact_id),
+                RateLimitLog.timestamp >= datetime.now(UTC) - window,
+            )
+        )
+
+    def _raise_verification_rate_limited(self, contact_id: uuid.UUID, count: int) -> NoReturn:
+        """
+        Raise the 429 for a contact over its verification code rate limit.
+
+        Args:
+            contact_id: UUID of the contact
+            count: Requests counted within the window
+
+        Raises:
+            HTTPException: 429 always
+        """
+        logger.warning(
+            "verification_rate_limit_exceeded",
+            contact_id=str(contact_id),
+            count=count,
+        )
+        raise HTTPException(
+            status_code=429,
+            detail=(
+                f"Too many verification code requests. Please try again in "
+                f"{VERIFICATION_CODE_RATE_WINDOW_HOURS} hour(s)."
+            ),
+        )
+
+    async def _count_recent_attempts(self, key: str, window: timedelta, log_count: Select[tuple[int]]) -> int:
+        """
+        Count rate-limited attempts within a window.
+
+        Attempts are counted in Redis when a rate limiter is available. Without one, or if
+        Redis fails, they are counted in rate_limit_logs instead.
+
+        Args:
+            key: Rate limit key in Redis
+            window: How far back to count
+            log_count: Equivalent COUNT query over rate_limit_logs
+
+        Returns:
+            Number of attempts within the window
+        """
+        if self.rate_limiter is not None:
+            try:
+                return await self.rate_limiter.count(key, window)
+            except RedisError as e:
+                logger.warning("rate_limit_redis_error", key=key, operation="count", error=str(e))
+
+        result = await self.db.execute(log_count)
+        return result.scalar_one()
+
+    async def _record_attempt(self, key: str, window: timedelta) -> None:
+        """
+        Record a rate-limited attempt in Redis (no-op without a rate limiter).
+
+        Args:
+            key: Rate limit key in Redis
+            window: Window of the limit
+        """
+        if self.rate_limiter is None:
+            return
+        try:
+            await self.rate_limiter.record(key, window)
+        except RedisError as e:
+            # The attempt is still in rate_limit_logs, which is counted while Redis is down
+            logger.warning("rate_limit_redis_error", key=key, operation="record", error=str(e))
+
     async def create_and_send_code(
         self,
         contact_id: uuid.UUID,
@@ -203,8 +364,8 @@ class VerificationService:
             span.set_attribute("verification.contact_id", str(contact_id))
             span.set_attribute("verification.user_id", str(user_id))
             span.set_attribute("verification.contact_type", contact_type.value)
-            # Check rate limit
-            await self.check_verification_rate_limit(contact_id)
+            # Check the rate limit and count this request against it
+            await self.reserve_verification_code_request(contact_id, user_id)
 
             # Generate code
             code = self.generate_code()
@@ -219,11 +380,9 @@ class VerificationService:
                 used=False,
             )
             self.db.add(verification_code)
+            # Commits the rate limit audit row along with the code
             await self.db.commit()
 
-            # Record rate limit event
-            await self.record_verification_code_request(contact_id, user_id)
-
             # Send code via appropriate channel
             try:
                 if contact_type == VerificationType.EMAIL:
@@ -16,16 +16,20 @@ from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from urllib.parse import quote_plus, urlunparse
 
 import pytest
 from alembic import command
 from alembic.config import Config
-from app.core.auth import clear_jwks_cache, set_mock_jwks
+from app.core.auth import clear_jwks_cache, clear_token_cache, set_mock_jwks
 from app.core.config import Settings, settings
 from app.core.database import get_db
+from app.core.rate_limiter import SlidingWindowRateLimiter
+from app.core.redis import create_redis_client
+from app.core.tiered_cache import clear_local_caches
 from app.core.utils import convert_async_db_url_to_sync
+from app.helpers.route_variant_index import clear_compiled_route_variants
 from app.main import app
 from app.models.admin import AdminRole, AdminUser
 
@@ -445,6 +449,26 @@ def reset_jwks_cache() -> Generator[None]:
     clear_jwks_cache()
 
 
+@pytest.fixture(autouse=True)
+def reset_local_caches() -> Generator[None]:
+    """
+    Reset process-local caches (TfL cache tiers, compiled route variants, verified tokens) around each test.
+
+    Local entries outlive the Redis data they were read from, so without this
+    a value cached by one test could be served to the next.
+
+    Yields:
+        None
+    """
+    clear_local_caches()
+    clear_compiled_route_variants()
+    clear_token_cache()
+    yield
+    clear_local_caches()
+    clear_compiled_route_variants()
+    clear_token_cache()
+
+
 @pytest.fixture
 def mock_jwt_token() -> str:
     """
@@ -555,6 +579,70 @@ def authenticated_client(auth_headers: dict[str, str]) -> TestClient:
     return client
 
 
+class MockRedisPipeline:
+    """
+    Pipeline for mock Redis clients.
+
+    Queues commands and runs them against the mock client's own methods on execute(),
+    so tests can assert on (or stub) client.set/setex/delete whether or not the code
+    under test batches its writes.
+    """
+
+    def __init__(self, client: AsyncMock) -> None:
+        self._client = client
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    def set(self, name: str, value: str) -> "MockRedisPipeline":
+        self._commands.append(("set", (name, value)))
+        return self
+
+    def setex(self, name: str, time: int, value: str) -> "MockRedisPipeline":
+        self._commands.append(("setex", (name, time, value)))
+        return self
+
+    def delete(self, *names: str) -> "MockRedisPipeline":
+        self._commands.append(("delete", names))
+        return self
+
+    def zadd(self, name: str, mapping: dict[str, float], gt: bool = False) -> "MockRedisPipeline":
+        self._commands.append(("zadd", (name, mapping, gt)))
+        return self
+
+    def zremrangebyscore(self, name: str, min: float | str, max: float | str) -> "MockRedisPipeline":
+        self._commands.append(("zremrangebyscore", (name, min, max)))
+        return self
+
+    def zrangebyscore(self, name: str, min: float | str, max: float | str) -> "MockRedisPipeline":
+        self._commands.append(("zrangebyscore", (name, min, max)))
+        return self
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [await getattr(self._client, method)(*args) for method, args in commands]
+
+    async def __aenter__(self) -> "MockRedisPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._commands = []
+
+
+def add_mock_redis_batching(mock: AsyncMock) -> AsyncMock:
+    """
+    Give a mock Redis client mget() and pipeline() built on its get/set/setex/delete.
+
+    The per-key methods are looked up at call time, so tests that replace
+    mock.get afterwards also control what mget() returns.
+    """
+
+    async def mock_mget(keys: list[str]) -> list[str | None]:
+        return [await mock.get(key) for key in keys]
+
+    mock.mget = AsyncMock(side_effect=mock_mget)
+    mock.pipeline = MagicMock(side_effect=lambda transaction=True: MockRedisPipeline(mock))
+    return mock
+
+
 @pytest.fixture
 def mock_redis() -> AsyncMock:
     """Create a mock Redis client for testing."""
@@ -562,9 +650,13 @@ def mock_redis() -> AsyncMock:
     mock.get = AsyncMock(return_value=None)
     mock.set = AsyncMock(return_value=True)
     mock.setex = AsyncMock(return_value=True)
+    mock.delete = AsyncMock(return_value=1)
+    mock.zadd = AsyncMock(return_value=1)
+    mock.zremrangebyscore = AsyncMock(return_value=0)
+    mock.zrangebyscore = AsyncMock(return_value=[])
     mock.close = AsyncMock()
     mock.aclose = AsyncMock()
-    return mock
+    return add_mock_redis_batching(mock)
 
 
 @pytest.fixture
@@ -572,6 +664,7 @@ def stateful_mock_redis() -> AsyncMock:
     """Create a stateful mock Redis client that remembers set/get operations."""
     mock = AsyncMock()
     redis_storage: dict[str, str] = {}
+    sorted_sets: dict[str, dict[str, float]] = {}
 
     async def mock_get(key: str) -> str | None:
         return redis_storage.get(key)
@@ -584,12 +677,40 @@ def stateful_mock_redis() -> AsyncMock:
         redis_storage[key] = value
         return True
 
+    async def mock_delete(*keys: str) -> int:
+        return sum(redis_storage.pop(key, None) is not None for key in keys)
+
+    async def mock_zadd(key: str, mapping: dict[str, float], gt: bool = False) -> int:
+        zset = sorted_sets.setdefault(key, {})
+        added = len(mapping.keys() - zset.keys())
+        for member, score in mapping.items():
+            if not gt or score > zset.get(member, float("-inf")):
+                zset[member] = score
+        return added
+
+    async def mock_zremrangebyscore(key: str, min: float | str, max: float | str) -> int:
+        zset = sorted_sets.get(key, {})
+        removed = [member for member, score in zset.items() if float(min) <= score <= float(max)]
+        for member in removed:
+            del zset[member]
+        return len(removed)
+
+    async def mock_zrangebyscore(key: str, min: float | str, max: float | str) -> list[str]:
+        zset = sorted_sets.get(key, {})
+        return sorted(
+            (member for member, score in zset.items() if float(min) <= score <= float(max)), key=zset.__getitem__
+        )
+
     mock.get = mock_get
     mock.set = mock_set
     mock.setex = mock_setex
+    mock.delete = mock_delete
+    mock.zadd = mock_zadd
+    mock.zremrangebyscore = mock_zremrangebyscore
+    mock.zrangebyscore = mock_zrangebyscore
     mock.close = AsyncMock()
     mock.aclose = AsyncMock()
-    return mock
+    return add_mock_redis_batching(mock)
 
 
 @pytest.fixture
@@ -598,6 +719,18 @@ def alert_service(db_session: AsyncSession, mock_redis: AsyncMock) -> AlertServi
     return AlertService(db=db_session, redis_client=mock_redis)
 
 
+@pytest.fixture
+async def rate_limiter() -> AsyncGenerator[SlidingWindowRateLimiter]:
+    """
+    Redis rate limiter on the test Redis server (REDIS_URL).
+
+    Rate limit keys include contact/user IDs, which are unique per test, so no cleanup is needed.
+    """
+    limiter = SlidingWindowRateLimiter(create_redis_client())
+    yield limiter
+    await limiter.aclose()
+
+
 # Admin fixtures
 
 
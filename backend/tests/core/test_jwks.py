@@ -0,0 +1,242 @@
+"""Tests for the background-refreshed JWKS cache, against a local HTTP server."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from collections.abc import AsyncGenerator, Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+from app.core.jwks import JwksCache, close_jwks_cache, get_jwks_cache, init_jwks_cache
+
+KEYS_V1 = {"keys": [{"kid": "key-1", "kty": "RSA"}]}
+KEYS_V2 = {"keys": [{"kid": "key-2", "kty": "RSA"}]}
+
+
+class JwksServer:
+    """Local stand-in for Auth0's JWKS endpoint with a configurable response."""
+
+    def __init__(self) -> None:
+        """Serve KEYS_V1 until told otherwise."""
+        self.payload: Any = KEYS_V1
+        self.status = 200
+        self.delay = 0.0
+        self.request_count = 0
+        self.url = ""
+
+
+def _handler_for(server: JwksServer) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler serving the server's current response."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            server.request_count += 1
+            time.sleep(server.delay)
+            body = json.dumps(server.payload).encode()
+            self.send_response(server.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: ANN401
+            """Keep test output quiet."""
+
+    return Handler
+
+
+@pytest.fixture
+def jwks_server() -> Generator[JwksServer]:
+    """Run a local JWKS endpoint on a free port."""
+    server = JwksServer()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(server))
+    httpd.daemon_threads = True
+    server.url = f"http://127.0.0.1:{httpd.server_address[1]}/.well-known/jwks.json"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _cache(url: str, *, refresh_interval: float = 3600.0, retry_interval: float = 30.0) -> JwksCache:
+    """Create a cache for the local server."""
+    return JwksCache(url=url, refresh_interval=refresh_interval, retry_interval=retry_interval, timeout=5)
+
+
+def _expire(cache: JwksCache) -> None:
+    """Make the cached key set stale without waiting for the refresh interval."""
+    cache._fetched_at -= cache.refresh_interval
+
+
+@pytest.fixture
+async def registered_jwks_cache() -> AsyncGenerator[None]:
+    """Ensure no process-wide JWKS cache leaks between tests."""
+    await close_jwks_cache()
+    yield
+    await close_jwks_cache()
+
+
+class TestJwksCache:
+    """Tests for JwksCache."""
+
+    @pytest.mark.asyncio
+    async def test_cold_get_fetches_once(self, jwks_server: JwksServer):
+        """The first get() should fetch the keys and later calls should reuse them."""
+        cache = _cache(jwks_server.url)
+        try:
+            assert await cache.get() == KEYS_V1
+            assert await cache.get() == KEYS_V1
+        finally:
+            await cache.aclose()
+
+        assert jwks_server.request_count == 1
+        assert cache.fetch_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_gets_share_one_fetch(self, jwks_server: JwksServer):
+        """Requests arriving before the keys are cached should wait on a single fetch."""
+        jwks_server.delay = 0.2
+        cache = _cache(jwks_server.url)
+        try:
+            results = await asyncio.gather(*(cache.get() for _ in range(10)))
+        finally:
+            await cache.aclose()
+
+        assert results == [KEYS_V1] * 10
+        assert jwks_server.request_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cold_get_error_propagates(self, jwks_server: JwksServer):
+        """With nothing cached, a failed fetch should raise."""
+        jwks_server.status = 500
+        cache = _cache(jwks_server.url)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await cache.get()
+        finally:
+            await cache.aclose()
+
+    @pytest.mark.asyncio
+    async def test_response_without_keys_rejected(self, jwks_server: JwksServer):
+        """A response that isn't a key set should not be cached."""
+        jwks_server.payload = {"error": "not found"}
+        cache = _cache(jwks_server.url)
+        try:
+            with pytest.raises(ValueError, match="no keys"):
+                await cache.get()
+            assert cache.is_stale
+        finally:
+            await cache.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stale_keys_served_while_refreshing(self, jwks_server: JwksServer):
+        """A stale key set should be returned immediately and replaced in the background."""
+        cache = _cache(jwks_server.url)
+        try:
+            await cache.get()
+            _expire(cache)
+            jwks_server.payload = KEYS_V2
+            jwks_server.delay = 0.2
+
+            started = time.monotonic()
+            assert await cache.get() == KEYS_V1
+            assert time.monotonic() - started < jwks_server.delay
+
+            assert cache._revalidate_task is not None
+            assert await cache._revalidate_task is True
+            assert await cache.get() == KEYS_V2
+            assert not cache.is_stale
+        finally:
+            await cache.aclose()
+
+        assert jwks_server.request_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_gets_share_one_refresh(self, jwks_server: JwksServer):
+        """Concurrent requests for a stale key set should start a single background refresh."""
+        cache = _cache(jwks_server.url)
+        try:
+            await cache.get()
+            _expire(cache)
+            jwks_server.delay = 0.1
+
+            await asyncio.gather(*(cache.get() for _ in range(10)))
+            assert cache._revalidate_task is not None
+            await cache._revalidate_task
+        finally:
+            await cache.aclose()
+
+        assert jwks_server.request_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_previous_keys(self, jwks_server: JwksServer):
+        """If Auth0 is unavailable, the previous key set should keep being served."""
+        cache = _cache(jwks_server.url)
+        try:
+            await cache.get()
+            _expire(cache)
+            jwks_server.status = 503
+
+            assert await cache.get() == KEYS_V1
+            assert cache._revalidate_task is not None
+            assert await cache._revalidate_task is False
+            assert await cache.get() == KEYS_V1
+        finally:
+            await cache.aclose()
+
+    @pytest.mark.asyncio
+    async def test_start_refreshes_in_background(self, jwks_server: JwksServer):
+        """start() should fetch the keys and keep refreshing them until aclose()."""
+        cache = _cache(jwks_server.url, refresh_interval=0.05)
+        try:
+            await cache.start()
+            assert jwks_server.request_count == 1
+
+            jwks_server.payload = KEYS_V2
+            await asyncio.sleep(0.3)
+            assert jwks_server.request_count >= 2
+        finally:
+            await cache.aclose()
+
+        assert cache._jwks == KEYS_V2
+        request_count = jwks_server.request_count
+        await asyncio.sleep(0.1)
+        assert jwks_server.request_count == request_count
+
+    @pytest.mark.asyncio
+    async def test_start_tolerates_unreachable_auth0(self):
+        """Startup should not fail if Auth0 can't be reached."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        cache = _cache(f"http://127.0.0.1:{port}/.well-known/jwks.json")
+        try:
+            await cache.start()
+            assert cache.is_stale
+        finally:
+            await cache.aclose()
+
+
+class TestProcessWideJwksCache:
+    """Tests for the process-wide JWKS cache registration."""
+
+    @pytest.mark.asyncio
+    async def test_init_fetches_keys_and_close_unregisters(self, jwks_server: JwksServer, registered_jwks_cache: None):
+        """init_jwks_cache should register a started cache that get_jwks_cache() returns."""
+        with patch("app.core.jwks.create_jwks_cache", side_effect=lambda: _cache(jwks_server.url)):
+            jwks_cache = await init_jwks_cache()
+
+            assert get_jwks_cache() is jwks_cache
+            assert jwks_server.request_count == 1
+            assert await jwks_cache.get() == KEYS_V1
+
+            await close_jwks_cache()
+
+            assert get_jwks_cache() is not jwks_cache
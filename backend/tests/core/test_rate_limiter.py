@@ -0,0 +1,133 @@
+"""Tests for the Redis sliding-window rate limiter, against the test Redis server."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from app.core.rate_limiter import (
+    SlidingWindowRateLimiter,
+    close_rate_limiter,
+    get_rate_limiter,
+    init_rate_limiter,
+    rate_limit_key,
+)
+from app.services.verification_service import VerificationService
+from sqlalchemy.ext.asyncio import AsyncSession
+
+WINDOW = timedelta(hours=1)
+
+
+def _key() -> str:
+    """Build a rate limit key unique to this test."""
+    return rate_limit_key("test_action", uuid4())
+
+
+@pytest.fixture
+async def registered_rate_limiter() -> AsyncGenerator[None]:
+    """Ensure no process-wide rate limiter leaks between tests."""
+    await close_rate_limiter()
+    yield
+    await close_rate_limiter()
+
+
+def test_rate_limit_key() -> None:
+    """Keys should be namespaced by action and subject."""
+    assert rate_limit_key("verify_code", "abc") == "rate_limit:verify_code:abc"
+
+
+class TestSlidingWindowRateLimiter:
+    """Tests for SlidingWindowRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_counts_recorded_events(self, rate_limiter: SlidingWindowRateLimiter):
+        """Each recorded event should be counted once."""
+        key = _key()
+
+        assert await rate_limiter.count(key, WINDOW) == 0
+        for _ in range(3):
+            await rate_limiter.record(key, WINDOW)
+
+        assert await rate_limiter.count(key, WINDOW) == 3
+
+    @pytest.mark.asyncio
+    async def test_ignores_events_outside_window(self, rate_limiter: SlidingWindowRateLimiter):
+        """Events older than the window should not be counted."""
+        key = _key()
+        async with rate_limiter.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {"two-hours-ago": time.time() - 2 * 3600})
+            await pipe.execute()
+        await rate_limiter.record(key, WINDOW)
+
+        assert await rate_limiter.count(key, WINDOW) == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self, rate_limiter: SlidingWindowRateLimiter):
+        """Events for one key should not count towards another."""
+        key, other_key = _key(), _key()
+        await rate_limiter.record(key, WINDOW)
+
+        assert await rate_limiter.count(other_key, WINDOW) == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_records_until_limit(self, rate_limiter: SlidingWindowRateLimiter):
+        """acquire() should record events until the limit is reached, then refuse without recording."""
+        key = _key()
+
+        results = [await rate_limiter.acquire(key, WINDOW, limit=3) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+        assert await rate_limiter.count(key, WINDOW) == 3
+
+    @pytest.mark.asyncio
+    async def test_acquire_frees_slots_outside_window(self, rate_limiter: SlidingWindowRateLimiter):
+        """Events older than the window should not count towards the limit."""
+        key = _key()
+        async with rate_limiter.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {"two-hours-ago": time.time() - 2 * 3600})
+            await pipe.execute()
+
+        assert await rate_limiter.acquire(key, WINDOW, limit=1)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_do_not_exceed_limit(self, rate_limiter: SlidingWindowRateLimiter):
+        """Concurrent acquire() calls should let exactly limit events through."""
+        key = _key()
+
+        results = await asyncio.gather(*(rate_limiter.acquire(key, WINDOW, limit=3) for _ in range(10)))
+
+        assert results.count(True) == 3
+        assert await rate_limiter.count(key, WINDOW) == 3
+
+    @pytest.mark.asyncio
+    async def test_reset_forgets_events(self, rate_limiter: SlidingWindowRateLimiter):
+        """reset() should clear all events for the key."""
+        key = _key()
+        for _ in range(3):
+            await rate_limiter.record(key, WINDOW)
+
+        await rate_limiter.reset(key)
+
+        assert await rate_limiter.count(key, WINDOW) == 0
+
+
+class TestProcessWideRateLimiter:
+    """Tests for the process-wide rate limiter registration."""
+
+    @pytest.mark.asyncio
+    async def test_init_is_idempotent_and_close_unregisters(
+        self, db_session: AsyncSession, registered_rate_limiter: None
+    ):
+        """init_rate_limiter should register one limiter, picked up by new VerificationService instances."""
+        rate_limiter = init_rate_limiter()
+
+        assert init_rate_limiter() is rate_limiter
+        assert get_rate_limiter() is rate_limiter
+        assert VerificationService(db_session).rate_limiter is rate_limiter
+
+        await close_rate_limiter()
+
+        assert get_rate_limiter() is None
+        assert VerificationService(db_session).rate_limiter is None
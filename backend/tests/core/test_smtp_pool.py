@@ -0,0 +1,259 @@
+"""Tests for the pooled SMTP connections, against a local aiosmtpd server."""
+
+import asyncio
+import socket
+from collections.abc import AsyncGenerator, Generator
+from email.message import EmailMessage
+from unittest.mock import AsyncMock
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, AuthResult, Envelope, LoginPassword, Session
+from app.core.smtp_pool import (
+    SmtpConnectionPool,
+    close_smtp_pool,
+    get_smtp_pool,
+    init_smtp_pool,
+)
+from app.services.email_service import EmailService, OutgoingEmail
+
+REJECTED_RECIPIENT = "rejected@example.com"
+
+
+class RecordingHandler:
+    """aiosmtpd handler that records delivered messages and sessions."""
+
+    def __init__(self) -> None:
+        """Initialize empty records."""
+        self.recipients: list[str] = []
+        self.sessions: set[int] = set()
+
+    async def handle_RCPT(  # noqa: N802  # aiosmtpd hook signature
+        self,
+        server: SMTP,
+        session: Session,
+        envelope: Envelope,
+        address: str,
+        rcpt_options: list[str],
+    ) -> str:
+        """Reject REJECTED_RECIPIENT, accept everyone else."""
+        if address == REJECTED_RECIPIENT:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server: SMTP, session: Session, envelope: Envelope) -> str:  # noqa: N802
+        """Record the delivered message and the session it arrived on."""
+        self.recipients.extend(envelope.rcpt_tos)
+        self.sessions.add(id(session))
+        return "250 Message accepted for delivery"
+
+
+def _authenticator(
+    server: SMTP, session: Session, envelope: Envelope, mechanism: str, auth_data: LoginPassword
+) -> AuthResult:
+    """Accept the test credentials only."""
+    success = auth_data.login == b"user" and auth_data.password == b"secret"
+    # handled=False makes aiosmtpd send the 535 response itself
+    return AuthResult(success=success, handled=False)
+
+
+@pytest.fixture
+def smtp_server() -> Generator[tuple[RecordingHandler, int]]:
+    """Run a local SMTP server with AUTH enabled on a free port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = RecordingHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=_authenticator,
+        auth_require_tls=False,
+    )
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def _pool(
+    port: int, *, password: str = "secret", max_connections: int = 3, idle_timeout: float = 30.0
+) -> SmtpConnectionPool:
+    """Create a pool for the local server."""
+    return SmtpConnectionPool(
+        hostname="127.0.0.1",
+        port=port,
+        username="user",
+        password=password,
+        timeout=5,
+        use_tls=False,
+        start_tls=False,
+        max_connections=max_connections,
+        idle_timeout=idle_timeout,
+    )
+
+
+def _message(to: str) -> EmailMessage:
+    """Build a minimal message."""
+    message = EmailMessage()
+    message["From"] = "alerts@example.com"
+    message["To"] = to
+    message["Subject"] = "Disruption"
+    message.set_content("Victoria line: Severe Delays")
+    return message
+
+
+@pytest.fixture
+async def registered_pool() -> AsyncGenerator[None]:
+    """Ensure no process-wide pool leaks between tests."""
+    await close_smtp_pool()
+    yield
+    await close_smtp_pool()
+
+
+class TestSmtpConnectionPool:
+    """Tests for SmtpConnectionPool."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection(self, smtp_server: tuple[RecordingHandler, int]):
+        """Sequential sends should share one authenticated connection."""
+        handler, port = smtp_server
+        pool = _pool(port)
+        try:
+            for i in range(5):
+                await pool.send_message(_message(f"user{i}@example.com"))
+        finally:
+            await pool.aclose()
+
+        assert len(handler.recipients) == 5
+        assert len(handler.sessions) == 1
+        assert pool.stats.connections_opened == 1
+        assert pool.stats.messages_sent == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_bounded(self, smtp_server: tuple[RecordingHandler, int]):
+        """Concurrent sends should open at most max_connections connections."""
+        handler, port = smtp_server
+        pool = _pool(port, max_connections=2)
+        try:
+            await asyncio.gather(*(pool.send_message(_message(f"user{i}@example.com")) for i in range(10)))
+        finally:
+            await pool.aclose()
+
+        assert len(handler.recipients) == 10
+        assert pool.stats.connections_opened <= 2
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_replaced(self, smtp_server: tuple[RecordingHandler, int]):
+        """Connections idle past the timeout should be closed and replaced."""
+        handler, port = smtp_server
+        pool = _pool(port, idle_timeout=0.0)
+        try:
+            await pool.send_message(_message("first@example.com"))
+            await asyncio.sleep(0.01)
+            await pool.send_message(_message("second@example.com"))
+        finally:
+            await pool.aclose()
+
+        assert handler.recipients == ["first@example.com", "second@example.com"]
+        assert pool.stats.connections_opened == 2
+        assert pool.stats.reconnects == 0
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_pooled_connection_lost(
+        self,
+        smtp_server: tuple[RecordingHandler, int],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """A pooled connection the server dropped should be replaced and the message resent."""
+        handler, port = smtp_server
+        pool = _pool(port)
+        try:
+            await pool.send_message(_message("first@example.com"))
+            stale, _released_at = pool._idle[-1]
+            monkeypatch.setattr(
+                stale, "send_message", AsyncMock(side_effect=aiosmtplib.SMTPServerDisconnected("Connection lost"))
+            )
+
+            await pool.send_message(_message("second@example.com"))
+        finally:
+            await pool.aclose()
+
+        assert handler.recipients == ["first@example.com", "second@example.com"]
+        assert pool.stats.reconnects == 1
+        assert pool.stats.connections_opened == 2
+
+    @pytest.mark.asyncio
+    async def test_rejected_message_keeps_connection(self, smtp_server: tuple[RecordingHandler, int]):
+        """A rejected recipient should fail that message but keep the connection pooled."""
+        handler, port = smtp_server
+        pool = _pool(port)
+        try:
+            with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+                await pool.send_message(_message(REJECTED_RECIPIENT))
+            await pool.send_message(_message("ok@example.com"))
+        finally:
+            await pool.aclose()
+
+        assert handler.recipients == ["ok@example.com"]
+        assert pool.stats.connections_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_login_failure(self, smtp_server: tuple[RecordingHandler, int]):
+        """Authentication failures should propagate and leave nothing pooled."""
+        _handler, port = smtp_server
+        pool = _pool(port, password="wrong")
+        try:
+            with pytest.raises(aiosmtplib.SMTPAuthenticationError):
+                await pool.send_message(_message("user@example.com"))
+        finally:
+            await pool.aclose()
+
+        assert pool._idle == []
+        assert pool.stats.connections_opened == 0
+
+
+class TestEmailServiceBatch:
+    """Tests for EmailService.send_emails() over a pool."""
+
+    @pytest.mark.asyncio
+    async def test_send_emails_shares_connections(self, smtp_server: tuple[RecordingHandler, int]):
+        """A batch should go out over the pool and report per-email failures."""
+        handler, port = smtp_server
+        pool = _pool(port, max_connections=2)
+        service = EmailService(smtp_pool=pool)
+        emails = [
+            OutgoingEmail(to=to, subject="Disruption", html_content="<p>Delays</p>", text_content="Delays")
+            for to in ("a@example.com", REJECTED_RECIPIENT, "b@example.com")
+        ]
+        try:
+            errors = await service.send_emails(emails)
+        finally:
+            await pool.aclose()
+
+        assert errors[0] is None
+        assert isinstance(errors[1], aiosmtplib.SMTPRecipientsRefused)
+        assert errors[2] is None
+        assert sorted(handler.recipients) == ["a@example.com", "b@example.com"]
+        assert pool.stats.connections_opened <= 2
+
+
+class TestProcessWideSmtpPool:
+    """Tests for the process-wide pool registration."""
+
+    @pytest.mark.asyncio
+    async def test_init_is_idempotent_and_close_unregisters(self, registered_pool: None):
+        """init_smtp_pool should register one pool, picked up by new EmailService instances."""
+        pool = init_smtp_pool()
+
+        assert init_smtp_pool() is pool
+        assert get_smtp_pool() is pool
+        assert EmailService().smtp_pool is pool
+
+        await close_smtp_pool()
+
+        assert get_smtp_pool() is None
+        assert EmailService().smtp_pool is None
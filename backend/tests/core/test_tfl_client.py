@@ -0,0 +1,164 @@
+"""Tests for the application-scoped TfL clients and cache."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from app.core import tfl_client
+from app.core.tfl_client import (
+    CountingConnectionPool,
+    PooledAsyncHttpxClient,
+    close_tfl_resources,
+    create_tfl_resources,
+    get_tfl_resources,
+    init_tfl_resources,
+)
+from app.services.tfl_service import TfLService
+
+
+@pytest.fixture
+async def registered_resources() -> AsyncGenerator[None]:
+    """Ensure no process-wide resources leak between tests."""
+    await close_tfl_resources()
+    yield
+    await close_tfl_resources()
+
+
+class TestPooledAsyncHttpxClient:
+    """Tests for PooledAsyncHttpxClient."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_httpx_client(self):
+        """Should send every request through the same keep-alive client and count them."""
+        client = PooledAsyncHttpxClient(max_connections=5, keepalive_expiry=30)
+        mock_get = AsyncMock(return_value=httpx.Response(200, json=[]))
+        try:
+            with patch.object(client._client, "get", mock_get):
+                await client.get("https://api.tfl.gov.uk/Line/Mode/tube")
+                await client.get("https://api.tfl.gov.uk/Line/Mode/dlr", timeout=5)
+
+            assert mock_get.call_count == 2
+            assert mock_get.call_args_list[0].kwargs["timeout"] == 30
+            assert mock_get.call_args_list[1].kwargs["timeout"] == 5
+            assert client.stats.requests == 2
+        finally:
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_counts_connections_from_trace_events(self):
+        """Should count new TCP connections and TLS handshakes only."""
+        client = PooledAsyncHttpxClient(max_connections=5, keepalive_expiry=30)
+        try:
+            await client._trace("connection.connect_tcp.complete", {})
+            await client._trace("connection.start_tls.complete", {})
+            await client._trace("http11.send_request_headers.complete", {})
+
+            assert client.stats.connections_opened == 1
+            assert client.stats.tls_handshakes == 1
+        finally:
+            await client.aclose()
+
+
+class TestCountingConnectionPool:
+    """Tests for CountingConnectionPool."""
+
+    def test_counts_created_connections(self):
+        """Should count each connection the pool creates."""
+        pool = CountingConnectionPool(host="localhost", port=6379)
+
+        pool.make_connection()
+        pool.make_connection()
+
+        assert pool.connections_created == 2
+
+
+class TestTfLResources:
+    """Tests for TfLResources lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_http_backend(self):
+        """Line and stop point clients should share one pooled HTTP backend."""
+        resources = create_tfl_resources()
+        try:
+            assert resources.line_client.client.http_client is resources.http_client
+            assert resources.stoppoint_client.client.http_client is resources.http_client
+            assert resources.stats() == {
+                "http_requests": 0,
+                "http_connections_opened": 0,
+                "http_tls_handshakes": 0,
+                "redis_connections_created": 0,
+            }
+        finally:
+            await resources.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_calls_beyond_pool_size_wait_for_connection(self):
+        """Concurrent cache calls beyond the Redis pool size should wait for a connection, not fail."""
+        with patch.object(tfl_client.settings, "TFL_REDIS_POOL_MAX_SIZE", 2):
+            resources = create_tfl_resources()
+        key = f"pool-test:{uuid4()}"
+        try:
+            results = await asyncio.gather(*(resources.cache.remote.get(key) for _ in range(10)))
+
+            assert results == [None] * 10
+            assert resources.stats()["redis_connections_created"] == 2
+        finally:
+            await resources.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("registered_resources")
+    async def test_init_is_idempotent_and_close_unregisters(self):
+        """Should register one instance until closed."""
+        assert get_tfl_resources() is None
+
+        resources = init_tfl_resources()
+
+        assert init_tfl_resources() is resources
+        assert get_tfl_resources() is resources
+
+        await close_tfl_resources()
+
+        assert get_tfl_resources() is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_init_is_noop(self):
+        """Should not fail when nothing is registered."""
+        with patch.object(tfl_client, "_tfl_resources", None):
+            await close_tfl_resources()
+
+
+class TestTfLServiceResources:
+    """Tests for TfLService picking up shared resources."""
+
+    def test_uses_explicit_resources(self):
+        """Should use the clients and cache of the resources passed in."""
+        resources = MagicMock()
+
+        service = TfLService(db=MagicMock(), resources=resources)
+
+        assert service.line_client is resources.line_client
+        assert service.stoppoint_client is resources.stoppoint_client
+        assert service.cache is resources.cache
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("registered_resources")
+    async def test_uses_registered_resources(self):
+        """Should default to the process-wide resources when registered."""
+        resources = init_tfl_resources()
+
+        first = TfLService(db=MagicMock())
+        second = TfLService(db=MagicMock())
+
+        assert first.line_client is second.line_client is resources.line_client
+        assert first.cache is second.cache is resources.cache
+
+    def test_creates_own_clients_without_resources(self):
+        """Should fall back to per-instance clients when nothing is registered."""
+        with patch.object(tfl_client, "_tfl_resources", None):
+            first = TfLService(db=MagicMock())
+            second = TfLService(db=MagicMock())
+
+        assert first.line_client is not second.line_client
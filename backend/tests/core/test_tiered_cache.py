@@ -0,0 +1,284 @@
+"""Tests for the two-tier (process-local + Redis) cache."""
+
+import copy
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from app.core.tiered_cache import (
+    CACHE_VERSION_KEY,
+    LocalTTLCache,
+    TieredCache,
+    clear_local_caches,
+    create_tiered_cache,
+    get_local_cache,
+)
+
+
+@pytest.fixture
+def remote() -> AsyncMock:
+    """
+    Mock aiocache remote cache backed by a dict (TTLs in ms recorded in `pttls`, -1 = no expiry).
+
+    Values are stored as copies, like the pickling Redis cache.
+    """
+    store: dict[str, object] = {}
+    pttls: dict[str, int] = {}
+    cache = AsyncMock()
+
+    async def _get(key: str) -> object | None:
+        return store.get(key)
+
+    async def _set(key: str, value: object, ttl: int | None = None) -> bool:
+        store[key] = copy.deepcopy(value)
+        pttls[key] = ttl * 1000 if ttl else -1
+        return True
+
+    async def _add(key: str, value: object, ttl: int | None = None) -> bool:
+        if key in store:
+            msg = f"Key {key} already exists"
+            raise ValueError(msg)
+        return await _set(key, value, ttl)
+
+    async def _delete(key: str) -> int:
+        pttls.pop(key, None)
+        return 1 if store.pop(key, None) is not None else 0
+
+    async def _raw(command: str, key: str) -> int:
+        assert command == "pttl"
+        return pttls.get(key, -1) if key in store else -2
+
+    cache.get = AsyncMock(side_effect=_get)
+    cache.set = AsyncMock(side_effect=_set)
+    cache.add = AsyncMock(side_effect=_add)
+    cache.delete = AsyncMock(side_effect=_delete)
+    cache.raw = AsyncMock(side_effect=_raw)
+    cache.build_key = lambda key: key
+    cache.store = store
+    cache.pttls = pttls
+    return cache
+
+
+def _tiered(remote: AsyncMock, local: LocalTTLCache | None = None, check_interval: float = 60) -> TieredCache:
+    """Build a TieredCache with a long version check interval unless specified."""
+    return TieredCache(
+        remote=remote,
+        local=local or LocalTTLCache(max_entries=10),
+        local_ttl=30,
+        version_check_interval=check_interval,
+    )
+
+
+class TestLocalTTLCache:
+    """Tests for LocalTTLCache."""
+
+    def test_get_set(self):
+        """Should return stored values and count hits/misses."""
+        local = LocalTTLCache(max_entries=10)
+        local.set("a", [1, 2], ttl=30)
+
+        assert local.get("a") == [1, 2]
+        assert local.get("b") is None
+        assert (local.hits, local.misses) == (1, 1)
+
+    def test_expired_entries_are_dropped(self):
+        """Should not return entries past their TTL."""
+        local = LocalTTLCache(max_entries=10)
+        with patch("app.core.tiered_cache.time.monotonic", return_value=100.0):
+            local.set("a", "value", ttl=5)
+        with patch("app.core.tiered_cache.time.monotonic", return_value=105.0):
+            assert local.get("a") is None
+        assert len(local) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used entry beyond max_entries."""
+        local = LocalTTLCache(max_entries=2)
+        local.set("a", 1, ttl=30)
+        local.set("b", 2, ttl=30)
+        local.get("a")
+        local.set("c", 3, ttl=30)
+
+        assert local.get("a") == 1
+        assert local.get("b") is None
+        assert local.get("c") == 3
+
+    def test_non_positive_ttl_skips_caching(self):
+        """Should not store entries with a zero TTL."""
+        local = LocalTTLCache(max_entries=10)
+        local.set("a", 1, ttl=0)
+
+        assert len(local) == 0
+
+
+class TestTieredCache:
+    """Tests for TieredCache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_served_locally(self, remote: AsyncMock):
+        """Should read the value from Redis once, then from process memory."""
+        remote.store["line_disruptions:modes:tube"] = ["disruption"]
+        cache = _tiered(remote)
+
+        first = await cache.get("line_disruptions:modes:tube")
+        second = await cache.get("line_disruptions:modes:tube")
+
+        assert first == ["disruption"]
+        assert second is first
+        remote_keys = [call.args[0] for call in remote.get.call_args_list]
+        assert remote_keys.count("line_disruptions:modes:tube") == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_is_not_cached_locally(self, remote: AsyncMock):
+        """Should keep asking Redis for keys that aren't cached."""
+        cache = _tiered(remote)
+
+        assert await cache.get("stations:all") is None
+        assert await cache.get("stations:all") is None
+
+        remote_keys = [call.args[0] for call in remote.get.call_args_list]
+        assert remote_keys.count("stations:all") == 2
+
+    @pytest.mark.asyncio
+    async def test_set_new_key_writes_remote_without_bumping_version(self, remote: AsyncMock):
+        """Should write a new key through to Redis, leaving the version token alone."""
+        cache = _tiered(remote)
+
+        await cache.set("stations:all", ["station"], ttl=600)
+
+        assert remote.store["stations:all"] == ["station"]
+        assert CACHE_VERSION_KEY not in remote.store
+        assert await cache.get("stations:all") == ["station"]
+
+    @pytest.mark.asyncio
+    async def test_set_does_not_keep_callers_object_locally(self, remote: AsyncMock):
+        """Should serve the copy decoded from Redis, unaffected by later changes to the caller's object."""
+        cache = _tiered(remote)
+        lines = [{"tfl_id": "victoria", "route_variants": None}]
+
+        await cache.set("lines:all", lines, ttl=600)
+        lines[0]["route_variants"] = {"routes": ["mutated"]}
+
+        cached = await cache.get("lines:all")
+        assert cached == [{"tfl_id": "victoria", "route_variants": None}]
+        assert cached is not lines
+        assert await cache.get("lines:all") is cached
+
+    @pytest.mark.asyncio
+    async def test_set_drops_stale_local_copy(self, remote: AsyncMock):
+        """Should stop serving this process's old local copy after overwriting a key."""
+        remote.store["stations:all"] = ["old"]
+        cache = _tiered(remote)
+        assert await cache.get("stations:all") == ["old"]
+
+        await cache.set("stations:all", ["new"], ttl=600)
+
+        assert await cache.get("stations:all") == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_overwrite_bumps_version(self, remote: AsyncMock):
+        """Should replace the version token when overwriting an existing key."""
+        remote.store["stations:all"] = ["old"]
+        cache = _tiered(remote)
+
+        await cache.set("stations:all", ["new"], ttl=600)
+
+        assert remote.store["stations:all"] == ["new"]
+        assert CACHE_VERSION_KEY in remote.store
+
+    @pytest.mark.asyncio
+    async def test_delete_of_missing_key_keeps_version(self, remote: AsyncMock):
+        """Should not replace the version token when nothing was deleted."""
+        cache = _tiered(remote)
+
+        assert await cache.delete("stations:all") == 0
+        assert CACHE_VERSION_KEY not in remote.store
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_local_entry(self, remote: AsyncMock):
+        """Should delete from Redis and stop serving the local copy."""
+        cache = _tiered(remote)
+        await cache.set("stations:all", ["station"], ttl=600)
+
+        await cache.delete("stations:all")
+
+        assert await cache.get("stations:all") is None
+
+    @pytest.mark.asyncio
+    async def test_write_in_other_process_invalidates_local_tier(self, remote: AsyncMock):
+        """Should drop local entries when another process changes the version token."""
+        local = LocalTTLCache(max_entries=10)
+        reader = _tiered(remote, local, check_interval=0)
+        writer = _tiered(remote, LocalTTLCache(max_entries=10), check_interval=0)
+        remote.store["stations:all"] = ["old"]
+        assert await reader.get("stations:all") == ["old"]
+
+        await writer.set("stations:all", ["new"], ttl=600)
+
+        assert await reader.get("stations:all") == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_new_key_in_other_process_keeps_local_tier(self, remote: AsyncMock):
+        """Should keep serving local entries when another process writes an unrelated new key."""
+        reader = _tiered(remote, check_interval=0)
+        remote.store["stations:all"] = ["station"]
+        assert await reader.get("stations:all") == ["station"]
+
+        await _tiered(remote, check_interval=0).set("lines:all", ["line"], ttl=600)
+
+        assert await reader.get("stations:all") == ["station"]
+        remote_keys = [call.args[0] for call in remote.get.call_args_list]
+        assert remote_keys.count("stations:all") == 1
+
+    @pytest.mark.asyncio
+    async def test_local_copy_capped_at_remaining_remote_ttl(self, remote: AsyncMock):
+        """Should not keep a remote value locally for longer than it has left in Redis."""
+        remote.store["stations:all"] = ["station"]
+        remote.pttls["stations:all"] = 5000
+        cache = _tiered(remote)
+
+        with patch("app.core.tiered_cache.time.monotonic", return_value=100.0):
+            assert await cache.get("stations:all") == ["station"]
+        with patch("app.core.tiered_cache.time.monotonic", return_value=105.0):
+            assert cache.local.get("stations:all") is None
+
+    @pytest.mark.asyncio
+    async def test_version_checked_at_most_once_per_interval(self, remote: AsyncMock):
+        """Should not read the version token on every local hit."""
+        remote.store["stations:all"] = ["station"]
+        cache = _tiered(remote, check_interval=60)
+
+        for _ in range(5):
+            await cache.get("stations:all")
+
+        remote_keys = [call.args[0] for call in remote.get.call_args_list]
+        assert remote_keys.count(CACHE_VERSION_KEY) == 1
+
+    @pytest.mark.asyncio
+    async def test_local_tier_disabled_with_zero_ttl(self, remote: AsyncMock):
+        """Should read straight from Redis when the local TTL is 0."""
+        remote.store["stations:all"] = ["station"]
+        cache = TieredCache(remote=remote, local=LocalTTLCache(10), local_ttl=0, version_check_interval=1)
+
+        await cache.get("stations:all")
+        await cache.get("stations:all")
+
+        remote_keys = [call.args[0] for call in remote.get.call_args_list]
+        assert remote_keys == ["stations:all", "stations:all"]
+
+
+class TestLocalCacheRegistry:
+    """Tests for get_local_cache() and create_tiered_cache()."""
+
+    def test_instances_share_local_tier_per_namespace(self, remote: AsyncMock):
+        """TieredCaches for the same namespace should share one process-local tier."""
+        first = create_tiered_cache(remote, "tfl")
+        second = create_tiered_cache(remote, "tfl")
+
+        assert first.local is second.local
+        assert first.local is not get_local_cache("other")
+
+    def test_clear_local_caches(self):
+        """Should give a fresh local tier after clearing."""
+        local = get_local_cache("tfl")
+        clear_local_caches()
+
+        assert get_local_cache("tfl") is not local
@@ -0,0 +1,107 @@
+"""Tests for per-cycle alert state batching (app/helpers/alert_state_batch.py)."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from app.helpers.alert_state_batch import ALERTED_LINES_KEY, AlertStateBatch, get_alert_state_key
+
+
+def test_get_alert_state_key() -> None:
+    """Test that the key combines route, user and schedule IDs."""
+    route_id, user_id, schedule_id = uuid4(), uuid4(), uuid4()
+
+    assert get_alert_state_key(route_id, user_id, schedule_id) == f"alert:{route_id}:{user_id}:{schedule_id}"
+
+
+class TestAlertStateBatch:
+    """Test AlertStateBatch reads and writes."""
+
+    @pytest.mark.asyncio
+    async def test_load_reads_keys_in_one_mget(self, stateful_mock_redis: AsyncMock) -> None:
+        """Test that loaded keys are served from memory."""
+        await stateful_mock_redis.set("alert:a", "state-a")
+        batch = AlertStateBatch(stateful_mock_redis)
+
+        await batch.load(["alert:a", "alert:b", "alert:a"])
+
+        stateful_mock_redis.mget.assert_awaited_once_with(["alert:a", "alert:b"])
+        assert await batch.get("alert:a") == "state-a"
+        assert await batch.get("alert:b") is None
+        stateful_mock_redis.mget.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_load_skips_loaded_keys(self, mock_redis: AsyncMock) -> None:
+        """Test that keys already in the batch are not read again."""
+        batch = AlertStateBatch(mock_redis)
+        await batch.load(["alert:a"])
+
+        await batch.load(["alert:a"])
+
+        mock_redis.mget.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_falls_back_to_single_read(self, mock_redis: AsyncMock) -> None:
+        """Test that a key not loaded up front is read individually, once."""
+        mock_redis.get = AsyncMock(return_value="state")
+        batch = AlertStateBatch(mock_redis)
+
+        assert await batch.get("alert:late") == "state"
+        assert await batch.get("alert:late") == "state"
+
+        mock_redis.get.assert_awaited_once_with("alert:late")
+
+    @pytest.mark.asyncio
+    async def test_writes_visible_before_flush(self, mock_redis: AsyncMock) -> None:
+        """Test that writes are served by get() but not sent to Redis until flush()."""
+        batch = AlertStateBatch(mock_redis)
+        await batch.load(["alert:a", "alert:b"])
+
+        batch.setex("alert:a", 60, "new-state")
+        batch.delete("alert:b")
+
+        assert await batch.get("alert:a") == "new-state"
+        assert await batch.get("alert:b") is None
+        mock_redis.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_changes_in_one_pipeline(self, stateful_mock_redis: AsyncMock) -> None:
+        """Test that flush() sends every pending write and delete in one pipeline."""
+        await stateful_mock_redis.set("alert:b", "old-state")
+        batch = AlertStateBatch(stateful_mock_redis)
+        batch.setex("alert:a", 60, "first")
+        batch.setex("alert:a", 60, "second")
+        batch.delete("alert:b")
+
+        written = await batch.flush()
+
+        assert written == 2
+        stateful_mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert await stateful_mock_redis.get("alert:a") == "second"
+        assert await stateful_mock_redis.get("alert:b") is None
+
+    @pytest.mark.asyncio
+    async def test_flush_without_changes(self, mock_redis: AsyncMock) -> None:
+        """Test that flush() with nothing pending doesn't touch Redis."""
+        batch = AlertStateBatch(mock_redis)
+
+        assert await batch.flush() == 0
+        assert await batch.flush() == 0
+
+        mock_redis.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_records_alerted_lines_with_latest_expiry(self, stateful_mock_redis: AsyncMock) -> None:
+        """Test that alerted lines are written with their latest expiry, never lowering a stored one."""
+        await stateful_mock_redis.zadd(ALERTED_LINES_KEY, {"northern": 5000.0})
+        batch = AlertStateBatch(stateful_mock_redis)
+        batch.setex("alert:a", 60, "state")
+        batch.record_alerted_lines(["victoria", "northern"], 2000.0)
+        batch.record_alerted_lines(["victoria"], 3000.0)
+        batch.record_alerted_lines(["victoria"], 1000.0)
+
+        await batch.flush()
+
+        stateful_mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert await stateful_mock_redis.zrangebyscore(ALERTED_LINES_KEY, 3000.0, 3000.0) == ["victoria"]
+        assert await stateful_mock_redis.zrangebyscore(ALERTED_LINES_KEY, 5000.0, 5000.0) == ["northern"]
@@ -0,0 +1,44 @@
+"""Tests for verified token cache helpers (app/helpers/auth_tokens.py)."""
+
+from app.helpers.auth_tokens import get_token_cache_ttl, hash_token, index_jwks_keys
+
+
+def test_hash_token() -> None:
+    """Test that tokens hash to stable, distinct digests that do not contain the token."""
+    assert hash_token("token-a") == hash_token("token-a")
+    assert hash_token("token-a") != hash_token("token-b")
+    assert len(hash_token("token-a")) == 64
+    assert "token-a" not in hash_token("token-a")
+
+
+def test_get_token_cache_ttl_capped_by_max_ttl() -> None:
+    """Test that a long-lived token is cached for the configured TTL."""
+    assert get_token_cache_ttl({"exp": 1_086_400}, now=1_000_000, max_ttl=60) == 60
+
+
+def test_get_token_cache_ttl_capped_by_exp() -> None:
+    """Test that a token about to expire is only cached until it expires."""
+    assert get_token_cache_ttl({"exp": 1_000_030}, now=1_000_000, max_ttl=60) == 30
+
+
+def test_get_token_cache_ttl_not_cacheable() -> None:
+    """Test that expired tokens and tokens without a numeric exp are not cached."""
+    assert get_token_cache_ttl({"exp": 999_990}, now=1_000_000, max_ttl=60) == 0
+    assert get_token_cache_ttl({}, now=1_000_000, max_ttl=60) == 0
+    assert get_token_cache_ttl({"exp": "1000030"}, now=1_000_000, max_ttl=60) == 0
+    assert get_token_cache_ttl({"exp": True}, now=1_000_000, max_ttl=60) == 0
+
+
+def test_index_jwks_keys() -> None:
+    """Test that keys are indexed by kid, skipping keys without one and keeping the first duplicate."""
+    first = {"kid": "key-1", "n": "first"}
+    jwks = {"keys": [first, {"kid": "key-2"}, {"n": "no-kid"}, {"kid": "key-1", "n": "duplicate"}]}
+
+    keys = index_jwks_keys(jwks)
+
+    assert keys == {"key-1": first, "key-2": {"kid": "key-2"}}
+
+
+def test_index_jwks_keys_empty() -> None:
+    """Test that a JWKS without keys gives an empty index."""
+    assert index_jwks_keys({}) == {}
@@ -0,0 +1,39 @@
+"""Tests for the per-cycle contact snapshot (app/helpers/contact_snapshot.py)."""
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+from app.helpers.contact_snapshot import ContactSnapshot, collect_preference_target_ids
+from app.models.notification import NotificationPreference
+
+
+def _make_pref(target_email_id: object = None, target_phone_id: object = None) -> Mock:
+    pref = Mock(spec=NotificationPreference)
+    pref.target_email_id = target_email_id
+    pref.target_phone_id = target_phone_id
+    return pref
+
+
+def test_collect_preference_target_ids() -> None:
+    """Test that email and phone targets are collected once each, skipping missing targets."""
+    email_id, phone_id = uuid4(), uuid4()
+    prefs = [
+        _make_pref(target_email_id=email_id),
+        _make_pref(target_email_id=email_id),
+        _make_pref(target_phone_id=phone_id),
+        _make_pref(),
+    ]
+
+    assert collect_preference_target_ids(prefs) == ({email_id}, {phone_id})
+
+
+def test_collect_preference_target_ids_empty() -> None:
+    """Test that no preferences give no targets."""
+    assert collect_preference_target_ids([]) == (set(), set())
+
+
+def test_contact_snapshot_len() -> None:
+    """Test that the snapshot length counts emails and phones, including missing ones."""
+    snapshot = ContactSnapshot(emails={uuid4(): "user@example.com"}, phones={uuid4(): None})
+
+    assert len(snapshot) == 2
@@ -5,6 +5,7 @@ This module tests pure helper functions extracted to backend/app/helpers/disrupt
 - disruption_affects_route()
 - calculate_affected_segments()
 - calculate_affected_stations()
+- create_disruption_set_hash()
 
 These tests follow ADR 10 testing patterns and achieve 100% branch and statement coverage.
 """
@@ -16,6 +17,7 @@ import pytest
 from app.helpers.disruption_helpers import (
     calculate_affected_segments,
     calculate_affected_stations,
+    create_disruption_set_hash,
     disruption_affects_route,
     extract_line_station_pairs,
 )
@@ -968,6 +970,54 @@ class TestCalculateAffectedStations:
 # ==================== Integration Tests ====================
 
 
+class TestCreateDisruptionSetHash:
+    """Test create_disruption_set_hash function."""
+
+    @staticmethod
+    def _disruption(line_id: str, line_name: str, status: str, reason: str | None = None) -> DisruptionResponse:
+        return DisruptionResponse(
+            line_id=line_id,
+            line_name=line_name,
+            mode="tube",
+            status_severity=6,
+            status_severity_description=status,
+            reason=reason,
+        )
+
+    def test_same_disruptions_same_hash(self) -> None:
+        """Test that equal disruption sets hash equally."""
+        first = [self._disruption("victoria", "Victoria", "Severe Delays", "Signal failure")]
+        second = [self._disruption("victoria", "Victoria", "Severe Delays", "Signal failure")]
+
+        assert create_disruption_set_hash(first) == create_disruption_set_hash(second)
+
+    def test_changed_reason_changes_hash(self) -> None:
+        """Test that a different reason produces a different hash."""
+        first = [self._disruption("victoria", "Victoria", "Severe Delays", "Signal failure")]
+        second = [self._disruption("victoria", "Victoria", "Severe Delays", "Customer incident")]
+
+        assert create_disruption_set_hash(first) != create_disruption_set_hash(second)
+
+    def test_line_name_changes_hash(self) -> None:
+        """Test that the line name is part of the hash (it is shown to users)."""
+        first = [self._disruption("elizabeth", "Elizabeth line", "Minor Delays")]
+        second = [self._disruption("elizabeth", "Elizabeth", "Minor Delays")]
+
+        assert create_disruption_set_hash(first) != create_disruption_set_hash(second)
+
+    def test_line_order_changes_hash(self) -> None:
+        """Test that line order is part of the hash (it is the order lines are shown in)."""
+        victoria = self._disruption("victoria", "Victoria", "Severe Delays")
+        northern = self._disruption("northern", "Northern", "Minor Delays")
+
+        assert create_disruption_set_hash([victoria, northern]) != create_disruption_set_hash([northern, victoria])
+
+    def test_empty_list(self) -> None:
+        """Test that an empty disruption list hashes consistently."""
+        assert create_disruption_set_hash([]) == create_disruption_set_hash([])
+        assert len(create_disruption_set_hash([])) == 64
+
+
 class TestIntegration:
     """Integration tests combining multiple functions."""
 
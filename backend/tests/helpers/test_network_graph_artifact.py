@@ -0,0 +1,116 @@
+"""
+Unit tests for the network graph artifact helpers.
+
+All functions are pure, so no database or cache is needed.
+"""
+
+import json
+import pickle
+import random
+
+from app.helpers.network_graph_artifact import (
+    build_network_graph_artifact,
+    decompress_network_graph,
+    etag_matches,
+)
+from app.types.tfl_api import NetworkConnection
+
+
+def _connection(station_tfl_id: str, line_tfl_id: str = "victoria") -> NetworkConnection:
+    """Build a NetworkConnection for tests."""
+    return NetworkConnection(
+        station_id=f"id-{station_tfl_id}",
+        station_tfl_id=station_tfl_id,
+        station_name=station_tfl_id,
+        line_id=f"id-{line_tfl_id}",
+        line_tfl_id=line_tfl_id,
+        line_name=line_tfl_id.title(),
+    )
+
+
+class TestBuildNetworkGraphArtifact:
+    """Tests for build_network_graph_artifact()."""
+
+    def test_round_trips_graph(self):
+        """Decompressed body should be the graph as JSON."""
+        graph = {"940GZZLUVIC": [_connection("940GZZLUGPK")]}
+
+        artifact = build_network_graph_artifact(graph)
+
+        data = json.loads(decompress_network_graph(artifact))
+        assert data == {"940GZZLUVIC": [graph["940GZZLUVIC"][0].model_dump()]}
+        assert artifact.stations_count == 1
+
+    def test_accepts_plain_dicts(self):
+        """Should accept connections as dicts as well as models."""
+        model_graph = {"940GZZLUVIC": [_connection("940GZZLUGPK")]}
+        dict_graph = {"940GZZLUVIC": [_connection("940GZZLUGPK").model_dump()]}
+
+        assert build_network_graph_artifact(model_graph).etag == build_network_graph_artifact(dict_graph).etag
+
+    def test_etag_is_deterministic(self):
+        """Same graph in a different insertion order should give the same ETag and bytes."""
+        first = build_network_graph_artifact(
+            {"940GZZLUVIC": [_connection("940GZZLUGPK")], "940GZZLUGPK": [_connection("940GZZLUOXC")]}
+        )
+        second = build_network_graph_artifact(
+            {"940GZZLUGPK": [_connection("940GZZLUOXC")], "940GZZLUVIC": [_connection("940GZZLUGPK")]}
+        )
+
+        assert first.etag == second.etag
+        assert first.gzip_body == second.gzip_body
+
+    def test_etag_ignores_connection_order(self):
+        """Each station's connections in a shuffled order should give the same ETag and bytes."""
+        connections = [
+            _connection("940GZZLUGPK"),
+            _connection("940GZZLUWRR", "northern"),
+            _connection("940GZZLUTCR", "central"),
+            _connection("940GZZLUBST", "bakerloo"),
+            _connection("940GZZLUOXC", "northern"),
+        ]
+        shuffled = connections.copy()
+        random.Random(42).shuffle(shuffled)
+        assert shuffled != connections
+
+        first = build_network_graph_artifact({"940GZZLUOXC": connections})
+        second = build_network_graph_artifact({"940GZZLUOXC": list(reversed(connections))})
+        third = build_network_graph_artifact({"940GZZLUOXC": shuffled})
+
+        assert first.etag == second.etag == third.etag
+        assert first.gzip_body == second.gzip_body == third.gzip_body
+
+    def test_etag_changes_with_graph(self):
+        """Different graphs should give different ETags."""
+        first = build_network_graph_artifact({"940GZZLUVIC": [_connection("940GZZLUGPK")]})
+        second = build_network_graph_artifact({"940GZZLUVIC": [_connection("940GZZLUGPK", "northern")]})
+
+        assert first.etag != second.etag
+
+    def test_is_picklable(self):
+        """Artifact should survive the pickle round-trip used by the Redis cache."""
+        artifact = build_network_graph_artifact({"940GZZLUVIC": [_connection("940GZZLUGPK")]})
+
+        assert pickle.loads(pickle.dumps(artifact)) == artifact
+
+
+class TestEtagMatches:
+    """Tests for etag_matches()."""
+
+    def test_exact_match(self):
+        """Should match the same quoted ETag."""
+        assert etag_matches('"abc"', '"abc"') is True
+
+    def test_no_header(self):
+        """Should not match when If-None-Match is absent or empty."""
+        assert etag_matches(None, '"abc"') is False
+        assert etag_matches("", '"abc"') is False
+
+    def test_list_and_weak_validators(self):
+        """Should match any entry in a list, including weak validators."""
+        assert etag_matches('"old", W/"abc"', '"abc"') is True
+        assert etag_matches('"old", "older"', '"abc"') is False
+
+    def test_wildcard(self):
+        """Should match "*"."""
+        assert etag_matches("*", '"abc"') is True
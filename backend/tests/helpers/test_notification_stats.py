@@ -0,0 +1,59 @@
+"""Tests for notification count helpers (app/helpers/notification_stats.py)."""
+
+from datetime import UTC, date, datetime
+
+from app.helpers.notification_stats import (
+    NotificationCountRow,
+    NotificationCounts,
+    get_live_counts_start,
+    summarize_notification_counts,
+)
+from app.models.notification import NotificationMethod, NotificationStatus
+
+
+def test_get_live_counts_start() -> None:
+    """Test that live counts start at midnight UTC after the last rolled-up day."""
+    assert get_live_counts_start(date(2025, 1, 6)) == datetime(2025, 1, 7, tzinfo=UTC)
+    assert get_live_counts_start(date(2024, 12, 31)) == datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def test_get_live_counts_start_empty_rollup() -> None:
+    """Test that an empty rollup means counting the whole log."""
+    assert get_live_counts_start(None) is None
+
+
+def test_summarize_notification_counts() -> None:
+    """Test that rows for the same method and status from the rollup and live log are added."""
+    rows = [
+        # Rollup
+        NotificationCountRow(NotificationMethod.EMAIL, NotificationStatus.SENT, total=10, recent=4),
+        NotificationCountRow(NotificationMethod.SMS, NotificationStatus.FAILED, total=3, recent=0),
+        NotificationCountRow(NotificationMethod.SMS, NotificationStatus.PENDING, total=1, recent=1),
+        # Live
+        NotificationCountRow(NotificationMethod.EMAIL, NotificationStatus.SENT, total=2, recent=2),
+        NotificationCountRow(NotificationMethod.EMAIL, NotificationStatus.FAILED, total=1, recent=1),
+    ]
+
+    counts = summarize_notification_counts(rows)
+
+    assert counts == NotificationCounts(
+        total=17,
+        successful=12,
+        failed=4,
+        by_method_recent={"email": 7, "sms": 1},
+    )
+
+
+def test_summarize_notification_counts_empty() -> None:
+    """Test that no rows give zero counts and no methods."""
+    assert summarize_notification_counts([]) == NotificationCounts()
+
+
+def test_count_by_status() -> None:
+    """Test that counts by status are derived from the totals, with pending as the remainder."""
+    counts = NotificationCounts(total=10, successful=6, failed=3)
+
+    assert counts.count_by_status(None) == 10
+    assert counts.count_by_status(NotificationStatus.SENT) == 6
+    assert counts.count_by_status(NotificationStatus.FAILED) == 3
+    assert counts.count_by_status(NotificationStatus.PENDING) == 1
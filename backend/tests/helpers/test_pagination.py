@@ -0,0 +1,49 @@
+"""Tests for keyset pagination helpers (app/helpers/pagination.py)."""
+
+import base64
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from app.helpers.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+ROW_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def _encode_raw(raw: str) -> str:
+    """Encode a raw cursor payload the way encode_keyset_cursor does."""
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip() -> None:
+    """Test that a decoded cursor gives back the timestamp and ID it was encoded from."""
+    timestamp = datetime(2025, 1, 7, 12, 30, 15, 123456, tzinfo=UTC)
+
+    cursor = encode_keyset_cursor(timestamp, ROW_ID)
+
+    assert decode_keyset_cursor(cursor) == (timestamp, ROW_ID)
+
+
+def test_cursor_is_url_safe() -> None:
+    """Test that cursors can be used in a query string without escaping."""
+    cursor = encode_keyset_cursor(datetime(2025, 1, 7, 12, 0, tzinfo=UTC), ROW_ID)
+
+    assert cursor.replace("-", "").replace("_", "").isalnum()
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor!",
+        _encode_raw("2025-01-07T12:00:00+00:00"),
+        _encode_raw(f"not-a-date|{ROW_ID}"),
+        _encode_raw("2025-01-07T12:00:00+00:00|not-a-uuid"),
+        _encode_raw(f"2025-01-07T12:00:00|{ROW_ID}"),
+    ],
+    ids=["empty", "not_base64", "missing_id", "invalid_timestamp", "invalid_id", "naive_timestamp"],
+)
+def test_decode_invalid_cursor(cursor: str) -> None:
+    """Test that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_keyset_cursor(cursor)
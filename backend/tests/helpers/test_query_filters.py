@@ -0,0 +1,17 @@
+"""Tests for array-bound query filters (app/helpers/query_filters.py)."""
+
+from uuid import uuid4
+
+from app.helpers.query_filters import any_of
+from app.models.user_route import UserRoute
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+
+
+def test_any_of_binds_values_as_one_parameter() -> None:
+    """Test that the filter compiles to a single array parameter however many values there are."""
+    route_ids = [uuid4() for _ in range(40_000)]
+
+    compiled = any_of(UserRoute.id, route_ids).compile(dialect=PGDialect_asyncpg())
+
+    assert "= ANY (" in str(compiled)
+    assert list(compiled.params.values()) == [route_ids]
@@ -0,0 +1,165 @@
+"""
+Tests for the in-memory route station index snapshot.
+
+RouteIndexSnapshot tests are pure; load_route_index_snapshot tests use the database.
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from app.helpers.route_index_snapshot import RouteIndexSnapshot, load_route_index_snapshot
+from app.models.user import User
+from app.models.user_route import UserRoute
+from app.models.user_route_index import UserRouteStationIndex
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TestRouteIndexSnapshot:
+    """Tests for RouteIndexSnapshot."""
+
+    def test_builds_both_directions(self):
+        """Should map routes to pairs and pairs to routes."""
+        route_a, route_b = uuid4(), uuid4()
+        snapshot = RouteIndexSnapshot.from_rows(
+            [
+                (route_a, "piccadilly", "940GZZLUKSX"),
+                (route_a, "piccadilly", "940GZZLURSQ"),
+                (route_b, "piccadilly", "940GZZLUKSX"),
+            ]
+        )
+
+        assert snapshot.get_route_pairs(route_a) == {("piccadilly", "940GZZLUKSX"), ("piccadilly", "940GZZLURSQ")}
+        assert snapshot.get_route_pairs(route_b) == {("piccadilly", "940GZZLUKSX")}
+        assert snapshot.routes_for_pairs([("piccadilly", "940GZZLUKSX")]) == {route_a, route_b}
+        assert snapshot.routes_for_pairs([("piccadilly", "940GZZLURSQ")]) == {route_a}
+        assert len(snapshot) == 2
+
+    def test_unknown_route_and_pair_return_empty(self):
+        """Should return empty sets for routes and pairs not in the snapshot."""
+        snapshot = RouteIndexSnapshot.from_rows([(uuid4(), "victoria", "940GZZLUVIC")])
+
+        assert snapshot.get_route_pairs(uuid4()) == set()
+        assert snapshot.routes_for_pairs([("northern", "940GZZLUEUS")]) == set()
+
+    def test_get_route_pairs_returns_copy(self):
+        """Mutating the returned pairs should not change the snapshot."""
+        route_id = uuid4()
+        snapshot = RouteIndexSnapshot.from_rows([(route_id, "victoria", "940GZZLUVIC")])
+
+        snapshot.get_route_pairs(route_id).add(("northern", "940GZZLUEUS"))
+
+        assert snapshot.get_route_pairs(route_id) == {("victoria", "940GZZLUVIC")}
+
+    def test_covers(self):
+        """Unrestricted snapshots cover every route; restricted ones only their routes."""
+        loaded, other = uuid4(), uuid4()
+
+        assert RouteIndexSnapshot.from_rows([]).covers(other)
+
+        restricted = RouteIndexSnapshot.from_rows([], route_ids=[loaded])
+        assert restricted.covers(loaded)
+        assert not restricted.covers(other)
+
+    def test_interns_identifiers(self):
+        """Repeated line/station IDs across routes should share a single string object."""
+        line_a = "".join(["pic", "cadilly"])
+        line_b = "".join(["picca", "dilly"])
+        snapshot = RouteIndexSnapshot.from_rows([(uuid4(), line_a, "940GZZLUKSX"), (uuid4(), line_b, "940GZZLUKSX")])
+
+        pairs = [next(iter(pairs)) for pairs in snapshot.pairs_by_route.values()]
+        assert pairs[0][0] is pairs[1][0]
+
+
+class TestLoadRouteIndexSnapshot:
+    """Tests for load_route_index_snapshot()."""
+
+    @pytest.fixture
+    async def two_routes(self, db_session: AsyncSession) -> tuple[UserRoute, UserRoute]:
+        """Two routes sharing King's Cross, one with a soft-deleted entry."""
+        user = User(external_id="snapshot-user", auth_provider="auth0")
+        db_session.add(user)
+        await db_session.flush()
+
+        route_a = UserRoute(user_id=user.id, name="Route A", active=True, timezone="Europe/London")
+        route_b = UserRoute(user_id=user.id, name="Route B", active=True, timezone="Europe/London")
+        db_session.add_all([route_a, route_b])
+        await db_session.flush()
+
+        now = datetime.now(UTC)
+        db_session.add_all(
+            [
+                UserRouteStationIndex(
+                    route_id=route_a.id, line_tfl_id="piccadilly", station_naptan="940GZZLUKSX", line_data_version=now
+                ),
+                UserRouteStationIndex(
+                    route_id=route_b.id, line_tfl_id="piccadilly", station_naptan="940GZZLUKSX", line_data_version=now
+                ),
+                UserRouteStationIndex(
+                    route_id=route_b.id,
+                    line_tfl_id="piccadilly",
+                    station_naptan="940GZZLURSQ",
+                    line_data_version=now,
+                    deleted_at=now,
+                ),
+            ]
+        )
+        await db_session.commit()
+        return route_a, route_b
+
+    @pytest.mark.asyncio
+    async def test_loads_active_entries_for_routes(
+        self, db_session: AsyncSession, two_routes: tuple[UserRoute, UserRoute]
+    ):
+        """Should load only active entries, in one query, for the requested routes."""
+        route_a, route_b = two_routes
+
+        snapshot = await load_route_index_snapshot(db_session, [route_a.id, route_b.id])
+
+        assert snapshot.get_route_pairs(route_a.id) == {("piccadilly", "940GZZLUKSX")}
+        assert snapshot.get_route_pairs(route_b.id) == {("piccadilly", "940GZZLUKSX")}
+        assert snapshot.routes_for_pairs([("piccadilly", "940GZZLUKSX")]) == {route_a.id, route_b.id}
+
+    @pytest.mark.asyncio
+    async def test_restricts_to_requested_routes(
+        self, db_session: AsyncSession, two_routes: tuple[UserRoute, UserRoute]
+    ):
+        """Should not include routes that weren't requested."""
+        route_a, route_b = two_routes
+
+        snapshot = await load_route_index_snapshot(db_session, [route_a.id])
+
+        assert snapshot.routes_for_pairs([("piccadilly", "940GZZLUKSX")]) == {route_a.id}
+        assert not snapshot.covers(route_b.id)
+
+    @pytest.mark.asyncio
+    async def test_unrestricted_loads_whole_index(
+        self, db_session: AsyncSession, two_routes: tuple[UserRoute, UserRoute]
+    ):
+        """Should load every active entry when no routes are given."""
+        route_a, route_b = two_routes
+
+        snapshot = await load_route_index_snapshot(db_session)
+
+        assert {route_a.id, route_b.id} <= set(snapshot.pairs_by_route)
+        assert snapshot.covers(uuid4())
+
+    @pytest.mark.asyncio
+    async def test_accepts_more_route_ids_than_bind_parameters(
+        self, db_session: AsyncSession, two_routes: tuple[UserRoute, UserRoute]
+    ):
+        """Should bind the route IDs as one array, so lists past asyncpg's 32767 parameter limit work."""
+        route_a, _route_b = two_routes
+        route_ids = [route_a.id, *(uuid4() for _ in range(40_000))]
+
+        snapshot = await load_route_index_snapshot(db_session, route_ids)
+
+        assert snapshot.routes_for_pairs([("piccadilly", "940GZZLUKSX")]) == {route_a.id}
+
+    @pytest.mark.asyncio
+    async def test_empty_route_ids_skips_query(self, db_session: AsyncSession):
+        """Should return an empty snapshot without querying for an empty route list."""
+        snapshot = await load_route_index_snapshot(db_session, [])
+
+        assert len(snapshot) == 0
+        assert snapshot.route_ids == frozenset()
@@ -0,0 +1,111 @@
+"""Unit tests for the compiled route variant index."""
+
+import itertools
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.helpers import route_variant_index
+from app.helpers.route_validation import RouteVariant, find_valid_connection_in_routes
+from app.helpers.route_variant_index import (
+    CompiledRouteVariants,
+    compile_route_variants,
+    get_compiled_route_variants,
+)
+from app.models.tfl import Line
+
+ROUTES: list[RouteVariant] = [
+    {"name": "Edgware → Morden", "direction": "inbound", "service_type": "Regular", "stations": ["E", "C", "K", "M"]},
+    {
+        "name": "High Barnet → Morden",
+        "direction": "inbound",
+        "service_type": "Regular",
+        "stations": ["H", "B", "K", "M"],
+    },
+    {"name": "Morden → Edgware", "direction": "outbound", "service_type": "Regular", "stations": ["M", "K", "C", "E"]},
+    {"name": "Loop", "direction": "inbound", "service_type": "Regular", "stations": ["L", "X", "L"]},
+]
+
+
+def _line(routes: list[RouteVariant] | None) -> Line:
+    """Build an in-memory Line with route variants."""
+    return Line(
+        id=uuid.uuid4(),
+        tfl_id="northern",
+        name="Northern",
+        last_updated=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        route_variants={"routes": routes} if routes is not None else None,
+    )
+
+
+class TestCompiledRouteVariants:
+    """Tests for CompiledRouteVariants."""
+
+    def test_matches_linear_scan_for_every_pair(self):
+        """Should give the same result as find_valid_connection_in_routes for every station pair."""
+        compiled = CompiledRouteVariants.from_routes(ROUTES)
+        stations = sorted({station for route in ROUTES for station in route["stations"]} | {"unknown"})
+
+        for from_id, to_id in itertools.product(stations, repeat=2):
+            assert compiled.find_connection(from_id, to_id) == find_valid_connection_in_routes(
+                from_id, to_id, ROUTES
+            ), (from_id, to_id)
+
+    def test_found_connection_reports_variant(self):
+        """Should report the first variant with a forward connection."""
+        compiled = CompiledRouteVariants.from_routes(ROUTES)
+
+        result = compiled.find_connection("K", "C")
+
+        assert result is not None
+        assert result["found"] is True
+        assert result["route_name"] == "Morden → Edgware"
+        assert (result["from_index"], result["to_index"]) == (1, 2)
+
+    def test_different_branches(self):
+        """Should return None for stations on different branches."""
+        compiled = CompiledRouteVariants.from_routes(ROUTES)
+
+        assert compiled.find_connection("C", "B") is None
+
+
+class TestGetCompiledRouteVariants:
+    """Tests for the process-level compiled route variant registry."""
+
+    def test_no_route_variants(self):
+        """Should return None for lines without route variants."""
+        assert get_compiled_route_variants(_line(None)) is None
+
+    def test_reuses_compiled_entry(self):
+        """Should compile once per line while updated_at is unchanged."""
+        line = _line(ROUTES)
+
+        assert get_compiled_route_variants(line) is get_compiled_route_variants(line)
+
+    def test_recompiles_when_line_updated(self):
+        """Should recompile when the line's updated_at changes."""
+        line = _line(ROUTES)
+        first = get_compiled_route_variants(line)
+
+        line.route_variants = {"routes": ROUTES[:1]}
+        line.updated_at = line.updated_at + timedelta(seconds=1)
+        second = get_compiled_route_variants(line)
+
+        assert second is not first
+        assert second is not None
+        assert second.find_connection("B", "K") is None
+
+    def test_unflushed_line_not_kept(self):
+        """Should not keep entries for lines without updated_at."""
+        line = _line(ROUTES)
+        line.updated_at = None  # type: ignore[assignment]
+
+        assert get_compiled_route_variants(line) is not None
+        assert line.id not in route_variant_index._compiled_route_variants
+
+    def test_compile_route_variants(self):
+        """Should compile all lines with route variants."""
+        lines = [_line(ROUTES), _line(None), _line(ROUTES[:2])]
+
+        assert compile_route_variants(lines) == 2
+        assert len(route_variant_index._compiled_route_variants) == 2
@@ -0,0 +1,56 @@
+"""Tests for minute-of-week schedule windows (app/helpers/schedule_windows.py)."""
+
+from datetime import UTC, datetime, time
+from zoneinfo import ZoneInfo
+
+from app.helpers.schedule_windows import get_local_minutes_of_week, get_minute_of_week, get_schedule_windows
+
+LONDON = ZoneInfo("Europe/London")
+
+
+def test_get_minute_of_week() -> None:
+    """Test minutes since Monday 00:00 local time, ignoring seconds."""
+    assert get_minute_of_week(datetime(2025, 1, 6, 0, 0, tzinfo=LONDON)) == 0  # Monday
+    assert get_minute_of_week(datetime(2025, 1, 7, 8, 30, 59, tzinfo=LONDON)) == 1950  # Tuesday
+    assert get_minute_of_week(datetime(2025, 1, 12, 23, 59, tzinfo=LONDON)) == 10079  # Sunday
+
+
+def test_get_minute_of_week_uses_local_wall_clock() -> None:
+    """Test that the minute of week follows the datetime's own timezone, not UTC."""
+    monday_midnight_utc = datetime(2025, 1, 6, 0, 0, tzinfo=UTC)
+
+    assert get_minute_of_week(monday_midnight_utc) == 0
+    # Sunday 19:00 in New York (EST, UTC-5)
+    assert get_minute_of_week(monday_midnight_utc.astimezone(ZoneInfo("America/New_York"))) == 6 * 1440 + 19 * 60
+
+
+def test_get_schedule_windows() -> None:
+    """Test one inclusive window per scheduled day, in day order."""
+    windows = get_schedule_windows(["SUN", "MON"], time(8, 0), time(9, 30, 45))
+
+    assert windows == [(480, 570), (8640 + 480, 8640 + 570)]
+
+
+def test_get_schedule_windows_ignores_unknown_days() -> None:
+    """Test that unknown day codes produce no windows."""
+    assert get_schedule_windows(["XYZ"], time(8, 0), time(9, 0)) == []
+
+
+def test_get_local_minutes_of_week_per_timezone() -> None:
+    """Test that each timezone gets its own local minute of week, following DST."""
+    # Monday 02:00 UTC in summer: London is on BST (UTC+1), New York on EDT (UTC-4)
+    now_utc = datetime(2025, 7, 7, 2, 0, tzinfo=UTC)
+
+    minutes = get_local_minutes_of_week(["Europe/London", "America/New_York"], now_utc)
+
+    assert minutes == {
+        "Europe/London": 3 * 60,  # Monday 03:00
+        "America/New_York": 6 * 1440 + 22 * 60,  # Sunday 22:00
+    }
+
+
+def test_get_local_minutes_of_week_skips_unknown_timezones() -> None:
+    """Test that invalid timezone names are left out."""
+    now_utc = datetime(2025, 1, 6, 8, 0, tzinfo=UTC)
+
+    assert get_local_minutes_of_week(["Not/AZone", "UTC"], now_utc) == {"UTC": 480}
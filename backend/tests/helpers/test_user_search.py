@@ -0,0 +1,19 @@
+"""Tests for admin user search helpers (app/helpers/user_search.py)."""
+
+import pytest
+from app.helpers.user_search import build_contains_pattern
+
+
+@pytest.mark.parametrize(
+    ("search", "expected"),
+    [
+        ("alice@example.com", "%alice@example.com%"),
+        ("+4477", "%+4477%"),
+        ("first_last", "%first\\_last%"),
+        ("100%", "%100\\%%"),
+        ("back\\slash", "%back\\\\slash%"),
+    ],
+)
+def test_build_contains_pattern(search: str, expected: str) -> None:
+    """Test that the term is wrapped in wildcards with LIKE wildcards in it escaped."""
+    assert build_contains_pattern(search) == expected
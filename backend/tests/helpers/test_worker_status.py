@@ -0,0 +1,49 @@
+"""Tests for worker heartbeat snapshots (app/helpers/worker_status.py)."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from app.helpers.worker_status import WorkerHeartbeat, get_live_heartbeats, parse_worker_heartbeats
+
+NOW = datetime(2025, 1, 15, 8, 30, tzinfo=UTC)
+
+
+def _heartbeat(hostname: str, age_seconds: int) -> WorkerHeartbeat:
+    return WorkerHeartbeat(
+        hostname=hostname,
+        sent_at=NOW - timedelta(seconds=age_seconds),
+        active_tasks=1,
+        scheduled_tasks=2,
+    )
+
+
+def test_heartbeat_json_round_trip() -> None:
+    """Test that a heartbeat survives serialization."""
+    heartbeat = _heartbeat("celery@worker1", 0)
+
+    assert WorkerHeartbeat.from_json(heartbeat.to_json()) == heartbeat
+
+
+@pytest.mark.parametrize("data", ["not json", "[]", '{"hostname": "celery@worker1"}', '{"sent_at": "x"}'])
+def test_heartbeat_from_json_invalid(data: str) -> None:
+    """Test that malformed heartbeats raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid worker heartbeat"):
+        WorkerHeartbeat.from_json(data)
+
+
+def test_parse_worker_heartbeats_skips_invalid_and_orders_newest_first() -> None:
+    """Test that malformed entries are skipped and the newest heartbeat comes first."""
+    older, newer = _heartbeat("celery@worker1", 20), _heartbeat("celery@worker2", 5)
+
+    heartbeats = parse_worker_heartbeats(
+        {"celery@worker1": older.to_json(), "celery@broken": "garbage", "celery@worker2": newer.to_json()}
+    )
+
+    assert heartbeats == [newer, older]
+
+
+def test_get_live_heartbeats() -> None:
+    """Test that heartbeats older than the stale threshold are dropped."""
+    live, boundary, stale = _heartbeat("a", 5), _heartbeat("b", 30), _heartbeat("c", 31)
+
+    assert get_live_heartbeats([live, boundary, stale], NOW, timedelta(seconds=30)) == [live, boundary]
@@ -2,9 +2,10 @@
 
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from app.helpers.notification_stats import NotificationCounts
 from app.schemas.admin import UserDetailResponse
 from app.services.admin_service import AdminService
 from fastapi import HTTPException
@@ -205,25 +206,20 @@ class TestAdminServiceOtelSpans:
         # Create mock database session
         mock_db = AsyncMock()
 
-        # Mock count query result
-        mock_count_result = MagicMock()
-        mock_count_result.scalar.return_value = 5
-
-        # Mock users query result
+        # Mock search query result: a search returns each user with the total match count
+        mock_user_row = MagicMock()
+        mock_user_row.__getitem__.return_value = MagicMock()
+        mock_user_row.total = 5
         mock_users_result = MagicMock()
-        mock_unique = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_unique.scalars.return_value = mock_scalars
-        mock_users_result.unique.return_value = mock_unique
-
-        # Set up execute to return different results for different queries
-        mock_db.execute = AsyncMock(side_effect=[mock_count_result, mock_users_result])
+        mock_users_result.all.return_value = [mock_user_row]
+        mock_db.execute = AsyncMock(return_value=mock_users_result)
 
         # Create admin service
         admin_svc = AdminService(db=mock_db)
 
-        await admin_svc.get_users_paginated(limit=10, offset=0, search="test")
+        _, _, next_cursor = await admin_svc.get_users_paginated(limit=10, offset=0, search="test")
+        assert next_cursor is None
+        assert mock_db.execute.call_count == 1  # Count and page in one query
 
         # Verify span was created with OK status
         spans = exporter.get_finished_spans()
@@ -240,9 +236,10 @@ class TestAdminServiceOtelSpans:
         assert span.attributes["admin.operation"] == "get_users_paginated"
         assert span.attributes["admin.limit"] == 10
         assert span.attributes["admin.offset"] == 0
+        assert span.attributes["admin.cursor_enabled"] is False
         assert span.attributes["admin.search_enabled"] is True
         assert span.attributes["admin.include_deleted"] is False
-        assert span.attributes["admin.result_count"] == 0
+        assert span.attributes["admin.result_count"] == 1
         assert span.attributes["admin.total_count"] == 5
 
     @pytest.mark.asyncio
@@ -286,26 +283,22 @@ class TestAdminServiceOtelSpans:
         admin_svc = AdminService(db=mock_db)
 
         # Mock all private helper methods
-        admin_svc._count_total_users = AsyncMock(return_value=100)
-        admin_svc._count_active_users = AsyncMock(return_value=50)
-        admin_svc._count_users_with_verified_email = AsyncMock(return_value=60)
-        admin_svc._count_users_with_verified_phone = AsyncMock(return_value=30)
-        admin_svc._count_admin_users = AsyncMock(return_value=5)
-        admin_svc._count_total_routes = AsyncMock(return_value=150)
-        admin_svc._count_active_routes = AsyncMock(return_value=120)
-        admin_svc._get_routes_user_count = AsyncMock(return_value=(150, 50))
-        admin_svc._count_total_notifications = AsyncMock(return_value=500)
-        admin_svc._count_successful_notifications = AsyncMock(return_value=480)
-        admin_svc._count_failed_notifications = AsyncMock(return_value=20)
-        admin_svc._get_notifications_by_method = AsyncMock(return_value={"email": 300, "sms": 200})
-        admin_svc._count_new_users_since = AsyncMock(return_value=10)
+        admin_svc._get_user_counts = AsyncMock(return_value=(100, 10, 10))
+        admin_svc._get_contact_and_admin_counts = AsyncMock(return_value=(60, 30, 5))
+        admin_svc._get_route_counts = AsyncMock(return_value=(150, 120, 50, 50))
         admin_svc._get_daily_signups_since = AsyncMock(return_value=[])
+        notification_counts = NotificationCounts(
+            total=500, successful=480, failed=20, by_method_recent={"email": 300, "sms": 200}
+        )
 
-        metrics = await admin_svc.get_engagement_metrics()
+        with patch("app.services.admin_service.NotificationStatsService") as mock_stats_service_class:
+            mock_stats_service_class.return_value.get_notification_counts = AsyncMock(return_value=notification_counts)
+            metrics = await admin_svc.get_engagement_metrics()
 
         # Verify metrics were returned
         assert metrics is not None
         assert metrics.user_counts.total_users == 100
+        assert metrics.notification_stats.success_rate == 96.0
 
         # Verify span was created with OK status
         spans = exporter.get_finished_spans()
@@ -336,7 +329,7 @@ class TestAdminServiceOtelSpans:
         admin_svc = AdminService(db=mock_db)
 
         # Mock helper method to raise exception
-        admin_svc._count_total_users = AsyncMock(side_effect=Exception("Database connection lost"))
+        admin_svc._get_user_counts = AsyncMock(side_effect=Exception("Database connection lost"))
 
         with pytest.raises(Exception, match="Database connection lost"):
             await admin_svc.get_engagement_metrics()
@@ -12,6 +12,7 @@ from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 from opentelemetry.trace import SpanKind, StatusCode
 
+from tests.conftest import add_mock_redis_batching
 from tests.helpers.otel import assert_span_status
 
 
@@ -431,7 +432,7 @@ class TestAlertServiceLogLineStateChangesOtelSpans:
         mock_db.commit = AsyncMock()
 
         # Create mock Redis client
-        mock_redis = AsyncMock()
+        mock_redis = add_mock_redis_batching(AsyncMock())
         mock_redis.get = AsyncMock(return_value=None)  # No previous hash
         mock_redis.set = AsyncMock()
 
@@ -493,7 +494,7 @@ class TestAlertServiceLogLineStateChangesOtelSpans:
         mock_db.rollback = AsyncMock()
 
         # Create mock Redis client
-        mock_redis = AsyncMock()
+        mock_redis = add_mock_redis_batching(AsyncMock())
         mock_redis.get = AsyncMock(return_value=None)
         mock_redis.set = AsyncMock()
 
@@ -128,6 +128,34 @@ class TestDisruptionMatchingService:
         assert ("piccadilly", "940GZZLUKSX") in pairs
         assert ("piccadilly", "940GZZLURSQ") not in pairs
 
+    @pytest.mark.asyncio
+    async def test_get_route_index_snapshot(self, db_session: AsyncSession) -> None:
+        """Test loading index pairs for several routes at once."""
+        user = User(external_id="test-user-snapshot", auth_provider="auth0")
+        db_session.add(user)
+        await db_session.flush()
+
+        route1 = UserRoute(user_id=user.id, name="Route 1", active=True, timezone="Europe/London")
+        route2 = UserRoute(user_id=user.id, name="Route 2", active=True, timezone="Europe/London")
+        db_session.add_all([route1, route2])
+        await db_session.flush()
+
+        db_session.add(
+            UserRouteStationIndex(
+                route_id=route1.id,
+                line_tfl_id="piccadilly",
+                station_naptan="940GZZLUKSX",
+                line_data_version=datetime.now(UTC),
+            )
+        )
+        await db_session.commit()
+
+        service = DisruptionMatchingService(db=db_session)
+        snapshot = await service.get_route_index_snapshot([route1.id, route2.id])
+
+        assert snapshot.get_route_pairs(route1.id) == {("piccadilly", "940GZZLUKSX")}
+        assert snapshot.get_route_pairs(route2.id) == set()
+
     @pytest.mark.asyncio
     async def test_filter_alertable_disruptions(self, db_session: AsyncSession) -> None:
         """Test filtering by disabled severities."""
@@ -16,9 +16,6 @@ from pydantic_tfl_api.models import (
 from pydantic_tfl_api.models import (
     Mode as TflMode,
 )
-from pydantic_tfl_api.models import (
-    StopPoint as TflStopPoint,
-)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.helpers.otel import assert_span_status
@@ -56,17 +53,6 @@ def create_mock_line(
     return TflLine(id=id, name=name, **kwargs)
 
 
-def create_mock_stop_point(
-    id: str = "940GZZLUVIC",
-    common_name: str = "Victoria",
-    **kwargs: Any,  # noqa: ANN401
-) -> TflStopPoint:
-    """Create mock TfL StopPoint object."""
-    if "modes" not in kwargs:
-        kwargs["modes"] = ["tube"]
-    return TflStopPoint(id=id, commonName=common_name, **kwargs)
-
-
 @pytest.fixture
 def mock_db_session() -> AsyncMock:
     """Create mock database session."""
@@ -193,18 +179,14 @@ class TestTflApiSpans:
             assert "tfl.api.mode" in span.attributes
 
     @pytest.mark.asyncio
-    async def test_extract_hub_fields_creates_span_when_hub_exists(
+    async def test_fetch_hub_name_creates_span(
         self,
         tfl_service_with_mock: TfLService,
         otel_enabled_provider: tuple[TracerProvider, InMemorySpanExporter],
     ) -> None:
-        """Test that _extract_hub_fields creates a span when hub code exists."""
+        """Test that _fetch_hub_name creates a span with the hub code."""
         _, exporter = otel_enabled_provider
 
-        # Create stop point with hub code
-        stop_point = create_mock_stop_point()
-        object.__setattr__(stop_point, "hubNaptanCode", "HUBVIC")
-
         # Create hub data response
         hub_data = MagicMock()
         hub_data.commonName = "Victoria"
@@ -217,7 +199,9 @@ class TestTflApiSpans:
             new_callable=AsyncMock,
             return_value=mock_response,
         ):
-            await tfl_service_with_mock._extract_hub_fields(stop_point)
+            hub_name = await tfl_service_with_mock._fetch_hub_name("HUBVIC")
+
+        assert hub_name == "Victoria"
 
         # Verify span was created
         spans = exporter.get_finished_spans()
@@ -229,28 +213,20 @@ class TestTflApiSpans:
         assert span.attributes["tfl.api.hub_code"] == "HUBVIC"
 
     @pytest.mark.asyncio
-    async def test_extract_hub_fields_no_span_when_no_hub(
+    async def test_fetch_hub_names_no_span_without_hubs(
         self,
         tfl_service_with_mock: TfLService,
         otel_enabled_provider: tuple[TracerProvider, InMemorySpanExporter],
     ) -> None:
-        """Test that _extract_hub_fields creates no span when hub code is None."""
+        """Test that _fetch_hub_names creates no span when there are no hub codes."""
         _, exporter = otel_enabled_provider
 
-        # Create stop point without hub code
-        stop_point = create_mock_stop_point()
-        # hubNaptanCode is None by default
-
-        hub_code, hub_name = await tfl_service_with_mock._extract_hub_fields(stop_point)
+        assert await tfl_service_with_mock._fetch_hub_names([]) == {}
 
         # Verify no span was created
         spans = exporter.get_finished_spans()
         assert len(spans) == 0
 
-        # Verify return values
-        assert hub_code is None
-        assert hub_name is None
-
     @pytest.mark.asyncio
     async def test_fetch_route_sequence_creates_span(
         self,
@@ -616,10 +592,6 @@ class TestTflApiSpanErrorHandling:
         """Test that span records exception when hub API call fails."""
         _, exporter = otel_enabled_provider
 
-        # Create stop point with hub code
-        stop_point = create_mock_stop_point()
-        object.__setattr__(stop_point, "hubNaptanCode", "HUBVIC")
-
         # Mock API to raise an exception
         api_error = Exception("Hub API error")
 
@@ -629,8 +601,8 @@ class TestTflApiSpanErrorHandling:
             new_callable=AsyncMock,
             side_effect=api_error,
         ):
-            # _extract_hub_fields catches exceptions and returns original hub_code, None for hub_name
-            hub_code, hub_name = await tfl_service_with_mock._extract_hub_fields(stop_point)
+            # _fetch_hub_name catches exceptions and returns None for the hub name
+            hub_name = await tfl_service_with_mock._fetch_hub_name("HUBVIC")
 
         # Verify span was created and has error status
         spans = exporter.get_finished_spans()
@@ -640,8 +612,7 @@ class TestTflApiSpanErrorHandling:
         assert span.name == "tfl.api.GetByPathIdsQueryIncludeCrowdingData"
         assert span.status.status_code == StatusCode.ERROR
 
-        # Verify the method returns hub_code (from stop_point) and None for hub_name on error
-        assert hub_code == "HUBVIC"
+        # Verify the method returns None for hub_name on error
         assert hub_name is None
 
 
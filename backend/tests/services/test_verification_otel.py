@@ -39,9 +39,8 @@ class TestVerificationServiceOtelSpans:
         verification_svc = VerificationService(db=mock_db)
         verification_svc.email_service = mock_email_service
 
-        # Mock check_verification_rate_limit to pass
-        verification_svc.check_verification_rate_limit = AsyncMock()
-        verification_svc.record_verification_code_request = AsyncMock()
+        # Mock the rate limit reservation to pass
+        verification_svc.reserve_verification_code_request = AsyncMock()
 
         contact_id = uuid.uuid4()
         user_id = uuid.uuid4()
@@ -92,8 +91,7 @@ class TestVerificationServiceOtelSpans:
         verification_svc.sms_service = mock_sms_service
 
         # Mock rate limiting
-        verification_svc.check_verification_rate_limit = AsyncMock()
-        verification_svc.record_verification_code_request = AsyncMock()
+        verification_svc.reserve_verification_code_request = AsyncMock()
 
         contact_id = uuid.uuid4()
         user_id = uuid.uuid4()
@@ -138,8 +136,7 @@ class TestVerificationServiceOtelSpans:
         verification_svc.email_service = mock_email_service
 
         # Mock rate limiting
-        verification_svc.check_verification_rate_limit = AsyncMock()
-        verification_svc.record_verification_code_request = AsyncMock()
+        verification_svc.reserve_verification_code_request = AsyncMock()
 
         contact_id = uuid.uuid4()
         user_id = uuid.uuid4()
@@ -174,8 +171,8 @@ class TestVerificationServiceOtelSpans:
         # Create verification service
         verification_svc = VerificationService(db=mock_db)
 
-        # Mock check_verification_rate_limit to raise HTTPException
-        verification_svc.check_verification_rate_limit = AsyncMock(
+        # Mock the rate limit reservation to raise HTTPException
+        verification_svc.reserve_verification_code_request = AsyncMock(
             side_effect=HTTPException(status_code=429, detail="Rate limit exceeded")
         )
 
@@ -3,10 +3,12 @@
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from app.core.config import settings
+from app.helpers.pagination import encode_keyset_cursor
+from app.helpers.worker_status import WORKER_STATUS_KEY, WorkerHeartbeat
 from app.models.notification import NotificationLog, NotificationMethod, NotificationStatus
 from app.models.user import User
 from app.models.user_route import UserRoute
@@ -216,30 +218,38 @@ async def test_trigger_check_with_errors(
 # ==================== Worker Status Endpoint Tests ====================
 
 
+def _heartbeat_json(hostname: str, age_seconds: float, active_tasks: int = 0, scheduled_tasks: int = 0) -> str:
+    """Build a published worker heartbeat sent `age_seconds` ago."""
+    return WorkerHeartbeat(
+        hostname=hostname,
+        sent_at=datetime.now(UTC) - timedelta(seconds=age_seconds),
+        active_tasks=active_tasks,
+        scheduled_tasks=scheduled_tasks,
+    ).to_json()
+
+
+def _mock_worker_status_redis(mock_get_redis: AsyncMock, heartbeats: dict[str, str]) -> AsyncMock:
+    """Make get_redis_client return a client whose worker status hash holds `heartbeats`."""
+    mock_redis = AsyncMock()
+    mock_redis.hgetall = AsyncMock(return_value=heartbeats)
+    mock_redis.aclose = AsyncMock()
+    mock_get_redis.return_value = mock_redis
+    return mock_redis
+
+
 @pytest.mark.asyncio
 @patch("app.api.admin.get_redis_client")
-@patch("app.api.admin.celery_app")
 async def test_worker_status_healthy(
-    mock_celery: MagicMock,
     mock_get_redis: AsyncMock,
     async_client_with_db: AsyncClient,
     admin_user: tuple[User, Any],
     auth_headers_for_user: dict[str, str],
 ) -> None:
     """Test worker status when workers are healthy."""
-    # Mock Redis client
-    mock_redis = AsyncMock()
-    mock_redis.get = AsyncMock(return_value=None)  # No cached clock (first run)
-    mock_redis.setex = AsyncMock()
-    mock_redis.aclose = AsyncMock()
-    mock_get_redis.return_value = mock_redis
-
-    # Mock Celery inspector
-    mock_inspector = MagicMock()
-    mock_inspector.active.return_value = {"worker1": [{"id": "task1"}]}
-    mock_inspector.scheduled.return_value = {"worker1": [{"id": "task2"}, {"id": "task3"}]}
-    mock_inspector.stats.return_value = {"worker1": {"clock": 12345, "total": {}}}
-    mock_celery.control.inspect.return_value = mock_inspector
+    mock_redis = _mock_worker_status_redis(
+        mock_get_redis,
+        {"celery@worker1": _heartbeat_json("celery@worker1", 2, active_tasks=1, scheduled_tasks=2)},
+    )
 
     response = await async_client_with_db.get(
         build_api_url("/admin/alerts/worker-status"),
@@ -253,22 +263,20 @@ async def test_worker_status_healthy(
     assert data["scheduled_tasks"] == 2
     assert data["last_heartbeat"] is not None
     assert "healthy" in data["message"].lower()
+    mock_redis.hgetall.assert_awaited_once_with(WORKER_STATUS_KEY)
+    mock_redis.aclose.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-@patch("app.api.admin.celery_app")
+@patch("app.api.admin.get_redis_client")
 async def test_worker_status_no_workers(
-    mock_celery: MagicMock,
+    mock_get_redis: AsyncMock,
     async_client_with_db: AsyncClient,
     admin_user: tuple[User, Any],
     auth_headers_for_user: dict[str, str],
 ) -> None:
-    """Test worker status when no workers are available."""
-    mock_inspector = MagicMock()
-    mock_inspector.active.return_value = None
-    mock_inspector.scheduled.return_value = None
-    mock_inspector.stats.return_value = None
-    mock_celery.control.inspect.return_value = mock_inspector
+    """Test worker status when no worker has published a heartbeat."""
+    _mock_worker_status_redis(mock_get_redis, {})
 
     response = await async_client_with_db.get(
         build_api_url("/admin/alerts/worker-status"),
@@ -286,33 +294,22 @@ async def test_worker_status_no_workers(
 
 @pytest.mark.asyncio
 @patch("app.api.admin.get_redis_client")
-@patch("app.api.admin.celery_app")
 async def test_worker_status_multiple_workers(
-    mock_celery: MagicMock,
     mock_get_redis: AsyncMock,
     async_client_with_db: AsyncClient,
     admin_user: tuple[User, Any],
     auth_headers_for_user: dict[str, str],
 ) -> None:
-    """Test worker status with multiple workers."""
-    # Mock Redis client with cached (clock, timestamp) tuple
-    mock_redis = AsyncMock()
-    mock_redis.get = AsyncMock(return_value="10,2025-01-01T00:00:00+00:00")  # Cached clock,timestamp
-    mock_redis.setex = AsyncMock()
-    mock_redis.aclose = AsyncMock()
-    mock_get_redis.return_value = mock_redis
-
-    mock_inspector = MagicMock()
-    mock_inspector.active.return_value = {
-        "worker1": [{"id": "task1"}, {"id": "task2"}],
-        "worker2": [{"id": "task3"}],
-    }
-    mock_inspector.scheduled.return_value = {
-        "worker1": [{"id": "task4"}],
-        "worker2": [],
-    }
-    mock_inspector.stats.return_value = {"worker1": {"clock": 42}, "worker2": {"clock": 43}}
-    mock_celery.control.inspect.return_value = mock_inspector
+    """Test worker status sums task counts over live workers only."""
+    _mock_worker_status_redis(
+        mock_get_redis,
+        {
+            "celery@worker1": _heartbeat_json("celery@worker1", 1, active_tasks=2, scheduled_tasks=1),
+            "celery@worker2": _heartbeat_json("celery@worker2", 5, active_tasks=1),
+            # Silent for longer than the stale threshold: not counted
+            "celery@worker3": _heartbeat_json("celery@worker3", 600, active_tasks=7, scheduled_tasks=7),
+        },
+    )
 
     response = await async_client_with_db.get(
         build_api_url("/admin/alerts/worker-status"),
@@ -324,32 +321,21 @@ async def test_worker_status_multiple_workers(
     assert data["worker_available"] is True
     assert data["active_tasks"] == 3  # 2 + 1
     assert data["scheduled_tasks"] == 1  # 1 + 0
-    assert data["last_heartbeat"] is not None  # Worker is responding (clock 42 > cached 10)
 
 
 @pytest.mark.asyncio
 @patch("app.api.admin.get_redis_client")
-@patch("app.api.admin.celery_app")
-async def test_worker_status_frozen_worker(
-    mock_celery: MagicMock,
+async def test_worker_status_stale_heartbeat(
     mock_get_redis: AsyncMock,
     async_client_with_db: AsyncClient,
     admin_user: tuple[User, Any],
     auth_headers_for_user: dict[str, str],
 ) -> None:
-    """Test worker status when worker clock doesn't increment (frozen)."""
-    # Mock Redis client with cached (clock, timestamp) - same clock value
-    mock_redis = AsyncMock()
-    mock_redis.get = AsyncMock(return_value="100,2025-01-01T00:00:00+00:00")
-    mock_redis.setex = AsyncMock()
-    mock_redis.aclose = AsyncMock()
-    mock_get_redis.return_value = mock_redis
-
-    mock_inspector = MagicMock()
-    mock_inspector.active.return_value = {"worker1": []}
-    mock_inspector.scheduled.return_value = {"worker1": []}
-    mock_inspector.stats.return_value = {"worker1": {"clock": 100}}  # Same clock as cached
-    mock_celery.control.inspect.return_value = mock_inspector
+    """Test worker status when the only worker stopped publishing (down or frozen)."""
+    _mock_worker_status_redis(
+        mock_get_redis,
+        {"celery@worker1": _heartbeat_json("celery@worker1", 120, active_tasks=1)},
+    )
 
     response = await async_client_with_db.get(
         build_api_url("/admin/alerts/worker-status"),
@@ -358,72 +344,29 @@ async def test_worker_status_frozen_worker(
 
     assert response.status_code == 200
     data = response.json()
-    assert data["worker_available"] is True
-    assert data["last_heartbeat"] is None  # Clock didn't increment - frozen
+    assert data["worker_available"] is False
+    assert data["active_tasks"] == 0
+    assert data["last_heartbeat"] is not None  # Last seen time is still reported
     assert "frozen" in data["message"].lower()
 
 
 @pytest.mark.asyncio
 @patch("app.api.admin.get_redis_client")
-@patch("app.api.admin.celery_app")
-async def test_worker_status_worker_restarted(
-    mock_celery: MagicMock,
+async def test_worker_status_ignores_invalid_heartbeats(
     mock_get_redis: AsyncMock,
     async_client_with_db: AsyncClient,
     admin_user: tuple[User, Any],
     auth_headers_for_user: dict[str, str],
 ) -> None:
-    """Test worker status when worker restarts (clock resets to lower value)."""
-    # Mock Redis client with high cached clock value
-    mock_redis = AsyncMock()
-    mock_redis.get = AsyncMock(return_value="10000,2025-01-01T00:00:00+00:00")
-    mock_redis.setex = AsyncMock()
-    mock_redis.aclose = AsyncMock()
-    mock_get_redis.return_value = mock_redis
-
-    mock_inspector = MagicMock()
-    mock_inspector.active.return_value = {"worker1": [{"id": "task1"}]}
-    mock_inspector.scheduled.return_value = {"worker1": []}
-    mock_inspector.stats.return_value = {"worker1": {"clock": 42}}  # Clock reset (< cached)
-    mock_celery.control.inspect.return_value = mock_inspector
-
-    response = await async_client_with_db.get(
-        build_api_url("/admin/alerts/worker-status"),
-        headers=auth_headers_for_user,
+    """Test worker status when the status hash holds malformed entries."""
+    _mock_worker_status_redis(
+        mock_get_redis,
+        {
+            "celery@broken": "not_a_valid_format",
+            "celery@worker1": _heartbeat_json("celery@worker1", 1, active_tasks=1),
+        },
     )
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["worker_available"] is True
-    assert data["active_tasks"] == 1
-    assert data["last_heartbeat"] is not None  # Worker restarted - treat as healthy
-    assert "healthy" in data["message"].lower()
-
-
-@pytest.mark.asyncio
-@patch("app.api.admin.get_redis_client")
-@patch("app.api.admin.celery_app")
-async def test_worker_status_invalid_cached_data(
-    mock_celery: MagicMock,
-    mock_get_redis: AsyncMock,
-    async_client_with_db: AsyncClient,
-    admin_user: tuple[User, Any],
-    auth_headers_for_user: dict[str, str],
-) -> None:
-    """Test worker status when Redis cache has invalid data format."""
-    # Mock Redis client with invalid cached data (missing comma)
-    mock_redis = AsyncMock()
-    mock_redis.get = AsyncMock(return_value="not_a_valid_format")
-    mock_redis.setex = AsyncMock()
-    mock_redis.aclose = AsyncMock()
-    mock_get_redis.return_value = mock_redis
-
-    mock_inspector = MagicMock()
-    mock_inspector.active.return_value = {"worker1": [{"id": "task1"}]}
-    mock_inspector.scheduled.return_value = {"worker1": []}
-    mock_inspector.stats.return_value = {"worker1": {"clock": 123}}
-    mock_celery.control.inspect.return_value = mock_inspector
-
     response = await async_client_with_db.get(
         build_api_url("/admin/alerts/worker-status"),
         headers=auth_headers_for_user,
@@ -433,7 +376,6 @@ async def test_worker_status_invalid_cached_data(
     data = response.json()
     assert data["worker_available"] is True
     assert data["active_tasks"] == 1
-    assert data["last_heartbeat"] is not None  # Treated as first check - healthy
     assert "healthy" in data["message"].lower()
 
 
@@ -582,6 +524,90 @@ async def test_recent_logs_pagination(
     assert data["offset"] == 5
 
 
+@pytest.mark.asyncio
+async def test_recent_logs_cursor_pagination(
+    db_session: AsyncSession,
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+    test_user: User,
+) -> None:
+    """Test paging through recent logs with next_cursor, including logs with the same sent_at."""
+    route = UserRoute(
+        user_id=test_user.id,
+        name="Test Route",
+        active=True,
+        timezone="Europe/London",
+    )
+    db_session.add(route)
+    await db_session.commit()
+    await db_session.refresh(route)
+
+    # Two logs share each timestamp, so pages must break ties on ID
+    base_time = datetime.now(UTC)
+    for i in range(5):
+        log = NotificationLog(
+            user_id=test_user.id,
+            route_id=route.id,
+            sent_at=base_time - timedelta(minutes=i // 2),
+            method=NotificationMethod.EMAIL,
+            status=NotificationStatus.SENT,
+            error_message=None,
+        )
+        db_session.add(log)
+    await db_session.commit()
+
+    seen_ids: list[str] = []
+    page_sizes: list[int] = []
+    url = build_api_url("/admin/alerts/recent-logs?limit=2")
+    while url:
+        response = await async_client_with_db.get(url, headers=auth_headers_for_user)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen_ids.extend(log["id"] for log in data["logs"])
+        page_sizes.append(len(data["logs"]))
+        next_cursor = data["next_cursor"]
+        url = build_api_url(f"/admin/alerts/recent-logs?limit=2&cursor={next_cursor}") if next_cursor else ""
+
+    assert page_sizes == [2, 2, 1]
+    assert len(set(seen_ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_recent_logs_invalid_cursor(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+) -> None:
+    """Test that a malformed cursor is rejected."""
+    response = await async_client_with_db.get(
+        build_api_url("/admin/alerts/recent-logs?cursor=not-a-cursor"),
+        headers=auth_headers_for_user,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor."
+
+
+@pytest.mark.asyncio
+async def test_recent_logs_cursor_with_offset(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+) -> None:
+    """Test that cursor and offset cannot be combined."""
+    cursor = encode_keyset_cursor(datetime.now(UTC), uuid4())
+    response = await async_client_with_db.get(
+        build_api_url(f"/admin/alerts/recent-logs?cursor={cursor}&offset=5"),
+        headers=auth_headers_for_user,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Use either cursor or offset, not both."
+
+
 @pytest.mark.asyncio
 async def test_recent_logs_filter_by_status(
     db_session: AsyncSession,
@@ -334,6 +334,54 @@ async def test_list_users_pagination(
     assert len(data["users"]) <= 2
 
 
+@pytest.mark.asyncio
+async def test_list_users_cursor_pagination(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+    db_session: AsyncSession,
+) -> None:
+    """Test paging through all users with next_cursor."""
+    for i in range(5):
+        user = User(external_id=f"test_user_{i}", auth_provider="auth0")
+        db_session.add(user)
+    await db_session.commit()
+
+    seen_ids: list[str] = []
+    total = None
+    url = build_api_url("/admin/users?limit=2")
+    while url:
+        response = await async_client_with_db.get(url, headers=auth_headers_for_user)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["users"]) <= 2
+        total = data["total"]
+        seen_ids.extend(user["id"] for user in data["users"])
+        next_cursor = data["next_cursor"]
+        url = build_api_url(f"/admin/users?limit=2&cursor={next_cursor}") if next_cursor else ""
+
+    assert total is not None
+    assert total >= 6  # Admin + 5 test users
+    assert len(seen_ids) == total
+    assert len(set(seen_ids)) == total
+
+
+@pytest.mark.asyncio
+async def test_list_users_invalid_cursor(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+) -> None:
+    """Test that a malformed cursor is rejected."""
+    response = await async_client_with_db.get(
+        build_api_url("/admin/users?cursor=not-a-cursor"),
+        headers=auth_headers_for_user,
+    )
+
+    assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_list_users_search_by_email(
     async_client_with_db: AsyncClient,
@@ -469,6 +517,84 @@ async def test_list_users_search_by_phone(
     assert any(u["id"] == str(test_user.id) for u in data["users"])
 
 
+@pytest.mark.asyncio
+async def test_list_users_search_multiple_matching_contacts(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+    test_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test that a user with several matching contacts is returned and counted once."""
+    db_session.add_all(
+        [
+            EmailAddress(user_id=test_user.id, email="commuter@example.com", verified=True, is_primary=True),
+            EmailAddress(user_id=test_user.id, email="commuter@work.example.com", verified=True, is_primary=False),
+        ]
+    )
+    await db_session.commit()
+
+    response = await async_client_with_db.get(
+        build_api_url("/admin/users?search=commuter"),
+        headers=auth_headers_for_user,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert [u["id"] for u in data["users"]] == [str(test_user.id)]
+    assert len(data["users"][0]["email_addresses"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_list_users_search_escapes_wildcards(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+    test_user: User,
+    another_user: User,
+    db_session: AsyncSession,
+) -> None:
+    """Test that an underscore in the search term only matches an underscore."""
+    db_session.add_all(
+        [
+            EmailAddress(user_id=test_user.id, email="first_last@example.com", verified=True, is_primary=True),
+            EmailAddress(user_id=another_user.id, email="firstxlast@example.com", verified=True, is_primary=True),
+        ]
+    )
+    await db_session.commit()
+
+    response = await async_client_with_db.get(
+        build_api_url("/admin/users?search=first_last"),
+        headers=auth_headers_for_user,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert [u["id"] for u in data["users"]] == [str(test_user.id)]
+
+
+@pytest.mark.asyncio
+async def test_list_users_search_past_last_page(
+    async_client_with_db: AsyncClient,
+    admin_user: tuple[User, Any],
+    auth_headers_for_user: dict[str, str],
+    test_user: User,
+) -> None:
+    """Test that the search total is still returned for a page past the last match."""
+    response = await async_client_with_db.get(
+        build_api_url(f"/admin/users?search={test_user.external_id}&offset=10"),
+        headers=auth_headers_for_user,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["users"] == []
+    assert data["next_cursor"] is None
+
+
 @pytest.mark.asyncio
 async def test_list_users_exclude_deleted(
     async_client_with_db: AsyncClient,
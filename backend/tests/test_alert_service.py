@@ -1,5 +1,6 @@
 """Tests for AlertService."""
 
+import asyncio
 import json
 import os
 import time
@@ -8,12 +9,13 @@ from datetime import UTC, datetime, timedelta
 from datetime import time as time_class
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 import redis.asyncio as redis
 from app.core.redis import get_redis_client
 from app.helpers.disruption_helpers import extract_line_station_pairs
+from app.helpers.route_index_snapshot import RouteIndexSnapshot
 from app.models.notification import (
     NotificationLog,
     NotificationMethod,
@@ -31,17 +33,22 @@ from app.services.alert_service import (
     create_line_aggregate_hash,
     detect_cleared_lines,
     filter_alertable_disruptions,
+    get_candidate_line_ids,
     get_day_code,
     init_alert_processing_stats,
+    intersect_route_id_filters,
     is_time_in_schedule_window,
     warm_up_line_state_cache,
 )
+from app.services.user_route_schedule_index_service import UserRouteScheduleIndexService
 from freezegun import freeze_time
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from tests.conftest import add_mock_redis_batching
+
 # ==================== Fixtures ====================
 # Note: mock_redis and alert_service fixtures are defined in conftest.py
 
@@ -1075,7 +1082,7 @@ async def test_process_all_routes_success(
 
     # Mock notification service
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock(return_value=[None])
     mock_notif_class.return_value = mock_notif_instance
 
     # Execute
@@ -1118,6 +1125,696 @@ async def test_process_all_routes_with_error(
     assert result["errors"] == 1
 
 
+# ==================== Line-first evaluation Tests ====================
+
+
+@pytest.mark.parametrize(
+    ("statuses", "changed_line_ids", "alerted_line_ids", "expected"),
+    [
+        # All Good Service, nothing changed - no routes need evaluating
+        ([("victoria", 10), ("northern", 10)], set(), set(), set()),
+        # Disrupted line is a candidate
+        ([("victoria", 10), ("northern", 5)], set(), set(), {"northern"}),
+        # Line that just changed state (e.g., cleared to Good Service) is a candidate
+        ([("victoria", 10), ("northern", 10)], {"victoria"}, set(), {"victoria"}),
+        # Line still in a route's alert state is a candidate even though it's unchanged
+        ([("victoria", 10), ("northern", 10)], set(), {"northern"}, {"northern"}),
+        # Union of disrupted, changed and alerted lines
+        ([("victoria", 10), ("northern", 5)], {"victoria"}, {"central"}, {"victoria", "northern", "central"}),
+        # No data at all
+        ([], set(), set(), set()),
+    ],
+)
+def test_get_candidate_line_ids(
+    statuses: list[tuple[str, int]],
+    changed_line_ids: set[str],
+    alerted_line_ids: set[str],
+    expected: set[str],
+) -> None:
+    """Test candidate line selection from alertable, changed and alerted lines."""
+    disruptions = [
+        DisruptionResponse(
+            line_id=line_id,
+            line_name=line_id.title(),
+            mode="tube",
+            status_severity=severity,
+            status_severity_description="Good Service" if severity == 10 else "Severe Delays",
+        )
+        for line_id, severity in statuses
+    ]
+
+    assert get_candidate_line_ids(disruptions, {("tube", 10)}, changed_line_ids, alerted_line_ids) == expected
+
+
+_ROUTE_A, _ROUTE_B, _ROUTE_C = uuid4(), uuid4(), uuid4()
+
+
+@pytest.mark.parametrize(
+    ("route_id_filters", "expected"),
+    [
+        # No restriction from any filter
+        ((None, None), None),
+        # One restriction applies on its own
+        (({_ROUTE_A, _ROUTE_B}, None), {_ROUTE_A, _ROUTE_B}),
+        ((None, {_ROUTE_B, _ROUTE_C}), {_ROUTE_B, _ROUTE_C}),
+        # Restrictions intersect
+        (({_ROUTE_A, _ROUTE_B}, {_ROUTE_B, _ROUTE_C}), {_ROUTE_B}),
+        # An empty restriction selects nothing
+        ((set(), None), set()),
+    ],
+)
+def test_intersect_route_id_filters(
+    route_id_filters: tuple[set[UUID] | None, ...],
+    expected: set[UUID] | None,
+) -> None:
+    """Test combining route ID restrictions where None means unrestricted."""
+    assert intersect_route_id_filters(*route_id_filters) == expected
+
+
+class TestGetCandidateRouteIds:
+    """Tests for _get_candidate_route_ids (line-first route selection)."""
+
+    @pytest.fixture
+    def good_service(self) -> list[DisruptionResponse]:
+        """Victoria line running normally."""
+        return [
+            DisruptionResponse(
+                line_id="victoria",
+                line_name="Victoria",
+                mode="tube",
+                status_severity=10,
+                status_severity_description="Good Service",
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_returns_none_without_cycle_disruptions(self) -> None:
+        """Test that all routes are evaluated when disruption data is unavailable."""
+        service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+
+        assert await service._get_candidate_route_ids(set()) is None
+        service.db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_disabled(self, sample_disruptions: list[DisruptionResponse]) -> None:
+        """Test that ALERT_LINE_FIRST_EVALUATION=False evaluates every route."""
+        service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+        service._cycle_disruptions = sample_disruptions
+
+        with patch("app.services.alert_service.settings.ALERT_LINE_FIRST_EVALUATION", False):
+            assert await service._get_candidate_route_ids(set()) is None
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_set_without_querying_when_no_lines_affected(
+        self, good_service: list[DisruptionResponse]
+    ) -> None:
+        """Test that a healthy, unchanged network selects no routes and issues no query."""
+        service = AlertService(db=AsyncMock(), redis_client=add_mock_redis_batching(AsyncMock()))
+        service._cycle_disruptions = good_service
+
+        assert await service._get_candidate_route_ids({("tube", 10)}) == set()
+        service.db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_db_error(self, sample_disruptions: list[DisruptionResponse]) -> None:
+        """Test that a failed candidate lookup falls back to evaluating every route."""
+        service = AlertService(db=AsyncMock(), redis_client=add_mock_redis_batching(AsyncMock()))
+        service.db.execute = AsyncMock(side_effect=SQLAlchemyError("DB error"))
+        service._cycle_disruptions = sample_disruptions
+
+        assert await service._get_candidate_route_ids(set()) is None
+
+    @pytest.mark.asyncio
+    async def test_finds_indexed_route_on_disrupted_line(
+        self,
+        alert_service: AlertService,
+        test_route_with_schedule: UserRoute,
+        sample_disruptions: list[DisruptionResponse],
+        populate_route_index: Callable[[UserRoute], UserRoute],
+    ) -> None:
+        """Test that routes indexed on a disrupted line are selected."""
+        await populate_route_index(test_route_with_schedule)
+        alert_service._cycle_disruptions = sample_disruptions
+
+        assert await alert_service._get_candidate_route_ids(set()) == {test_route_with_schedule.id}
+
+    @pytest.mark.asyncio
+    async def test_finds_unindexed_route_via_segments(
+        self,
+        alert_service: AlertService,
+        test_route_with_schedule: UserRoute,
+        sample_disruptions: list[DisruptionResponse],
+    ) -> None:
+        """Test that routes without an index yet are matched through their segment lines."""
+        alert_service._cycle_disruptions = sample_disruptions
+
+        assert await alert_service._get_candidate_route_ids(set()) == {test_route_with_schedule.id}
+
+    @pytest.mark.asyncio
+    async def test_skips_routes_on_other_lines(
+        self,
+        alert_service: AlertService,
+        test_route_with_schedule: UserRoute,
+        populate_route_index: Callable[[UserRoute], UserRoute],
+    ) -> None:
+        """Test that routes on healthy lines are not selected."""
+        await populate_route_index(test_route_with_schedule)
+        alert_service._cycle_disruptions = [
+            DisruptionResponse(
+                line_id="northern",
+                line_name="Northern",
+                mode="tube",
+                status_severity=5,
+                status_severity_description="Severe Delays",
+            )
+        ]
+
+        assert await alert_service._get_candidate_route_ids(set()) == set()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_alerted_lines_unavailable(self, good_service: list[DisruptionResponse]) -> None:
+        """Test that every route is evaluated when the alerted lines can't be read."""
+        redis_client = add_mock_redis_batching(AsyncMock())
+        redis_client.zrangebyscore = AsyncMock(side_effect=ConnectionError("Redis down"))
+        service = AlertService(db=AsyncMock(), redis_client=redis_client)
+        service._cycle_disruptions = good_service
+
+        assert await service._get_candidate_route_ids({("tube", 10)}) is None
+        service.db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_selects_routes_on_alerted_lines(
+        self,
+        alert_service: AlertService,
+        test_route_with_schedule: UserRoute,
+        good_service: list[DisruptionResponse],
+        populate_route_index: Callable[[UserRoute], UserRoute],
+    ) -> None:
+        """Test that routes on an unchanged Good Service line are selected while alert state for it is live."""
+        await populate_route_index(test_route_with_schedule)
+        alert_service._cycle_disruptions = good_service
+        alert_service.redis_client.zrangebyscore = AsyncMock(return_value=["victoria"])
+
+        assert await alert_service._get_candidate_route_ids({("tube", 10)}) == {test_route_with_schedule.id}
+
+
+@pytest.mark.asyncio
+@patch("app.services.alert_service.TfLService")
+@freeze_time("2025-01-15 08:30:00", tz_offset=0)  # Wednesday 8:30 AM UTC
+async def test_process_all_routes_line_first_skips_healthy_routes(
+    mock_tfl_class: MagicMock,
+    alert_service: AlertService,
+    test_route_with_schedule: UserRoute,
+    populate_route_index: Callable[[UserRoute], UserRoute],
+) -> None:
+    """Test that routes on unchanged Good Service lines are never loaded or evaluated."""
+    await populate_route_index(test_route_with_schedule)
+    good_service = [
+        DisruptionResponse(
+            line_id="victoria",
+            line_name="Victoria",
+            mode="tube",
+            status_severity=10,
+            status_severity_description="Good Service",
+        )
+    ]
+    mock_tfl_instance = AsyncMock()
+    mock_tfl_instance.fetch_line_disruptions = AsyncMock(return_value=good_service)
+    mock_tfl_class.return_value = mock_tfl_instance
+
+    # Line state unchanged since the previous cycle
+    alert_service.redis_client.get = AsyncMock(return_value=create_line_aggregate_hash(good_service))
+
+    with patch.object(alert_service, "_process_single_route", new_callable=AsyncMock) as mock_process:
+        result = await alert_service.process_all_routes()
+
+    assert result["routes_checked"] == 0
+    assert result["errors"] == 0
+    mock_process.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.services.alert_service.TfLService")
+@freeze_time("2025-01-15 08:30:00", tz_offset=0)  # Wednesday 8:30 AM UTC
+async def test_process_all_routes_rechecks_route_that_failed_when_its_line_cleared(
+    mock_tfl_class: MagicMock,
+    db_session: AsyncSession,
+    stateful_mock_redis: AsyncMock,
+    test_route_with_schedule: UserRoute,
+    sample_disruptions: list[DisruptionResponse],
+    populate_route_index: Callable[[UserRoute], UserRoute],
+) -> None:
+    """Test that a route failing in the cycle its line clears is evaluated again while its alert state is live."""
+    route = test_route_with_schedule
+    await populate_route_index(route)
+    await UserRouteScheduleIndexService(db_session).build_route_schedule_index(route.id)
+    alert_service = AlertService(db=db_session, redis_client=stateful_mock_redis)
+
+    # An earlier cycle alerted the route about the Victoria line disruption
+    await alert_service._store_alert_state(
+        route=route, user_id=route.user_id, schedule=route.schedules[0], disruptions=sample_disruptions
+    )
+
+    good_service = [
+        DisruptionResponse(
+            line_id="victoria",
+            line_name="Victoria",
+            mode="tube",
+            status_severity=10,
+            status_severity_description="Good Service",
+        )
+    ]
+    mock_tfl_instance = AsyncMock()
+    mock_tfl_instance.fetch_line_disruptions = AsyncMock(return_value=good_service)
+    mock_tfl_class.return_value = mock_tfl_instance
+
+    # The line clears, but processing the route fails
+    with patch.object(alert_service, "_process_single_route", AsyncMock(return_value=(0, True))) as mock_process:
+        result = await alert_service.process_all_routes()
+
+    assert result["errors"] == 1
+    mock_process.assert_awaited_once()
+
+    # The line is unchanged from now on, but the route still holds alert state for it
+    with patch.object(alert_service, "_process_single_route", AsyncMock(return_value=(1, False))) as mock_process:
+        result = await alert_service.process_all_routes()
+
+    assert result["routes_checked"] == 1
+    assert mock_process.await_args.kwargs["route"].id == route.id
+
+
+@pytest.mark.asyncio
+@patch("app.services.alert_service.TfLService")
+@freeze_time("2025-01-15 22:00:00", tz_offset=0)  # Wednesday 10 PM UTC, outside the 08:00-10:00 schedule
+async def test_process_all_routes_skips_routes_outside_schedule_window(
+    mock_tfl_class: MagicMock,
+    alert_service: AlertService,
+    test_route_with_schedule: UserRoute,
+    sample_disruptions: list[DisruptionResponse],
+) -> None:
+    """Test that off-peak cycles load no routes and skip the line-first lookup."""
+    await UserRouteScheduleIndexService(alert_service.db).build_route_schedule_index(test_route_with_schedule.id)
+    mock_tfl_instance = AsyncMock()
+    mock_tfl_instance.fetch_line_disruptions = AsyncMock(return_value=sample_disruptions)
+    mock_tfl_class.return_value = mock_tfl_instance
+
+    with (
+        patch.object(alert_service, "_get_candidate_route_ids", new_callable=AsyncMock) as mock_candidates,
+        patch.object(alert_service, "_process_single_route", new_callable=AsyncMock) as mock_process,
+    ):
+        result = await alert_service.process_all_routes()
+
+    assert result["routes_checked"] == 0
+    assert result["errors"] == 0
+    mock_candidates.assert_not_awaited()
+    mock_process.assert_not_called()
+
+
+@pytest.mark.asyncio
+@freeze_time("2025-01-15 08:30:00", tz_offset=0)  # Wednesday 8:30 AM UTC
+async def test_get_in_window_route_ids_selects_in_window_routes(
+    alert_service: AlertService,
+    test_route_with_schedule: UserRoute,
+) -> None:
+    """Test that routes with a schedule window open now are selected from the index."""
+    await UserRouteScheduleIndexService(alert_service.db).build_route_schedule_index(test_route_with_schedule.id)
+
+    assert await alert_service._get_in_window_route_ids() == {test_route_with_schedule.id}
+
+    with patch("app.services.alert_service.settings.ALERT_SCHEDULE_WINDOW_INDEX", False):
+        assert await alert_service._get_in_window_route_ids() is None
+
+
+@pytest.mark.asyncio
+async def test_get_in_window_route_ids_returns_none_on_error(alert_service: AlertService) -> None:
+    """Test that a failed index lookup falls back to checking every route's schedules."""
+    with patch.object(alert_service.db, "execute", side_effect=SQLAlchemyError("Database error")):
+        assert await alert_service._get_in_window_route_ids() is None
+
+
+@pytest.mark.asyncio
+async def test_log_line_state_changes_records_changed_lines(
+    alert_service: AlertService,
+    sample_disruptions: list[DisruptionResponse],
+) -> None:
+    """Test that lines whose aggregate state changed are recorded for line-first evaluation."""
+    unchanged = DisruptionResponse(
+        line_id="northern",
+        line_name="Northern",
+        mode="tube",
+        status_severity=10,
+        status_severity_description="Good Service",
+    )
+    unchanged_hash = create_line_aggregate_hash([unchanged])
+    alert_service.redis_client.get = AsyncMock(
+        side_effect=lambda key: unchanged_hash if key == "line_state:northern" else None
+    )
+
+    await alert_service._log_line_disruption_state_changes([*sample_disruptions, unchanged])
+
+    assert alert_service._changed_line_ids == {"victoria"}
+
+
+@pytest.mark.asyncio
+async def test_log_line_state_changes_marks_all_lines_changed_on_error(
+    sample_disruptions: list[DisruptionResponse],
+) -> None:
+    """Test that a change-detection failure conservatively marks every line as changed."""
+    service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+    service.redis_client.mget = AsyncMock(side_effect=ConnectionError("Redis down"))
+
+    await service._log_line_disruption_state_changes(sample_disruptions)
+
+    assert service._changed_line_ids == {"victoria"}
+
+
+@pytest.mark.asyncio
+async def test_log_line_state_changes_batches_redis_access(
+    alert_service: AlertService,
+    mock_redis: AsyncMock,
+) -> None:
+    """Test that line states are read with one MGET and written with one pipeline, not per line."""
+    disruptions = [
+        DisruptionResponse(
+            line_id=line_id,
+            line_name=line_id.title(),
+            mode="tube",
+            status_severity=6,
+            status_severity_description="Severe Delays",
+        )
+        for line_id in ("victoria", "northern", "central")
+    ]
+
+    await alert_service._log_line_disruption_state_changes(disruptions)
+
+    mock_redis.mget.assert_awaited_once_with(["line_state:central", "line_state:northern", "line_state:victoria"])
+    mock_redis.pipeline.assert_called_once()
+    assert {call.args[0] for call in mock_redis.set.await_args_list} == {
+        "line_state:central",
+        "line_state:northern",
+        "line_state:victoria",
+    }
+    assert alert_service._changed_line_ids == {"victoria", "northern", "central"}
+
+
+# ==================== Concurrent route processing Tests ====================
+
+
+def _make_mock_routes(count: int) -> list[Mock]:
+    """Create mock routes with unique IDs for concurrency tests."""
+    routes = []
+    for i in range(count):
+        route = Mock(spec=UserRoute)
+        route.id = uuid4()
+        route.name = f"Route {i}"
+        routes.append(route)
+    return routes
+
+
+class TestProcessRoutesConcurrently:
+    """Tests for bounded-parallel route processing in process_all_routes."""
+
+    @pytest.fixture
+    def session_factory(self) -> MagicMock:
+        """Session factory that returns a fresh mock session (async context manager) per call."""
+
+        def _create_session() -> AsyncMock:
+            session = AsyncMock()
+            session.__aenter__.return_value = session
+            return session
+
+        return MagicMock(side_effect=_create_session)
+
+    def _make_service(self, session_factory: MagicMock, routes: list[Mock], concurrency: int) -> AlertService:
+        """Create an AlertService with global data loading mocked out."""
+        service = AlertService(
+            db=AsyncMock(),
+            redis_client=AsyncMock(),
+            session_factory=session_factory,
+            concurrency=concurrency,
+        )
+        service._get_active_routes = AsyncMock(return_value=routes)
+        service._fetch_global_disruption_data = AsyncMock(return_value=(set(), set()))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self, session_factory: MagicMock) -> None:
+        """Test that no more than `concurrency` routes are processed at once."""
+        routes = _make_mock_routes(10)
+        service = self._make_service(session_factory, routes, concurrency=3)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_process(self: AlertService, **kwargs: object) -> tuple[int, bool]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 1, False
+
+        with (
+            patch("app.services.alert_service.get_active_children_for_parents", AsyncMock(return_value={})),
+            patch.object(AlertService, "_process_single_route", fake_process),
+        ):
+            result = await service.process_all_routes()
+
+        assert result == {"routes_checked": 10, "alerts_sent": 10, "errors": 0}
+        assert max_in_flight == 3
+        # One session per worker, not per route
+        assert session_factory.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_workers_share_notification_outbox(self, session_factory: MagicMock) -> None:
+        """Test that per-worker AlertService instances queue notifications through the same outbox."""
+        routes = _make_mock_routes(4)
+        service = self._make_service(session_factory, routes, concurrency=2)
+        service.notification_outbox = MagicMock()
+        worker_outboxes: list[object] = []
+
+        async def fake_process(self: AlertService, **kwargs: object) -> tuple[int, bool]:
+            worker_outboxes.append(self.notification_outbox)
+            return 0, False
+
+        with (
+            patch("app.services.alert_service.get_active_children_for_parents", AsyncMock(return_value={})),
+            patch.object(AlertService, "_process_single_route", fake_process),
+        ):
+            await service.process_all_routes()
+
+        assert worker_outboxes == [service.notification_outbox] * 4
+
+    @pytest.mark.asyncio
+    async def test_route_errors_are_isolated(self, session_factory: MagicMock) -> None:
+        """Test that an exception in one route doesn't stop the other routes."""
+        routes = _make_mock_routes(5)
+        failing_route_id = routes[2].id
+        service = self._make_service(session_factory, routes, concurrency=2)
+        processed: list[UUID] = []
+
+        async def fake_process(self: AlertService, route: UserRoute, **kwargs: object) -> tuple[int, bool]:
+            if route.id == failing_route_id:
+                msg = "boom"
+                raise RuntimeError(msg)
+            processed.append(route.id)
+            return 1, False
+
+        with (
+            patch("app.services.alert_service.get_active_children_for_parents", AsyncMock(return_value={})),
+            patch.object(AlertService, "_process_single_route", fake_process),
+        ):
+            result = await service.process_all_routes()
+
+        assert result == {"routes_checked": 5, "alerts_sent": 4, "errors": 1}
+        assert failing_route_id not in processed
+        assert len(processed) == 4
+
+    @pytest.mark.asyncio
+    async def test_passes_route_schedules_to_workers(self, session_factory: MagicMock) -> None:
+        """Test that each worker receives the schedules belonging to its route."""
+        routes = _make_mock_routes(3)
+        schedules_by_route = {route.id: [Mock(spec=UserRouteSchedule)] for route in routes}
+        service = self._make_service(session_factory, routes, concurrency=4)
+        seen: dict[UUID, list[Any]] = {}
+
+        async def fake_process(
+            self: AlertService, route: UserRoute, schedules: list[UserRouteSchedule], **kwargs: object
+        ) -> tuple[int, bool]:
+            seen[route.id] = schedules
+            return 0, False
+
+        with (
+            patch(
+                "app.services.alert_service.get_active_children_for_parents",
+                AsyncMock(return_value=schedules_by_route),
+            ),
+            patch.object(AlertService, "_process_single_route", fake_process),
+        ):
+            await service.process_all_routes()
+
+        assert seen == schedules_by_route
+        # Worker count is capped at the number of routes
+        assert session_factory.call_count == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 2])
+    async def test_alert_state_flushed_after_each_route(self, session_factory: MagicMock, concurrency: int) -> None:
+        """Test that each route's alert state is written once it is processed, not at the end of the cycle."""
+        routes = _make_mock_routes(3)
+        service = self._make_service(session_factory, routes, concurrency=concurrency)
+        redis_client = add_mock_redis_batching(AsyncMock())
+        service.redis_client = redis_client
+        writes_before_route: dict[UUID, int] = {}
+
+        async def fake_process(self: AlertService, route: UserRoute, **kwargs: object) -> tuple[int, bool]:
+            writes_before_route[route.id] = redis_client.setex.await_count
+            await self._set_alert_state(f"alert:{route.id}", 60, "{}")
+            return 1, False
+
+        with (
+            patch("app.services.alert_service.get_active_children_for_parents", AsyncMock(return_value={})),
+            patch.object(AlertService, "_process_single_route", fake_process),
+        ):
+            await service.process_all_routes()
+
+        # One pipeline per route, each holding that route's state
+        assert redis_client.pipeline.call_count == 3
+        assert {call.args[0] for call in redis_client.setex.await_args_list} == {f"alert:{r.id}" for r in routes}
+        # Each route starts after the routes processed before it have been written
+        assert sorted(writes_before_route.values()) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_sequential_without_session_factory(self) -> None:
+        """Test that routes are processed on the shared session when no factory is given."""
+        routes = _make_mock_routes(3)
+        service = AlertService(db=AsyncMock(), redis_client=AsyncMock(), concurrency=8)
+        service._get_active_routes = AsyncMock(return_value=routes)
+        service._fetch_global_disruption_data = AsyncMock(return_value=(set(), set()))
+        service._process_single_route = AsyncMock(return_value=(1, False))
+        service._process_routes_concurrently = AsyncMock()
+
+        with patch("app.services.alert_service.get_active_children_for_parents", AsyncMock(return_value={})):
+            result = await service.process_all_routes()
+
+        assert result == {"routes_checked": 3, "alerts_sent": 3, "errors": 0}
+        service._process_routes_concurrently.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_requires_session_factory(self) -> None:
+        """Test that calling the concurrent path without a session factory fails loudly."""
+        service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+
+        with pytest.raises(RuntimeError, match="session_factory is required"):
+            await service._process_routes_concurrently(
+                routes=[],
+                schedules_by_route={},
+                disabled_severity_pairs=set(),
+                cleared_states=set(),
+                stats=init_alert_processing_stats(),
+            )
+
+    def test_concurrency_defaults_to_setting(self) -> None:
+        """Test that concurrency falls back to ALERT_ROUTE_CONCURRENCY and is at least 1."""
+        with patch("app.services.alert_service.settings.ALERT_ROUTE_CONCURRENCY", 6):
+            assert AlertService(db=AsyncMock(), redis_client=AsyncMock()).concurrency == 6
+        assert AlertService(db=AsyncMock(), redis_client=AsyncMock(), concurrency=0).concurrency == 1
+
+
+# ==================== Route index snapshot Tests ====================
+
+
+@pytest.mark.asyncio
+async def test_get_route_index_pairs_uses_snapshot_without_query() -> None:
+    """Test that index pairs come from the per-cycle snapshot when it covers the route."""
+    route_id = uuid4()
+    service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+    service._route_index_snapshot = RouteIndexSnapshot.from_rows(
+        [(route_id, "victoria", "940GZZLUKSX")], route_ids=[route_id]
+    )
+
+    assert await service._get_route_index_pairs(route_id) == {("victoria", "940GZZLUKSX")}
+    service.db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_route_index_pairs_queries_routes_outside_snapshot() -> None:
+    """Test that routes not covered by the snapshot fall back to a database query."""
+    service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+    service._route_index_snapshot = RouteIndexSnapshot.from_rows([], route_ids=[uuid4()])
+    mock_result = MagicMock()
+    mock_result.all.return_value = [("northern", "940GZZLUEUS")]
+    service.db.execute = AsyncMock(return_value=mock_result)
+
+    assert await service._get_route_index_pairs(uuid4()) == {("northern", "940GZZLUEUS")}
+    service.db.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_query_routes_by_index_uses_snapshot_without_query() -> None:
+    """Test that route lookups by (line, station) come from the per-cycle snapshot."""
+    route_a, route_b = uuid4(), uuid4()
+    service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+    service._route_index_snapshot = RouteIndexSnapshot.from_rows(
+        [(route_a, "victoria", "940GZZLUKSX"), (route_b, "northern", "940GZZLUEUS")],
+        route_ids=[route_a, route_b],
+    )
+
+    assert await service._query_routes_by_index([("victoria", "940GZZLUKSX"), ("jubilee", "940GZZLUBND")]) == {route_a}
+    service.db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load_route_index_snapshot_failure_returns_none() -> None:
+    """Test that a failed snapshot load falls back to per-route queries."""
+    service = AlertService(db=AsyncMock(), redis_client=AsyncMock())
+
+    with patch(
+        "app.services.alert_service.load_route_index_snapshot",
+        AsyncMock(side_effect=SQLAlchemyError("DB error")),
+    ):
+        assert await service._load_route_index_snapshot([uuid4()]) is None
+
+    assert await service._load_route_index_snapshot([]) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workers_share_route_index_snapshot() -> None:
+    """Test that concurrent workers read index pairs from the cycle's snapshot."""
+    routes = _make_mock_routes(2)
+    snapshot = RouteIndexSnapshot.from_rows(
+        [(route.id, "victoria", "940GZZLUKSX") for route in routes], route_ids=[route.id for route in routes]
+    )
+
+    def _create_session() -> AsyncMock:
+        session = AsyncMock()
+        session.__aenter__.return_value = session
+        return session
+
+    service = AlertService(
+        db=AsyncMock(),
+        redis_client=AsyncMock(),
+        session_factory=MagicMock(side_effect=_create_session),
+        concurrency=2,
+    )
+    service._route_index_snapshot = snapshot
+    seen: list[RouteIndexSnapshot | None] = []
+
+    async def fake_process(self: AlertService, **kwargs: object) -> tuple[int, bool]:
+        seen.append(self._route_index_snapshot)
+        return 0, False
+
+    with patch.object(AlertService, "_process_single_route", fake_process):
+        await service._process_routes_concurrently(
+            routes=routes,
+            schedules_by_route={},
+            disabled_severity_pairs=set(),
+            cleared_states=set(),
+            stats=init_alert_processing_stats(),
+        )
+
+    assert seen == [snapshot, snapshot]
+
+
 # ==================== _get_active_routes Tests ====================
 
 
@@ -1206,6 +1903,19 @@ async def test_get_active_routes_preloads_relationships(
     assert route.user is not None
 
 
+@pytest.mark.asyncio
+async def test_get_active_routes_accepts_more_route_ids_than_bind_parameters(
+    alert_service: AlertService,
+    test_route_with_schedule: UserRoute,
+) -> None:
+    """Test that a candidate list beyond asyncpg's 32767 parameter limit is bound as one array."""
+    route_ids = {test_route_with_schedule.id, *(uuid4() for _ in range(40_000))}
+
+    routes = await alert_service._get_active_routes(route_ids=route_ids)
+
+    assert [route.id for route in routes] == [test_route_with_schedule.id]
+
+
 # ==================== _get_active_schedule Tests ====================
 
 
@@ -1582,7 +2292,7 @@ async def test_should_send_alert_same_disruption(
             "stored_at": datetime.now(UTC).isoformat(),
         }
     )
-    alert_service.redis_client.get = AsyncMock(return_value=stored_state)  # type: ignore[method-assign]
+    alert_service.redis_client.get = AsyncMock(return_value=stored_state)
 
     should_send, filtered, _stored_lines = await alert_service._should_send_alert(
         route=test_route_with_schedule,
@@ -1636,7 +2346,7 @@ async def test_should_send_alert_changed_disruption(
             "stored_at": datetime.now(UTC).isoformat(),
         }
     )
-    alert_service.redis_client.get = AsyncMock(return_value=stored_state)  # type: ignore[method-assign]
+    alert_service.redis_client.get = AsyncMock(return_value=stored_state)
 
     should_send, filtered, _stored_lines = await alert_service._should_send_alert(
         route=test_route_with_schedule,
@@ -1659,7 +2369,7 @@ async def test_should_send_alert_redis_error(
     schedule = test_route_with_schedule.schedules[0]
 
     # Mock Redis to raise error
-    alert_service.redis_client.get = AsyncMock(side_effect=Exception("Redis error"))  # type: ignore[method-assign]
+    alert_service.redis_client.get = AsyncMock(side_effect=Exception("Redis error"))
 
     should_send, filtered, _stored_lines = await alert_service._should_send_alert(
         route=test_route_with_schedule,
@@ -1683,7 +2393,7 @@ async def test_should_send_alert_invalid_stored_data(
     schedule = test_route_with_schedule.schedules[0]
 
     # Mock Redis to return invalid JSON
-    alert_service.redis_client.get = AsyncMock(return_value="invalid json")  # type: ignore[method-assign]
+    alert_service.redis_client.get = AsyncMock(return_value="invalid json")
 
     should_send, filtered, _stored_lines = await alert_service._should_send_alert(
         route=test_route_with_schedule,
@@ -1696,6 +2406,46 @@ async def test_should_send_alert_invalid_stored_data(
     assert len(filtered) > 0
 
 
+@pytest.mark.asyncio
+@freeze_time("2025-01-15 08:30:00", tz_offset=0)  # Within the test schedule window
+async def test_alert_state_batched_within_cycle(
+    alert_service: AlertService,
+    mock_redis: AsyncMock,
+    test_route_with_schedule: UserRoute,
+    sample_disruptions: list[DisruptionResponse],
+) -> None:
+    """Test that alert state is read from one MGET and held in the batch until it is written."""
+    route = test_route_with_schedule
+    schedule = route.schedules[0]
+    alert_service._alert_state = await alert_service._load_alert_state([route], {route.id: [schedule]})
+
+    should_send, filtered, _stored_lines = await alert_service._should_send_alert(
+        route=route, user_id=route.user_id, schedule=schedule, disruptions=sample_disruptions
+    )
+    assert should_send is True
+    await alert_service._store_alert_state(route=route, user_id=route.user_id, schedule=schedule, disruptions=filtered)
+
+    # The stored state is visible to the rest of the cycle, but not yet written
+    should_send_again, _filtered, _stored_lines = await alert_service._should_send_alert(
+        route=route, user_id=route.user_id, schedule=schedule, disruptions=sample_disruptions
+    )
+    assert should_send_again is False
+    mock_redis.mget.assert_awaited_once()
+    mock_redis.setex.assert_not_called()
+
+    await alert_service._write_alert_state()
+
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    mock_redis.setex.assert_awaited_once()
+    assert mock_redis.setex.await_args.args[0] == f"alert:{route.id}:{route.user_id}:{schedule.id}"
+
+    # Ending the cycle has nothing left to write
+    await alert_service._flush_alert_state()
+
+    mock_redis.pipeline.assert_called_once()
+    assert alert_service._alert_state is None
+
+
 # ==================== _send_alerts_for_route Tests ====================
 
 
@@ -1711,7 +2461,7 @@ async def test_send_alerts_for_route_success(
     """Test successful alert sending."""
     # Mock notification service
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock(return_value=[None])
     mock_notif_class.return_value = mock_notif_instance
 
     schedule = test_route_with_schedule.schedules[0]
@@ -1725,7 +2475,7 @@ async def test_send_alerts_for_route_success(
     assert alerts_sent == 1
 
     # Verify notification was sent
-    mock_notif_instance.send_disruption_email.assert_called_once()
+    mock_notif_instance.send_disruption_emails.assert_called_once()
 
     # Verify notification log was created
     result = await db_session.execute(
@@ -1841,7 +2591,7 @@ async def test_send_alerts_unverified_contact(
 
     # Mock notification service (should not be called)
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock()
     mock_notif_class.return_value = mock_notif_instance
 
     alerts_sent = await alert_service._send_alerts_for_route(
@@ -1854,7 +2604,7 @@ async def test_send_alerts_unverified_contact(
     assert alerts_sent == 0
 
     # Notification service was not called
-    mock_notif_instance.send_disruption_email.assert_not_called()
+    mock_notif_instance.send_disruption_emails.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -1946,7 +2696,7 @@ async def test_send_alerts_for_route_skips_unverified_contact_continue(
 
     # Mock notification service (should be called once for verified email)
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock(return_value=(True, None))
+    mock_notif_instance.send_disruption_emails = AsyncMock(return_value=[None])
     mock_notif_class.return_value = mock_notif_instance
 
     alerts_sent = await alert_service._send_alerts_for_route(
@@ -1959,7 +2709,7 @@ async def test_send_alerts_for_route_skips_unverified_contact_continue(
     assert alerts_sent == 1
 
     # Notification service was called exactly once (for verified contact)
-    assert mock_notif_instance.send_disruption_email.call_count == 1
+    assert mock_notif_instance.send_disruption_emails.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -1974,7 +2724,7 @@ async def test_send_alerts_notification_failure(
     """Test that notification failures are logged but don't stop processing."""
     # Mock notification service to fail
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock(side_effect=Exception("SMTP error"))
+    mock_notif_instance.send_disruption_emails = AsyncMock(side_effect=Exception("SMTP error"))
     mock_notif_class.return_value = mock_notif_instance
 
     schedule = test_route_with_schedule.schedules[0]
@@ -1999,6 +2749,98 @@ async def test_send_alerts_notification_failure(
     assert "SMTP error" in logs[0].error_message
 
 
+@pytest.mark.asyncio
+@patch("app.services.alert_service.NotificationService")
+async def test_send_alerts_email_batch_recipient_failure(
+    mock_notif_class: MagicMock,
+    alert_service: AlertService,
+    test_route_with_schedule: UserRoute,
+    sample_disruptions: list[DisruptionResponse],
+    db_session: AsyncSession,
+) -> None:
+    """Test that a recipient rejected within an email batch gets a failed notification log."""
+    mock_notif_instance = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock(return_value=[Exception("Mailbox unavailable")])
+    mock_notif_class.return_value = mock_notif_instance
+
+    alerts_sent = await alert_service._send_alerts_for_route(
+        route=test_route_with_schedule,
+        schedule=test_route_with_schedule.schedules[0],
+        disruptions=sample_disruptions,
+    )
+
+    assert alerts_sent == 0
+    result = await db_session.execute(
+        select(NotificationLog).where(NotificationLog.route_id == test_route_with_schedule.id)
+    )
+    logs = result.scalars().all()
+    assert len(logs) == 1
+    assert logs[0].status == NotificationStatus.FAILED
+    assert logs[0].error_message == "Mailbox unavailable"
+
+
+@pytest.mark.asyncio
+async def test_send_alerts_with_outbox_enqueues_rendered_notification(
+    mock_redis: AsyncMock,
+    test_route_with_schedule: UserRoute,
+    sample_disruptions: list[DisruptionResponse],
+    db_session: AsyncSession,
+) -> None:
+    """Test that alerts are rendered and queued instead of sent, leaving the log to the delivery worker."""
+    outbox = MagicMock()
+    alert_service = AlertService(db=db_session, redis_client=mock_redis, notification_outbox=outbox)
+
+    with patch("app.services.email_service.EmailService.send_email", new_callable=AsyncMock) as mock_send_email:
+        alerts_sent = await alert_service._send_alerts_for_route(
+            route=test_route_with_schedule,
+            schedule=test_route_with_schedule.schedules[0],
+            disruptions=sample_disruptions,
+        )
+
+    assert alerts_sent == 1
+    mock_send_email.assert_not_called()
+    outbound = outbox.enqueue.call_args[0][0]
+    assert outbound["route_id"] == str(test_route_with_schedule.id)
+    assert outbound["user_id"] == str(test_route_with_schedule.user_id)
+    assert outbound["kind"] == "disruption_alert"
+    assert outbound["recipient"] == "test@example.com"
+    assert outbound["notification"]["method"] == "email"
+    assert outbound["notification"]["subject"] is not None
+
+    result = await db_session.execute(
+        select(NotificationLog).where(NotificationLog.route_id == test_route_with_schedule.id)
+    )
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_send_alerts_with_outbox_enqueue_failure_logged(
+    mock_redis: AsyncMock,
+    test_route_with_schedule: UserRoute,
+    sample_disruptions: list[DisruptionResponse],
+    db_session: AsyncSession,
+) -> None:
+    """Test that a notification that can't be queued gets a failed notification log."""
+    outbox = MagicMock()
+    outbox.enqueue.side_effect = ConnectionError("Broker unavailable")
+    alert_service = AlertService(db=db_session, redis_client=mock_redis, notification_outbox=outbox)
+
+    alerts_sent = await alert_service._send_alerts_for_route(
+        route=test_route_with_schedule,
+        schedule=test_route_with_schedule.schedules[0],
+        disruptions=sample_disruptions,
+    )
+
+    assert alerts_sent == 0
+    result = await db_session.execute(
+        select(NotificationLog).where(NotificationLog.route_id == test_route_with_schedule.id)
+    )
+    logs = result.scalars().all()
+    assert len(logs) == 1
+    assert logs[0].status == NotificationStatus.FAILED
+    assert logs[0].error_message == "Broker unavailable"
+
+
 @pytest.mark.asyncio
 @freeze_time("2025-01-13 09:00:00", tz_offset=0)  # 9:00 AM UTC on Monday (within 8-10 AM schedule)
 @patch("app.services.alert_service.NotificationService")
@@ -2011,7 +2853,7 @@ async def test_send_alerts_stores_state_in_redis(
     """Test that alert state is stored in Redis after successful send."""
     # Mock notification service
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock(return_value=[None])
     mock_notif_class.return_value = mock_notif_instance
 
     schedule = test_route_with_schedule.schedules[0]
@@ -2733,6 +3575,7 @@ async def test_send_alerts_for_route_sms_notification(
     # Mock notification service
     mock_notif_instance = AsyncMock()
     mock_notif_instance.send_disruption_sms = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock(return_value=[None])
     mock_notif_class.return_value = mock_notif_instance
 
     schedule = test_route_with_schedule.schedules[0]
@@ -2813,7 +3656,7 @@ async def test_send_alerts_for_route_preference_exception(
     """Test unexpected exception in preference processing (lines 635-637)."""
     # Mock notification service to raise unexpected error
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock(side_effect=RuntimeError("Unexpected error"))
+    mock_notif_instance.send_disruption_emails = AsyncMock(side_effect=RuntimeError("Unexpected error"))
     mock_notif_class.return_value = mock_notif_instance
 
     schedule = test_route_with_schedule.schedules[0]
@@ -2840,7 +3683,7 @@ async def test_store_alert_state_exception_handling(
     schedule = test_route_with_schedule.schedules[0]
 
     # Mock Redis to raise error on setex
-    alert_service.redis_client.setex = AsyncMock(side_effect=RuntimeError("Redis error"))  # type: ignore[method-assign]
+    alert_service.redis_client.setex = AsyncMock(side_effect=RuntimeError("Redis error"))
 
     # Should handle exception gracefully (logs error but doesn't crash)
     try:
@@ -2868,7 +3711,7 @@ async def test_send_alerts_for_route_handles_get_verified_contact_exception(
     """Test exception handling in preference processing loop (lines 663-665)."""
     # Mock notification service
     mock_notif_instance = AsyncMock()
-    mock_notif_instance.send_disruption_email = AsyncMock()
+    mock_notif_instance.send_disruption_emails = AsyncMock()
     mock_notif_class.return_value = mock_notif_instance
 
     # Patch _get_verified_contact to raise an unexpected exception
@@ -2888,7 +3731,7 @@ async def test_send_alerts_for_route_handles_get_verified_contact_exception(
     assert alerts_sent == 0
 
     # Notification service was not called
-    mock_notif_instance.send_disruption_email.assert_not_called()
+    mock_notif_instance.send_disruption_emails.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -5830,6 +6673,31 @@ class TestSendStatusUpdateNotifications:
         assert logs[0].error_message is not None
         assert "SMTP error" in logs[0].error_message
 
+    @pytest.mark.asyncio
+    async def test_send_status_update_with_outbox_enqueues(
+        self,
+        mock_redis: AsyncMock,
+        test_route_with_schedule: UserRoute,
+        sample_cleared_lines: list[ClearedLineInfo],
+        sample_disruptions: list[DisruptionResponse],
+        db_session: AsyncSession,
+    ) -> None:
+        """Test that status updates are queued when a notification outbox is configured."""
+        outbox = MagicMock()
+        alert_service = AlertService(db=db_session, redis_client=mock_redis, notification_outbox=outbox)
+
+        result = await alert_service._send_status_update_notifications(
+            route=test_route_with_schedule,
+            schedule=test_route_with_schedule.schedules[0],
+            cleared_lines=sample_cleared_lines,
+            still_disrupted=sample_disruptions,
+        )
+
+        assert result == 1
+        outbound = outbox.enqueue.call_args[0][0]
+        assert outbound["kind"] == "status_update"
+        assert outbound["notification"]["method"] == "email"
+
     @pytest.mark.asyncio
     @patch("app.services.alert_service.NotificationService")
     async def test_all_lines_cleared_sends_status_update(
@@ -13,7 +13,6 @@ from app.models.user import User
 from app.services.auth_service import AuthService
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
-from freezegun import freeze_time
 from jose import jwt
 from sqlalchemy.exc import IntegrityError as SQLAlchemyIntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -328,7 +327,7 @@ class TestVerifyJWTEdgeCases:
 
     @pytest.mark.asyncio
     async def test_get_jwks_success(self) -> None:
-        """Test get_jwks successfully fetches JWKS from Auth0."""
+        """Test get_jwks returns the key set held by the process-wide JWKS cache."""
         mock_jwks = {
             "keys": [
                 {
@@ -341,92 +340,111 @@ class TestVerifyJWTEdgeCases:
             ]
         }
 
-        # Mock httpx.AsyncClient
-        with patch("app.core.auth.httpx.AsyncClient") as mock_client_cls:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_jwks
-            mock_response.raise_for_status.return_value = None
+        with patch("app.core.auth.get_jwks_cache") as mock_get_jwks_cache:
+            mock_get_jwks_cache.return_value.get = AsyncMock(return_value=mock_jwks)
 
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client_instance
-
-            result = await get_jwks("test.auth0.com")
+            result = await get_jwks()
 
             assert result == mock_jwks
 
     @pytest.mark.asyncio
     async def test_get_jwks_http_error(self, reset_jwks_cache: None) -> None:
-        """Test get_jwks handles HTTP errors."""
-        # Mock httpx.AsyncClient to raise HTTPError
-        with patch("app.core.auth.httpx.AsyncClient") as mock_client_cls:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
-            mock_client_cls.return_value.__aenter__.return_value = mock_client_instance
+        """Test get_jwks returns 503 if the JWKS cannot be fetched."""
+        with patch("app.core.auth.get_jwks_cache") as mock_get_jwks_cache:
+            mock_get_jwks_cache.return_value.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_jwks()
+
+            assert exc_info.value.status_code == 503
+            assert "unable to fetch jwks" in exc_info.value.detail.lower()
+
+    @pytest.mark.asyncio
+    async def test_get_jwks_invalid_response(self, reset_jwks_cache: None) -> None:
+        """Test get_jwks returns 503 if Auth0's response has no keys."""
+        with patch("app.core.auth.get_jwks_cache") as mock_get_jwks_cache:
+            mock_get_jwks_cache.return_value.get = AsyncMock(side_effect=ValueError("JWKS response has no keys"))
 
             with pytest.raises(HTTPException) as exc_info:
-                await get_jwks("test.auth0.com")
+                await get_jwks()
 
             assert exc_info.value.status_code == 503
             assert "unable to fetch jwks" in exc_info.value.detail.lower()
 
+
+class TestTokenCache:
+    """Tests for the verified token cache used by verify_jwt and get_current_user."""
+
     @pytest.mark.asyncio
-    async def test_get_jwks_uses_cache(self, reset_jwks_cache: None) -> None:
-        """Test get_jwks uses cached JWKS within TTL."""
-        mock_jwks = {"keys": [{"kid": "cached-key"}]}
-
-        with patch("app.core.auth.httpx.AsyncClient") as mock_client_cls:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_jwks
-            mock_response.raise_for_status.return_value = None
-
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client_instance
-
-            # First call should fetch from Auth0
-            result1 = await get_jwks("test.auth0.com")
-            assert result1 == mock_jwks
-            assert mock_client_instance.get.call_count == 1
-
-            # Second call should use cache
-            result2 = await get_jwks("test.auth0.com")
-            assert result2 == mock_jwks
-            # Call count should still be 1 (cached)
-            assert mock_client_instance.get.call_count == 1
+    async def test_verify_jwt_caches_verified_claims(self) -> None:
+        """Test that a token is only verified once while cached."""
+        token = MockJWTGenerator.generate(auth0_id=make_unique_external_id())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            first = await verify_jwt(credentials)
+            second = await verify_jwt(credentials)
+
+        assert second == first
+        assert mock_decode.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_get_jwks_cache_expiry(self, reset_jwks_cache: None) -> None:
-        """Test get_jwks fetches fresh JWKS after cache TTL expires."""
-        mock_jwks_1 = {"keys": [{"kid": "cached-key-1"}]}
-        mock_jwks_2 = {"keys": [{"kid": "cached-key-2"}]}
-
-        initial_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-
-        with patch("app.core.auth.httpx.AsyncClient") as mock_client_cls:
-            mock_response_1 = MagicMock()
-            mock_response_1.json.return_value = mock_jwks_1
-            mock_response_1.raise_for_status.return_value = None
-
-            mock_response_2 = MagicMock()
-            mock_response_2.json.return_value = mock_jwks_2
-            mock_response_2.raise_for_status.return_value = None
-
-            mock_client_instance = AsyncMock()
-            # First call returns mock_jwks_1, second call returns mock_jwks_2
-            mock_client_instance.get = AsyncMock(side_effect=[mock_response_1, mock_response_2])
-            mock_client_cls.return_value.__aenter__.return_value = mock_client_instance
-
-            # First call should fetch from Auth0 at initial time
-            with freeze_time(initial_time):
-                result1 = await get_jwks("test.auth0.com")
-                assert result1 == mock_jwks_1
-                assert mock_client_instance.get.call_count == 1
-
-            # Fast forward 2 hours (beyond TTL) to simulate cache expiry
-            expired_time = initial_time + timedelta(hours=2)
-            with freeze_time(expired_time):
-                # Next call should fetch fresh JWKS after expiry
-                result2 = await get_jwks("test.auth0.com")
-                assert result2 == mock_jwks_2
-                assert mock_client_instance.get.call_count == 2
+    async def test_verify_jwt_without_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that every request verifies the token when the cache TTL is 0."""
+        monkeypatch.setattr(settings, "AUTH_TOKEN_CACHE_TTL_SECONDS", 0)
+        token = MockJWTGenerator.generate(auth0_id=make_unique_external_id())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            await verify_jwt(credentials)
+            await verify_jwt(credentials)
+
+        assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_jwt_does_not_cache_invalid_tokens(self) -> None:
+        """Test that a rejected token is rejected again rather than served from the cache."""
+        token = MockJWTGenerator.generate(auth0_id=make_unique_external_id())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=f"{token}tampered")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_jwt(credentials)
+            assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_reuses_cached_user(self, db_session: AsyncSession) -> None:
+        """Test that a repeat request with the same token attaches the user without a query."""
+        external_id = make_unique_external_id()
+        token = MockJWTGenerator.generate(auth0_id=external_id)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        payload = await verify_jwt(credentials)
+        first = await get_current_user(payload=payload, db=db_session, credentials=credentials)
+        db_session.expunge(first)
+
+        payload = await verify_jwt(credentials)
+        with patch.object(db_session, "execute", side_effect=AssertionError("unexpected query")):
+            second = await get_current_user(payload=payload, db=db_session, credentials=credentials)
+
+        assert second.id == first.id
+        assert second.external_id == external_id
+        assert second in db_session
+
+    @pytest.mark.asyncio
+    async def test_clear_token_cache(self, db_session: AsyncSession) -> None:
+        """Test that clearing the cache makes the next request look the user up again."""
+        token = MockJWTGenerator.generate(auth0_id=make_unique_external_id())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        payload = await verify_jwt(credentials)
+        await get_current_user(payload=payload, db=db_session, credentials=credentials)
+
+        auth.clear_token_cache()
+
+        with patch("app.core.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            payload = await verify_jwt(credentials)
+        with patch.object(db_session, "execute", wraps=db_session.execute) as mock_execute:
+            await get_current_user(payload=payload, db=db_session, credentials=credentials)
+
+        assert mock_decode.call_count == 1
+        assert mock_execute.called
@@ -19,8 +19,12 @@ from app.celery.database import (
     get_worker_loop,
     get_worker_redis_client,
     get_worker_session,
+    get_worker_smtp_pool,
+    get_worker_tfl_resources,
     init_worker_resources,
 )
+from app.core.smtp_pool import get_smtp_pool
+from app.core.tfl_client import get_tfl_resources
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -176,6 +180,52 @@ def test_get_worker_redis_client_returns_same_instance() -> None:
     assert client1 is client2
 
 
+def test_get_worker_tfl_resources_is_shared_and_cleaned_up() -> None:
+    """
+    Test that get_worker_tfl_resources returns one registered instance per worker.
+
+    TfLService instances created in the worker pick up the registered resources,
+    and cleanup_worker_resources closes and unregisters them.
+    """
+    init_worker_resources()
+
+    resources = get_worker_tfl_resources()
+
+    assert get_worker_tfl_resources() is resources
+    assert get_tfl_resources() is resources
+
+    cleanup_worker_resources()
+
+    assert db_module._worker_tfl_resources is None
+    assert get_tfl_resources() is None
+
+    # Re-initialize for subsequent tests
+    init_worker_resources()
+
+
+def test_get_worker_smtp_pool_is_shared_and_cleaned_up() -> None:
+    """
+    Test that get_worker_smtp_pool returns one registered pool per worker.
+
+    EmailService instances created in the worker pick up the registered pool,
+    and cleanup_worker_resources closes and unregisters it.
+    """
+    init_worker_resources()
+
+    pool = get_worker_smtp_pool()
+
+    assert get_worker_smtp_pool() is pool
+    assert get_smtp_pool() is pool
+
+    cleanup_worker_resources()
+
+    assert db_module._worker_smtp_pool is None
+    assert get_smtp_pool() is None
+
+    # Re-initialize for subsequent tests
+    init_worker_resources()
+
+
 def test_redis_client_protocol_exported() -> None:
     """
     Test that RedisClientProtocol is exported from the module.
@@ -14,11 +14,13 @@ from app.services.tfl_service import MetadataChangeDetectedError
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
 async def test_refresh_metadata_async_success_no_changes(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test successful metadata refresh with no changes detected."""
     # Mock database session
@@ -46,7 +48,7 @@ async def test_refresh_metadata_async_success_no_changes(
     assert result["error"] is None
 
     # Verify TfLService was instantiated correctly
-    mock_tfl_service_class.assert_called_once_with(db=mock_session)
+    mock_tfl_service_class.assert_called_once_with(db=mock_session, resources=mock_tfl_resources_func.return_value)
 
     # Verify refresh method was called
     mock_tfl_service.refresh_metadata_with_change_detection.assert_called_once()
@@ -57,11 +59,13 @@ async def test_refresh_metadata_async_success_no_changes(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
 async def test_refresh_metadata_async_changes_detected(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test metadata refresh when changes are detected."""
     # Mock database session
@@ -101,11 +105,13 @@ async def test_refresh_metadata_async_changes_detected(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
 async def test_refresh_metadata_async_ensures_session_cleanup(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test that session is always closed even on generic exception."""
     # Mock database session
@@ -131,6 +137,7 @@ async def test_refresh_metadata_async_ensures_session_cleanup(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.detect_and_rebuild_stale_routes")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
@@ -138,6 +145,7 @@ async def test_rebuild_graph_async_success(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
     mock_stale_detection_task: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test successful graph rebuild."""
     # Mock database session
@@ -170,7 +178,7 @@ async def test_rebuild_graph_async_success(
     assert result["error"] is None
 
     # Verify TfLService was instantiated correctly
-    mock_tfl_service_class.assert_called_once_with(db=mock_session)
+    mock_tfl_service_class.assert_called_once_with(db=mock_session, resources=mock_tfl_resources_func.return_value)
 
     # Verify build_station_graph was called
     mock_tfl_service.build_station_graph.assert_called_once()
@@ -184,6 +192,7 @@ async def test_rebuild_graph_async_success(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.detect_and_rebuild_stale_routes")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
@@ -191,6 +200,7 @@ async def test_rebuild_graph_async_handles_stale_detection_failure(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
     mock_stale_detection_task: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test that graph rebuild continues even if stale detection triggering fails."""
     # Mock database session
@@ -221,11 +231,13 @@ async def test_rebuild_graph_async_handles_stale_detection_failure(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
 async def test_rebuild_graph_async_handles_build_failure(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test that graph rebuild handles build failures gracefully."""
     # Mock database session
@@ -254,11 +266,13 @@ async def test_rebuild_graph_async_handles_build_failure(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
 async def test_rebuild_graph_async_ensures_session_cleanup_on_failure(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test that session is always closed even when graph rebuild fails."""
     # Mock database session
@@ -286,6 +300,7 @@ async def test_rebuild_graph_async_ensures_session_cleanup_on_failure(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.detect_and_rebuild_stale_routes")
 @patch("app.celery.tasks.TfLService")
 @patch("app.celery.tasks.get_worker_session")
@@ -293,6 +308,7 @@ async def test_rebuild_graph_async_full_success_flow(
     mock_session_factory: MagicMock,
     mock_tfl_service_class: MagicMock,
     mock_stale_detection_task: MagicMock,
+    mock_tfl_resources_func: MagicMock,
 ) -> None:
     """Test complete success flow: graph rebuild + stale detection + cleanup."""
     # Mock database session
@@ -76,6 +76,20 @@ class TestScheduleConfiguration:
         assert "expires" in task_config["options"]
         assert task_config["options"]["expires"] == 60
 
+    def test_refresh_notification_stats_schedule(self):
+        """Test that the notification stats rollup is refreshed hourly."""
+        task_config = celery_app.conf.beat_schedule["refresh-notification-stats"]
+
+        assert task_config["task"] == "app.celery.tasks.refresh_notification_stats"
+        assert task_config["schedule"].run_every.total_seconds() == 3600.0
+
+    def test_prune_rate_limit_logs_schedule(self):
+        """Test that rate limit audit rows are pruned daily."""
+        task_config = celery_app.conf.beat_schedule["prune-rate-limit-logs"]
+
+        assert task_config["task"] == "app.celery.tasks.prune_rate_limit_logs"
+        assert task_config["schedule"].run_every.total_seconds() == 86400.0
+
     def test_beat_schedule_structure_integrity(self):
         """Test that all registered tasks have required configuration keys."""
         for task_name, task_config in celery_app.conf.beat_schedule.items():
@@ -1,23 +1,34 @@
 """Tests for Celery tasks."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest
 from app.celery.tasks import (
+    CeleryNotificationOutbox,
     _check_disruptions_async,
+    _deliver_notification_async,
     _detect_stale_routes_async,
+    _prune_rate_limit_logs_async,
     _rebuild_indexes_async,
+    _refresh_notification_stats_async,
     check_disruptions_and_alert,
+    deliver_notification_task,
     detect_and_rebuild_stale_routes,
     find_stale_route_ids,
+    prune_rate_limit_logs_task,
     rebuild_route_indexes_task,
+    refresh_notification_stats_task,
 )
+from app.core.config import settings
+from app.services.notification_outbox import OutboundNotification
 
 # ==================== check_disruptions_and_alert Tests ====================
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.get_worker_session")
@@ -25,6 +36,8 @@ async def test_check_disruptions_async_success(
     mock_session_factory: MagicMock,
     mock_redis_func: MagicMock,
     mock_alert_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test successful execution of _check_disruptions_async function."""
     # Mock database session
@@ -57,13 +70,26 @@ async def test_check_disruptions_async_success(
     assert result["errors"] == 0
 
     # Verify AlertService was instantiated correctly
-    mock_alert_class.assert_called_once_with(db=mock_session, redis_client=mock_redis)
+    mock_alert_class.assert_called_once_with(
+        db=mock_session,
+        redis_client=mock_redis,
+        session_factory=mock_session_factory,
+        tfl_resources=mock_tfl_resources_func.return_value,
+        notification_outbox=ANY,
+    )
+    # Notifications are queued for delivery workers by default
+    assert isinstance(mock_alert_class.call_args.kwargs["notification_outbox"], CeleryNotificationOutbox)
+
+    # Verify the worker's SMTP pool was registered for alert emails
+    mock_smtp_pool_func.assert_called_once()
 
     # Verify process_all_routes was called
     mock_alert_instance.process_all_routes.assert_called_once()
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.get_worker_session")
@@ -71,6 +97,8 @@ async def test_check_disruptions_async_returns_stats(
     mock_session_factory: MagicMock,
     mock_redis_func: MagicMock,
     mock_alert_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test that async function returns correct statistics structure."""
     # Mock database session
@@ -105,6 +133,8 @@ async def test_check_disruptions_async_returns_stats(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_session")
@@ -112,6 +142,8 @@ async def test_check_disruptions_async_closes_session(
     mock_session_factory: MagicMock,
     mock_alert_class: MagicMock,
     mock_redis_func: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test that async function properly closes database session.
 
@@ -145,6 +177,8 @@ async def test_check_disruptions_async_closes_session(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_session")
@@ -152,6 +186,8 @@ async def test_check_disruptions_async_closes_session_on_error(
     mock_session_factory: MagicMock,
     mock_alert_class: MagicMock,
     mock_redis_func: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test that async function closes session even when error occurs."""
     # Mock database session
@@ -177,6 +213,8 @@ async def test_check_disruptions_async_closes_session_on_error(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_session")
@@ -184,6 +222,8 @@ async def test_check_disruptions_async_no_routes_checked(
     mock_session_factory: MagicMock,
     mock_alert_class: MagicMock,
     mock_redis_func: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test async function when no routes are checked (no active routes)."""
     # Mock database session
@@ -217,6 +257,8 @@ async def test_check_disruptions_async_no_routes_checked(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_session")
@@ -224,6 +266,8 @@ async def test_check_disruptions_async_with_errors(
     mock_session_factory: MagicMock,
     mock_alert_class: MagicMock,
     mock_redis_func: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test async function when some routes have errors but function completes."""
     # Mock database session
@@ -257,10 +301,15 @@ async def test_check_disruptions_async_with_errors(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.get_worker_session")
 async def test_check_disruptions_async_closes_session_when_redis_fails(
-    mock_session_factory: MagicMock, mock_redis_func: MagicMock
+    mock_session_factory: MagicMock,
+    mock_redis_func: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test that session is closed even when Redis client retrieval fails."""
     # Mock database session
@@ -280,6 +329,8 @@ async def test_check_disruptions_async_closes_session_when_redis_fails(
 
 
 @pytest.mark.asyncio
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
 @patch("app.celery.tasks.AlertService")
 @patch("app.celery.tasks.get_worker_redis_client")
 @patch("app.celery.tasks.get_worker_session")
@@ -287,6 +338,8 @@ async def test_check_disruptions_async_closes_session_when_service_fails(
     mock_session_factory: MagicMock,
     mock_redis_func: MagicMock,
     mock_alert_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
 ) -> None:
     """Test that session is closed even when AlertService instantiation fails."""
     # Mock database session
@@ -379,6 +432,133 @@ def test_check_disruptions_task_logs_on_error(mock_run_async_task: MagicMock) ->
         assert call_args[0][0] == "check_disruptions_task_failed"
 
 
+@pytest.mark.asyncio
+@patch.object(settings, "NOTIFICATION_QUEUE_ENABLED", False)
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_tfl_resources")
+@patch("app.celery.tasks.AlertService")
+@patch("app.celery.tasks.get_worker_redis_client")
+@patch("app.celery.tasks.get_worker_session")
+async def test_check_disruptions_async_inline_notifications_when_queue_disabled(
+    mock_session_factory: MagicMock,
+    mock_redis_func: MagicMock,
+    mock_alert_class: MagicMock,
+    mock_tfl_resources_func: MagicMock,
+    mock_smtp_pool_func: MagicMock,
+) -> None:
+    """Test that no outbox is passed (inline sending) when the notification queue is disabled."""
+    mock_session_factory.return_value = AsyncMock()
+    mock_alert_class.return_value.process_all_routes = AsyncMock(
+        return_value={"routes_checked": 0, "alerts_sent": 0, "errors": 0}
+    )
+
+    await _check_disruptions_async()
+
+    assert mock_alert_class.call_args.kwargs["notification_outbox"] is None
+
+
+# ==================== deliver_notification Tests ====================
+
+
+def _outbound() -> OutboundNotification:
+    """Build a queued email notification."""
+    return OutboundNotification(
+        user_id=str(uuid4()),
+        route_id=str(uuid4()),
+        kind="disruption_alert",
+        recipient="user@example.com",
+        notification={
+            "method": "email",
+            "subject": "Disrupted",
+            "html_content": "<p>Disrupted</p>",
+            "text_content": "Disrupted",
+        },
+    )
+
+
+@patch("app.celery.tasks.deliver_notification_task.delay")
+def test_celery_notification_outbox_enqueues_task(mock_delay: MagicMock) -> None:
+    """Test that the Celery outbox queues a deliver_notification task."""
+    outbound = _outbound()
+
+    CeleryNotificationOutbox().enqueue(outbound)
+
+    mock_delay.assert_called_once_with(outbound)
+
+
+def test_deliver_notification_routed_to_notifications_queue() -> None:
+    """Test that deliveries go to the notifications queue consumed by delivery workers."""
+    queue = deliver_notification_task.app.amqp.router.route({}, deliver_notification_task.name)["queue"]
+
+    assert queue.name == "notifications"
+    assert deliver_notification_task.acks_late is True
+
+
+@patch("app.celery.tasks.run_in_worker_loop")
+def test_deliver_notification_task_success(mock_run_async_task: MagicMock) -> None:
+    """Test the synchronous task wrapper success path."""
+    mock_run_async_task.return_value = True
+    outbound = _outbound()
+
+    result = deliver_notification_task(outbound)
+
+    assert result == {"status": "sent", "kind": "disruption_alert", "retries": 0}
+    mock_run_async_task.assert_called_once_with(_deliver_notification_async, outbound, final_attempt=False)
+
+
+@patch("app.celery.tasks.run_in_worker_loop")
+def test_deliver_notification_task_retries_on_error(mock_run_async_task: MagicMock) -> None:
+    """Test that a failed delivery is retried with backoff."""
+    mock_run_async_task.side_effect = ConnectionRefusedError("SMTP down")
+
+    with (
+        patch.object(deliver_notification_task, "retry", side_effect=RuntimeError("retry")) as mock_retry,
+        pytest.raises(RuntimeError, match="retry"),
+    ):
+        deliver_notification_task(_outbound())
+
+    assert mock_retry.call_args.kwargs["countdown"] == settings.NOTIFICATION_DELIVERY_RETRY_BACKOFF_SECONDS
+
+
+@patch("app.celery.tasks.run_in_worker_loop")
+def test_deliver_notification_task_final_attempt(mock_run_async_task: MagicMock) -> None:
+    """Test that the last retry is a final attempt, reported as failed instead of retried."""
+    mock_run_async_task.return_value = False
+    retries = settings.NOTIFICATION_DELIVERY_MAX_RETRIES
+
+    deliver_notification_task.push_request(retries=retries)
+    try:
+        result = deliver_notification_task(_outbound())
+    finally:
+        deliver_notification_task.pop_request()
+
+    assert result == {"status": "failed", "kind": "disruption_alert", "retries": retries}
+    assert mock_run_async_task.call_args.kwargs["final_attempt"] is True
+
+
+@pytest.mark.asyncio
+@patch("app.celery.tasks.deliver_outbound_notification", new_callable=AsyncMock)
+@patch("app.celery.tasks.get_worker_smtp_pool")
+@patch("app.celery.tasks.get_worker_session")
+async def test_deliver_notification_async_uses_pool_and_closes_session(
+    mock_session_factory: MagicMock,
+    mock_smtp_pool_func: MagicMock,
+    mock_deliver: AsyncMock,
+) -> None:
+    """Test that delivery registers the worker SMTP pool and closes its session."""
+    mock_session = AsyncMock()
+    mock_session_factory.return_value = mock_session
+    mock_deliver.side_effect = RuntimeError("boom")
+    outbound = _outbound()
+
+    with pytest.raises(RuntimeError):
+        await _deliver_notification_async(outbound, final_attempt=False)
+
+    mock_smtp_pool_func.assert_called_once()
+    mock_deliver.assert_called_once_with(mock_session, outbound, final_attempt=False)
+    mock_session.close.assert_called_once()
+
+
 # ==================== rebuild_route_indexes_task Tests ====================
 
 
@@ -1059,3 +1239,83 @@ def test_detect_stale_routes_task_logs_on_error(mock_run_async_task: MagicMock)
         mock_logger.error.assert_called_once()
         call_args = mock_logger.error.call_args
         assert call_args[0][0] == "detect_stale_routes_task_failed"
+
+
+# ==================== refresh_notification_stats Tests ====================
+
+
+@pytest.mark.asyncio
+@patch("app.celery.tasks.NotificationStatsService")
+@patch("app.celery.tasks.get_worker_session")
+async def test_refresh_notification_stats_async_success(
+    mock_session_factory: MagicMock,
+    mock_stats_service_class: MagicMock,
+) -> None:
+    """Test that the rollup is refreshed and the session closed."""
+    mock_session = AsyncMock()
+    mock_session_factory.return_value = mock_session
+    mock_stats_service_class.return_value.refresh_daily_stats = AsyncMock(return_value=4)
+
+    result = await _refresh_notification_stats_async()
+
+    assert result == {"status": "success", "rows_upserted": 4}
+    mock_stats_service_class.assert_called_once_with(mock_session)
+    mock_session.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("app.celery.tasks.NotificationStatsService")
+@patch("app.celery.tasks.get_worker_session")
+async def test_refresh_notification_stats_async_closes_session_on_error(
+    mock_session_factory: MagicMock,
+    mock_stats_service_class: MagicMock,
+) -> None:
+    """Test that the session is closed when the refresh fails."""
+    mock_session = AsyncMock()
+    mock_session_factory.return_value = mock_session
+    mock_stats_service_class.return_value.refresh_daily_stats = AsyncMock(side_effect=RuntimeError("DB error"))
+
+    with pytest.raises(RuntimeError, match="DB error"):
+        await _refresh_notification_stats_async()
+
+    mock_session.close.assert_called_once()
+
+
+@patch("app.celery.tasks.run_in_worker_loop")
+def test_refresh_notification_stats_task_retry_on_error(mock_run_async_task: MagicMock) -> None:
+    """Test that task retries on exception."""
+    mock_run_async_task.side_effect = RuntimeError("Database connection lost")
+
+    with pytest.raises(Exception):  # noqa: B017, PT011  # Celery raises Retry exception
+        refresh_notification_stats_task()
+
+
+# ==================== prune_rate_limit_logs Tests ====================
+
+
+@pytest.mark.asyncio
+@patch("app.celery.tasks.VerificationService")
+@patch("app.celery.tasks.get_worker_session")
+async def test_prune_rate_limit_logs_async_success(
+    mock_session_factory: MagicMock,
+    mock_verification_service_class: MagicMock,
+) -> None:
+    """Test that old audit rows are pruned and the session closed."""
+    mock_session = AsyncMock()
+    mock_session_factory.return_value = mock_session
+    mock_verification_service_class.return_value.prune_rate_limit_logs = AsyncMock(return_value=7)
+
+    result = await _prune_rate_limit_logs_async()
+
+    assert result == {"status": "success", "rows_deleted": 7}
+    mock_verification_service_class.assert_called_once_with(mock_session)
+    mock_session.close.assert_called_once()
+
+
+@patch("app.celery.tasks.run_in_worker_loop")
+def test_prune_rate_limit_logs_task_retry_on_error(mock_run_async_task: MagicMock) -> None:
+    """Test that task retries on exception."""
+    mock_run_async_task.side_effect = RuntimeError("Database connection lost")
+
+    with pytest.raises(Exception):  # noqa: B017, PT011  # Celery raises Retry exception
+        prune_rate_limit_logs_task()
@@ -0,0 +1,102 @@
+"""Tests for the Celery worker heartbeat publisher."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.celery.app import celery_app
+from app.celery.worker_status import (
+    WorkerHeartbeatStep,
+    build_heartbeat,
+    prune_stale_heartbeats,
+    publish_heartbeat,
+)
+from app.helpers.worker_status import WORKER_STATUS_KEY, WORKER_STATUS_TTL_SECONDS, WorkerHeartbeat
+
+
+def _make_consumer() -> MagicMock:
+    """Create a mock worker consumer with an empty timer queue."""
+    consumer = MagicMock()
+    consumer.hostname = "celery@worker1"
+    consumer.timer.schedule.queue = []
+    return consumer
+
+
+@patch("app.celery.worker_status.worker_state")
+def test_build_heartbeat_counts_active_and_waiting_tasks(mock_worker_state: MagicMock) -> None:
+    """Test that reserved tasks not yet executing count as scheduled."""
+    active = [object()]
+    mock_worker_state.active_requests = set(active)
+    mock_worker_state.reserved_requests = {*active, object(), object()}
+
+    heartbeat = build_heartbeat(_make_consumer())
+
+    assert heartbeat.hostname == "celery@worker1"
+    assert heartbeat.active_tasks == 1
+    assert heartbeat.scheduled_tasks == 2
+
+
+@patch("app.celery.worker_status.worker_state")
+def test_publish_heartbeat_writes_to_status_hash(mock_worker_state: MagicMock) -> None:
+    """Test that the heartbeat is written to the hash and the hash expiry refreshed."""
+    mock_worker_state.active_requests = set()
+    mock_worker_state.reserved_requests = set()
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+
+    publish_heartbeat(client, _make_consumer())
+
+    hostname, data = pipe.hset.call_args.args[1:]
+    assert pipe.hset.call_args.args[0] == WORKER_STATUS_KEY
+    assert hostname == "celery@worker1"
+    assert WorkerHeartbeat.from_json(data).hostname == "celery@worker1"
+    pipe.expire.assert_called_once_with(WORKER_STATUS_KEY, WORKER_STATUS_TTL_SECONDS)
+    pipe.execute.assert_called_once()
+
+
+def test_publish_heartbeat_swallows_redis_errors() -> None:
+    """Test that a Redis failure doesn't propagate into the consumer's timer."""
+    client = MagicMock()
+    client.pipeline.return_value.execute.side_effect = ConnectionError("Redis down")
+
+    publish_heartbeat(client, _make_consumer())
+
+
+def test_prune_stale_heartbeats() -> None:
+    """Test that heartbeats from long-silent or malformed workers are removed."""
+    now = datetime.now(UTC)
+    recent = WorkerHeartbeat("celery@recent", now - timedelta(minutes=1), 0, 0)
+    old = WorkerHeartbeat("celery@old", now - timedelta(days=1), 0, 0)
+    client = MagicMock()
+    client.hgetall.return_value = {
+        recent.hostname: recent.to_json(),
+        old.hostname: old.to_json(),
+        "celery@broken": "garbage",
+    }
+
+    assert prune_stale_heartbeats(client) == 2
+    client.hdel.assert_called_once_with(WORKER_STATUS_KEY, "celery@old", "celery@broken")
+
+
+@patch("app.celery.worker_status.redis.Redis.from_url")
+def test_heartbeat_step_lifecycle(mock_from_url: MagicMock) -> None:
+    """Test that the step publishes on the consumer timer and removes its heartbeat on shutdown."""
+    client = mock_from_url.return_value
+    client.hgetall.return_value = {}
+    consumer = _make_consumer()
+    step = WorkerHeartbeatStep(consumer)
+
+    step.start(consumer)
+
+    consumer.timer.call_repeatedly.assert_called_once()
+    assert consumer.timer.call_repeatedly.call_args.args[1] is publish_heartbeat
+
+    step.shutdown(consumer)
+
+    consumer.timer.call_repeatedly.return_value.cancel.assert_called_once()
+    client.hdel.assert_called_once_with(WORKER_STATUS_KEY, "celery@worker1")
+    client.close.assert_called_once()
+
+
+def test_heartbeat_step_registered() -> None:
+    """Test that workers run the heartbeat step with their consumer."""
+    assert WorkerHeartbeatStep in celery_app.steps["consumer"]
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiosmtplib
 import pytest
-from app.services.email_service import EmailService, get_tls_settings
+from app.services.email_service import EmailService, OutgoingEmail, get_tls_settings
 
 
 class TestGetTlsSettings:
@@ -106,3 +106,55 @@ class TestEmailService:
 
         with pytest.raises(ConnectionRefusedError):
             await service.send_verification_email("test@example.com", "123456")
+
+    @pytest.mark.asyncio
+    async def test_send_verification_email_uses_pool(self) -> None:
+        """Test that a registered SMTP pool is used instead of a new connection."""
+        mock_pool = AsyncMock()
+
+        service = EmailService(smtp_pool=mock_pool)
+        await service.send_verification_email("test@example.com", "123456")
+
+        mock_pool.send_message.assert_called_once()
+        assert mock_pool.send_message.call_args[0][0]["To"] == "test@example.com"
+
+    @pytest.mark.asyncio
+    async def test_send_emails_collects_failures(self) -> None:
+        """Test that one failed email in a batch doesn't stop the others."""
+        mock_pool = AsyncMock()
+        refused = aiosmtplib.SMTPRecipientsRefused([])
+        mock_pool.send_message.side_effect = [None, refused, None]
+
+        service = EmailService(smtp_pool=mock_pool)
+        errors = await service.send_emails(
+            [
+                OutgoingEmail(to=f"user{i}@example.com", subject="Subject", html_content="<p>Hi</p>", text_content="Hi")
+                for i in range(3)
+            ]
+        )
+
+        assert errors == [None, refused, None]
+        assert mock_pool.send_message.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("app.services.email_service.create_smtp_pool")
+    async def test_send_emails_without_pool_uses_temporary_pool(self, mock_create_pool: MagicMock) -> None:
+        """Test that a batch without a process-wide pool shares a temporary pool, closed afterwards."""
+        mock_pool = AsyncMock()
+        mock_create_pool.return_value = mock_pool
+
+        service = EmailService()
+        service.smtp_pool = None  # As if no lifespan or worker registered a pool
+        errors = await service.send_emails(
+            [OutgoingEmail(to="user@example.com", subject="Subject", html_content="<p>Hi</p>", text_content="Hi")]
+        )
+
+        assert errors == [None]
+        mock_create_pool.assert_called_once()
+        mock_pool.send_message.assert_called_once()
+        mock_pool.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_send_emails_empty(self) -> None:
+        """Test that an empty batch sends nothing."""
+        assert await EmailService().send_emails([]) == []
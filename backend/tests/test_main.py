@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from app import __version__
+from app.core.rate_limiter import get_rate_limiter
 from app.main import _check_alembic_migrations, lifespan
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
@@ -289,6 +290,8 @@ async def test_lifespan_production_success() -> None:
             "app.main.warm_up_metadata_cache",
             return_value={"severity_codes_count": 0, "disruption_categories_count": 0, "stop_types_count": 0},
         ),
+        patch("app.main.init_jwks_cache", new_callable=AsyncMock) as mock_init_jwks_cache,
+        patch("app.main.close_jwks_cache", new_callable=AsyncMock) as mock_close_jwks_cache,
     ):
         mock_settings.DEBUG = False
         mock_settings.LOG_LEVEL = "INFO"
@@ -296,7 +299,10 @@ async def test_lifespan_production_success() -> None:
 
         # Lifespan should complete without raising exceptions
         async with lifespan(mock_app):
-            pass  # Lifespan startup successful
+            # Auth0 signing keys are fetched at startup
+            mock_init_jwks_cache.assert_awaited_once()
+
+        mock_close_jwks_cache.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -316,6 +322,9 @@ async def test_lifespan_production_runtime_error() -> None:
             async with lifespan(mock_app):
                 pass
 
+    # Clients created before the failure are closed and unregistered
+    assert get_rate_limiter() is None
+
 
 @pytest.mark.asyncio
 async def test_lifespan_production_os_error() -> None:
@@ -333,3 +342,6 @@ async def test_lifespan_production_os_error() -> None:
         with pytest.raises(OSError, match="File error"):
             async with lifespan(mock_app):
                 pass
+
+    # Clients created before the failure are closed and unregistered
+    assert get_rate_limiter() is None
@@ -0,0 +1,101 @@
+"""Tests for queued notification delivery."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from app.models.notification import NotificationLog, NotificationMethod, NotificationStatus
+from app.services.notification_outbox import OutboundNotification, deliver_outbound_notification
+from sqlalchemy.exc import OperationalError
+
+
+def _outbound(method: str = "email") -> OutboundNotification:
+    """Build a queued notification."""
+    return OutboundNotification(
+        user_id=str(uuid4()),
+        route_id=str(uuid4()),
+        kind="disruption_alert",
+        recipient="user@example.com" if method == "email" else "+447700900123",
+        notification={
+            "method": method,
+            "subject": "Disrupted" if method == "email" else None,
+            "html_content": "<p>Disrupted</p>" if method == "email" else None,
+            "text_content": "Disrupted",
+        },
+    )
+
+
+def _mock_db() -> AsyncMock:
+    """Build a mock AsyncSession that records added objects."""
+    db = AsyncMock()
+    db.add = MagicMock()
+    return db
+
+
+class TestDeliverOutboundNotification:
+    """Tests for deliver_outbound_notification()."""
+
+    @pytest.mark.asyncio
+    @patch("app.services.email_service.EmailService.send_email", new_callable=AsyncMock)
+    async def test_sent_email_logged(self, mock_send_email: AsyncMock) -> None:
+        """Test that a delivered email is sent as rendered and logged as SENT."""
+        db = _mock_db()
+        outbound = _outbound()
+
+        assert await deliver_outbound_notification(db, outbound, final_attempt=False) is True
+
+        mock_send_email.assert_called_once_with("user@example.com", "Disrupted", "<p>Disrupted</p>", "Disrupted")
+        log = db.add.call_args[0][0]
+        assert isinstance(log, NotificationLog)
+        assert str(log.route_id) == outbound["route_id"]
+        assert log.method == NotificationMethod.EMAIL
+        assert log.status == NotificationStatus.SENT
+        db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("app.services.sms_service.SmsService.send_sms", new_callable=AsyncMock)
+    async def test_sent_sms(self, mock_send_sms: AsyncMock) -> None:
+        """Test that SMS notifications are sent via SmsService."""
+        db = _mock_db()
+
+        assert await deliver_outbound_notification(db, _outbound("sms"), final_attempt=False) is True
+
+        mock_send_sms.assert_called_once_with("+447700900123", "Disrupted")
+        assert db.add.call_args[0][0].method == NotificationMethod.SMS
+
+    @pytest.mark.asyncio
+    @patch("app.services.email_service.EmailService.send_email", new_callable=AsyncMock)
+    async def test_failure_before_final_attempt_raises(self, mock_send_email: AsyncMock) -> None:
+        """Test that failures are raised for retry without a log entry."""
+        mock_send_email.side_effect = ConnectionRefusedError("SMTP down")
+        db = _mock_db()
+
+        with pytest.raises(ConnectionRefusedError):
+            await deliver_outbound_notification(db, _outbound(), final_attempt=False)
+
+        db.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.services.email_service.EmailService.send_email", new_callable=AsyncMock)
+    async def test_final_failure_logged(self, mock_send_email: AsyncMock) -> None:
+        """Test that the final failed attempt is logged as FAILED instead of raised."""
+        mock_send_email.side_effect = ConnectionRefusedError("SMTP down")
+        db = _mock_db()
+
+        assert await deliver_outbound_notification(db, _outbound(), final_attempt=True) is False
+
+        log = db.add.call_args[0][0]
+        assert log.status == NotificationStatus.FAILED
+        assert log.error_message == "SMTP down"
+
+    @pytest.mark.asyncio
+    @patch("app.services.email_service.EmailService.send_email", new_callable=AsyncMock)
+    async def test_log_failure_not_raised(self, mock_send_email: AsyncMock) -> None:
+        """Test that a database error after sending doesn't raise (a retry would resend)."""
+        db = _mock_db()
+        db.commit.side_effect = OperationalError("INSERT", {}, Exception("connection lost"))
+
+        assert await deliver_outbound_notification(db, _outbound(), final_attempt=False) is True
+
+        mock_send_email.assert_called_once()
+        db.rollback.assert_called_once()
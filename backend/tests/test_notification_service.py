@@ -7,10 +7,14 @@ from unittest.mock import AsyncMock, patch
 from urllib.parse import urlparse
 
 import pytest
+from app.models.notification import NotificationMethod
 from app.schemas.tfl import ClearedLineInfo, DisruptionResponse
 from app.services.notification_service import (
+    NotificationRenderCache,
     NotificationService,
+    _build_disruption_sms,
     _build_disruption_subject,
+    _build_status_update_sms,
     _build_status_update_subject,
 )
 
@@ -123,6 +127,102 @@ class TestNotificationService:
         with pytest.raises(smtplib.SMTPException):
             await service.send_disruption_email(email, route_name, disruptions)
 
+    @pytest.mark.asyncio
+    @patch("app.services.email_service.EmailService.send_emails", new_callable=AsyncMock)
+    async def test_send_disruption_emails_renders_once_for_batch(self, mock_send_emails: AsyncMock) -> None:
+        """Test that a batch sends the same rendered email to every recipient and returns per-recipient errors."""
+        failure = smtplib.SMTPRecipientsRefused({})
+        mock_send_emails.return_value = [None, failure]
+
+        service = NotificationService()
+        disruptions = [
+            DisruptionResponse(
+                line_id="victoria",
+                line_name="Victoria",
+                mode="tube",
+                status_severity=6,
+                status_severity_description="Minor Delays",
+            )
+        ]
+
+        errors = await service.send_disruption_emails(
+            ["one@example.com", "two@example.com"], "Morning Commute", disruptions
+        )
+
+        assert errors == [None, failure]
+        outgoing = mock_send_emails.call_args[0][0]
+        assert [email.to for email in outgoing] == ["one@example.com", "two@example.com"]
+        assert outgoing[0].subject == "⚠️ Morning Commute: Victoria disrupted"
+        assert outgoing[0].html_content == outgoing[1].html_content
+        assert outgoing[0].text_content == outgoing[1].text_content
+
+    def test_render_disruption_notification(self) -> None:
+        """Test that rendered disruption alerts match what the direct send methods produce."""
+        service = NotificationService()
+        disruptions = [
+            DisruptionResponse(
+                line_id="victoria",
+                line_name="Victoria",
+                mode="tube",
+                status_severity=6,
+                status_severity_description="Minor Delays",
+            )
+        ]
+
+        email = service.render_disruption_notification(NotificationMethod.EMAIL, "Morning Commute", disruptions)
+        sms = service.render_disruption_notification(NotificationMethod.SMS, "Morning Commute", disruptions)
+
+        assert email["method"] == "email"
+        assert email["subject"] == "⚠️ Morning Commute: Victoria disrupted"
+        assert email["html_content"] is not None
+        assert "Victoria: Minor Delays" in email["text_content"]
+        assert sms == {
+            "method": "sms",
+            "subject": None,
+            "html_content": None,
+            "text_content": _build_disruption_sms("Morning Commute", disruptions),
+        }
+
+    def test_render_status_update_notification(self) -> None:
+        """Test that rendered status updates carry the status update subject and SMS text."""
+        service = NotificationService()
+        cleared = [
+            ClearedLineInfo(
+                line_id="victoria",
+                line_name="Victoria",
+                mode="tube",
+                previous_severity=6,
+                previous_status="Minor Delays",
+                current_severity=10,
+                current_status="Good Service",
+            )
+        ]
+
+        email = service.render_status_update_notification(NotificationMethod.EMAIL, "Morning Commute", cleared, [])
+        sms = service.render_status_update_notification(NotificationMethod.SMS, "Morning Commute", cleared, [])
+
+        assert email["subject"] == "✅ Morning Commute: Victoria restored"
+        assert sms["text_content"] == _build_status_update_sms("Morning Commute", cleared, [])
+
+    @pytest.mark.asyncio
+    @patch("app.services.sms_service.SmsService.send_sms", new_callable=AsyncMock)
+    @patch("app.services.email_service.EmailService.send_email", new_callable=AsyncMock)
+    async def test_send_rendered_notification(self, mock_send_email: AsyncMock, mock_send_sms: AsyncMock) -> None:
+        """Test that rendered notifications are sent via the service for their method."""
+        service = NotificationService()
+
+        await service.send_rendered_notification(
+            "test@example.com",
+            {"method": "email", "subject": "Subject", "html_content": "<p>Body</p>", "text_content": "Body"},
+        )
+        await service.send_rendered_notification(
+            "+442071234567",
+            {"method": "sms", "subject": None, "html_content": None, "text_content": "Body"},
+        )
+
+        mock_send_email.assert_called_once_with("test@example.com", "Subject", "<p>Body</p>", "Body")
+        mock_send_sms.assert_called_once_with("+442071234567", "Body")
+
     @pytest.mark.asyncio
     @patch("app.services.sms_service.SmsService.send_sms", new_callable=AsyncMock)
     async def test_send_disruption_sms_success(self, mock_send_sms: AsyncMock) -> None:
@@ -1071,3 +1171,95 @@ class TestNotificationService:
 
         with pytest.raises(ValueError, match="No lines provided"):
             _build_status_update_subject("To Work", cleared_lines, still_disrupted)
+
+
+class TestNotificationRenderCache:
+    """Test cases for sharing rendered email content between recipients."""
+
+    @staticmethod
+    def _disruptions(reason: str = "Signal failure") -> list[DisruptionResponse]:
+        return [
+            DisruptionResponse(
+                line_id="victoria",
+                line_name="Victoria",
+                mode="tube",
+                status_severity=6,
+                status_severity_description="Severe Delays",
+                reason=reason,
+            )
+        ]
+
+    def test_disruption_block_rendered_once_per_disruption_set(self) -> None:
+        """Test that routes with the same disruptions reuse the rendered block but keep their own route name."""
+        cache = NotificationRenderCache()
+        service = NotificationService(render_cache=cache)
+
+        first = service.render_disruption_notification(NotificationMethod.EMAIL, "Morning Commute", self._disruptions())
+        second = service.render_disruption_notification(
+            NotificationMethod.EMAIL, "Evening Commute", self._disruptions()
+        )
+
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        assert len(cache) == 1
+        assert "Morning Commute" in first["html_content"]
+        assert "Evening Commute" in second["html_content"]
+        assert "Evening Commute" in second["text_content"]
+        assert "Signal failure" in second["html_content"]
+        assert "  Reason: Signal failure" in second["text_content"]
+
+    def test_different_disruptions_rendered_separately(self) -> None:
+        """Test that a changed disruption reason is a cache miss."""
+        cache = NotificationRenderCache()
+        service = NotificationService(render_cache=cache)
+
+        service.render_disruption_notification(NotificationMethod.EMAIL, "To Work", self._disruptions())
+        changed = service.render_disruption_notification(
+            NotificationMethod.EMAIL, "To Work", self._disruptions(reason="Customer incident")
+        )
+
+        assert cache.stats.misses == 2
+        assert cache.stats.hits == 0
+        assert "Customer incident" in changed["html_content"]
+        assert "Signal failure" not in changed["html_content"]
+
+    def test_cached_email_matches_uncached_email(self) -> None:
+        """Test that the cache doesn't change the rendered disruption or status update emails."""
+        cached_service = NotificationService(render_cache=NotificationRenderCache())
+        cleared_lines = [
+            ClearedLineInfo(
+                line_id="northern",
+                line_name="Northern",
+                mode="tube",
+                previous_severity=6,
+                previous_status="Severe Delays",
+                current_severity=10,
+                current_status="Good Service",
+            )
+        ]
+
+        for _ in range(2):
+            assert cached_service.render_disruption_notification(
+                NotificationMethod.EMAIL, "To Work", self._disruptions()
+            ) == NotificationService().render_disruption_notification(
+                NotificationMethod.EMAIL, "To Work", self._disruptions()
+            )
+            assert cached_service.render_status_update_notification(
+                NotificationMethod.EMAIL, "To Work", cleared_lines, self._disruptions()
+            ) == NotificationService().render_status_update_notification(
+                NotificationMethod.EMAIL, "To Work", cleared_lines, self._disruptions()
+            )
+
+        assert cached_service.render_cache is not None
+        assert cached_service.render_cache.stats.hits == 2
+
+    def test_block_html_is_escaped(self) -> None:
+        """Test that disruption text is still HTML-escaped when rendered into the cached block."""
+        service = NotificationService(render_cache=NotificationRenderCache())
+
+        rendered = service.render_disruption_notification(
+            NotificationMethod.EMAIL, "To Work", self._disruptions(reason="<script>alert(1)</script>")
+        )
+
+        assert "<script>" not in rendered["html_content"]
+        assert "&lt;script&gt;" in rendered["html_content"]
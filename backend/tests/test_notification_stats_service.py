@@ -0,0 +1,160 @@
+"""Tests for NotificationStatsService."""
+
+from datetime import UTC, date, datetime
+
+import pytest
+from app.models.notification import (
+    NotificationLog,
+    NotificationLogDailyStat,
+    NotificationMethod,
+    NotificationStatus,
+)
+from app.models.user import User
+from app.models.user_route import UserRoute
+from app.services.notification_stats_service import NotificationStatsService
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Tuesday 2025-01-07 12:00 UTC: Jan 5 and Jan 6 are complete days, Jan 7 is not
+NOW = datetime(2025, 1, 7, 12, 0, tzinfo=UTC)
+
+
+async def _add_logs(
+    db_session: AsyncSession,
+    user: User,
+    logs: list[tuple[datetime, NotificationMethod, NotificationStatus]],
+) -> None:
+    """Add notification logs with the given (sent_at, method, status)."""
+    route = UserRoute(user_id=user.id, name="Test Route", active=True, timezone="Europe/London")
+    db_session.add(route)
+    await db_session.flush()
+
+    db_session.add_all(
+        NotificationLog(user_id=user.id, route_id=route.id, sent_at=sent_at, method=method, status=status)
+        for sent_at, method, status in logs
+    )
+    await db_session.commit()
+
+
+async def _get_daily_stats(db_session: AsyncSession) -> list[tuple[date, NotificationMethod, NotificationStatus, int]]:
+    """Get the rollup as sorted (day, method, status, count) tuples."""
+    result = await db_session.execute(
+        select(
+            NotificationLogDailyStat.day,
+            NotificationLogDailyStat.method,
+            NotificationLogDailyStat.status,
+            NotificationLogDailyStat.count,
+        ).order_by(NotificationLogDailyStat.day, NotificationLogDailyStat.method)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+class TestRefreshDailyStats:
+    """Tests for refresh_daily_stats."""
+
+    @pytest.mark.asyncio
+    async def test_rolls_up_complete_days_only(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that complete UTC days are counted per method and status, and today is skipped."""
+        await _add_logs(
+            db_session,
+            test_user,
+            [
+                (datetime(2025, 1, 5, 8, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 5, 23, 59, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 6, 0, 0, tzinfo=UTC), NotificationMethod.SMS, NotificationStatus.FAILED),
+                (datetime(2025, 1, 7, 9, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+            ],
+        )
+
+        rows_upserted = await NotificationStatsService(db_session).refresh_daily_stats(NOW)
+
+        assert rows_upserted == 2
+        assert await _get_daily_stats(db_session) == [
+            (date(2025, 1, 5), NotificationMethod.EMAIL, NotificationStatus.SENT, 2),
+            (date(2025, 1, 6), NotificationMethod.SMS, NotificationStatus.FAILED, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_refresh_only_recounts_from_last_rolled_up_day(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Test that a refresh recounts the last rolled-up day onwards, leaving earlier days alone."""
+        await _add_logs(
+            db_session,
+            test_user,
+            [
+                (datetime(2025, 1, 5, 8, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 6, 8, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+            ],
+        )
+        service = NotificationStatsService(db_session)
+        await service.refresh_daily_stats(NOW)
+
+        # Late arrivals for both rolled-up days, plus a now-complete Jan 7
+        await _add_logs(
+            db_session,
+            test_user,
+            [
+                (datetime(2025, 1, 5, 9, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 6, 9, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 7, 9, 0, tzinfo=UTC), NotificationMethod.SMS, NotificationStatus.SENT),
+            ],
+        )
+        await service.refresh_daily_stats(datetime(2025, 1, 8, 0, 30, tzinfo=UTC))
+
+        assert await _get_daily_stats(db_session) == [
+            (date(2025, 1, 5), NotificationMethod.EMAIL, NotificationStatus.SENT, 1),
+            (date(2025, 1, 6), NotificationMethod.EMAIL, NotificationStatus.SENT, 2),
+            (date(2025, 1, 7), NotificationMethod.SMS, NotificationStatus.SENT, 1),
+        ]
+
+
+class TestGetNotificationCounts:
+    """Tests for get_notification_counts."""
+
+    @pytest.mark.asyncio
+    async def test_counts_from_live_log_without_rollup(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that the whole log is counted when nothing has been rolled up."""
+        await _add_logs(
+            db_session,
+            test_user,
+            [
+                (datetime(2024, 11, 1, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 6, tzinfo=UTC), NotificationMethod.SMS, NotificationStatus.FAILED),
+            ],
+        )
+
+        counts = await NotificationStatsService(db_session).get_notification_counts(datetime(2024, 12, 8, tzinfo=UTC))
+
+        assert counts.total == 2
+        assert counts.successful == 1
+        assert counts.failed == 1
+        assert counts.by_method_recent == {"sms": 1}
+
+    @pytest.mark.asyncio
+    async def test_combines_rollup_with_days_not_rolled_up(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that rolled-up days come from the rollup and later days from the live log."""
+        await _add_logs(
+            db_session,
+            test_user,
+            [
+                (datetime(2024, 11, 1, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT),
+                (datetime(2025, 1, 6, tzinfo=UTC), NotificationMethod.SMS, NotificationStatus.FAILED),
+            ],
+        )
+        service = NotificationStatsService(db_session)
+        await service.refresh_daily_stats(NOW)
+
+        # Sent after the last rolled-up day: counted from the live log
+        await _add_logs(
+            db_session,
+            test_user,
+            [(datetime(2025, 1, 7, 9, 0, tzinfo=UTC), NotificationMethod.EMAIL, NotificationStatus.SENT)],
+        )
+
+        counts = await service.get_notification_counts(datetime(2024, 12, 8, tzinfo=UTC))
+
+        assert counts.total == 3
+        assert counts.successful == 2
+        assert counts.failed == 1
+        assert counts.by_method_recent == {"email": 1, "sms": 1}
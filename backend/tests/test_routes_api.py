@@ -17,7 +17,7 @@ from app.models.notification import (
 from app.models.tfl import Line, Station
 from app.models.user import EmailAddress, User
 from app.models.user_route import UserRoute, UserRouteSchedule, UserRouteSegment
-from app.models.user_route_index import UserRouteStationIndex
+from app.models.user_route_index import UserRouteScheduleWindow, UserRouteStationIndex
 from fastapi import HTTPException, status
 from httpx import AsyncClient
 from sqlalchemy import select
@@ -1482,6 +1482,61 @@ class TestRoutesAPI:
         assert deleted_schedule is not None
         assert deleted_schedule.deleted_at is not None
 
+    @pytest.mark.asyncio
+    async def test_schedule_changes_rebuild_schedule_windows(
+        self,
+        async_client: AsyncClient,
+        auth_headers_for_user: dict[str, str],
+        test_user: User,
+        db_session: AsyncSession,
+    ) -> None:
+        """Test that creating, updating and deleting schedules keeps the schedule window index in sync."""
+        route = UserRoute(user_id=test_user.id, name="Test Route", active=True, timezone="Europe/London")
+        db_session.add(route)
+        await db_session.commit()
+        await db_session.refresh(route)
+
+        async def get_windows() -> list[tuple[str, int, int]]:
+            result = await db_session.execute(
+                select(UserRouteScheduleWindow).where(
+                    UserRouteScheduleWindow.route_id == route.id,
+                    UserRouteScheduleWindow.deleted_at.is_(None),
+                )
+            )
+            return sorted((w.timezone, w.start_minute, w.end_minute) for w in result.scalars().all())
+
+        response = await async_client.post(
+            f"/api/v1/routes/{route.id}/schedules",
+            json={"days_of_week": ["MON", "TUE"], "start_time": "08:00:00", "end_time": "09:30:00"},
+            headers=auth_headers_for_user,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        schedule_id = response.json()["id"]
+        assert await get_windows() == [("Europe/London", 480, 570), ("Europe/London", 1920, 2010)]
+
+        response = await async_client.patch(
+            f"/api/v1/routes/{route.id}/schedules/{schedule_id}",
+            json={"days_of_week": ["WED"]},
+            headers=auth_headers_for_user,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert await get_windows() == [("Europe/London", 3360, 3450)]
+
+        response = await async_client.patch(
+            f"/api/v1/routes/{route.id}",
+            json={"timezone": "America/New_York"},
+            headers=auth_headers_for_user,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert await get_windows() == [("America/New_York", 3360, 3450)]
+
+        response = await async_client.delete(
+            f"/api/v1/routes/{route.id}/schedules/{schedule_id}",
+            headers=auth_headers_for_user,
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert await get_windows() == []
+
     @pytest.mark.asyncio
     async def test_schedule_ownership_validation(
         self,
@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from app.core.config import settings
 from app.core.database import get_db
+from app.helpers.network_graph_artifact import build_network_graph_artifact
 from app.main import app
 from app.models.tfl import DisruptionCategory, Line, SeverityCode, Station, StopType
 from app.models.user import User
@@ -560,25 +561,29 @@ async def test_build_graph_tfl_api_failure(
     assert "unavailable" in response.json()["detail"].lower()
 
 
-@patch("app.services.tfl_service.TfLService.get_network_graph")
+NETWORK_GRAPH = {
+    "940GZZLUOXC": [
+        {
+            "station_id": "abc123",
+            "station_tfl_id": "940GZZLUBND",
+            "station_name": "Bond Street",
+            "line_id": "def456",
+            "line_tfl_id": "central",
+            "line_name": "Central",
+        }
+    ]
+}
+
+
+@patch("app.services.tfl_service.TfLService.get_network_graph_artifact")
 async def test_get_network_graph_success(
-    mock_get_graph: AsyncMock,
+    mock_get_artifact: AsyncMock,
     async_client_with_auth: AsyncClient,
 ) -> None:
     """Test getting the network graph."""
     # Mock successful graph retrieval
-    mock_get_graph.return_value = {
-        "940GZZLUOXC": [
-            {
-                "station_id": "abc123",
-                "station_tfl_id": "940GZZLUBND",
-                "station_name": "Bond Street",
-                "line_id": "def456",
-                "line_tfl_id": "central",
-                "line_name": "Central",
-            }
-        ]
-    }
+    artifact = build_network_graph_artifact(NETWORK_GRAPH)
+    mock_get_artifact.return_value = artifact
 
     # Execute
     response = await async_client_with_auth.get(build_api_url("/tfl/network-graph"))
@@ -589,16 +594,71 @@ async def test_get_network_graph_success(
     assert "940GZZLUOXC" in data
     assert len(data["940GZZLUOXC"]) == 1
     assert data["940GZZLUOXC"][0]["station_name"] == "Bond Street"
+    assert response.headers["etag"] == artifact.etag
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+@patch("app.services.tfl_service.TfLService.get_network_graph_artifact")
+async def test_get_network_graph_sends_stored_gzip_body(
+    mock_get_artifact: AsyncMock,
+    async_client_with_auth: AsyncClient,
+) -> None:
+    """Test the compressed artifact is sent as-is to clients accepting gzip."""
+    artifact = build_network_graph_artifact(NETWORK_GRAPH)
+    mock_get_artifact.return_value = artifact
+
+    response = await async_client_with_auth.get(
+        build_api_url("/tfl/network-graph"), headers={"Accept-Encoding": "gzip, deflate"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json()["940GZZLUOXC"][0]["line_tfl_id"] == "central"
+
+
+@patch("app.services.tfl_service.TfLService.get_network_graph_artifact")
+async def test_get_network_graph_not_modified(
+    mock_get_artifact: AsyncMock,
+    async_client_with_auth: AsyncClient,
+) -> None:
+    """Test a matching If-None-Match returns 304 with no body."""
+    artifact = build_network_graph_artifact(NETWORK_GRAPH)
+    mock_get_artifact.return_value = artifact
+
+    response = await async_client_with_auth.get(
+        build_api_url("/tfl/network-graph"), headers={"If-None-Match": artifact.etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == artifact.etag
+
+
+@patch("app.services.tfl_service.TfLService.get_network_graph_artifact")
+async def test_get_network_graph_stale_etag_returns_graph(
+    mock_get_artifact: AsyncMock,
+    async_client_with_auth: AsyncClient,
+) -> None:
+    """Test a non-matching If-None-Match returns the full graph."""
+    mock_get_artifact.return_value = build_network_graph_artifact(NETWORK_GRAPH)
+
+    response = await async_client_with_auth.get(
+        build_api_url("/tfl/network-graph"), headers={"If-None-Match": '"stale"'}
+    )
+
+    assert response.status_code == 200
+    assert "940GZZLUOXC" in response.json()
 
 
-@patch("app.services.tfl_service.TfLService.get_network_graph")
+@patch("app.services.tfl_service.TfLService.get_network_graph_artifact")
 async def test_get_network_graph_not_built(
-    mock_get_graph: AsyncMock,
+    mock_get_artifact: AsyncMock,
     async_client_with_auth: AsyncClient,
 ) -> None:
     """Test get_network_graph when graph not built yet."""
     # Mock graph not built (503 error)
-    mock_get_graph.side_effect = HTTPException(
+    mock_get_artifact.side_effect = HTTPException(
         status_code=503,
         detail="Station graph has not been built yet. Please contact administrator.",
     )
@@ -611,14 +671,14 @@ async def test_get_network_graph_not_built(
     assert "graph has not been built" in response.json()["detail"].lower()
 
 
-@patch("app.services.tfl_service.TfLService.get_network_graph")
+@patch("app.services.tfl_service.TfLService.get_network_graph_artifact")
 async def test_get_network_graph_unexpected_error(
-    mock_get_graph: AsyncMock,
+    mock_get_artifact: AsyncMock,
     async_client_with_auth: AsyncClient,
 ) -> None:
     """Test get_network_graph when unexpected exception occurs."""
     # Mock unexpected exception (should be caught and return 500)
-    mock_get_graph.side_effect = HTTPException(
+    mock_get_artifact.side_effect = HTTPException(
         status_code=500,
         detail="Failed to fetch network graph.",
     )
@@ -1,8 +1,9 @@
 """Tests for TfL service."""
 
+import asyncio
 import uuid
 from collections.abc import Callable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any, NoReturn
 from unittest.mock import AsyncMock, MagicMock, patch
 from urllib.parse import urlparse
@@ -11,6 +12,7 @@ import pytest
 from aiocache import Cache
 from aiocache.serializers import PickleSerializer
 from app.core.config import settings
+from app.helpers.network_graph_artifact import NETWORK_GRAPH_ARTIFACT_CACHE_KEY, build_network_graph_artifact
 from app.models.tfl import (
     DisruptionCategory,
     Line,
@@ -32,6 +34,7 @@ from app.services.tfl_service import (
     _parse_tfl_timestamp,
     warm_up_metadata_cache,
 )
+from app.types.tfl_api import NetworkConnection
 from fastapi import HTTPException, status
 from freezegun import freeze_time
 from opentelemetry.sdk.trace import TracerProvider
@@ -1018,6 +1021,30 @@ async def test_fetch_lines_multiple_custom_modes(
         assert tfl_service.cache.set.call_args[0][0] == expected_cache_key
 
 
+async def test_fetch_lines_line_in_several_modes(
+    tfl_service: TfLService,
+    db_session: AsyncSession,
+) -> None:
+    """Test that a line listed under several modes is upserted once, keeping the last mode."""
+    with freeze_time("2025-01-01 12:00:00"):
+        shared = create_mock_line(id="liberty", name="Liberty")
+        tfl_service.line_client.GetByModeByPathModes.side_effect = [
+            MockResponse(data=[shared], shared_expires=datetime(2025, 1, 2, 12, 0, 0, tzinfo=UTC)),
+            MockResponse(
+                data=[create_mock_line(id="dlr", name="DLR"), shared],
+                shared_expires=datetime(2025, 1, 2, 12, 0, 0, tzinfo=UTC),
+            ),
+        ]
+
+        lines = await tfl_service.fetch_lines(modes=["overground", "elizabeth-line"], use_cache=False)
+
+        assert [line.tfl_id for line in lines] == ["liberty", "dlr"]
+        assert lines[0].mode == "elizabeth-line"
+
+        result = await db_session.execute(select(Line).where(Line.tfl_id == "liberty"))
+        assert len(result.scalars().all()) == 1
+
+
 async def test_fetch_lines_empty_mode_list(
     tfl_service: TfLService,
     db_session: AsyncSession,
@@ -1318,232 +1345,103 @@ async def test_store_line_routes_logs_changes(
 # -------------------- Unit Tests for Helper Methods --------------------
 
 
-async def test_extract_hub_fields_with_hub_code(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields extracts hub code and fetches hub name from API."""
+async def test_fetch_hub_name_returns_common_name(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_name fetches the hub's common name from the API."""
     # Mock the hub API response using helper function
     mock_hub_response = create_mock_hub_api_response(hub_id="HUBSVS", hub_common_name="Seven Sisters")
 
-    # Create mock stop point with hub code
-    stop_point = create_mock_stop_point(
-        id="910GSEVNSIS",
-        common_name="Seven Sisters Rail Station",
-        hubNaptanCode="HUBSVS",
-    )
-
     # Mock the async client method
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData.return_value = mock_hub_response
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData.side_effect = None  # Clear fail-safe error
 
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
+    assert await tfl_service._fetch_hub_name("HUBSVS") == "Seven Sisters"
 
-    # Verify extraction
-    assert hub_code == "HUBSVS"
-    assert hub_name == "Seven Sisters"
 
+async def test_fetch_hub_names_without_hub_codes(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_names makes no API calls when there are no hub codes."""
+    assert await tfl_service._fetch_hub_names([]) == {}
 
-async def test_extract_hub_fields_without_hub_code(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields returns None for both fields when hubNaptanCode is absent."""
-    # Create mock place without hub code (Place objects don't have hubNaptanCode)
-    stop_point = create_mock_place(
-        id="940GZZLUWBN",
-        common_name="Wimbledon",
-        lat=51.4214,
-        lon=-0.2064,
-    )
+    tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData.assert_not_called()
 
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
 
-    # Verify both are None
-    assert hub_code is None
-    assert hub_name is None
+NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
 
 
-def test_update_existing_station_adds_new_line(tfl_service: TfLService) -> None:
-    """Test _update_existing_station adds a new line to station's lines array."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Create station with only victoria line
-        station = Station(
-            tfl_id="940GZZLUKSX",
-            name="King's Cross",
-            latitude=51.5308,
-            longitude=-0.1238,
-            lines=["victoria"],
-            last_updated=datetime(2024, 12, 1, 0, 0, 0, tzinfo=UTC),
-            hub_naptan_code=None,
-            hub_common_name=None,
-        )
+def test_build_station_row_adds_new_line(tfl_service: TfLService) -> None:
+    """Test _build_station_row appends a new line to an existing station's lines."""
+    stop_point = create_mock_place(id="940GZZLUKSX", common_name="King's Cross", lat=51.5308, lon=-0.1238)
 
-        # Update with northern line and hub fields
-        tfl_service._update_existing_station(
-            station=station,
-            line_tfl_id="northern",
-            hub_code="HUBKGX",
-            hub_name="King's Cross",
-        )
+    row = tfl_service._build_station_row(
+        stop_point, "northern", "HUBKGX", "King's Cross", existing_lines=["victoria"], now=NOW
+    )
 
-        # Verify northern was added
-        assert "victoria" in station.lines
-        assert "northern" in station.lines
-        assert len(station.lines) == 2
-        # Verify timestamp updated
-        assert station.last_updated == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        # Verify hub fields updated
-        assert station.hub_naptan_code == "HUBKGX"
-        assert station.hub_common_name == "King's Cross"
+    assert row["lines"] == ["victoria", "northern"]
+    assert row["last_updated"] == NOW
+    assert row["updated_at"] == NOW
+    assert row["hub_naptan_code"] == "HUBKGX"
+    assert row["hub_common_name"] == "King's Cross"
 
 
-def test_update_existing_station_no_duplicate_line(tfl_service: TfLService) -> None:
-    """Test _update_existing_station does not duplicate existing line."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Create station that already has victoria line
-        station = Station(
-            tfl_id="940GZZLUKSX",
-            name="King's Cross",
-            latitude=51.5308,
-            longitude=-0.1238,
-            lines=["victoria"],
-            last_updated=datetime(2024, 12, 1, 0, 0, 0, tzinfo=UTC),
-            hub_naptan_code=None,
-            hub_common_name=None,
-        )
+def test_build_station_row_no_duplicate_line(tfl_service: TfLService) -> None:
+    """Test _build_station_row does not duplicate a line the station already has."""
+    stop_point = create_mock_place(id="940GZZLUKSX", common_name="King's Cross", lat=51.5308, lon=-0.1238)
 
-        # Update with same victoria line
-        tfl_service._update_existing_station(
-            station=station,
-            line_tfl_id="victoria",
-            hub_code="HUBKGX",
-            hub_name="King's Cross",
-        )
+    row = tfl_service._build_station_row(
+        stop_point, "victoria", "HUBKGX", "King's Cross", existing_lines=["victoria"], now=NOW
+    )
 
-        # Verify no duplicate
-        assert station.lines == ["victoria"]
-        # Verify timestamp and hub fields still updated
-        assert station.last_updated == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        assert station.hub_naptan_code == "HUBKGX"
-        assert station.hub_common_name == "King's Cross"
+    assert row["lines"] == ["victoria"]
+    assert row["hub_naptan_code"] == "HUBKGX"
 
 
-def test_update_existing_station_clears_hub_fields(tfl_service: TfLService) -> None:
-    """Test _update_existing_station clears hub fields when hub code is None."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Create station with existing hub fields
-        station = Station(
-            tfl_id="940GZZLUWBN",
-            name="Wimbledon",
-            latitude=51.4214,
-            longitude=-0.2064,
-            lines=["district"],
-            last_updated=datetime(2024, 12, 1, 0, 0, 0, tzinfo=UTC),
-            hub_naptan_code="HUBWIM",
-            hub_common_name="Wimbledon Station",
-        )
+def test_build_station_row_clears_hub_fields(tfl_service: TfLService) -> None:
+    """Test _build_station_row sets hub fields to None when the hub code is gone."""
+    stop_point = create_mock_place(id="940GZZLUWBN", common_name="Wimbledon", lat=51.4214, lon=-0.2064)
 
-        # Update with None hub fields (hub removed from API)
-        tfl_service._update_existing_station(
-            station=station,
-            line_tfl_id="district",
-            hub_code=None,
-            hub_name=None,
-        )
+    row = tfl_service._build_station_row(stop_point, "district", None, None, existing_lines=["district"], now=NOW)
 
-        # Verify hub fields cleared
-        assert station.hub_naptan_code is None
-        assert station.hub_common_name is None
+    assert row["hub_naptan_code"] is None
+    assert row["hub_common_name"] is None
 
 
-def test_create_new_station_with_hub_code(tfl_service: TfLService) -> None:
-    """Test _create_new_station creates station with hub fields when hub code is present."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Mock the hub API response
-        mock_hub_response = MagicMock()
-        mock_hub_data = create_mock_stop_point(
-            id="HUBSVS",
-            common_name="Seven Sisters",  # Hub name from API
-        )
-        mock_hub_response.content.root = [mock_hub_data]
-        tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData = MagicMock(return_value=mock_hub_response)
-
-        # Create mock stop point with hub code
-        stop_point = create_mock_stop_point(
-            id="910GSEVNSIS",
-            common_name="Seven Sisters Rail Station",
-            lat=51.5823,
-            lon=-0.0751,
-            hubNaptanCode="HUBSVS",
-        )
-
-        # Create new station
-        station = tfl_service._create_new_station(
-            stop_point=stop_point,
-            line_tfl_id="weaver",
-            hub_code="HUBSVS",
-            hub_name="Seven Sisters",  # Hub name from API
-        )
-
-        # Verify all fields
-        assert station.tfl_id == "910GSEVNSIS"
-        assert station.name == "Seven Sisters Rail Station"
-        assert station.latitude == 51.5823
-        assert station.longitude == -0.0751
-        assert station.lines == ["weaver"]
-        assert station.last_updated == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        assert station.hub_naptan_code == "HUBSVS"
-        assert station.hub_common_name == "Seven Sisters"
-
-
-def test_create_new_station_without_hub_code(tfl_service: TfLService) -> None:
-    """Test _create_new_station creates station with None hub fields when hub code is absent."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Create mock place without hub code
-        stop_point = create_mock_place(
-            id="940GZZLUWBN",
-            common_name="Wimbledon",
-            lat=51.4214,
-            lon=-0.2064,
-        )
-
-        # Create new station
-        station = tfl_service._create_new_station(
-            stop_point=stop_point,
-            line_tfl_id="district",
-            hub_code=None,
-            hub_name=None,
-        )
-
-        # Verify all fields
-        assert station.tfl_id == "940GZZLUWBN"
-        assert station.name == "Wimbledon"
-        assert station.latitude == 51.4214
-        assert station.longitude == -0.2064
-        assert station.lines == ["district"]
-        assert station.last_updated == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-        assert station.hub_naptan_code is None
-        assert station.hub_common_name is None
-
-
-async def test_extract_hub_fields_with_empty_string(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields returns None for empty string hub code."""
-    # Create mock stop point with empty string hub code
+def test_build_station_row_new_station_with_hub_code(tfl_service: TfLService) -> None:
+    """Test _build_station_row fills all fields for a new station with a hub."""
     stop_point = create_mock_stop_point(
-        id="940GZZLUVIC",
-        common_name="Victoria",
-        hubNaptanCode="",  # Empty string should be treated as None
+        id="910GSEVNSIS",
+        common_name="Seven Sisters Rail Station",
+        lat=51.5823,
+        lon=-0.0751,
+        hubNaptanCode="HUBSVS",
     )
 
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
+    row = tfl_service._build_station_row(stop_point, "weaver", "HUBSVS", "Seven Sisters", existing_lines=None, now=NOW)
 
-    # Verify behavior: empty string is preserved but treated as falsy for hub_name
-    # hub_code = "" (empty string from getattr)
-    # hub_name = None (because empty string is falsy in "if hub_code" check)
-    assert hub_code == ""
-    assert hub_name is None
+    assert row == {
+        "tfl_id": "910GSEVNSIS",
+        "name": "Seven Sisters Rail Station",
+        "latitude": 51.5823,
+        "longitude": -0.0751,
+        "lines": ["weaver"],
+        "last_updated": NOW,
+        "updated_at": NOW,
+        "hub_naptan_code": "HUBSVS",
+        "hub_common_name": "Seven Sisters",
+    }
+
+
+def test_build_station_row_new_station_without_hub_code(tfl_service: TfLService) -> None:
+    """Test _build_station_row leaves hub fields None for a new station without a hub."""
+    stop_point = create_mock_place(id="940GZZLUWBN", common_name="Wimbledon", lat=51.4214, lon=-0.2064)
 
+    row = tfl_service._build_station_row(stop_point, "district", None, None, existing_lines=None, now=NOW)
 
-async def test_extract_hub_fields_with_whitespace(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields handles whitespace hub code."""
+    assert row["lines"] == ["district"]
+    assert row["hub_naptan_code"] is None
+    assert row["hub_common_name"] is None
+
+
+async def test_fetch_hub_name_with_whitespace(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_name returns None for a whitespace hub code the API rejects."""
     # Mock API to return error for whitespace hub code
     mock_api_error = ApiError(
         timestampUtc=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
@@ -1555,25 +1453,14 @@ async def test_extract_hub_fields_with_whitespace(tfl_service: TfLService) -> No
     )
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData = lambda **kwargs: mock_api_error
 
-    # Create mock stop point with whitespace hub code
-    stop_point = create_mock_stop_point(
-        id="940GZZLUVIC",
-        common_name="Victoria",
-        hubNaptanCode="   ",  # Whitespace is truthy in Python
-    )
-
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
+    hub_name = await tfl_service._fetch_hub_name("   ")
 
-    # Current implementation treats whitespace as truthy (valid hub code)
-    # This matches Python's truthiness rules: bool("   ") == True
-    # Hub name is None because API returned error
-    assert hub_code == "   "
+    # Hub name is None because the API returned an error
     assert hub_name is None
 
 
-async def test_extract_hub_fields_api_error(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields handles API errors gracefully."""
+async def test_fetch_hub_name_api_error(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_name handles API errors gracefully."""
     # Mock API to return error
     mock_api_error = ApiError(
         timestampUtc=datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC),
@@ -1585,23 +1472,14 @@ async def test_extract_hub_fields_api_error(tfl_service: TfLService) -> None:
     )
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData = lambda **kwargs: mock_api_error
 
-    # Create mock stop point with hub code
-    stop_point = create_mock_stop_point(
-        id="910GSEVNSIS",
-        common_name="Seven Sisters Rail Station",
-        hubNaptanCode="HUBSVS",
-    )
-
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
+    hub_name = await tfl_service._fetch_hub_name("HUBSVS")
 
-    # Should return hub code but None for hub name when API fails
-    assert hub_code == "HUBSVS"
+    # Hub name is None when the API fails
     assert hub_name is None
 
 
-async def test_extract_hub_fields_api_exception(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields handles API exceptions gracefully."""
+async def test_fetch_hub_name_api_exception(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_name handles API exceptions gracefully."""
 
     # Mock API to raise exception
     def mock_raise_exception(**kwargs: Any) -> None:  # noqa: ANN401
@@ -1610,23 +1488,14 @@ async def test_extract_hub_fields_api_exception(tfl_service: TfLService) -> None
 
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData = mock_raise_exception
 
-    # Create mock stop point with hub code
-    stop_point = create_mock_stop_point(
-        id="910GSEVNSIS",
-        common_name="Seven Sisters Rail Station",
-        hubNaptanCode="HUBSVS",
-    )
+    hub_name = await tfl_service._fetch_hub_name("HUBSVS")
 
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
-
-    # Should return hub code but None for hub name when exception occurs
-    assert hub_code == "HUBSVS"
+    # Hub name is None when an exception occurs
     assert hub_name is None
 
 
-async def test_extract_hub_fields_empty_response(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields handles empty API response."""
+async def test_fetch_hub_name_empty_response(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_name handles empty API response."""
 
     # Mock API to return empty response using proper class structure
     class MockContent:
@@ -1637,23 +1506,14 @@ async def test_extract_hub_fields_empty_response(tfl_service: TfLService) -> Non
     mock_hub_response.content = MockContent()
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData = lambda **kwargs: mock_hub_response
 
-    # Create mock stop point with hub code
-    stop_point = create_mock_stop_point(
-        id="910GSEVNSIS",
-        common_name="Seven Sisters Rail Station",
-        hubNaptanCode="HUBSVS",
-    )
-
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
+    hub_name = await tfl_service._fetch_hub_name("HUBSVS")
 
-    # Should return hub code but None for hub name when response is empty
-    assert hub_code == "HUBSVS"
+    # Hub name is None when the response is empty
     assert hub_name is None
 
 
-async def test_extract_hub_fields_with_multiple_results(tfl_service: TfLService) -> None:
-    """Test _extract_hub_fields handles multiple hub results by taking the first one."""
+async def test_fetch_hub_name_with_multiple_results(tfl_service: TfLService) -> None:
+    """Test _fetch_hub_name handles multiple hub results by taking the first one."""
     # Create mock response with multiple hubs (edge case - API should return one, but test robustness)
     mock_hub_data_1 = create_mock_stop_point(
         id="HUBSVS",
@@ -1672,81 +1532,27 @@ async def test_extract_hub_fields_with_multiple_results(tfl_service: TfLService)
     mock_hub_response = MagicMock()
     mock_hub_response.content = MockContent()
 
-    # Create mock stop point with hub code
-    stop_point = create_mock_stop_point(
-        id="910GSEVNSIS",
-        common_name="Seven Sisters Rail Station",
-        hubNaptanCode="HUBSVS",
-    )
-
     # Mock the async client method
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData.return_value = mock_hub_response
     tfl_service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData.side_effect = None  # Clear fail-safe error
 
-    # Extract hub fields
-    hub_code, hub_name = await tfl_service._extract_hub_fields(stop_point)
+    hub_name = await tfl_service._fetch_hub_name("HUBSVS")
 
     # Should use the first hub in the list
-    assert hub_code == "HUBSVS"
     assert hub_name == "Seven Sisters"
 
 
-def test_update_existing_station_updates_hub_fields(tfl_service: TfLService) -> None:
-    """Test _update_existing_station updates hub fields when they change."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Create station with OLD hub fields
-        station = Station(
-            tfl_id="940GZZLUKSX",
-            name="King's Cross St. Pancras",
-            latitude=51.5308,
-            longitude=-0.1238,
-            lines=["victoria"],
-            last_updated=datetime(2024, 12, 1, 0, 0, 0, tzinfo=UTC),
-            hub_naptan_code="OLDHUB",  # Old value
-            hub_common_name="Old Hub Name",  # Old value
-        )
-
-        # Update with NEW hub fields
-        tfl_service._update_existing_station(
-            station=station,
-            line_tfl_id="victoria",
-            hub_code="HUBKGX",  # New value
-            hub_name="King's Cross",  # New value
-        )
-
-        # Verify hub fields updated (not just added)
-        assert station.hub_naptan_code == "HUBKGX"
-        assert station.hub_common_name == "King's Cross"
-        assert station.last_updated == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
-
+def test_build_station_row_updates_hub_fields(tfl_service: TfLService) -> None:
+    """Test _build_station_row carries new hub code and name for an existing station."""
+    stop_point = create_mock_place(id="940GZZLUKSX", common_name="King's Cross St. Pancras", lat=51.5308, lon=-0.1238)
 
-def test_update_existing_station_hub_name_change_only(tfl_service: TfLService) -> None:
-    """Test _update_existing_station updates hub name when only name changes."""
-    with freeze_time("2025-01-01 12:00:00"):
-        # Create station with hub code and name
-        station = Station(
-            tfl_id="940GZZLUKSX",
-            name="King's Cross St. Pancras",
-            latitude=51.5308,
-            longitude=-0.1238,
-            lines=["victoria"],
-            last_updated=datetime(2024, 12, 1, 0, 0, 0, tzinfo=UTC),
-            hub_naptan_code="HUBKGX",  # Code stays same
-            hub_common_name="Old Name",  # Old name
-        )
-
-        # Update with same code but different name
-        tfl_service._update_existing_station(
-            station=station,
-            line_tfl_id="victoria",
-            hub_code="HUBKGX",  # Same code
-            hub_name="King's Cross",  # New name
-        )
+    row = tfl_service._build_station_row(
+        stop_point, "victoria", "HUBKGX", "King's Cross", existing_lines=["victoria"], now=NOW
+    )
 
-        # Verify hub name updated, code unchanged
-        assert station.hub_naptan_code == "HUBKGX"
-        assert station.hub_common_name == "King's Cross"
-        assert station.last_updated == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+    assert row["hub_naptan_code"] == "HUBKGX"
+    assert row["hub_common_name"] == "King's Cross"
+    assert row["last_updated"] == NOW
 
 
 async def test_fetch_stations_filters_non_matching_modes(
@@ -1824,6 +1630,46 @@ async def test_fetch_stations_includes_stations_with_mode_overlap(
     assert station_ids == {"910GBHILLPK", "910GLIVST", "940GZZLUDLR"}
 
 
+async def test_fetch_stations_from_api_bulk_upserts(
+    tfl_service: TfLService,
+    db_session: AsyncSession,
+) -> None:
+    """Test that stations are upserted in bulk: existing rows gain the line, duplicates collapse."""
+    existing = Station(
+        tfl_id="940GZZLUOXC",
+        name="Oxford Circus",
+        latitude=51.5152,
+        longitude=-0.1419,
+        lines=["central"],
+        last_updated=datetime(2024, 12, 1, tzinfo=UTC),
+    )
+    db_session.add(existing)
+    await db_session.commit()
+
+    oxford_circus = create_mock_place(id="940GZZLUOXC", common_name="Oxford Circus", lat=51.5152, lon=-0.1419)
+    mock_response = MagicMock()
+    mock_response.content.root = [
+        create_mock_place(id="940GZZLUKSX", common_name="King's Cross", lat=51.5308, lon=-0.1238),
+        oxford_circus,
+        oxford_circus,  # TfL occasionally repeats a stop point
+    ]
+    tfl_service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly.return_value = mock_response
+    tfl_service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly.side_effect = None
+
+    stations, _ = await tfl_service._fetch_stations_from_api("victoria")
+
+    assert [station.tfl_id for station in stations] == ["940GZZLUKSX", "940GZZLUOXC"]
+    assert all(station.id is not None for station in stations)
+    assert stations[1].id == existing.id
+    assert stations[1].lines == ["central", "victoria"]
+
+    result = await db_session.execute(select(Station).order_by(Station.tfl_id))
+    assert [(station.tfl_id, station.lines) for station in result.scalars().all()] == [
+        ("940GZZLUKSX", ["victoria"]),
+        ("940GZZLUOXC", ["central", "victoria"]),
+    ]
+
+
 # NOTE: Logging tests for mode filtering and hub detection are not included.
 # The logging functionality exists in the code (using structlog for debug logging),
 # but structlog doesn't integrate easily with pytest's caplog. For this hobby project,
@@ -3365,6 +3211,32 @@ async def test_fetch_severity_codes_database_persistence(
             assert level_10_codes[0].description == "Good Service"
 
 
+async def test_fetch_severity_codes_deduplicates_and_updates(
+    tfl_service: TfLService,
+    db_session: AsyncSession,
+) -> None:
+    """Test that duplicate codes are upserted once and existing descriptions are updated."""
+    db_session.add(SeverityCode(mode_id="tube", severity_level=10, description="Old", last_updated=datetime.now(UTC)))
+    await db_session.commit()
+
+    tfl_service.line_client.MetaSeverity.return_value = MockResponse(
+        data=[
+            create_mock_severity_code(severity_level=10, description="Good Service"),
+            create_mock_severity_code(severity_level=0, description="Special Service"),
+            create_mock_severity_code(severity_level=0, description="Special Service"),
+        ],
+        shared_expires=datetime(2025, 1, 8, 12, 0, 0, tzinfo=UTC),
+    )
+    tfl_service.line_client.MetaSeverity.side_effect = None  # Clear fail-safe error
+
+    codes = await tfl_service.fetch_severity_codes(use_cache=False)
+
+    assert sorted((code.severity_level, code.description) for code in codes) == [
+        (0, "Special Service"),
+        (10, "Good Service"),
+    ]
+
+
 # ==================== fetch_disruption_categories Tests ====================
 
 
@@ -5493,6 +5365,159 @@ def test_parse_redis_port(tfl_service: TfLService) -> None:
     assert port > 0
 
 
+# ==================== Concurrent TfL API Fetching Tests ====================
+
+
+def _rate_limited_error() -> ApiError:
+    """Create a 429 ApiError as returned by pydantic-tfl-api."""
+    return ApiError(
+        timestamp_utc=datetime.now(UTC),
+        http_status_code=429,
+        http_status="TooManyRequests",
+        exception_type="ApiException",
+        message="Rate limit exceeded",
+        relative_uri="/Line/victoria/Route/Sequence/inbound",
+    )
+
+
+class TestCallTflApi:
+    """Tests for TfLService._call_tfl_api() concurrency limit and 429 backoff."""
+
+    async def test_retries_rate_limited_calls(self) -> None:
+        """Should retry 429 responses with exponential backoff and return the first success."""
+        service = TfLService(db=AsyncMock())
+        call = AsyncMock(side_effect=[_rate_limited_error(), _rate_limited_error(), "ok"])
+
+        with (
+            patch("app.services.tfl_service.settings.TFL_RATE_LIMIT_BACKOFF_SECONDS", 0.5),
+            patch("app.services.tfl_service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await service._call_tfl_api(call)
+
+        assert result == "ok"
+        assert call.await_count == 3
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [0.5, 1.0]
+
+    async def test_returns_error_when_retries_exhausted(self) -> None:
+        """Should give up after TFL_RATE_LIMIT_MAX_RETRIES and return the 429 error."""
+        service = TfLService(db=AsyncMock())
+        call = AsyncMock(return_value=_rate_limited_error())
+
+        with (
+            patch("app.services.tfl_service.settings.TFL_RATE_LIMIT_MAX_RETRIES", 2),
+            patch("app.services.tfl_service.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await service._call_tfl_api(call)
+
+        assert isinstance(result, ApiError)
+        assert call.await_count == 3
+
+    async def test_does_not_retry_other_errors(self) -> None:
+        """Should return non-429 errors immediately."""
+        service = TfLService(db=AsyncMock())
+        error = _rate_limited_error()
+        error.http_status_code = 500
+        call = AsyncMock(return_value=error)
+
+        assert await service._call_tfl_api(call) is error
+        assert call.await_count == 1
+
+    async def test_limits_concurrent_calls(self) -> None:
+        """Should never run more than TFL_GRAPH_FETCH_CONCURRENCY calls at once."""
+        with patch("app.services.tfl_service.settings.TFL_GRAPH_FETCH_CONCURRENCY", 2):
+            service = TfLService(db=AsyncMock())
+        in_flight = 0
+        max_in_flight = 0
+
+        async def call() -> str:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return "ok"
+
+        results = await asyncio.gather(*(service._call_tfl_api(call) for _ in range(6)))
+
+        assert results == ["ok"] * 6
+        assert max_in_flight == 2
+
+
+class TestFetchLineNetworkData:
+    """Tests for the network phase of build_station_graph()."""
+
+    async def test_fetches_stop_points_and_both_directions(self) -> None:
+        """Should fetch stop points and both route sequences for a line."""
+        service = TfLService(db=AsyncMock())
+        service.line_client = MagicMock()
+        service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly = AsyncMock(
+            return_value=MockResponse(
+                data=[create_mock_place(id="940GZZLUVIC", common_name="Victoria", lat=51.4965, lon=-0.1447)],
+                shared_expires=datetime.now(UTC) + timedelta(days=1),
+            )
+        )
+        inbound = MagicMock(content="inbound-sequence")
+        outbound = MagicMock(content="outbound-sequence")
+        service.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding = AsyncMock(
+            side_effect=[inbound, outbound]
+        )
+        line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
+
+        data = await service._fetch_line_network_data(line)
+
+        assert data.line is line
+        assert [stop_point.id for stop_point in data.stop_points] == ["940GZZLUVIC"]
+        assert data.inbound == "inbound-sequence"
+        assert data.outbound == "outbound-sequence"
+
+    async def test_failed_direction_is_none(self) -> None:
+        """Should keep going with None when one direction fails."""
+        service = TfLService(db=AsyncMock())
+        service.line_client = MagicMock()
+        service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly = AsyncMock(
+            return_value=MockResponse(data=[], shared_expires=datetime.now(UTC) + timedelta(days=1))
+        )
+        service.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding = AsyncMock(
+            side_effect=[RuntimeError("boom"), MagicMock(content="outbound-sequence")]
+        )
+        line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
+
+        data = await service._fetch_line_network_data(line)
+
+        assert data.inbound is None
+        assert data.outbound == "outbound-sequence"
+
+    async def test_stop_point_failure_raises_503(self) -> None:
+        """Should fail the line with 503 when its stop points cannot be fetched."""
+        service = TfLService(db=AsyncMock())
+        service.line_client = MagicMock()
+        service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        service.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding = AsyncMock(
+            return_value=MagicMock(content=None)
+        )
+        line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service._fetch_line_network_data(line)
+
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    async def test_hub_names_fetched_once_per_hub(self) -> None:
+        """Should request each distinct hub once."""
+        service = TfLService(db=AsyncMock())
+        service.stoppoint_client = MagicMock()
+        service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData = AsyncMock(
+            return_value=MagicMock(content=MagicMock(root=[MagicMock(commonName="Seven Sisters")]))
+        )
+
+        names = await service._fetch_hub_names(["HUBSVS", "HUBSVS", "HUBSVS"])
+
+        assert names == {"HUBSVS": "Seven Sisters"}
+        service.stoppoint_client.GetByPathIdsQueryIncludeCrowdingData.assert_awaited_once_with("HUBSVS", False)
+
+
 # ==================== Helper Method Tests for build_station_graph ====================
 
 
@@ -5529,37 +5554,28 @@ def test_get_stop_ids_missing(tfl_service: TfLService) -> None:
     assert result is None
 
 
-async def test_get_station_by_tfl_id_exists(db_session: AsyncSession) -> None:
-    """Test station lookup when station exists."""
-    # Create a station
-    station = Station(
-        tfl_id="940GZZLUVIC",
-        name="Victoria",
-        latitude=51.5,
-        longitude=-0.1,
-        lines=["victoria"],
-        last_updated=datetime.now(UTC),
-    )
-    db_session.add(station)
+async def test_load_stations_by_tfl_id(db_session: AsyncSession) -> None:
+    """Test all stations are loaded in one query, keyed by TfL ID."""
+    stations = [
+        Station(
+            tfl_id=tfl_id,
+            name=name,
+            latitude=51.5,
+            longitude=-0.1,
+            lines=["victoria"],
+            last_updated=datetime.now(UTC),
+        )
+        for tfl_id, name in (("940GZZLUVIC", "Victoria"), ("940GZZLUGPK", "Green Park"))
+    ]
+    db_session.add_all(stations)
     await db_session.commit()
 
-    # Test lookup
     tfl_service = TfLService(db_session)
     apply_fail_safe_mocks(tfl_service)  # Apply fail-safe mocking
-    result = await tfl_service._get_station_by_tfl_id("940GZZLUVIC")
-
-    assert result is not None
-    assert result.tfl_id == "940GZZLUVIC"
-    assert result.name == "Victoria"
+    result = await tfl_service._load_stations_by_tfl_id()
 
-
-async def test_get_station_by_tfl_id_not_found(db_session: AsyncSession) -> None:
-    """Test station lookup when station doesn't exist."""
-    tfl_service = TfLService(db_session)
-    apply_fail_safe_mocks(tfl_service)  # Apply fail-safe mocking
-    result = await tfl_service._get_station_by_tfl_id("nonexistent")
-
-    assert result is None
+    assert set(result) == {"940GZZLUVIC", "940GZZLUGPK"}
+    assert result["940GZZLUVIC"].name == "Victoria"
 
 
 async def test_connection_exists_true(db_session: AsyncSession) -> None:
@@ -5633,22 +5649,8 @@ async def test_connection_exists_false(db_session: AsyncSession) -> None:
     assert result is False
 
 
-def test_create_connection(tfl_service: TfLService) -> None:
-    """Test connection object creation."""
-    from_id = uuid.uuid4()
-    to_id = uuid.uuid4()
-    line_id = uuid.uuid4()
-
-    connection = tfl_service._create_connection(from_id, to_id, line_id)
-
-    assert connection.from_station_id == from_id
-    assert connection.to_station_id == to_id
-    assert connection.line_id == line_id
-
-
-async def test_process_station_pair_creates_both(db_session: AsyncSession) -> None:
-    """Test station pair processing creates bidirectional connections."""
-    # Create line and stations
+async def test_insert_connections(db_session: AsyncSession) -> None:
+    """Test pending connections are inserted with one bulk statement."""
     line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
     station1 = Station(
         tfl_id="940GZZLUVIC",
@@ -5669,6 +5671,45 @@ async def test_process_station_pair_creates_both(db_session: AsyncSession) -> No
     db_session.add_all([line, station1, station2])
     await db_session.commit()
 
+    tfl_service = TfLService(db_session)
+    apply_fail_safe_mocks(tfl_service)  # Apply fail-safe mocking
+    await tfl_service._insert_connections(
+        {(station1.id, station2.id, line.id), (station2.id, station1.id, line.id)},
+    )
+    await db_session.commit()
+
+    result = await db_session.execute(select(StationConnection.from_station_id, StationConnection.to_station_id))
+    assert set(result.tuples().all()) == {(station1.id, station2.id), (station2.id, station1.id)}
+
+
+async def test_insert_connections_empty(tfl_service: TfLService) -> None:
+    """Test no statement is issued when there are no connections."""
+    tfl_service.db = AsyncMock()
+
+    await tfl_service._insert_connections(set())
+
+    tfl_service.db.execute.assert_not_called()
+
+
+def _station(tfl_id: str) -> Station:
+    """Build an in-memory station with an ID for pair processing tests."""
+    return Station(
+        id=uuid.uuid4(),
+        tfl_id=tfl_id,
+        name=tfl_id,
+        latitude=51.5,
+        longitude=-0.1,
+        lines=["victoria"],
+        last_updated=datetime.now(UTC),
+    )
+
+
+def test_process_station_pair_creates_both(tfl_service: TfLService) -> None:
+    """Test station pair processing records bidirectional connections."""
+    line = Line(id=uuid.uuid4(), tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
+    station1 = _station("940GZZLUVIC")
+    station2 = _station("940GZZLUGPK")
+
     # Create mock stops
     class MockStop1:
         id = "940GZZLUVIC"
@@ -5676,65 +5717,54 @@ async def test_process_station_pair_creates_both(db_session: AsyncSession) -> No
     class MockStop2:
         id = "940GZZLUGPK"
 
-    # Process pair
-    tfl_service = TfLService(db_session)
-    apply_fail_safe_mocks(tfl_service)  # Apply fail-safe mocking
     stations_set: set[str] = set()
     pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]] = set()
-    count = await tfl_service._process_station_pair(MockStop1(), MockStop2(), line, stations_set, pending_connections)
+    count = tfl_service._process_station_pair(
+        MockStop1(),
+        MockStop2(),
+        line,
+        stations_by_tfl_id={station.tfl_id: station for station in (station1, station2)},
+        stations_set=stations_set,
+        pending_connections=pending_connections,
+    )
 
-    assert count == 2  # Both forward and reverse connections created
-    assert "940GZZLUVIC" in stations_set
-    assert "940GZZLUGPK" in stations_set
+    assert count == 2  # Both forward and reverse connections recorded
+    assert stations_set == {"940GZZLUVIC", "940GZZLUGPK"}
+    assert pending_connections == {(station1.id, station2.id, line.id), (station2.id, station1.id, line.id)}
 
 
-async def test_process_station_pair_missing_station(db_session: AsyncSession) -> None:
-    """Test station pair processing when station not in DB."""
-    # Create line but no stations
-    line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
-    db_session.add(line)
-    await db_session.commit()
+def test_process_station_pair_missing_station(tfl_service: TfLService) -> None:
+    """Test station pair processing when station is not in the preloaded map."""
+    line = Line(id=uuid.uuid4(), tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
 
     # Create mock stops
     class MockStop1:
-        id = "nonexistent1"
+        id = "940GZZLUVIC"
 
     class MockStop2:
-        id = "nonexistent2"
+        id = "nonexistent"
 
-    # Process pair
-    tfl_service = TfLService(db_session)
-    apply_fail_safe_mocks(tfl_service)  # Apply fail-safe mocking
     stations_set: set[str] = set()
     pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]] = set()
-    count = await tfl_service._process_station_pair(MockStop1(), MockStop2(), line, stations_set, pending_connections)
+    count = tfl_service._process_station_pair(
+        MockStop1(),
+        MockStop2(),
+        line,
+        stations_by_tfl_id={"940GZZLUVIC": _station("940GZZLUVIC")},
+        stations_set=stations_set,
+        pending_connections=pending_connections,
+    )
 
     assert count == 0
     assert not stations_set
+    assert not pending_connections
 
 
-async def test_process_station_pair_existing_connections(db_session: AsyncSession) -> None:
+def test_process_station_pair_existing_connections(tfl_service: TfLService) -> None:
     """Test station pair processing when connections already exist in pending set."""
-    # Create line and stations
-    line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
-    station1 = Station(
-        tfl_id="940GZZLUVIC",
-        name="Victoria",
-        latitude=51.5,
-        longitude=-0.1,
-        lines=["victoria"],
-        last_updated=datetime.now(UTC),
-    )
-    station2 = Station(
-        tfl_id="940GZZLUGPK",
-        name="Green Park",
-        latitude=51.5,
-        longitude=-0.1,
-        lines=["victoria"],
-        last_updated=datetime.now(UTC),
-    )
-    db_session.add_all([line, station1, station2])
-    await db_session.commit()
+    line = Line(id=uuid.uuid4(), tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
+    station1 = _station("940GZZLUVIC")
+    station2 = _station("940GZZLUGPK")
 
     # Create mock stops
     class MockStop1:
@@ -5743,22 +5773,26 @@ async def test_process_station_pair_existing_connections(db_session: AsyncSessio
     class MockStop2:
         id = "940GZZLUGPK"
 
-    # Process pair
-    tfl_service = TfLService(db_session)
-    apply_fail_safe_mocks(tfl_service)  # Apply fail-safe mocking
     stations_set: set[str] = set()
-    # Pre-populate pending_connections with the connections we're about to create
+    # Pre-populate pending_connections with the connections we're about to record
     # This simulates them already being processed in this transaction
     pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]] = {
         (station1.id, station2.id, line.id),
         (station2.id, station1.id, line.id),
     }
 
-    count = await tfl_service._process_station_pair(MockStop1(), MockStop2(), line, stations_set, pending_connections)
+    count = tfl_service._process_station_pair(
+        MockStop1(),
+        MockStop2(),
+        line,
+        stations_by_tfl_id={station.tfl_id: station for station in (station1, station2)},
+        stations_set=stations_set,
+        pending_connections=pending_connections,
+    )
 
-    assert count == 0  # No new connections created
-    assert "940GZZLUVIC" in stations_set
-    assert "940GZZLUGPK" in stations_set
+    assert count == 0  # No new connections recorded
+    assert stations_set == {"940GZZLUVIC", "940GZZLUGPK"}
+    assert len(pending_connections) == 2
 
 
 # ==================== Phase 1: get_network_graph Coverage Tests ====================
@@ -5899,6 +5933,87 @@ async def test_get_network_graph_exception(
     assert "failed to fetch network graph" in exc_info.value.detail.lower()
 
 
+async def test_get_network_graph_artifact_cache_hit(tfl_service: TfLService) -> None:
+    """Test the stored artifact is returned without rebuilding the graph."""
+    artifact = build_network_graph_artifact({})
+    tfl_service.cache.get = AsyncMock(return_value=artifact)
+
+    with patch.object(tfl_service, "get_network_graph", new_callable=AsyncMock) as mock_get_graph:
+        result = await tfl_service.get_network_graph_artifact()
+
+    assert result is artifact
+    tfl_service.cache.get.assert_called_once_with(NETWORK_GRAPH_ARTIFACT_CACHE_KEY)
+    mock_get_graph.assert_not_called()
+
+
+async def test_get_network_graph_artifact_cache_miss_rebuilds_and_stores(tfl_service: TfLService) -> None:
+    """Test a missing artifact is built from the graph and stored without a TTL."""
+    graph = {
+        "940GZZLUVIC": [
+            NetworkConnection(
+                station_id=str(uuid.uuid4()),
+                station_tfl_id="940GZZLUGPK",
+                station_name="Green Park",
+                line_id=str(uuid.uuid4()),
+                line_tfl_id="victoria",
+                line_name="Victoria",
+            )
+        ]
+    }
+
+    with patch.object(tfl_service, "get_network_graph", new_callable=AsyncMock, return_value=graph):
+        artifact = await tfl_service.get_network_graph_artifact()
+
+    assert artifact.stations_count == 1
+    assert artifact.etag == build_network_graph_artifact(graph).etag
+    tfl_service.cache.set.assert_called_once_with(NETWORK_GRAPH_ARTIFACT_CACHE_KEY, artifact)
+
+
+async def test_get_network_graph_artifact_propagates_not_built(tfl_service: TfLService) -> None:
+    """Test the 503 for an unbuilt graph is raised and nothing is stored."""
+    not_built = HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="not built")
+
+    with (
+        patch.object(tfl_service, "get_network_graph", new_callable=AsyncMock, side_effect=not_built),
+        pytest.raises(HTTPException) as exc_info,
+    ):
+        await tfl_service.get_network_graph_artifact()
+
+    assert exc_info.value.status_code == 503
+    tfl_service.cache.set.assert_not_called()
+
+
+async def test_refresh_artifact_after_build_stores_artifact(tfl_service: TfLService) -> None:
+    """Test the artifact is refreshed after a graph build."""
+    with patch.object(tfl_service, "refresh_network_graph_artifact", new_callable=AsyncMock) as mock_refresh:
+        await tfl_service._refresh_network_graph_artifact_after_build()
+
+    mock_refresh.assert_called_once()
+    tfl_service.cache.delete.assert_not_called()
+
+
+async def test_refresh_artifact_after_build_failure_deletes_stale_artifact(tfl_service: TfLService) -> None:
+    """Test a failed refresh is logged and the stale artifact deleted so it is rebuilt lazily."""
+    with patch.object(
+        tfl_service, "refresh_network_graph_artifact", new_callable=AsyncMock, side_effect=RuntimeError("Redis down")
+    ):
+        await tfl_service._refresh_network_graph_artifact_after_build()
+
+    tfl_service.cache.delete.assert_called_once_with(NETWORK_GRAPH_ARTIFACT_CACHE_KEY)
+
+
+async def test_refresh_artifact_after_build_tolerates_failed_delete(tfl_service: TfLService) -> None:
+    """Test a failure to delete the stale artifact is logged rather than raised."""
+    tfl_service.cache.delete = AsyncMock(side_effect=RuntimeError("Redis down"))
+
+    with patch.object(
+        tfl_service, "refresh_network_graph_artifact", new_callable=AsyncMock, side_effect=RuntimeError("Redis down")
+    ):
+        await tfl_service._refresh_network_graph_artifact_after_build()
+
+    tfl_service.cache.delete.assert_called_once_with(NETWORK_GRAPH_ARTIFACT_CACHE_KEY)
+
+
 # ==================== Phase 2: Edge Case Coverage Tests ====================
 
 
@@ -5919,12 +6034,13 @@ async def test_process_station_pair_missing_stop_ids(
     # Process pair with missing IDs
     stations_set: set[str] = set()
     pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]] = set()
-    count = await tfl_service._process_station_pair(
+    count = tfl_service._process_station_pair(
         MockStopNoId(),
         MockStopNoId(),
         line,
-        stations_set,
-        pending_connections,
+        stations_by_tfl_id={},
+        stations_set=stations_set,
+        pending_connections=pending_connections,
     )
 
     # Should return 0 and not add to set
@@ -6050,7 +6166,14 @@ async def test_process_route_sequence_empty_stop_points(
     # Execute
     stations_set: set[str] = set()
     pending_connections: set[tuple[uuid.UUID, uuid.UUID, uuid.UUID]] = set()
-    count, route_data = await tfl_service._process_route_sequence(line, "inbound", stations_set, pending_connections)
+    route_data = await tfl_service._fetch_route_sequence_or_none(line.tfl_id, "inbound")
+    count = tfl_service._process_route_sequence(
+        line,
+        route_data,
+        stations_by_tfl_id={},
+        stations_set=stations_set,
+        pending_connections=pending_connections,
+    )
 
     # Should skip sequence without stopPoint and return 0 connections
     assert count == 0
@@ -6911,7 +7034,7 @@ async def test_fetch_stations_with_hub_fields(
 
         # Verify hub fields populated
         assert stations[0].hub_naptan_code == "HUBSVS"
-        # Note: Hub name fetching is properly tested in test_extract_hub_fields_with_hub_code
+        # Note: Hub name fetching is properly tested in test_fetch_hub_name_returns_common_name
         # Integration test mocking has limitations with functools.partial and run_in_executor
         assert stations[0].hub_common_name is not None
 
@@ -7007,7 +7130,7 @@ async def test_fetch_stations_updates_changed_hub_fields(
 
         # Verify hub fields UPDATED (not just added)
         assert stations[0].hub_naptan_code == "HUBKGX"
-        # Note: Hub name fetching is properly tested in test_extract_hub_fields_with_hub_code
+        # Note: Hub name fetching is properly tested in test_fetch_hub_name_returns_common_name
         # Integration test mocking has limitations with functools.partial and run_in_executor
         assert stations[0].hub_common_name is not None
         assert stations[0].hub_common_name != "Old Hub Name"  # Verify it was updated
@@ -7325,26 +7448,66 @@ async def test_fetch_station_disruptions_http_exception_reraise(
     assert "Not found" in exc_info.value.detail
 
 
-async def test_process_route_sequence_exception_handling(
-    tfl_service: TfLService,
-    db_session: AsyncSession,
-) -> None:
-    """Test _process_route_sequence handles exceptions gracefully (covers lines 1282-1289)."""
-    # Create line
-    line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
-    db_session.add(line)
-    await db_session.commit()
-
+async def test_fetch_route_sequence_exception_handling(tfl_service: TfLService) -> None:
+    """Test a failed route sequence fetch raises, and the build's fetch phase turns it into None."""
     # Mock the async client method to raise a generic exception during route sequence fetch
     tfl_service.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding.side_effect = (
         ValueError("Invalid route data")
     )
 
-    # Call _process_route_sequence - should catch exception and return (0, None)
-    count, route_data = await tfl_service._process_route_sequence(line, "inbound", set(), set())
+    with pytest.raises(ValueError, match="Invalid route data"):
+        await tfl_service._fetch_route_sequence("victoria", "inbound")
 
-    assert count == 0
-    assert route_data is None
+    assert await tfl_service._fetch_route_sequence_or_none("victoria", "inbound") is None
+
+
+async def test_build_station_graph_survives_failed_route_sequence_fetch(
+    tfl_service: TfLService,
+    db_session: AsyncSession,
+) -> None:
+    """Test the graph is still built from the other direction when one route sequence fetch fails."""
+    with freeze_time("2025-01-01 12:00:00"):
+        expires = datetime(2025, 1, 2, 12, 0, 0, tzinfo=UTC)
+        tfl_service.line_client.GetByModeByPathModes.side_effect = [
+            MockResponse(data=[create_mock_line(id="victoria", name="Victoria")], shared_expires=expires),
+            MockResponse(data=[], shared_expires=expires),
+            MockResponse(data=[], shared_expires=expires),
+            MockResponse(data=[], shared_expires=expires),
+        ]
+        tfl_service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly.side_effect = None
+        tfl_service.line_client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly.return_value = MockResponse(
+            data=[
+                create_mock_place(id="940GZZLUOXC", common_name="Oxford Circus", lat=51.5152, lon=-0.1419),
+                create_mock_place(id="940GZZLUVIC", common_name="Victoria", lat=51.4965, lon=-0.1447),
+            ],
+            shared_expires=expires,
+        )
+        outbound = MagicMock()
+        outbound.content = MockRouteSequence(
+            stopPointSequences=[
+                MockStopPointSequence2(
+                    stopPoint=[
+                        MockStopPoint2(id="940GZZLUOXC", name="Oxford Circus"),
+                        MockStopPoint2(id="940GZZLUVIC", name="Victoria"),
+                    ]
+                )
+            ],
+        )
+
+        async def route_sequence(line_id: str, direction: str, *args: object) -> MagicMock:
+            if direction == "inbound":
+                error_msg = "Invalid route data"
+                raise ValueError(error_msg)
+            return outbound
+
+        tfl_service.line_client.RouteSequenceByPathIdPathDirectionQueryServiceTypesQueryExcludeCrowding.side_effect = (
+            route_sequence
+        )
+
+        result = await tfl_service.build_station_graph()
+
+    assert result["lines_count"] == 1
+    assert result["connections_count"] == 2  # Oxford Circus <-> Victoria from the outbound sequence
 
 
 async def test_get_line_by_tfl_id_not_found(
@@ -8333,22 +8496,34 @@ async def test_validate_route_hub_with_three_station_ids(
     assert invalid_segment is None
 
 
-async def test_check_connection_missing_entities(
-    tfl_service: TfLService,
-    db_session: AsyncSession,
-) -> None:
-    """Test _check_connection returns False when entities are missing (covers lines 1811-1817)."""
-    # Create a valid line
+def test_check_connection_no_route_variants(tfl_service: TfLService) -> None:
+    """Test _check_connection returns False when the line has no route variants."""
     line = Line(tfl_id="victoria", name="Victoria", last_updated=datetime.now(UTC))
-    db_session.add(line)
-    await db_session.commit()
+    from_station = Station(tfl_id="940GZZLUVIC", name="Victoria", latitude=51.5, longitude=-0.1, lines=["victoria"])
+    to_station = Station(tfl_id="940GZZLUGPK", name="Green Park", latitude=51.5, longitude=-0.1, lines=["victoria"])
 
-    # Test with non-existent station UUIDs
-    fake_uuid1 = uuid.uuid4()
-    fake_uuid2 = uuid.uuid4()
+    assert tfl_service._check_connection(from_station, to_station, line) is False
 
-    result = await tfl_service._check_connection(fake_uuid1, fake_uuid2, line.id)
-    assert result is False
+
+def test_check_connection_uses_compiled_route_variants(tfl_service: TfLService) -> None:
+    """Test _check_connection answers from the line's route variants without touching the database."""
+    line = Line(
+        id=uuid.uuid4(),
+        tfl_id="victoria",
+        name="Victoria",
+        last_updated=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+        route_variants={
+            "routes": [{"name": "Walthamstow → Brixton", "direction": "inbound", "stations": ["A", "B", "C"]}]
+        },
+    )
+    station_a = Station(tfl_id="A", name="A", latitude=51.5, longitude=-0.1, lines=["victoria"])
+    station_c = Station(tfl_id="C", name="C", latitude=51.5, longitude=-0.1, lines=["victoria"])
+    tfl_service.db = AsyncMock()
+
+    assert tfl_service._check_connection(station_a, station_c, line) is True
+    assert tfl_service._check_connection(station_c, station_a, line) is False
+    tfl_service.db.get.assert_not_called()
 
 
 # Unit tests for refactored helper functions
@@ -8642,7 +8817,7 @@ async def test_validate_segment_connections_valid(
     hub_map: dict[str, list[Station]] = {}
 
     # Validate connections
-    is_valid, message, idx = await tfl_service._validate_segment_connections(segments, stations_map, lines_map, hub_map)
+    is_valid, message, idx = tfl_service._validate_segment_connections(segments, stations_map, lines_map, hub_map)
 
     assert is_valid is True
     assert "valid" in message.lower()
@@ -8694,7 +8869,7 @@ async def test_validate_segment_connections_invalid(
     hub_map: dict[str, list[Station]] = {}
 
     # Validate connections
-    is_valid, message, idx = await tfl_service._validate_segment_connections(segments, stations_map, lines_map, hub_map)
+    is_valid, message, idx = tfl_service._validate_segment_connections(segments, stations_map, lines_map, hub_map)
 
     assert is_valid is False
     assert "No connection" in message or "different branches" in message
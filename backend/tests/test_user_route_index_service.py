@@ -1,7 +1,7 @@
 """Tests for UserRouteIndexService."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from app.models.tfl import Line, Station
@@ -11,6 +11,7 @@ from app.models.user_route_index import UserRouteStationIndex
 from app.services.user_route_index_service import (
     UserRouteIndexService,
     deduplicate_preserving_order,
+    diff_route_station_index,
     find_stations_between,
 )
 from sqlalchemy import select
@@ -72,12 +73,98 @@ class TestPureFunctions:
         result = deduplicate_preserving_order([])
         assert result == []
 
+    def test_diff_route_station_index_adds_and_removes_changes_only(self) -> None:
+        """Test that only entries entering or leaving the target are changed."""
+        version = datetime(2025, 1, 1, tzinfo=UTC)
+        id_a, id_b = uuid.uuid4(), uuid.uuid4()
+        existing = [(id_a, "victoria", "A", version), (id_b, "victoria", "B", version)]
+        target = {("victoria", "B"): version, ("victoria", "C"): version}
+
+        diff = diff_route_station_index(existing, target)
+
+        assert diff.to_add == {("victoria", "C"): version}
+        assert diff.to_remove == [id_a]
+        assert diff.to_refresh == {}
+
+    def test_diff_route_station_index_unchanged(self) -> None:
+        """Test that an unchanged index produces an empty diff."""
+        version = datetime(2025, 1, 1, tzinfo=UTC)
+        existing = [(uuid.uuid4(), "victoria", "A", version)]
+
+        diff = diff_route_station_index(existing, {("victoria", "A"): version})
+
+        assert diff.to_add == {}
+        assert diff.to_remove == []
+        assert diff.refreshed_count == 0
+
+    def test_diff_route_station_index_refreshes_line_data_version(self) -> None:
+        """Test that kept entries with outdated line data are refreshed, grouped by new version."""
+        old_version = datetime(2025, 1, 1, tzinfo=UTC)
+        new_version = old_version + timedelta(days=1)
+        id_a, id_b, id_c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        existing = [
+            (id_a, "victoria", "A", old_version),
+            (id_b, "victoria", "B", old_version),
+            (id_c, "central", "C", old_version),
+        ]
+        target = {("victoria", "A"): new_version, ("victoria", "B"): new_version, ("central", "C"): old_version}
+
+        diff = diff_route_station_index(existing, target)
+
+        assert diff.to_refresh == {new_version: [id_a, id_b]}
+        assert diff.refreshed_count == 2
+        assert diff.to_add == {}
+        assert diff.to_remove == []
+
+    def test_diff_route_station_index_removes_duplicates(self) -> None:
+        """Test that duplicate active entries are collapsed to the first one."""
+        version = datetime(2025, 1, 1, tzinfo=UTC)
+        first_id, duplicate_id = uuid.uuid4(), uuid.uuid4()
+        existing = [(first_id, "victoria", "A", version), (duplicate_id, "victoria", "A", version)]
+
+        diff = diff_route_station_index(existing, {("victoria", "A"): version})
+
+        assert diff.to_remove == [duplicate_id]
+        assert diff.to_add == {}
+
+    def test_diff_route_station_index_empty_target(self) -> None:
+        """Test that an empty target removes every entry."""
+        version = datetime(2025, 1, 1, tzinfo=UTC)
+        entry_id = uuid.uuid4()
+
+        diff = diff_route_station_index([(entry_id, "victoria", "A", version)], {})
+
+        assert diff.to_remove == [entry_id]
+        assert diff.to_add == {}
+
 
 # =============================================================================
 # Service Tests
 # =============================================================================
 
 
+async def _create_twostop_route(db_session: AsyncSession, user: User) -> tuple[UserRoute, Line]:
+    """Create a route from twostop-west to twostop-east on 2stopline."""
+    line = TestRailwayNetwork.create_2stopline()
+    station1 = TestRailwayNetwork.create_twostop_west()
+    station2 = TestRailwayNetwork.create_twostop_east()
+    db_session.add_all([line, station1, station2])
+    await db_session.flush()
+
+    route = UserRoute(user_id=user.id, name="Test Route", active=True)
+    db_session.add(route)
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            UserRouteSegment(route_id=route.id, sequence=1, station_id=station1.id, line_id=line.id),
+            UserRouteSegment(route_id=route.id, sequence=2, station_id=station2.id, line_id=None),
+        ]
+    )
+    await db_session.commit()
+    return route, line
+
+
 class TestUserRouteIndexService:
     """Tests for UserRouteIndexService."""
 
@@ -472,19 +559,98 @@ class TestUserRouteIndexService:
         result1 = await service.build_route_station_index(route.id)
         assert result1["entries_created"] == 2
 
-        # Build index again (simulating update)
+        # Build index again (simulating update) - nothing changed, so nothing is written
         result2 = await service.build_route_station_index(route.id)
-        assert result2["entries_created"] == 2
+        assert result2["entries_created"] == 0
+        assert result2["entries_removed"] == 0
+        assert result2["entries_refreshed"] == 0
 
-        # Verify still only 2 active entries (old ones were soft deleted - Issue #233)
+        # Verify still only the 2 original entries, with no soft-deleted copies left behind
+        index_result = await db_session.execute(
+            select(UserRouteStationIndex).where(UserRouteStationIndex.route_id == route.id)
+        )
+        index_entries = index_result.scalars().all()
+        assert len(index_entries) == 2
+        assert all(entry.deleted_at is None for entry in index_entries)
+
+    @pytest.mark.asyncio
+    async def test_build_index_refreshes_line_data_version(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        """Test that a rebuild after a line data update refreshes the version in place."""
+        route, line = await _create_twostop_route(db_session, test_user)
+        service = UserRouteIndexService(db_session)
+        await service.build_route_station_index(route.id)
+
+        # Simulate TfL line data being refreshed
+        line.last_updated = line.last_updated + timedelta(days=1)
+        await db_session.commit()
+
+        result = await service.build_route_station_index(route.id)
+
+        assert result["entries_refreshed"] == 2
+        assert result["entries_created"] == 0
+        assert result["entries_removed"] == 0
+
+        index_result = await db_session.execute(
+            select(UserRouteStationIndex).where(UserRouteStationIndex.route_id == route.id)
+        )
+        index_entries = index_result.scalars().all()
+        assert len(index_entries) == 2
+        assert all(entry.line_data_version == line.last_updated for entry in index_entries)
+
+    @pytest.mark.asyncio
+    async def test_build_index_soft_deletes_only_removed_entries(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        """Test that a rebuild soft deletes entries the route no longer needs and keeps the rest."""
+        route, line = await _create_twostop_route(db_session, test_user)
+        service = UserRouteIndexService(db_session)
+        await service.build_route_station_index(route.id)
+
+        index_result = await db_session.execute(
+            select(UserRouteStationIndex.id).where(UserRouteStationIndex.route_id == route.id)
+        )
+        original_ids = set(index_result.scalars().all())
+
+        # A stray entry for a station the route doesn't pass through, and a duplicate entry
+        db_session.add_all(
+            [
+                UserRouteStationIndex(
+                    route_id=route.id,
+                    line_tfl_id=line.tfl_id,
+                    station_naptan="940GZZSTRAY",
+                    line_data_version=line.last_updated,
+                ),
+                UserRouteStationIndex(
+                    route_id=route.id,
+                    line_tfl_id=line.tfl_id,
+                    station_naptan=TestRailwayNetwork.STATION_TWOSTOP_WEST,
+                    line_data_version=line.last_updated,
+                ),
+            ]
+        )
+        await db_session.commit()
+
+        result = await service.build_route_station_index(route.id)
+
+        assert result["entries_removed"] == 2
+        assert result["entries_created"] == 0
+
+        # Keep the ID: expired attributes can't be lazy-loaded outside a greenlet
+        route_id = route.id
+        db_session.expire_all()
         index_result = await db_session.execute(
             select(UserRouteStationIndex).where(
-                UserRouteStationIndex.route_id == route.id,
+                UserRouteStationIndex.route_id == route_id,
                 UserRouteStationIndex.deleted_at.is_(None),
             )
         )
-        index_entries = index_result.scalars().all()
-        assert len(index_entries) == 2
+        assert {entry.id for entry in index_result.scalars().all()} == original_ids
 
     @pytest.mark.asyncio
     async def test_build_index_line_with_no_routes_data(
@@ -0,0 +1,200 @@
+"""Tests for UserRouteScheduleIndexService."""
+
+import uuid
+from datetime import UTC, datetime, time
+
+import pytest
+from app.models.user import User
+from app.models.user_route import UserRoute, UserRouteSchedule
+from app.models.user_route_index import UserRouteScheduleWindow
+from app.services.user_route_schedule_index_service import (
+    UserRouteScheduleIndexService,
+    diff_route_schedule_windows,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Monday 2025-01-06 08:15 UTC (London is on GMT, so also 08:15 local)
+MONDAY_MORNING_UTC = datetime(2025, 1, 6, 8, 15, tzinfo=UTC)
+
+
+async def _create_route(
+    db_session: AsyncSession,
+    user: User,
+    timezone: str = "Europe/London",
+    schedules: list[tuple[list[str], time, time]] | None = None,
+) -> UserRoute:
+    """Create a route with the given (days_of_week, start_time, end_time) schedules."""
+    route = UserRoute(user_id=user.id, name="Test Route", active=True, timezone=timezone)
+    db_session.add(route)
+    await db_session.flush()
+
+    db_session.add_all(
+        UserRouteSchedule(route_id=route.id, days_of_week=days, start_time=start, end_time=end)
+        for days, start, end in schedules or []
+    )
+    await db_session.commit()
+    return route
+
+
+async def _get_active_windows(db_session: AsyncSession, route_id: uuid.UUID) -> list[UserRouteScheduleWindow]:
+    """Get a route's non-deleted schedule windows, ordered by start."""
+    result = await db_session.execute(
+        select(UserRouteScheduleWindow)
+        .where(
+            UserRouteScheduleWindow.route_id == route_id,
+            UserRouteScheduleWindow.deleted_at.is_(None),
+        )
+        .order_by(UserRouteScheduleWindow.start_minute)
+    )
+    return list(result.scalars().all())
+
+
+class TestBuildRouteScheduleIndex:
+    """Tests for build_route_schedule_index."""
+
+    @pytest.mark.asyncio
+    async def test_build_creates_window_per_day(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that each scheduled day becomes a window in the route's timezone."""
+        route = await _create_route(db_session, test_user, schedules=[(["MON", "WED"], time(8, 0), time(9, 30))])
+
+        service = UserRouteScheduleIndexService(db_session)
+        windows_created = await service.build_route_schedule_index(route.id)
+
+        assert windows_created == 2
+        windows = await _get_active_windows(db_session, route.id)
+        assert [(w.timezone, w.start_minute, w.end_minute) for w in windows] == [
+            ("Europe/London", 480, 570),
+            ("Europe/London", 2 * 1440 + 480, 2 * 1440 + 570),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_keeps_unchanged_windows(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that rebuilding an unchanged route writes nothing."""
+        route = await _create_route(db_session, test_user, schedules=[(["MON"], time(8, 0), time(9, 0))])
+        service = UserRouteScheduleIndexService(db_session)
+        await service.build_route_schedule_index(route.id)
+        original_ids = [w.id for w in await _get_active_windows(db_session, route.id)]
+
+        windows_created = await service.build_route_schedule_index(route.id)
+
+        assert windows_created == 0
+        assert [w.id for w in await _get_active_windows(db_session, route.id)] == original_ids
+        result = await db_session.execute(
+            select(UserRouteScheduleWindow).where(UserRouteScheduleWindow.route_id == route.id)
+        )
+        assert len(result.scalars().all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_rebuild_replaces_only_changed_windows(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that changing a schedule's days soft deletes and adds only the affected windows."""
+        route = await _create_route(db_session, test_user, schedules=[(["MON", "TUE"], time(8, 0), time(9, 0))])
+        service = UserRouteScheduleIndexService(db_session)
+        await service.build_route_schedule_index(route.id)
+        monday_id = (await _get_active_windows(db_session, route.id))[0].id
+
+        schedule = (
+            await db_session.execute(select(UserRouteSchedule).where(UserRouteSchedule.route_id == route.id))
+        ).scalar_one()
+        schedule.days_of_week = ["MON", "WED"]
+        await db_session.commit()
+
+        windows_created = await service.build_route_schedule_index(route.id)
+
+        assert windows_created == 1
+        windows = await _get_active_windows(db_session, route.id)
+        assert windows[0].id == monday_id
+        assert [w.start_minute for w in windows] == [480, 2 * 1440 + 480]
+        deleted = await db_session.execute(
+            select(UserRouteScheduleWindow.start_minute).where(
+                UserRouteScheduleWindow.route_id == route.id,
+                UserRouteScheduleWindow.deleted_at.is_not(None),
+            )
+        )
+        assert deleted.scalars().all() == [1440 + 480]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_after_timezone_change_replaces_all_windows(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Test that windows in the old timezone are replaced when the route's timezone changes."""
+        route = await _create_route(db_session, test_user, schedules=[(["MON"], time(8, 0), time(9, 0))])
+        service = UserRouteScheduleIndexService(db_session)
+        await service.build_route_schedule_index(route.id)
+
+        route.timezone = "America/New_York"
+        await db_session.commit()
+        await service.build_route_schedule_index(route.id)
+
+        windows = await _get_active_windows(db_session, route.id)
+        assert [(w.timezone, w.start_minute) for w in windows] == [("America/New_York", 480)]
+
+    @pytest.mark.asyncio
+    async def test_build_route_not_found(self, db_session: AsyncSession) -> None:
+        """Test that building for a missing route raises ValueError."""
+        service = UserRouteScheduleIndexService(db_session)
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.build_route_schedule_index(uuid.uuid4())
+
+
+class TestGetInWindowRouteIds:
+    """Tests for get_in_window_route_ids."""
+
+    @pytest.mark.asyncio
+    async def test_selects_only_routes_in_window(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that only routes with a window containing the current local minute are selected."""
+        in_window = await _create_route(db_session, test_user, schedules=[(["MON"], time(8, 0), time(9, 0))])
+        later = await _create_route(db_session, test_user, schedules=[(["MON"], time(17, 0), time(18, 0))])
+        other_day = await _create_route(db_session, test_user, schedules=[(["TUE"], time(8, 0), time(9, 0))])
+        # 08:15 UTC is 03:15 in New York, outside the 08:00-09:00 window there
+        other_timezone = await _create_route(
+            db_session, test_user, timezone="America/New_York", schedules=[(["MON"], time(8, 0), time(9, 0))]
+        )
+        service = UserRouteScheduleIndexService(db_session)
+        for route in (in_window, later, other_day, other_timezone):
+            await service.build_route_schedule_index(route.id)
+
+        route_ids = await service.get_in_window_route_ids(MONDAY_MORNING_UTC)
+
+        assert route_ids == {in_window.id}
+
+    @pytest.mark.asyncio
+    async def test_includes_routes_without_windows(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that routes with schedules but no index yet are always selected."""
+        unindexed = await _create_route(db_session, test_user, schedules=[(["SUN"], time(8, 0), time(9, 0))])
+        await _create_route(db_session, test_user)  # No schedules: never selected
+
+        service = UserRouteScheduleIndexService(db_session)
+        route_ids = await service.get_in_window_route_ids(MONDAY_MORNING_UTC)
+
+        assert route_ids == {unindexed.id}
+
+
+class TestDiffRouteScheduleWindows:
+    """Tests for diff_route_schedule_windows."""
+
+    def test_adds_and_removes_changes_only(self) -> None:
+        """Test that matching windows are kept and only the differences are returned."""
+        schedule_id = uuid.uuid4()
+        kept_id, removed_id = uuid.uuid4(), uuid.uuid4()
+        existing = [
+            (kept_id, (schedule_id, "Europe/London", 480, 540)),
+            (removed_id, (schedule_id, "Europe/London", 1920, 1980)),
+        ]
+        target = [(schedule_id, "Europe/London", 480, 540), (schedule_id, "Europe/London", 3360, 3420)]
+
+        diff = diff_route_schedule_windows(existing, target)
+
+        assert diff.to_add == [(schedule_id, "Europe/London", 3360, 3420)]
+        assert diff.to_remove == [removed_id]
+
+    def test_removes_duplicate_active_windows(self) -> None:
+        """Test that only the first of several active windows with the same key is kept."""
+        key = (uuid.uuid4(), "Europe/London", 480, 540)
+        first_id, duplicate_id = uuid.uuid4(), uuid.uuid4()
+
+        diff = diff_route_schedule_windows([(first_id, key), (duplicate_id, key)], [key])
+
+        assert diff.to_add == []
+        assert diff.to_remove == [duplicate_id]
@@ -1,14 +1,17 @@
 """Tests for verification service."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
+from app.core.rate_limiter import SlidingWindowRateLimiter
 from app.models.rate_limit import RateLimitAction, RateLimitLog
 from app.models.user import EmailAddress, PhoneNumber, User, VerificationCode, VerificationType
-from app.services.verification_service import VerificationService
+from app.services.verification_service import RATE_LIMIT_LOG_RETENTION_DAYS, VerificationService
 from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -493,3 +496,179 @@ class TestVerificationService:
 
         assert exc_info.value.status_code == 500
         assert "Failed to send verification code" in exc_info.value.detail
+
+
+class TestVerificationServiceRedisRateLimit:
+    """Test cases for rate limits counted in Redis."""
+
+    @pytest.mark.asyncio
+    async def test_verification_rate_limit_counted_in_redis(
+        self, db_session: AsyncSession, test_user: User, rate_limiter: SlidingWindowRateLimiter
+    ) -> None:
+        """Test that the verification rate limit is checked without querying rate_limit_logs."""
+        service = VerificationService(db_session, rate_limiter=rate_limiter)
+        contact_id = uuid4()
+
+        for _ in range(3):
+            await service.record_verification_code_request(contact_id, test_user.id)
+
+        with (
+            patch.object(db_session, "execute", wraps=db_session.execute) as mock_execute,
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await service.check_verification_rate_limit(contact_id)
+
+        assert exc_info.value.status_code == 429
+        mock_execute.assert_not_called()
+
+        # Attempts are still written to rate_limit_logs as the audit trail
+        result = await db_session.execute(select(RateLimitLog).where(RateLimitLog.resource_id == str(contact_id)))
+        assert len(result.scalars().all()) == 3
+
+    @pytest.mark.asyncio
+    async def test_add_contact_rate_limit_counted_in_redis(
+        self, db_session: AsyncSession, test_user: User, rate_limiter: SlidingWindowRateLimiter
+    ) -> None:
+        """Test that failed contact additions are counted per user in Redis."""
+        service = VerificationService(db_session, rate_limiter=rate_limiter)
+
+        for i in range(5):
+            await service.check_add_contact_rate_limit(test_user.id)
+            await service.record_add_contact_failure(test_user.id, f"test{i}@example.com")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.check_add_contact_rate_limit(test_user.id)
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_reset_verification_rate_limit_clears_redis(
+        self, db_session: AsyncSession, test_user: User, rate_limiter: SlidingWindowRateLimiter
+    ) -> None:
+        """Test that resetting the rate limit clears the attempts in Redis."""
+        service = VerificationService(db_session, rate_limiter=rate_limiter)
+        contact_id = uuid4()
+
+        for _ in range(3):
+            await service.record_verification_code_request(contact_id, test_user.id)
+        await service.reset_verification_rate_limit(contact_id)
+
+        await service.check_verification_rate_limit(contact_id)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reservations_do_not_exceed_limit(
+        self, db_session: AsyncSession, test_user: User, rate_limiter: SlidingWindowRateLimiter
+    ) -> None:
+        """Test that concurrent code requests are checked and counted atomically in Redis."""
+        service = VerificationService(db_session, rate_limiter=rate_limiter)
+        contact_id = uuid4()
+
+        results = await asyncio.gather(
+            *(service.reserve_verification_code_request(contact_id, test_user.id) for _ in range(6)),
+            return_exceptions=True,
+        )
+        await db_session.commit()
+
+        rejected = [r for r in results if isinstance(r, HTTPException)]
+        assert len(rejected) == 3
+        assert all(r.status_code == 429 for r in rejected)
+        # Audit rows are only written for the reserved requests
+        result = await db_session.execute(select(RateLimitLog).where(RateLimitLog.resource_id == str(contact_id)))
+        assert len(result.scalars().all()) == 3
+
+    @pytest.mark.asyncio
+    @patch("app.services.verification_service.EmailService.send_verification_email")
+    async def test_create_and_send_code_commits_once(
+        self,
+        mock_send_email: AsyncMock,
+        db_session: AsyncSession,
+        test_user: User,
+        rate_limiter: SlidingWindowRateLimiter,
+    ) -> None:
+        """Test that the code and its audit row are committed together, without counting rate_limit_logs."""
+        service = VerificationService(db_session, rate_limiter=rate_limiter)
+        contact_id = uuid4()
+
+        with (
+            patch.object(db_session, "commit", wraps=db_session.commit) as mock_commit,
+            patch.object(db_session, "execute", wraps=db_session.execute) as mock_execute,
+        ):
+            await service.create_and_send_code(
+                contact_id=contact_id,
+                user_id=test_user.id,
+                contact_type=VerificationType.EMAIL,
+                contact_value="test@example.com",
+            )
+
+        mock_commit.assert_awaited_once()
+        mock_execute.assert_not_called()
+        mock_send_email.assert_awaited_once()
+        result = await db_session.execute(select(RateLimitLog).where(RateLimitLog.resource_id == str(contact_id)))
+        assert len(result.scalars().all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_reservation_falls_back_to_logs_when_redis_unavailable(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Test that reservations count rate_limit_logs if Redis fails."""
+        failing_limiter = AsyncMock(spec=SlidingWindowRateLimiter)
+        failing_limiter.acquire.side_effect = RedisConnectionError("Connection refused")
+        service = VerificationService(db_session, rate_limiter=failing_limiter)
+        contact_id = uuid4()
+
+        for _ in range(3):
+            await service.reserve_verification_code_request(contact_id, test_user.id)
+            await db_session.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.reserve_verification_code_request(contact_id, test_user.id)
+
+        assert exc_info.value.status_code == 429
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_logs_when_redis_unavailable(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that rate_limit_logs is counted if Redis fails."""
+        failing_limiter = AsyncMock(spec=SlidingWindowRateLimiter)
+        failing_limiter.count.side_effect = RedisConnectionError("Connection refused")
+        failing_limiter.record.side_effect = RedisConnectionError("Connection refused")
+        service = VerificationService(db_session, rate_limiter=failing_limiter)
+        contact_id = uuid4()
+
+        for _ in range(3):
+            await service.record_verification_code_request(contact_id, test_user.id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.check_verification_rate_limit(contact_id)
+
+        assert exc_info.value.status_code == 429
+        failing_limiter.count.assert_awaited_once()
+
+
+class TestPruneRateLimitLogs:
+    """Test cases for rate_limit_logs retention."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_only_rows_past_retention(self, db_session: AsyncSession, test_user: User) -> None:
+        """Test that audit rows older than the retention are deleted and recent rows kept."""
+        now = datetime.now(UTC)
+        old_entry = RateLimitLog(
+            user_id=test_user.id,
+            action_type=RateLimitAction.VERIFY_CODE,
+            resource_id=str(uuid4()),
+            timestamp=now - timedelta(days=RATE_LIMIT_LOG_RETENTION_DAYS, minutes=1),
+        )
+        recent_entry = RateLimitLog(
+            user_id=test_user.id,
+            action_type=RateLimitAction.VERIFY_CODE,
+            resource_id=str(uuid4()),
+            timestamp=now - timedelta(days=RATE_LIMIT_LOG_RETENTION_DAYS - 1),
+        )
+        db_session.add_all([old_entry, recent_entry])
+        await db_session.commit()
+        recent_id = recent_entry.id
+
+        deleted = await VerificationService(db_session).prune_rate_limit_logs(now)
+
+        assert deleted == 1
+        result = await db_session.execute(select(RateLimitLog.id))
+        assert result.scalars().all() == [recent_id]
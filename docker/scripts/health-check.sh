@@ -19,7 +19,7 @@ echo ""
 
 # Check 1: Docker containers running
 echo "[1/5] Checking Docker containers..."
-EXPECTED_CONTAINERS=("isthetube-postgres-prod" "isthetube-redis-prod" "isthetube-backend-prod" "isthetube-celery-worker-prod" "isthetube-celery-beat-prod" "isthetube-frontend-prod")
+EXPECTED_CONTAINERS=("isthetube-postgres-prod" "isthetube-redis-prod" "isthetube-backend-prod" "isthetube-celery-worker-prod" "isthetube-celery-notification-worker-prod" "isthetube-celery-beat-prod" "isthetube-frontend-prod")
 RUNNING_COUNT=0
 
 for container in "${EXPECTED_CONTAINERS[@]}"; do
@@ -97,7 +97,7 @@ echo ""
 # Check 4: Container logs for errors
 echo "[4/5] Checking container logs for recent errors..."
 ERROR_COUNT=0
-for container in isthetube-backend-prod isthetube-celery-worker-prod isthetube-celery-beat-prod; do
+for container in isthetube-backend-prod isthetube-celery-worker-prod isthetube-celery-notification-worker-prod isthetube-celery-beat-prod; do
     # Check last 20 lines of logs for ERROR/CRITICAL/FATAL level messages
     if docker logs --tail 20 "$container" 2>&1 | grep -Ei "ERROR|CRITICAL|FATAL"; then
         ERROR_COUNT=$((ERROR_COUNT + 1))
@@ -2203,7 +2203,7 @@ export interface components {
     PaginatedUsersResponse: {
       /**
        * Total
-       * @description Total number of users matching filter
+       * @description Total number of users matching filter (cached briefly)
        */
       total: number
       /**
@@ -2221,6 +2221,11 @@ export interface components {
        * @description Starting offset for pagination
        */
       offset: number
+      /**
+       * Next Cursor
+       * @description Cursor for the next page (null on the last page)
+       */
+      next_cursor?: string | null
     }
     /**
      * PhoneNumberItem
@@ -2312,6 +2317,11 @@ export interface components {
        * @description Starting offset for pagination
        */
       offset: number
+      /**
+       * Next Cursor
+       * @description Cursor for the next page (null on the last page)
+       */
+      next_cursor?: string | null
     }
     /**
      * RouteDisruptionResponse
@@ -4222,6 +4232,8 @@ export interface operations {
         limit?: number
         /** @description Starting offset for pagination */
         offset?: number
+        /** @description Cursor from a previous page's next_cursor (keyset pagination; use instead of offset) */
+        cursor?: string | null
         /** @description Filter by notification status */
         status?: components['schemas']['NotificationStatus'] | null
       }
@@ -4258,6 +4270,8 @@ export interface operations {
         limit?: number
         /** @description Starting offset for pagination */
         offset?: number
+        /** @description Cursor from a previous page's next_cursor (keyset pagination; use instead of offset) */
+        cursor?: string | null
         /** @description Search term (email or external_id) */
         search?: string | null
         /** @description Include soft-deleted users */